@@ -13,6 +13,7 @@
 #################################################################################
 """ Block-like object meant for controller models.
 """
+import time as _time
 
 from idaes.apps.caprese.common.config import (
     ControlPenaltyType,
@@ -37,12 +38,27 @@ from pyomo.environ import (
     check_optimal_termination,
     Constraint,
     Block,
+    ConcreteModel,
+    Reference,
 )
 from pyomo.common.collections import ComponentMap
+from pyomo.contrib.appsi.base import PersistentSolver
 from pyomo.dae.set_utils import deactivate_model_at
 from pyomo.core.base.indexed_component import UnindexedComponent_set
 
 
+# Ipopt options for a solve that starts from the primal and bound multiplier
+# values of the previous NMPC cycle. The initial point is assumed to be close
+# to the solution, so it is barely pushed from the bounds and the barrier
+# parameter starts small.
+WARM_START_OPTIONS = {
+    "warm_start_init_point": "yes",
+    "warm_start_bound_push": 1e-8,
+    "warm_start_mult_bound_push": 1e-8,
+    "mu_init": 1e-6,
+}
+
+
 def pwc_rule(ctrl, i, t):
     time = ctrl.time
     sp_set = set(ctrl.sample_points)
@@ -169,6 +185,87 @@ class _ControllerBlockData(_DynamicBlockData):
         if VC.MEASUREMENT in self.categories:
             self.vectors.measurement.values = init_meas
 
+    def solve_cycle(self, solver, measured=None, warm_start=True, **kwargs):
+        """Solves the control problem of one NMPC cycle, and appends the
+        time taken by each step, in seconds, to `cycle_times`.
+
+        In every cycle after the first, the values of the previous cycle
+        are advanced by one sample to initialize the solve. If the solver
+        is an APPSI persistent solver, the controller keeps its own copy
+        of it, so the model is loaded only once and later solves only pass
+        the changed values, e.g. new initial conditions and setpoints.
+        Otherwise, the bound multipliers of the previous cycle are advanced
+        as well and sent to Ipopt with `WARM_START_OPTIONS`.
+
+        Parameters:
+            solver: A Pyomo solver object that will be used to solve
+                    the controller model.
+            measured: Measured values to load as initial conditions
+                      before the solve. Default is `None`, which does
+                      not load measurements.
+            warm_start: Whether to warm start Ipopt from the multipliers
+                        of the previous cycle. Default is `True`. Has no
+                        effect for persistent solvers.
+
+        Returns:
+            The results of the solve
+        """
+        config = self.CONFIG(kwargs)
+        start = _time.perf_counter()
+
+        try:
+            cycle_times = self.cycle_times
+        except AttributeError:
+            cycle_times = self.cycle_times = []
+        if isinstance(solver, PersistentSolver):
+            try:
+                cycle_solver = self._cycle_solver
+            except AttributeError:
+                cycle_solver = None
+            if cycle_solver is None or type(cycle_solver) is not type(solver):
+                # Solving other models with the same solver object would
+                # reload them in the solver
+                cycle_solver = self._cycle_solver = type(solver)()
+                cycle_solver.config = solver.config()
+                cycle_solver.options = dict(solver.options)
+                # APPSI solvers need a model, so wrap the controller in one
+                self._cycle_model = ConcreteModel()
+                self._cycle_model.controller = Reference(self)
+            solver = cycle_solver
+            model = self._cycle_model
+            warm_start = False
+        else:
+            model = self
+
+        if warm_start and self.component("ipopt_zL_out") is None:
+            self.add_ipopt_suffixes()
+        if cycle_times:
+            self.advance_one_sample()
+            if warm_start:
+                self.advance_ipopt_multipliers_one_sample()
+        if measured is not None:
+            self.load_measurements(measured)
+        advanced = _time.perf_counter()
+
+        options = dict(solver.options)
+        if warm_start and len(self.ipopt_zL_in) + len(self.ipopt_zU_in) > 0:
+            options.update(WARM_START_OPTIONS)
+        results = solver.solve(model, tee=config.tee, options=options)
+        solved = _time.perf_counter()
+
+        if warm_start:
+            self.update_ipopt_multipliers()
+
+        end = _time.perf_counter()
+        cycle_times.append(
+            {
+                "advance": advanced - start,
+                "solve": solved - advanced,
+                "total": end - start,
+            }
+        )
+        return results
+
     def add_setpoint_objective(
         self,
         setpoint,
@@ -586,6 +586,52 @@ class _DynamicBlockData(BlockData):
                 "category has been specified."
             )
 
+    def _time_shift_pairs(self, t_shift, tolerance=1e-8):
+        """Returns a list of pairs of time points `(t, ts)`, where `ts` is
+        the point of `time` nearest to `t + t_shift`, for the time points
+        where such a point exists. The pairs are computed once for every
+        shift and tolerance.
+        """
+        # Plans are cached on the block as time and the references it
+        # contains do not change after construction.
+        try:
+            cache = self._time_shift_cache
+        except AttributeError:
+            cache = self._time_shift_cache = {}
+        key = (t_shift, tolerance)
+        if key not in cache:
+            time = self.time
+            pairs = []
+            for t in time:
+                idx = time.find_nearest_index(t + t_shift, tolerance)
+                if idx is None:
+                    # t + sample_time is outside the model's "horizon"
+                    continue
+                pairs.append((t, time.at(idx)))
+            cache[key] = pairs
+        return cache[key]
+
+    def _shift_plan(self, t_shift, ctype, tolerance=1e-8):
+        """Returns flat lists of the vardata to set and the vardata to
+        take the values from when advancing the variables of the specified
+        ctypes by `t_shift`.
+        """
+        try:
+            cache = self._shift_plan_cache
+        except AttributeError:
+            cache = self._shift_plan_cache = {}
+        key = (t_shift, ctype, tolerance)
+        if key not in cache:
+            pairs = self._time_shift_pairs(t_shift, tolerance)
+            targets = []
+            sources = []
+            for var in self.component_objects(ctype):
+                for t, ts in pairs:
+                    targets.append(var[t])
+                    sources.append(var[ts])
+            cache[key] = (targets, sources)
+        return cache[key]
+
     def advance_by_time(
         self,
         t_shift,
@@ -597,20 +643,13 @@ class _DynamicBlockData(BlockData):
         """Set values for the variables of the specified ctypes
         to their values `t_shift` in the future.
         """
-        time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                var[t].set_value(var[ts].value)
+        targets, sources = self._shift_plan(t_shift, ctype, tolerance)
+        # All values are read before any are set, so every variable takes
+        # the value it had `t_shift` in the future before the shift.
+        values = [var.value for var in sources]
+        for var, val in zip(targets, values):
+            # Values come from the same variables, so they are valid
+            var.set_value(val, skip_validation=True)
 
     def advance_one_sample(
         self,
@@ -669,6 +708,12 @@ class _DynamicBlockData(BlockData):
         category_dict = self.category_dict
         vardata_map = self.vardata_map
 
+        # The time points in the sample are the same for every variable
+        sample = list(self.generate_time_in_sample(ts, tolerance=tolerance))
+        if include_t0:
+            i0 = time.find_nearest_index(ts - sample_time, tolerance=tolerance)
+            sample.insert(0, time.at(i0))
+
         data = OrderedDict()
         queue = list(variables)
         for var in queue:
@@ -679,16 +724,7 @@ class _DynamicBlockData(BlockData):
                 continue
             _slice = vardata_map[var]
             cuid = ComponentUID(_slice.referent)
-            if include_t0:
-                i0 = time.find_nearest_index(ts - sample_time, tolerance=tolerance)
-                t0 = time.at(i0)
-                data[cuid] = [_slice[t0].value]
-            else:
-                data[cuid] = []
-            data[cuid].extend(
-                _slice[t].value
-                for t in self.generate_time_in_sample(ts, tolerance=tolerance)
-            )
+            data[cuid] = [_slice[t].value for t in sample]
 
         return data
 
@@ -723,23 +759,12 @@ class _DynamicBlockData(BlockData):
         """
         zL = self.ipopt_zL_in
         zU = self.ipopt_zU_in
-        time = self.time
-        # The outer loop is over time so we don't have to call
-        # `find_nearest_index` for every variable.
-        # I am assuming that `find_nearest_index` is slower than
-        # accessing `component_objects`
-        for t in time:
-            ts = t + t_shift
-            idx = time.find_nearest_index(ts, tolerance)
-            if idx is None:
-                # t + sample_time is outside the model's "horizon"
-                continue
-            ts = time.at(idx)
-            for var in self.component_objects(ctype):
-                if var[t] in zL and var[ts] in zL:
-                    zL[var[t]] = zL[var[ts]]
-                if var[t] in zU and var[ts] in zU:
-                    zU[var[t]] = zU[var[ts]]
+        targets, sources = self._shift_plan(t_shift, ctype, tolerance)
+        for var, var_s in zip(targets, sources):
+            if var in zL and var_s in zL:
+                zL[var] = zL[var_s]
+            if var in zU and var_s in zU:
+                zU[var] = zU[var_s]
 
     def advance_ipopt_multipliers_one_sample(
         self,
@@ -17,6 +17,9 @@
 from pyomo.core.base.componentuid import ComponentUID
 from collections import OrderedDict
 import bisect
+import os
+
+import numpy as np
 
 
 class TimeList(list):
@@ -48,17 +51,14 @@ class TimeList(list):
         within-tolerance."
         """
         # Could sort time before doing this...
-        tolerance = self.tolerance
         len_time = len(time)
         if len_time == 0 or len_time == 1:
             return time
-        t0 = time[0]
-        for t1 in time[1:]:
-            if t1 - t0 <= 2 * self.tolerance:
-                raise ValueError(
-                    "Time points must be increasing and separated by more "
-                    "than twice the tolerance."
-                )
+        if np.any(np.diff(np.asarray(time, dtype=float)) <= 2 * self.tolerance):
+            raise ValueError(
+                "Time points must be increasing and separated by more "
+                "than twice the tolerance."
+            )
         return time
 
     def is_within_bounds(self, t):
@@ -287,3 +287,235 @@ class VectorSeries(OrderedDict):
         self.time.extend(tpoints)
         for series, new_data in zip(self.values(), data):
             series.extend(new_data)
+
+
+class VectorSeriesBuffer(object):
+    """
+    A time-indexed vector stored in NumPy arrays, for long rolling-horizon
+    histories.
+
+    At least the `capacity` latest time points are kept in memory. When
+    `chunk_size` more points have been appended, the oldest `chunk_size`
+    points are removed from memory, and written to an NPZ file in
+    `directory` if one was given. The points in memory are contiguous, so
+    `time`, `values`, `__getitem__` and `window` return views rather than
+    copies, appending is amortized O(1), and points are found by binary
+    search.
+    """
+
+    def __init__(
+        self,
+        keys,
+        capacity=10000,
+        chunk_size=None,
+        directory=None,
+        name=None,
+        tolerance=0.0,
+    ):
+        """
+        Args:
+            keys: keys of the entries of the vector, e.g. cuids
+            capacity: number of latest time points that are kept in memory
+            chunk_size: number of time points that are removed from memory
+                at a time, equal to capacity if None
+            directory: directory to write the removed time points to. If
+                None, they are discarded.
+            name: name of this vector
+            tolerance: time points must be separated by more than twice
+                this tolerance
+        """
+        if chunk_size is None:
+            chunk_size = capacity
+        if capacity < 1 or chunk_size < 1:
+            raise ValueError("capacity and chunk_size must be positive integers")
+
+        self.name = name
+        self.tolerance = tolerance
+        self.capacity = capacity
+        self.chunk_size = chunk_size
+        self.directory = directory
+        self.keys = list(keys)
+        self._index = {key: i for i, key in enumerate(self.keys)}
+        if len(self._index) != len(self.keys):
+            raise ValueError("Keys of the vector must be unique")
+
+        size = capacity + chunk_size
+        self._time = np.empty(size)
+        self._values = np.empty((len(self.keys), size))
+        self._n = 0
+        self.files = []
+        self.n_flushed = 0
+
+    def dim(self):
+        """This is the dimension of the vector that is indexed by time."""
+        return len(self.keys)
+
+    def __len__(self):
+        """This is the number of time points in memory."""
+        return self._n
+
+    @property
+    def time(self):
+        """View of the time points in memory."""
+        return self._time[: self._n]
+
+    @property
+    def values(self):
+        """View of the values in memory, one row for each key."""
+        return self._values[:, : self._n]
+
+    def __getitem__(self, key):
+        """View of the values of one entry of the vector in memory."""
+        return self._values[self._index[key], : self._n]
+
+    def _validate(self, tpoints):
+        tpoints = np.asarray(tpoints, dtype=float)
+        if len(tpoints) == 0:
+            return tpoints
+        if self._n > 0:
+            first_gap = tpoints[0] - self._time[self._n - 1]
+        else:
+            first_gap = np.inf
+        if first_gap <= 2 * self.tolerance or np.any(
+            np.diff(tpoints) <= 2 * self.tolerance
+        ):
+            raise ValueError(
+                "Time points must be increasing and separated by more "
+                "than twice the tolerance."
+            )
+        return tpoints
+
+    def append(self, t, data):
+        """
+        data is a vector.
+        """
+        self._validate([t])
+        if len(data) != self.dim():
+            raise ValueError(
+                "Tried to append a vector with inconsistent dimension. "
+                "Expected %s, got %s." % (self.dim(), len(data))
+            )
+        if self._n == len(self._time):
+            self._evict()
+        self._time[self._n] = t
+        self._values[:, self._n] = data
+        self._n += 1
+
+    def extend(self, tpoints, data):
+        """
+        data is a matrix with a row for each key, or an OrderedDict or
+        VectorSeries mapping keys to lists of values. A first point that
+        coincides with the last existing point, within the tolerance, is
+        skipped if its values are consistent with the existing values.
+        """
+        if hasattr(data, "values") and callable(data.values):
+            missing = [key for key in self.keys if key not in data]
+            extra = [key for key in data if key not in self._index]
+            if missing or extra:
+                raise KeyError(
+                    "Keys of the data do not match the keys of the vector. "
+                    "Missing keys: %s, unexpected keys: %s." % (missing, extra)
+                )
+            data = [data[key] for key in self.keys]
+        tpoints = np.asarray(tpoints, dtype=float)
+        data = np.asarray(data, dtype=float).reshape(self.dim(), len(tpoints))
+        if self._n > 0 and len(tpoints) > 0:
+            t_last = self._time[self._n - 1]
+            if abs(tpoints[0] - t_last) <= self.tolerance:
+                if not np.array_equal(data[:, 0], self._values[:, self._n - 1]):
+                    raise ValueError(
+                        "Tried to extend with series that overlapped at time "
+                        "point %s, but the series data was not consistent "
+                        "with pre-existing data." % tpoints[0]
+                    )
+                tpoints = tpoints[1:]
+                data = data[:, 1:]
+        self._validate(tpoints)
+
+        start = 0
+        while start < len(tpoints):
+            if self._n == len(self._time):
+                self._evict()
+            stop = min(len(tpoints), start + len(self._time) - self._n)
+            n_new = stop - start
+            self._time[self._n : self._n + n_new] = tpoints[start:stop]
+            self._values[:, self._n : self._n + n_new] = data[:, start:stop]
+            self._n += n_new
+            start = stop
+
+    def _evict(self):
+        """
+        Remove the oldest chunk of time points from memory.
+        """
+        n_evict = min(self.chunk_size, self._n)
+        if self.directory is not None:
+            self._write(self._time[:n_evict], self._values[:, :n_evict])
+        self.n_flushed += n_evict
+        self._n -= n_evict
+        self._time[: self._n] = self._time[n_evict : n_evict + self._n]
+        self._values[:, : self._n] = self._values[:, n_evict : n_evict + self._n]
+
+    def _write(self, time, values):
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(
+            self.directory, "%s_%s.npz" % (self.name or "series", len(self.files))
+        )
+        np.savez(path, time=time, values=values, keys=np.array(self.keys, dtype=str))
+        self.files.append(path)
+
+    def flush(self):
+        """
+        Write all the time points in memory to a file in `directory` and
+        remove them from memory.
+        """
+        if self.directory is None:
+            raise ValueError("No directory was given to flush the series to")
+        if self._n == 0:
+            return
+        self._write(self.time, self.values)
+        self.n_flushed += self._n
+        self._n = 0
+
+    def find_nearest_index(self, target):
+        """
+        Returns the index of the nearest point in memory, or None if there
+        is no point within the tolerance.
+        """
+        time = self.time
+        i = np.searchsorted(time, target)
+        candidates = [j for j in (i - 1, i) if 0 <= j < len(time)]
+        if not candidates:
+            return None
+        nearest_index = min(candidates, key=lambda j: abs(time[j] - target))
+        if abs(time[nearest_index] - target) > self.tolerance:
+            return None
+        return int(nearest_index)
+
+    def window(self, t_start, t_end):
+        """
+        Returns views of the time points in memory in the interval
+        [t_start, t_end], extended by the tolerance, and of their values.
+        """
+        time = self.time
+        lo = np.searchsorted(time, t_start - self.tolerance, side="left")
+        hi = np.searchsorted(time, t_end + self.tolerance, side="right")
+        return time[lo:hi], self._values[:, lo:hi]
+
+    def to_vector_series(self, include_flushed=True):
+        """
+        Returns a VectorSeries with the time points in memory, and the
+        points written to files before them if include_flushed is True.
+        """
+        time = [self.time]
+        values = [self.values]
+        if include_flushed:
+            for path in reversed(self.files):
+                with np.load(path) as npz:
+                    time.insert(0, npz["time"])
+                    values.insert(0, npz["values"])
+        time = np.concatenate(time)
+        values = np.concatenate(values, axis=1)
+        data = OrderedDict((key, values[i].tolist()) for i, key in enumerate(self.keys))
+        return VectorSeries(
+            data, time.tolist(), name=self.name, tolerance=self.tolerance
+        )
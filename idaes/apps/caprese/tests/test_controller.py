@@ -315,3 +315,65 @@ class TestControllerBlock(object):
             inputs = controller.vectors.input
             pred_expr = inputs[i, tn] == inputs[i, t]
             assert pwc_expr.to_string() == pred_expr.to_string()
+
+    @pytest.mark.component
+    @pytest.mark.skipif(
+        not pyo.SolverFactory("appsi_highs").available(exception_flag=False),
+        reason="HiGHS is not available",
+    )
+    def test_solve_cycle_persistent(self):
+        controller = self.make_controller()
+        model = controller.mod
+        t0 = controller.time.first()
+        # Make the model linear for HiGHS
+        model.flow_out.fix(1.0)
+        model.flow_eqn.deactivate()
+        controller.objective = pyo.Objective(expr=0)
+
+        highs = pyo.SolverFactory("appsi_highs")
+        results = controller.solve_cycle(highs, tee=False)
+        assert pyo.check_optimal_termination(results)
+        cycle_solver = controller._cycle_solver
+        assert cycle_solver is not highs
+        conc_sample = model.conc[0.5, "A"].value
+        assert conc_sample > 0
+
+        results = controller.solve_cycle(highs, tee=False)
+        assert pyo.check_optimal_termination(results)
+        assert controller._cycle_solver is cycle_solver
+        # Initial conditions were advanced by one sample
+        assert model.conc[t0, "A"].value == pytest.approx(conc_sample)
+        assert model.conc[t0, "A"].fixed
+
+        assert len(controller.cycle_times) == 2
+        for times in controller.cycle_times:
+            assert set(times) == {"advance", "solve", "total"}
+            assert times["total"] >= times["solve"] > 0
+        assert controller.component("ipopt_zL_out") is None
+
+    @pytest.mark.component
+    @pytest.mark.skipif(not solver_available, reason="IPOPT is not available")
+    def test_solve_cycle_warm_start(self):
+        controller = self.make_controller()
+        time = controller.time
+        t0 = time.first()
+        controller.mod.flow_in[:].set_value(3.0)
+        initialize_t0(controller.mod)
+        copy_values_forward(controller.mod)
+        controller.add_setpoint_objective(
+            [(controller.mod.flow_in[t0], 3.0)], [(controller.mod.flow_in[t0], 1.0)]
+        )
+        controller.solve_setpoint(solver)
+        controller.add_tracking_objective(
+            [(controller.mod.conc[t0, "A"], 1), (controller.mod.flow_in[t0], 1)]
+        )
+        controller.constrain_control_inputs_piecewise_constant()
+        controller.mod.flow_in[:].set_value(2.5)
+        controller.vectors.input[...].unfix()
+        controller.vectors.input[:, t0].fix()
+
+        for _ in range(3):
+            results = controller.solve_cycle(solver, tee=False)
+            assert pyo.check_optimal_termination(results)
+        assert len(controller.cycle_times) == 3
+        assert controller.component("ipopt_zL_out") is not None
@@ -888,6 +888,37 @@ class TestDynamicBlock(object):
                 for v in blk.component_objects(ctypes_to_not_shift):
                     assert v[t].value == t
 
+    @pytest.mark.unit
+    def test_advance_by_reuses_plan(self):
+        blk = self.make_block()
+        time = blk.time
+        ctypes = (DiffVar, DerivVar, AlgVar, InputVar, FixedVar)
+
+        for t in time:
+            for v in blk.component_objects(ctypes):
+                v[t].set_value(t)
+
+        shift = blk.sample_time
+        blk.advance_by_time(shift)
+        targets, sources = blk._shift_plan(shift, ctypes)
+        n_var = len(list(blk.component_objects(ctypes)))
+        n_pairs = len(blk._time_shift_pairs(shift))
+        assert len(targets) == len(sources) == n_var * n_pairs
+
+        # Values are shifted by one more sample with the same plan
+        blk.advance_by_time(shift)
+        assert blk._shift_plan(shift, ctypes)[0] is targets
+        # Points without a point one sample later keep their values
+        expected = {t: t for t in time}
+        for _ in range(2):
+            shifted = dict(expected)
+            for t, ts in blk._time_shift_pairs(shift):
+                shifted[t] = expected[ts]
+            expected = shifted
+        for t in time:
+            for v in blk.component_objects(ctypes):
+                assert v[t].value == expected[t]
+
     @pytest.mark.unit
     def test_advance_one_sample(self):
         blk = self.make_block()
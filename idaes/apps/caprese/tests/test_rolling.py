@@ -388,3 +388,80 @@ class TestVectorSeries(object):
             # Assuming that history_2.dim() != 1 ...
             history_2.extend([], [[]])
             assert "inconsistent dimension" in str(err)
+
+
+class TestVectorSeriesBuffer(object):
+    @pytest.mark.unit
+    def test_append_and_views(self):
+        series = VectorSeriesBuffer(["a", "b"], capacity=3, chunk_size=2, tolerance=0.1)
+        for t in range(4):
+            series.append(t, [t, 10 * t])
+        assert len(series) == 4
+        assert list(series.time) == [0, 1, 2, 3]
+        assert list(series["b"]) == [0, 10, 20, 30]
+
+        # Windows are views of the buffer
+        time, values = series.window(0.95, 2.05)
+        assert list(time) == [1, 2]
+        assert values.base is not None
+        values[0, 0] = -1
+        assert series["a"][1] == -1
+
+        # Buffer is full after five points, the two oldest are discarded
+        series.append(4, [4, 40])
+        assert series.n_flushed == 0
+        series.append(5, [5, 50])
+        assert list(series.time) == [2, 3, 4, 5]
+        assert series.n_flushed == 2
+        assert series.find_nearest_index(3.05) == 1
+        assert series.find_nearest_index(3.5) is None
+
+        with pytest.raises(ValueError, match="Time points must be increasing"):
+            series.append(5.1, [0, 0])
+        with pytest.raises(ValueError, match="inconsistent dimension"):
+            series.append(6, [0])
+
+    @pytest.mark.unit
+    def test_extend_mapping(self):
+        series = VectorSeriesBuffer(["a", "b"])
+        series.extend([0, 1], OrderedDict([("b", [10, 11]), ("a", [0, 1])]))
+        assert list(series["a"]) == [0, 1]
+        assert list(series["b"]) == [10, 11]
+
+        other = VectorSeries(OrderedDict([("b", [11, 12]), ("a", [1, 2])]), [1, 2])
+        series.extend([1, 2], other)
+        assert list(series["a"]) == [0, 1, 2]
+        assert list(series["b"]) == [10, 11, 12]
+
+        with pytest.raises(KeyError, match=r"Missing keys: \['b'\]"):
+            series.extend([3], {"a": [3]})
+        with pytest.raises(KeyError, match=r"unexpected keys: \['c'\]"):
+            series.extend([3], {"a": [3], "b": [13], "c": [23]})
+
+    @pytest.mark.unit
+    def test_extend_and_flush(self, tmp_path):
+        series = VectorSeriesBuffer(
+            ["a"], capacity=4, chunk_size=3, directory=tmp_path, name="hist"
+        )
+        series.extend([0, 1, 2], [[0, 1, 2]])
+        with pytest.raises(ValueError, match="data was not consistent"):
+            series.extend([2, 3], [[5, 3]])
+        # The overlapping point is skipped
+        series.extend(range(2, 12), [list(range(2, 12))])
+        assert series.n_flushed == 6
+        assert list(series.time) == [6, 7, 8, 9, 10, 11]
+        assert len(series.files) == 2
+
+        series.flush()
+        assert len(series) == 0
+        series.append(12, [12])
+
+        history = series.to_vector_series()
+        assert history.time == list(range(13))
+        assert history["a"] == list(range(13))
+        assert history.name == "hist"
+        assert sorted(p.name for p in tmp_path.iterdir()) == [
+            "hist_0.npz",
+            "hist_1.npz",
+            "hist_2.npz",
+        ]
@@ -13,11 +13,21 @@
 import os
 from abc import ABC, abstractmethod
 import datetime
-import pandas as pd
+import numpy as np
 import pyomo.environ as pyo
-from pyomo.opt.base.solvers import OptSolver
+from pyomo.common.collections import ComponentMap
 from pyomo.common.dependencies import attempt_import
-from idaes.apps.grid_integration.utils import convert_marginal_costs_to_actual_costs
+from pyomo.common.deprecation import deprecation_warning
+from idaes.apps.grid_integration.decomposition import (
+    project_nonanticipative,
+    project_nondecreasing,
+)
+from idaes.apps.grid_integration.results import ResultsRecorder
+from idaes.apps.grid_integration.utils import (
+    check_solver,
+    convert_marginal_costs_to_actual_costs,
+    ModelSolver,
+)
 import idaes.logger as idaeslog
 
 egret, egret_avail = attempt_import("egret")
@@ -155,6 +165,34 @@ class AbstractBidder(ABC):
     def generator(self):
         return "AbstractGenerator"
 
+    @property
+    def bids_result_list(self):
+        """
+        Deprecated list of DataFrames of the bids. The bids are recorded in the
+        results recorder `bids_results`.
+        """
+        deprecation_warning(
+            msg="bids_result_list is deprecated. The bids are recorded in the "
+            "ResultsRecorder bids_results.",
+            logger=_logger,
+            version="2.6.0",
+            remove_in="3.0.0",
+        )
+        return self.bids_results.frame_list()
+
+    @bids_result_list.setter
+    def bids_result_list(self, value):
+        deprecation_warning(
+            msg="bids_result_list is deprecated. The bids are recorded in the "
+            "ResultsRecorder bids_results.",
+            logger=_logger,
+            version="2.6.0",
+            remove_in="3.0.0",
+        )
+        self.bids_results.clear()
+        for df in value:
+            self.bids_results.record_frame(df)
+
     def _check_inputs(self):
         """
         Check if the inputs to construct the tracker is valid. If not raise errors.
@@ -210,10 +248,7 @@ class AbstractBidder(ABC):
         Check if provides solver is a valid Pyomo solver object.
         """
 
-        if not isinstance(self.solver, OptSolver):
-            raise TypeError(
-                f"The provided solver {self.solver} is not a valid Pyomo solver."
-            )
+        check_solver(self.solver)
 
 
 class StochasticProgramBidder(AbstractBidder):
@@ -230,6 +265,7 @@ class StochasticProgramBidder(AbstractBidder):
         solver,
         forecaster,
         real_time_underbid_penalty,
+        decomposition=None,
     ):
         """
         Initializes the stochastic bidder object.
@@ -243,12 +279,20 @@ class StochasticProgramBidder(AbstractBidder):
 
             n_scenario: number of uncertain LMP scenarios
 
-            solver: a Pyomo mathematical programming solver object
+            solver: a Pyomo mathematical programming solver object. If it is an
+                APPSI solver, e.g., SolverFactory("appsi_highs"), the bidding
+                models are kept loaded in the solver between solves, and only
+                the updated parameter values are passed to it.
 
             forecaster: an initialized LMP forecaster object
 
             real_time_underbid_penalty: penalty for RT power bid that's less than DA power bid, non-negative
 
+            decomposition: None to solve the bidding problems with all the price
+                scenarios at once (extensive form), or a scenario decomposition
+                object, e.g., ProgressiveHedging, to solve the price scenarios
+                separately and coordinate their bids
+
         Returns:
             None
         """
@@ -260,8 +304,10 @@ class StochasticProgramBidder(AbstractBidder):
         self.solver = solver
         self.forecaster = forecaster
         self.real_time_underbid_penalty = real_time_underbid_penalty
+        self.decomposition = decomposition
 
         self._check_inputs()
+        self._check_decomposition()
 
         self.generator = self.bidding_model_object.model_data.gen_name
 
@@ -269,8 +315,28 @@ class StochasticProgramBidder(AbstractBidder):
         self.day_ahead_model = self.formulate_DA_bidding_problem()
         self.real_time_model = self.formulate_RT_bidding_problem()
 
-        # declare a list to store results
-        self.bids_result_list = []
+        self._model_solvers = ComponentMap(
+            (m, ModelSolver(self.solver, m))
+            for m in (self.day_ahead_model, self.real_time_model)
+        )
+
+        # declare a recorder to store results
+        self.bids_results = ResultsRecorder()
+
+    def _check_decomposition(self):
+        """
+        Check if the bidder can be solved by scenario decomposition, i.e., it
+        implements the projection of the power bids of the separate scenarios.
+        """
+
+        if (
+            self.decomposition is not None
+            and type(self)._project_bids is StochasticProgramBidder._project_bids
+        ):
+            raise TypeError(
+                f"{type(self).__name__} does not support scenario decomposition, "
+                "since it does not implement _project_bids."
+            )
 
     def _set_up_bidding_problem(self, horizon):
         """
@@ -431,27 +497,39 @@ class StochasticProgramBidder(AbstractBidder):
         model.obj = pyo.Objective(expr=0, sense=pyo.maximize)
 
         for k in model.SCENARIOS:
-            time_index = model.fs[k].power_output_ref.index_set()
+            model.obj.expr += self._scenario_profit(model.fs[k])
 
-            # currently .total_cost is a tuple of 2 items
-            # the first item is the name of the cost expression
-            # the second item is the weight for the cost
-            cost_name = self.bidding_model_object.total_cost[0]
-            cost = getattr(model.fs[k], cost_name)
-            weight = self.bidding_model_object.total_cost[1]
+        return
 
-            for t in time_index:
-                model.obj.expr += (
-                    model.fs[k].day_ahead_energy_price[t]
-                    * model.fs[k].day_ahead_power[t]
-                    + model.fs[k].real_time_energy_price[t]
-                    * (model.fs[k].power_output_ref[t] - model.fs[k].day_ahead_power[t])
-                    - weight * cost[t]
-                    - model.fs[k].real_time_underbid_penalty
-                    * model.fs[k].real_time_underbid_power[t]
-                )
+    def _scenario_profit(self, fs):
+        """
+        Build the expression of the profit of the energy system in one price
+        scenario.
 
-        return
+        Arguments:
+            fs: price scenario block of the bidding model
+
+        Returns:
+            pyomo expression: the profit in the scenario
+        """
+
+        time_index = fs.power_output_ref.index_set()
+
+        # currently .total_cost is a tuple of 2 items
+        # the first item is the name of the cost expression
+        # the second item is the weight for the cost
+        cost_name = self.bidding_model_object.total_cost[0]
+        cost = getattr(fs, cost_name)
+        weight = self.bidding_model_object.total_cost[1]
+
+        return sum(
+            fs.day_ahead_energy_price[t] * fs.day_ahead_power[t]
+            + fs.real_time_energy_price[t]
+            * (fs.power_output_ref[t] - fs.day_ahead_power[t])
+            - weight * cost[t]
+            - fs.real_time_underbid_penalty * fs.real_time_underbid_power[t]
+            for t in time_index
+        )
 
     def _compute_bids(
         self,
@@ -492,7 +570,10 @@ class StochasticProgramBidder(AbstractBidder):
         # update the price forecasts
         self._pass_price_forecasts(model, day_ahead_price, real_time_energy_price)
 
-        self.solver.solve(model, tee=True)
+        if self.decomposition is None:
+            self._model_solvers[model].solve(tee=True)
+        else:
+            self._solve_decomposed(model, power_var_name, energy_price_param_name)
 
         bids = self._assemble_bids(
             model,
@@ -505,6 +586,69 @@ class StochasticProgramBidder(AbstractBidder):
 
         return bids
 
+    def _solve_decomposed(self, model, power_var_name, energy_price_param_name):
+        """
+        Solve the bidding model by scenario decomposition, i.e., solve the
+        price scenarios separately and coordinate their bids.
+
+        Arguments:
+            model: bidding model
+
+            power_var_name: the name of the power output (str)
+
+            energy_price_param_name: the name of the energy price forecast params (str)
+
+        Returns:
+            None
+        """
+
+        blocks = [model.fs[s] for s in model.SCENARIOS]
+        first_stage = [list(getattr(b, power_var_name).values()) for b in blocks]
+        prices = np.array(
+            [
+                [pyo.value(p) for p in getattr(b, energy_price_param_name).values()]
+                for b in blocks
+            ]
+        )
+
+        self.decomposition.solve(
+            blocks=blocks,
+            first_stage=first_stage,
+            profit=self._scenario_profit,
+            project=lambda values: self._project_bids(values, prices),
+            prices=prices,
+            solver=self.solver,
+        )
+
+    def _project_bids(self, values, prices):
+        """
+        Project the power bids of the separately solved price scenarios onto the
+        bids that satisfy the bidding constraints.
+
+        Arguments:
+            values: power bids, array of shape (n_scenario, n_time)
+
+            prices: energy prices, array of shape (n_scenario, n_time)
+
+        Returns:
+            numpy.ndarray: projected power bids
+        """
+
+        raise NotImplementedError(
+            f"{type(self).__name__} does not support scenario decomposition."
+        )
+
+    @property
+    def solve_times(self):
+        """
+        Wall clock time of each solve of the day-ahead and real-time bidding
+        problems [s].
+        """
+        return {
+            "Day-ahead": self._model_solvers[self.day_ahead_model].solve_times,
+            "Real-time": self._model_solvers[self.real_time_model].solve_times,
+        }
+
     def compute_day_ahead_bids(self, date, hour=0):
         """
         Solve the model to bid into the day-ahead market. After solving, record
@@ -759,9 +903,7 @@ class StochasticProgramBidder(AbstractBidder):
         """
 
         _logger.info("Saving bidding results to disk.")
-        pd.concat(self.bids_result_list).to_csv(
-            os.path.join(path, "bidder_detail.csv"), index=False
-        )
+        self.bids_results.write_csv(os.path.join(path, "bidder_detail.csv"))
         self.bidding_model_object.write_results(
             path=os.path.join(path, "bidding_model_detail.csv")
         )
@@ -792,6 +934,7 @@ class SelfScheduler(StochasticProgramBidder):
         forecaster,
         real_time_underbid_penalty=10000,
         fixed_to_schedule=False,
+        decomposition=None,
     ):
         """
         Initializes the stochastic self-scheduler object.
@@ -811,6 +954,11 @@ class SelfScheduler(StochasticProgramBidder):
 
             fixed_to_schedule: If True, force market simulator to give the same schedule.
 
+            decomposition: None to solve the bidding problems with all the price
+                scenarios at once (extensive form), or a scenario decomposition
+                object, e.g., ProgressiveHedging, to solve the price scenarios
+                separately and coordinate their bids
+
         Returns:
             None
         """
@@ -823,6 +971,7 @@ class SelfScheduler(StochasticProgramBidder):
             solver,
             forecaster,
             real_time_underbid_penalty,
+            decomposition,
         )
         self.fixed_to_schedule = fixed_to_schedule
 
@@ -884,6 +1033,22 @@ class SelfScheduler(StochasticProgramBidder):
 
         return
 
+    def _project_bids(self, values, prices):
+        """
+        Project the power bids of the separately solved price scenarios onto the
+        bids that are the same across all the scenarios.
+
+        Arguments:
+            values: power bids, array of shape (n_scenario, n_time)
+
+            prices: energy prices, array of shape (n_scenario, n_time)
+
+        Returns:
+            numpy.ndarray: projected power bids
+        """
+
+        return project_nonanticipative(values)
+
     def _assemble_bids(self, model, power_var_name, energy_price_param_name, hour):
         """
         This methods extract the bids out of the stochastic programming model and
@@ -956,9 +1121,8 @@ class SelfScheduler(StochasticProgramBidder):
 
     def _record_bids(self, bids, date, hour, **kwargs):
         """
-        This function records the bids (schedule) we computed for the given date into a
-        DataFrame and temporarily stores the DataFrame in an instance attribute
-        list called bids_result_list.
+        This function records the bids (schedule) we computed for the given date in
+        the results recorder bids_results, to be written when the simulation ends.
 
         Arguments:
             bids: the obtained bids (schedule) for this date.
@@ -972,7 +1136,6 @@ class SelfScheduler(StochasticProgramBidder):
 
         """
 
-        df_list = []
         for t in bids:
             for g in bids[t]:
 
@@ -989,12 +1152,8 @@ class SelfScheduler(StochasticProgramBidder):
                 for k, v in kwargs.items():
                     result_dict[k] = v
 
-                result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-                df_list.append(result_df.T)
-
-        # save the result to object property
-        # wait to be written when simulation ends
-        self.bids_result_list.append(pd.concat(df_list))
+                # wait to be written when simulation ends
+                self.bids_results.record(**result_dict)
 
 
 class Bidder(StochasticProgramBidder):
@@ -1011,6 +1170,7 @@ class Bidder(StochasticProgramBidder):
         solver,
         forecaster,
         real_time_underbid_penalty=10000,
+        decomposition=None,
     ):
         """
         Initializes the bidder object.
@@ -1030,6 +1190,11 @@ class Bidder(StochasticProgramBidder):
 
             real_time_underbid_penalty: penalty for RT power bid that's less than DA power bid, non-negative
 
+            decomposition: None to solve the bidding problems with all the price
+                scenarios at once (extensive form), or a scenario decomposition
+                object, e.g., ProgressiveHedging, to solve the price scenarios
+                separately and coordinate their bids
+
         Returns:
             None
         """
@@ -1042,6 +1207,7 @@ class Bidder(StochasticProgramBidder):
             solver,
             forecaster,
             real_time_underbid_penalty,
+            decomposition,
         )
 
     def _add_DA_bidding_constraints(self, model):
@@ -1110,6 +1276,22 @@ class Bidder(StochasticProgramBidder):
 
         return
 
+    def _project_bids(self, values, prices):
+        """
+        Project the power bids of the separately solved price scenarios onto the
+        bids that form nondecreasing bid curves.
+
+        Arguments:
+            values: power bids, array of shape (n_scenario, n_time)
+
+            prices: energy prices, array of shape (n_scenario, n_time)
+
+        Returns:
+            numpy.ndarray: projected power bids
+        """
+
+        return project_nondecreasing(values, prices)
+
     def _assemble_bids(self, model, power_var_name, energy_price_param_name, hour):
         """
         This methods extract the bids out of the stochastic programming model and
@@ -1241,12 +1423,10 @@ class Bidder(StochasticProgramBidder):
 
     def _record_bids(self, bids, date, hour, **kwargs):
         """
-        This method records the bids we computed for the given date into a
-        DataFrame. This DataFrame has the following columns: gen, date, hour,
-        power 1, ..., power n, price 1, ..., price n. And concatenate the
-        DataFrame into a class property 'bids_result_list'. The methods then
-        temporarily stores the DataFrame in an instance attribute list called
-        bids_result_list.
+        This method records the bids we computed for the given date in the results
+        recorder bids_results, with the following columns: gen, date, hour,
+        power 1, ..., power n, price 1, ..., price n. The results are written
+        when the simulation ends.
 
         Arguments:
             bids: the obtained bids for this date.
@@ -1260,7 +1440,6 @@ class Bidder(StochasticProgramBidder):
 
         """
 
-        df_list = []
         for t in bids:
             for gen in bids[t]:
 
@@ -1285,12 +1464,8 @@ class Bidder(StochasticProgramBidder):
 
                     pair_cnt += 1
 
-                result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-                df_list.append(result_df.T)
-
-        # save the result to object property
-        # wait to be written when simulation ends
-        self.bids_result_list.append(pd.concat(df_list))
+                # wait to be written when simulation ends
+                self.bids_results.record(**result_dict)
 
         return
 
@@ -1336,7 +1511,7 @@ class ParametrizedBidder(AbstractBidder):
         self._check_inputs()
 
         self.generator = self.bidding_model_object.model_data.gen_name
-        self.bids_result_list = []
+        self.bids_results = ResultsRecorder()
 
     @property
     def generator(self):
@@ -1453,7 +1628,6 @@ class ParametrizedBidder(AbstractBidder):
             None
 
         """
-        df_list = []
         for t in bids:
             for gen in bids[t]:
 
@@ -1471,12 +1645,8 @@ class ParametrizedBidder(AbstractBidder):
                     result_dict[f"Power {idx} [MW]"] = power
                     result_dict[f"Cost {idx} [$]"] = cost
 
-                result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-                df_list.append(result_df.T)
-
-        # save the result to object property
-        # wait to be written when simulation ends
-        self.bids_result_list.append(pd.concat(df_list))
+                # wait to be written when simulation ends
+                self.bids_results.record(**result_dict)
 
         return
 
@@ -1493,9 +1663,7 @@ class ParametrizedBidder(AbstractBidder):
         """
 
         _logger.info("Saving bidding results to disk.")
-        pd.concat(self.bids_result_list).to_csv(
-            os.path.join(path, "bidder_detail.csv"), index=False
-        )
+        self.bids_results.write_csv(os.path.join(path, "bidder_detail.csv"))
         return
 
 
@@ -10,13 +10,14 @@
 # All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
 # for full copyright and license information.
 #################################################################################
-from itertools import zip_longest
 from types import ModuleType
 
 from pyomo.common.dependencies import attempt_import
 from pyomo.common.config import ConfigDict, ConfigValue
-import pyomo.environ as pyo
-from idaes.apps.grid_integration.utils import convert_marginal_costs_to_actual_costs
+from idaes.apps.grid_integration.utils import (
+    convert_marginal_costs_to_actual_costs,
+    ModelValueCopier,
+)
 
 prescient, prescient_avail = attempt_import("prescient")
 
@@ -55,6 +56,10 @@ class DoubleLoopCoordinator:
         self.tracker = tracker
         self.projection_tracker = projection_tracker
 
+        # matches the tracker model to the projection tracker model, created
+        # when the projection tracker is first updated
+        self._tracking_model_copier = None
+
     def register_plugins(self, context, options, plugin_config):
         """
         Register functionalities in Prescient's plugin system.
@@ -375,24 +380,12 @@ class DoubleLoopCoordinator:
             None
         """
 
-        # iterate all the variables and params and clone the values
-        objects_list = [pyo.Var, pyo.Param]
-        for obj in objects_list:
-            for tracker_obj, proj_tracker_obj in zip_longest(
-                self.tracker.model.component_objects(
-                    obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
-                ),
-                self.projection_tracker.model.component_objects(
-                    obj, sort=pyo.SortComponents.alphabetizeComponentAndIndex
-                ),
-            ):
-                if tracker_obj.name != proj_tracker_obj.name:
-                    raise ValueError(
-                        f"Trying to copy the value of {tracker_obj} to {proj_tracker_obj}, but they do not have the same name and possibly not the corresponding objects. Please make sure tracker and projection tracker do not diverge. "
-                    )
-                for idx in tracker_obj.index_set():
-                    if pyo.value(proj_tracker_obj[idx]) != pyo.value(tracker_obj[idx]):
-                        proj_tracker_obj[idx] = round(pyo.value(tracker_obj[idx]), 4)
+        # the variables and params of the two models are matched only once
+        if self._tracking_model_copier is None:
+            self._tracking_model_copier = ModelValueCopier(
+                self.tracker.model, self.projection_tracker.model
+            )
+        self._tracking_model_copier.copy()
 
         return
 
@@ -0,0 +1,406 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Scenario decomposition for the stochastic programming bidding problems.
+"""
+from contextlib import nullcontext
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.common.collections import ComponentMap
+
+from idaes.apps.grid_integration.utils import ModelSolver
+from idaes.core.util.parallel import fork_available, get_worker_state, worker_pool
+import idaes.logger as idaeslog
+
+_logger = idaeslog.getLogger(__name__)
+
+# Slopes of the tangent cuts used to approximate the proximal term, relative
+# to the largest first-stage decision. The slopes halve towards zero, so the
+# approximation is finer close to the target.
+_CUT_SLOPES = (0.0,) + tuple(sign * 2.0**-j for j in range(20) for sign in (-1.0, 1.0))
+
+
+def project_nonanticipative(values):
+    """
+    Project first-stage decisions onto the nonanticipativity subspace, i.e.,
+    replace the decisions in every scenario by their average.
+
+    Args:
+        values: first-stage decisions, array of shape (n_scenario, n_time)
+
+    Returns:
+        numpy.ndarray: projected decisions, same shape as values
+    """
+
+    values = np.asarray(values, dtype=float)
+    return np.broadcast_to(values.mean(axis=0), values.shape).copy()
+
+
+def project_nondecreasing(values, prices):
+    """
+    Project first-stage decisions onto the set of nondecreasing bid curves, i.e.,
+    for every time period the decision in a scenario with a higher price must
+    be at least the decision in a scenario with a lower price.
+
+    This is an isotonic regression in the price order for each time period,
+    solved with the pool adjacent violators algorithm. Scenarios with the same
+    price are not ordered with respect to each other.
+
+    Args:
+        values: first-stage decisions, array of shape (n_scenario, n_time)
+
+        prices: prices that order the scenarios, array of shape (n_scenario, n_time)
+
+    Returns:
+        numpy.ndarray: projected decisions, same shape as values
+    """
+
+    values = np.asarray(values, dtype=float)
+    prices = np.asarray(prices, dtype=float)
+    projected = np.empty_like(values)
+
+    for t in range(values.shape[1]):
+        # ties in price are sorted by value, which gives the least squares
+        # solution for the partial order
+        order = np.lexsort((values[:, t], prices[:, t]))
+
+        # pool adjacent violators: list of [mean, count] of each pool
+        pools = []
+        for y in values[order, t]:
+            pools.append([y, 1])
+            while len(pools) > 1 and pools[-2][0] > pools[-1][0]:
+                mean, count = pools.pop()
+                pools[-1][0] = (pools[-1][0] * pools[-1][1] + mean * count) / (
+                    pools[-1][1] + count
+                )
+                pools[-1][1] += count
+
+        projected[order, t] = np.repeat([p[0] for p in pools], [p[1] for p in pools])
+
+    return projected
+
+
+class ProgressiveHedging:
+    """
+    Solve a scenario-based stochastic program by progressive hedging.
+
+    Instead of solving the extensive form with all the scenarios at once, the
+    scenario subproblems are solved separately, with the coupling between the
+    scenarios' first-stage decisions relaxed. Each subproblem maximizes its
+    scenario profit minus a price on the deviation of its first-stage decisions
+    from a common target, plus a proximal penalty on that deviation. The target
+    is the projection of the subproblem decisions onto the set of coupled
+    decisions, and the prices are updated by the remaining deviation. At
+    convergence, the first-stage decisions satisfy the coupling constraints.
+
+    The proximal penalty is approximated by tangent cuts around the target, so
+    that the subproblems stay linear if the bidding model is linear.
+
+    After the iterations, the scenarios are solved once more with their
+    first-stage decisions fixed at the target, so that the second-stage
+    decisions of every scenario are consistent with the first-stage decisions.
+    A RuntimeError is raised if any scenario subproblem is not solved to
+    optimality.
+
+    Subproblems are solved in separate processes if n_workers > 1 and the
+    platform can fork processes, otherwise they are solved one after another.
+    """
+
+    def __init__(self, rho=None, tolerance=1e-3, max_iter=500, n_workers=1):
+        """
+        Initializes the progressive hedging object.
+
+        Arguments:
+            rho: penalty parameter. If None, it is set from the mean absolute
+                price of the first-stage decisions divided by the spread of the
+                decisions across the scenarios in the first iteration (Watson and
+                Woodruff, 2011).
+
+            tolerance: convergence tolerance on the root mean square deviation of
+                the first-stage decisions from the target, and on the change of
+                the target between iterations (in the units of the decisions)
+
+            max_iter: maximum number of iterations
+
+            n_workers: number of processes to solve the scenario subproblems
+
+        Returns:
+            None
+        """
+
+        if rho is not None and rho <= 0:
+            raise ValueError(f"rho should be greater than zero, but {rho} was given.")
+        if not isinstance(n_workers, int) or n_workers < 1:
+            raise ValueError(
+                f"n_workers should be a positive integer, but {n_workers} was given."
+            )
+
+        self.rho = rho
+        self.tolerance = tolerance
+        self.max_iter = max_iter
+        self.n_workers = n_workers
+
+        self._model_solvers = ComponentMap()
+
+        # stats of the last solve
+        self.iterations = 0
+        self.converged = False
+
+    def solve(self, blocks, first_stage, profit, project, prices, solver):
+        """
+        Solve the stochastic program and load the first-stage decisions of the
+        target, and the second-stage decisions of each scenario for them, into
+        the scenario blocks.
+
+        Arguments:
+            blocks: list of scenario blocks
+
+            first_stage: list with a list of first-stage variables for each
+                scenario block
+
+            profit: function that returns the profit expression of a scenario
+                block
+
+            project: function that projects an array of first-stage decisions of
+                shape (n_scenario, n_time) onto the coupled decisions
+
+            prices: array of the prices of the first-stage decisions, shape
+                (n_scenario, n_time), used to choose the default penalty parameter
+
+            solver: a Pyomo mathematical programming solver object
+
+        Returns:
+            bool: whether the solve converged
+        """
+
+        for b, x in zip(blocks, first_stage):
+            self._add_ph_components(b, x, profit)
+            if b not in self._model_solvers:
+                # solvers need a model, so wrap the scenario block in one
+                subproblem = pyo.ConcreteModel()
+                subproblem.scenario = pyo.Reference(b)
+                self._model_solvers[b] = ModelSolver(solver, subproblem)
+
+        for b in blocks:
+            b.ph.activate()
+
+        if self.n_workers > 1 and len(blocks) > 1 and fork_available():
+            # the workers are forked with the scenario blocks
+            pool_context = worker_pool(
+                (self, blocks, first_stage),
+                max_workers=min(self.n_workers, len(blocks)),
+            )
+        else:
+            pool_context = nullcontext()
+
+        weights = np.zeros((len(blocks), len(first_stage[0])))
+        targets = np.zeros_like(weights)
+        # the first iteration solves the scenarios without coupling, since the
+        # weights are zero and all the proximal cuts are flat
+        rho = 0.0
+        scale = 0.0
+        self.converged = False
+        try:
+            with pool_context as pool:
+                for k in range(self.max_iter + 1):
+                    values = self._solve_subproblems(
+                        blocks, first_stage, weights, targets, rho, scale, pool
+                    )
+
+                    if k == 0:
+                        rho = self._penalty(values, prices)
+                        scale = max(np.max(np.abs(values)), self.tolerance)
+
+                    new_targets = project(values + weights / rho)
+                    primal_res = np.sqrt(np.mean((values - new_targets) ** 2))
+                    dual_res = np.sqrt(np.mean((new_targets - targets) ** 2))
+                    weights += rho * (values - new_targets)
+                    targets = new_targets
+                    self.iterations = k
+
+                    _logger.debug(
+                        f"Progressive hedging iteration {k}: primal residual "
+                        f"{primal_res:.3e}, dual residual {dual_res:.3e}"
+                    )
+
+                    if (
+                        k > 0
+                        and primal_res <= self.tolerance
+                        and dual_res <= self.tolerance
+                    ):
+                        self.converged = True
+                        break
+
+                if not self.converged:
+                    _logger.warning(
+                        f"Progressive hedging did not converge in {self.max_iter} "
+                        "iterations."
+                    )
+
+                # solve the scenarios for the first-stage decisions of the
+                # target, which satisfy the coupling constraints
+                self._solve_subproblems(
+                    blocks,
+                    first_stage,
+                    np.zeros_like(weights),
+                    targets,
+                    0.0,
+                    scale,
+                    pool,
+                    fix_first_stage=True,
+                )
+        finally:
+            # the progressive hedging objectives must not be active when the
+            # scenario blocks are solved together
+            for b in blocks:
+                b.ph.deactivate()
+
+        return self.converged
+
+    def _penalty(self, values, prices):
+        """
+        Penalty parameter for the first-stage decisions of the first iteration.
+        """
+
+        if self.rho is not None:
+            return self.rho
+
+        spread = np.max(np.ptp(values, axis=0))
+        return max(float(np.mean(np.abs(prices))), 1e-6) / max(spread, 1.0)
+
+    @staticmethod
+    def _add_ph_components(b, first_stage, profit):
+        """
+        Add a block with the progressive hedging parameters, proximal term and
+        objective to a scenario block, if not added before.
+        """
+
+        if b.component("ph") is not None:
+            return
+
+        b.ph = pyo.Block()
+        ph = b.ph
+        ph.time = pyo.Set(initialize=range(len(first_stage)))
+        ph.cuts = pyo.Set(initialize=range(len(_CUT_SLOPES)))
+        ph.rho = pyo.Param(initialize=0, mutable=True)
+        ph.weight = pyo.Param(ph.time, initialize=0, mutable=True)
+        ph.target = pyo.Param(ph.time, initialize=0, mutable=True)
+        ph.cut_slope = pyo.Param(ph.cuts, initialize=0, mutable=True)
+        ph.prox = pyo.Var(ph.time, initialize=0, within=pyo.NonNegativeReals)
+
+        # tangents of (x - target)^2 / 2 at x - target = slope
+        @ph.Constraint(ph.time, ph.cuts)
+        def prox_cuts(ph, t, c):
+            return (
+                ph.prox[t]
+                >= ph.cut_slope[c] * (first_stage[t] - ph.target[t])
+                - 0.5 * ph.cut_slope[c] ** 2
+            )
+
+        ph.objective = pyo.Objective(
+            expr=profit(b)
+            - sum(ph.weight[t] * first_stage[t] + ph.rho * ph.prox[t] for t in ph.time),
+            sense=pyo.maximize,
+        )
+
+    def _solve_subproblems(
+        self,
+        blocks,
+        first_stage,
+        weights,
+        targets,
+        rho,
+        scale,
+        pool,
+        fix_first_stage=False,
+    ):
+        """
+        Solve the scenario subproblems and return their first-stage decisions.
+        If fix_first_stage is True, the first-stage decisions are fixed at the
+        targets.
+        """
+
+        args = [
+            (s, weights[s], targets[s], rho, scale, fix_first_stage)
+            for s in range(len(blocks))
+        ]
+
+        if pool is None:
+            for a in args:
+                _solve_subproblem(self, blocks, first_stage, *a)
+        else:
+            for s, block_values in zip(
+                range(len(blocks)), pool.map(_solve_subproblem_in_worker, args)
+            ):
+                for v, val in zip(_block_vars(blocks[s]), block_values):
+                    v.set_value(val, skip_validation=True)
+
+        return np.array([[pyo.value(v) for v in x] for x in first_stage])
+
+
+def _block_vars(b):
+    return b.component_data_objects(pyo.Var, descend_into=True, sort=True)
+
+
+def _solve_subproblem(
+    ph, blocks, first_stage, s, weights, targets, rho, scale, fix_first_stage
+):
+    """
+    Set the progressive hedging parameters of a scenario block and solve it.
+    If fix_first_stage is True, the first-stage decisions are fixed at the
+    targets during the solve.
+    """
+
+    b = blocks[s]
+    b.ph.rho = rho
+    for t in b.ph.time:
+        b.ph.weight[t] = float(weights[t])
+        b.ph.target[t] = float(targets[t])
+    for c in b.ph.cuts:
+        b.ph.cut_slope[c] = _CUT_SLOPES[c] * scale
+
+    fixed = []
+    if fix_first_stage:
+        for v, val in zip(first_stage[s], targets):
+            if not v.fixed:
+                v.fix(float(val))
+                fixed.append(v)
+    try:
+        results = ph._model_solvers[b].solve(tee=False)
+    except RuntimeError as err:
+        # some solver interfaces raise if they cannot load a solution
+        raise RuntimeError(
+            f"The subproblem of scenario {s} was not solved to optimality: {err}"
+        ) from err
+    finally:
+        for v in fixed:
+            v.unfix()
+
+    if not pyo.check_optimal_termination(results):
+        raise RuntimeError(
+            f"The subproblem of scenario {s} was not solved to optimality "
+            f"(termination condition: {results.solver.termination_condition})."
+        )
+
+
+def _solve_subproblem_in_worker(args):
+    """
+    Solve a scenario subproblem in a worker process and return the values of
+    all the variables in the scenario block.
+    """
+
+    ph, blocks, first_stage = get_worker_state()
+    _solve_subproblem(ph, blocks, first_stage, *args)
+
+    return [v.value for v in _block_vars(blocks[args[0]])]
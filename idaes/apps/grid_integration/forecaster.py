@@ -11,9 +11,12 @@
 # for full copyright and license information.
 #################################################################################
 from abc import ABC, abstractmethod
+from collections.abc import Mapping
 from numbers import Real
 import pandas as pd
 import numpy as np
+from pyomo.common.deprecation import deprecation_warning
+
 import idaes.logger as idaeslog
 
 _logger = idaeslog.getLogger(__name__)
@@ -53,6 +56,43 @@ class AbstractPriceForecaster(ABC):
 
         """
 
+    def forecast_day_ahead_and_real_time_prices_batch(
+        self, date, hour, buses, horizon, n_samples
+    ):
+        """
+        Forecast both day-ahead and real-time market prices for several buses at
+        once. By default, the prices are forecast bus by bus.
+
+        Arguments:
+            date: intended date of the forecasts
+
+            hour: intended hour of the forecasts
+
+            buses: list of intended buses of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            numpy.ndarray: day-ahead price forecasts, shape (n_buses, n_samples, horizon)
+
+            numpy.ndarray: real-time price forecasts, shape (n_buses, n_samples, horizon)
+
+        """
+
+        da_forecasts = np.empty((len(buses), n_samples, horizon))
+        rt_forecasts = np.empty((len(buses), n_samples, horizon))
+        for i, bus in enumerate(buses):
+            da_forecast, rt_forecast = self.forecast_day_ahead_and_real_time_prices(
+                date, hour, bus, horizon, n_samples
+            )
+            for j in range(n_samples):
+                da_forecasts[i, j] = da_forecast[j]
+                rt_forecasts[i, j] = rt_forecast[j]
+
+        return da_forecasts, rt_forecasts
+
     @abstractmethod
     def forecast_real_time_prices(self, date, hour, bus, horizon, n_samples):
         """
@@ -275,15 +315,71 @@ class PlaceHolderForecaster(AbstractPrescientPriceForecaster):
             dict: real-time price forecasts
         """
 
-        corresponding_means = [means[t % 24] for t in range(hour, hour + horizon)]
-        corresponding_stds = [stds[t % 24] for t in range(hour, hour + horizon)]
+        forecasts_arr = self._sample(means, stds, hour, (n_samples, horizon))
+
+        return {i: list(forecasts_arr[i]) for i in range(n_samples)}
+
+    @staticmethod
+    def _sample(means, stds, hour, size):
+        """
+        Sample nonnegative prices for the time periods from hour onwards.
+
+        Arguments:
+            means: list of price means
+
+            stds: list of price standard deviations
+
+            hour: intended hour of the forecasts
+
+            size: shape of the samples, the last dimension is the horizon
+
+        Returns:
+            numpy.ndarray: price samples
+        """
+
+        hours = np.arange(hour, hour + size[-1]) % 24
 
         forecasts_arr = np.random.normal(
-            loc=corresponding_means, scale=corresponding_stds, size=(n_samples, horizon)
+            loc=np.asarray(means)[hours], scale=np.asarray(stds)[hours], size=size
         )
         forecasts_arr[forecasts_arr < 0] = 0
 
-        return {i: list(forecasts_arr[i]) for i in range(n_samples)}
+        return forecasts_arr
+
+    def forecast_day_ahead_and_real_time_prices_batch(
+        self, date, hour, buses, horizon, n_samples
+    ):
+        """
+        Forecast both day-ahead and real-time market prices for several buses at
+        once.
+
+        Arguments:
+            date: intended date of the forecasts
+
+            hour: intended hour of the forecasts
+
+            buses: list of intended buses of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            numpy.ndarray: day-ahead price forecasts, shape (n_buses, n_samples, horizon)
+
+            numpy.ndarray: real-time price forecasts, shape (n_buses, n_samples, horizon)
+
+        """
+
+        size = (len(buses), n_samples, horizon)
+        rt_forecast = self._sample(
+            self.daily_rt_price_means, self.daily_rt_price_stds, hour, size
+        )
+        da_forecast = self._sample(
+            self.daily_da_price_means, self.daily_da_price_stds, hour, size
+        )
+
+        return da_forecast, rt_forecast
 
     def fetch_hourly_stats_from_prescient(self, prescient_hourly_stats):
         """
@@ -318,6 +414,154 @@ class PlaceHolderForecaster(AbstractPrescientPriceForecaster):
         return
 
 
+class _PriceHistory(Mapping):
+    """
+    Hourly prices of the last days at a set of buses, stored in a ring buffer of
+    days for each bus, so that adding a day does not move the stored prices.
+
+    As a mapping, it maps each bus to the list of its prices, from the oldest to
+    the newest.
+    """
+
+    def __init__(self, prices, max_days):
+        """
+        Initialize the price history.
+
+        Arguments:
+            prices: dictionary of list for hourly prices, the number of prices
+                    for each bus must be a multiple of 24
+
+            max_days: maximum number of days of prices to store
+
+        Returns:
+            None
+        """
+
+        self.buses = list(prices)
+        self.bus_index = {b: i for i, b in enumerate(self.buses)}
+        self.max_days = max_days
+
+        n_buses = len(self.buses)
+        self._data = np.zeros((n_buses, max_days, 24))
+        # position of the oldest day, and number of days stored for each bus
+        self._start = np.zeros(n_buses, dtype=int)
+        self._n_days = np.zeros(n_buses, dtype=int)
+        for i, b in enumerate(self.buses):
+            days = np.asarray(prices[b], dtype=float).reshape(-1, 24)[-max_days:]
+            self._data[i, : len(days)] = days
+            self._n_days[i] = len(days)
+
+        # dictionary of lists of the stored prices, built when it is needed
+        if all(len(prices[b]) <= max_days * 24 for b in self.buses):
+            self._dict = prices
+        else:
+            self._dict = None
+        # dictionary returned by returned_dict, and a copy of it
+        self._returned = None
+
+    def __getitem__(self, bus):
+        i = self.bus_index[bus]
+        days = (self._start[i] + np.arange(self._n_days[i])) % self.max_days
+        return self._data[i, days].ravel().tolist()
+
+    def __iter__(self):
+        return iter(self.buses)
+
+    def __len__(self):
+        return len(self.buses)
+
+    def to_dict(self):
+        """
+        Return the stored prices as a dictionary of lists.
+
+        Returns:
+            dict: stored prices
+        """
+
+        if self._dict is None:
+            self._dict = {b: self[b] for b in self.buses}
+        return self._dict
+
+    def returned_dict(self):
+        """
+        Return the stored prices as a dictionary of lists, which is watched for
+        changes made in place, see `changed_in_place`.
+
+        Returns:
+            dict: stored prices
+        """
+
+        prices = self.to_dict()
+        self._returned = (prices, {b: list(p) for b, p in prices.items()})
+        return prices
+
+    def changed_in_place(self):
+        """
+        Check if the dictionary last returned by `returned_dict` was changed in
+        place since it was returned.
+
+        Returns:
+            dict: the changed dictionary, or None if it was not changed
+        """
+
+        if self._returned is None:
+            return None
+        prices, copied = self._returned
+        if prices == copied:
+            return None
+        self._returned = None
+        return prices
+
+    def append_day(self, prices):
+        """
+        Store the prices of a new day, replacing the oldest day for the buses
+        that already have max_days of prices.
+
+        Arguments:
+            prices: array of the new prices, shape (n_buses, 24)
+
+        Returns:
+            None
+        """
+
+        full = self._n_days == self.max_days
+        pos = (self._start + self._n_days) % self.max_days
+        self._data[np.arange(len(self.buses)), pos] = prices
+        self._start = np.where(full, (self._start + 1) % self.max_days, self._start)
+        self._n_days = np.minimum(self._n_days + 1, self.max_days)
+        self._dict = None
+
+    def backcast(self, bus_index, hour, horizon, n_samples):
+        """
+        Use the stored prices as samples of the future prices: sample i starts
+        from the given hour of the i-th newest day (cycling through the days),
+        and wraps around to the oldest day at the end of the stored prices.
+
+        Arguments:
+            bus_index: list of the indices of the buses
+
+            hour: hour of the first time period
+
+            horizon: number of the time periods
+
+            n_samples: number of the samples
+
+        Returns:
+            numpy.ndarray: price samples, shape (n_buses, n_samples, horizon)
+        """
+
+        bus_index = np.asarray(bus_index)[:, None, None]
+        n_days = self._n_days[bus_index]
+        sample = np.arange(n_samples)[None, :, None]
+        day_idx = n_days - (sample % n_days) - 1
+
+        # position in the prices from the oldest to the newest
+        t = (day_idx * 24 + hour + np.arange(horizon)[None, None, :]) % (n_days * 24)
+        day = (self._start[bus_index] + t // 24) % self.max_days
+
+        return self._data[bus_index, day, t % 24]
+
+
 class Backcaster(AbstractPrescientPriceForecaster):
     """
     Generate price forecasts by directly using historical prices.
@@ -343,7 +587,6 @@ class Backcaster(AbstractPrescientPriceForecaster):
         self.max_historical_days = max_historical_days
         self.historical_da_prices = historical_da_prices
         self.historical_rt_prices = historical_rt_prices
-        self._current_day_rt_prices = {bus: [] for bus in historical_da_prices}
 
     def _validate_input_historical_price(self, historical_price):
         """
@@ -430,16 +673,27 @@ class Backcaster(AbstractPrescientPriceForecaster):
 
         self._max_historical_days = value
 
+        # keep the newest days of the stored prices
+        for name in ("_historical_da_prices", "_historical_rt_prices"):
+            history = getattr(self, name, None)
+            if history is not None and history.max_days != value:
+                setattr(self, name, _PriceHistory(history.to_dict(), value))
+
     @property
     def historical_da_prices(self):
         """
         Property getter for historical_da_prices.
 
+        Changing the returned dictionary in place is deprecated: the changes
+        are stored, with a deprecation warning, the next time prices are
+        forecast or fetched. Assign the changed prices to historical_da_prices
+        instead.
+
         Returns:
             dict: saved historical day-ahead prices
         """
 
-        return self._historical_da_prices
+        return self._historical_da_prices.returned_dict()
 
     @historical_da_prices.setter
     def historical_da_prices(self, value):
@@ -454,18 +708,23 @@ class Backcaster(AbstractPrescientPriceForecaster):
         """
 
         self._validate_input_historical_price(value)
-        self._historical_da_prices = value
+        self._historical_da_prices = _PriceHistory(value, self.max_historical_days)
 
     @property
     def historical_rt_prices(self):
         """
         Property getter for historical_rt_prices.
 
+        Changing the returned dictionary in place is deprecated: the changes
+        are stored, with a deprecation warning, the next time prices are
+        forecast or fetched. Assign the changed prices to historical_rt_prices
+        instead.
+
         Returns:
             dict: saved historical real-time prices
         """
 
-        return self._historical_rt_prices
+        return self._historical_rt_prices.returned_dict()
 
     @historical_rt_prices.setter
     def historical_rt_prices(self, value):
@@ -480,7 +739,60 @@ class Backcaster(AbstractPrescientPriceForecaster):
         """
 
         self._validate_input_historical_price(value)
-        self._historical_rt_prices = value
+        self._historical_rt_prices = _PriceHistory(value, self.max_historical_days)
+
+        # real-time prices of the current day, not complete yet
+        self._current_day_rt = np.empty((len(value), 24))
+        self._n_current_day_hours = 0
+
+    def _store_changed_prices(self):
+        """
+        Store the historical prices again if the dictionary returned by
+        historical_da_prices or historical_rt_prices was changed in place, which
+        is deprecated.
+
+        Returns:
+            None
+        """
+
+        for name in ("historical_da_prices", "historical_rt_prices"):
+            history = getattr(self, "_" + name)
+            prices = history.changed_in_place()
+            if prices is None:
+                continue
+
+            deprecation_warning(
+                msg=f"Changing the dictionary returned by Backcaster.{name} in "
+                f"place has been DEPRECATED. Assign the changed prices to {name} "
+                "instead.",
+                logger=_logger,
+                version="2.6.0",
+                remove_in="3.0.0",
+            )
+            self._validate_input_historical_price(prices)
+            new_history = _PriceHistory(prices, self.max_historical_days)
+            new_history.returned_dict()
+            setattr(self, "_" + name, new_history)
+
+            # real-time prices of the current day are kept for the same buses
+            if name == "historical_rt_prices" and new_history.buses != history.buses:
+                self._current_day_rt = np.empty((len(new_history.buses), 24))
+                self._n_current_day_hours = 0
+
+    @property
+    def _current_day_rt_prices(self):
+        """
+        Real-time prices of the current day, which are not added to the
+        historical prices until the day is complete.
+
+        Returns:
+            dict: real-time prices of the current day
+        """
+
+        return {
+            b: self._current_day_rt[i, : self._n_current_day_hours].tolist()
+            for i, b in enumerate(self._historical_rt_prices.buses)
+        }
 
     def forecast_day_ahead_and_real_time_prices(
         self, date, hour, bus, horizon, n_samples
@@ -535,8 +847,9 @@ class Backcaster(AbstractPrescientPriceForecaster):
 
         """
 
+        self._store_changed_prices()
         return self._forecast(
-            historical_price_dict=self.historical_rt_prices,
+            historical_price_dict=self._historical_rt_prices,
             market="real-time",
             date=date,
             hour=hour,
@@ -565,8 +878,9 @@ class Backcaster(AbstractPrescientPriceForecaster):
 
         """
 
+        self._store_changed_prices()
         return self._forecast(
-            historical_price_dict=self.historical_da_prices,
+            historical_price_dict=self._historical_da_prices,
             market="day-ahead",
             date=date,
             hour=0,
@@ -583,7 +897,7 @@ class Backcaster(AbstractPrescientPriceForecaster):
 
         Arguments:
 
-            historical_price_dict: the dictionary that holds the intended historical prices
+            historical_price_dict: the price history that holds the intended historical prices
 
             market: the market that the price forecast is for, e.g., day-ahead
 
@@ -605,20 +919,56 @@ class Backcaster(AbstractPrescientPriceForecaster):
         if bus not in historical_price_dict:
             raise ForecastError(f"No {bus} {market} price available.")
 
-        historical_price_len = len(historical_price_dict[bus])
-        n_days = historical_price_len // 24
+        forecast = historical_price_dict.backcast(
+            [historical_price_dict.bus_index[bus]], hour, horizon, n_samples
+        )[0]
 
-        forecast = {}
+        return {i: forecast[i].tolist() for i in range(n_samples)}
 
-        for i in range(n_samples):
-            day_idx = n_days - (i % n_days) - 1
+    def forecast_day_ahead_and_real_time_prices_batch(
+        self, date, hour, buses, horizon, n_samples
+    ):
+        """
+        Forecast both day-ahead and real-time market prices for several buses at
+        once.
 
-            forecast[i] = [
-                historical_price_dict[bus][t % historical_price_len]
-                for t in range(day_idx * 24 + hour, day_idx * 24 + hour + horizon)
-            ]
+        Arguments:
+            date: intended date of the forecasts
 
-        return forecast
+            hour: intended hour of the forecasts
+
+            buses: list of intended buses of the forecasts
+
+            horizon: number of the time periods of the forecasts
+
+            n_samples: number of the samples
+
+        Returns:
+            numpy.ndarray: day-ahead price forecasts, shape (n_buses, n_samples, horizon)
+
+            numpy.ndarray: real-time price forecasts, shape (n_buses, n_samples, horizon)
+
+        """
+
+        self._store_changed_prices()
+        forecasts = []
+        for history, market, start_hour in (
+            (self._historical_da_prices, "day-ahead", 0),
+            (self._historical_rt_prices, "real-time", hour),
+        ):
+            for bus in buses:
+                if bus not in history:
+                    raise ForecastError(f"No {bus} {market} price available.")
+            forecasts.append(
+                history.backcast(
+                    [history.bus_index[b] for b in buses],
+                    start_hour,
+                    horizon,
+                    n_samples,
+                )
+            )
+
+        return tuple(forecasts)
 
     def fetch_hourly_stats_from_prescient(self, prescient_hourly_stats):
         """
@@ -633,21 +983,20 @@ class Backcaster(AbstractPrescientPriceForecaster):
             None
         """
 
-        # save the newest rt prices
-        for b, price_list in self._current_day_rt_prices.items():
-            price_list.append(prescient_hourly_stats.observed_bus_LMPs[b])
-
-        # update the historical
-        for b in self._current_day_rt_prices:
-
-            # if a full day's data is ready, get them ready for future forecasts
-            if len(self._current_day_rt_prices[b]) >= 24:
-                self._historical_rt_prices[b] += self._current_day_rt_prices[b]
-                self._current_day_rt_prices[b] = []
+        self._store_changed_prices()
 
-            # drop oldest historical prices if total stored data exceeded the upper bound
-            while len(self._historical_rt_prices[b]) // 24 > self.max_historical_days:
-                self._historical_rt_prices[b] = self._historical_rt_prices[b][24:]
+        # save the newest rt prices
+        lmps = prescient_hourly_stats.observed_bus_LMPs
+        self._current_day_rt[:, self._n_current_day_hours] = [
+            lmps[b] for b in self._historical_rt_prices.buses
+        ]
+        self._n_current_day_hours += 1
+
+        # if a full day's data is ready, get them ready for future forecasts, and
+        # drop the oldest historical prices if the stored data exceeds the upper bound
+        if self._n_current_day_hours == 24:
+            self._historical_rt_prices.append_day(self._current_day_rt)
+            self._n_current_day_hours = 0
 
         return
 
@@ -668,17 +1017,17 @@ class Backcaster(AbstractPrescientPriceForecaster):
             None
         """
 
-        for b in self._historical_da_prices:
+        self._store_changed_prices()
 
-            # save the newest da prices
-            self._historical_da_prices[b] += [
-                day_ahead_result.ruc_market.day_ahead_prices.get((b, t))
-                for t in range(24)
+        # save the newest da prices, and drop the oldest historical prices if
+        # the stored data exceeds the upper bound
+        day_ahead_prices = day_ahead_result.ruc_market.day_ahead_prices
+        self._historical_da_prices.append_day(
+            [
+                [day_ahead_prices.get((b, t)) for t in range(24)]
+                for b in self._historical_da_prices.buses
             ]
-
-            # drop oldest historical prices if total stored data exceeded the upper bound
-            while len(self._historical_da_prices[b]) // 24 > self.max_historical_days:
-                self._historical_da_prices[b] = self._historical_da_prices[b][24:]
+        )
 
         return
 
@@ -11,8 +11,10 @@
 # for full copyright and license information.
 #################################################################################
 import pyomo.environ as pyo
+from pyomo.common.collections import ComponentMap
 from idaes.core.solvers import get_solver
-from idaes.core.util.exceptions import InitializationError
+from idaes.core.util.exceptions import ConfigurationError, InitializationError
+from idaes.core.util.var_snapshot import VarSnapshot
 import matplotlib.pyplot as plt
 import logging
 
@@ -88,6 +90,14 @@ class MultiPeriodModel(pyo.ConcreteModel):
 
         # populated on 'build_multi_period_model'
         self._first_active_time = None
+        # state of the first block when it was built, used to reset blocks
+        # in 'advance_time_rolling'
+        self._template_state = None
+        # time indices of the blocks in the order of the horizon, used
+        # by 'advance_time_rolling'
+        self._ring = None
+        # variables and mutable parameters of each block, in the same order
+        self._block_components = ComponentMap()
 
         # Create sets
         if use_stochastic_build:
@@ -139,6 +149,7 @@ class MultiPeriodModel(pyo.ConcreteModel):
         initialization_options=None,
         unfix_dof_options=None,
         solver=None,
+        set_data_func=None,
     ):
         """
         Build a multi-period capable model using user-provided functions
@@ -147,11 +158,17 @@ class MultiPeriodModel(pyo.ConcreteModel):
             model_data_kwargs: a dict of dicts with {time:{"key",value}}
                                where `time` is the time in the horizon. each
                                `time` dictionary is passed to the
-                               `create_process_model` function
+                               `create_process_model` function, or to
+                               `set_data_func` if it is provided
             flowsheet_options: dict containing the arguments needed to build an instance of flowsheet
             initialization_options: dict containing the arguments needed for `initialization_func`
             unfix_dof_options: dict containing the arguments needed for `unfix_dof_func`
             solver: pyomo solver object
+            set_data_func: function that sets the data of a time period on a flowsheet,
+                           called as set_data_func(process_block, **model_data_kwargs[time]).
+                           If provided, only one flowsheet is constructed and initialized,
+                           and the flowsheets of all time periods are cloned from it, which
+                           is much faster than constructing each of them.
         """
         if flowsheet_options is None:
             flowsheet_options = {}
@@ -169,12 +186,25 @@ class MultiPeriodModel(pyo.ConcreteModel):
         # will be required or not in general, so this is what I'm going to do:
         # If the argument is not provided, then use clone and initialize. If it
         # is provided, then return the multiperiod model without initialization.
+        # If set_data_func is also provided, the data of each time instance is
+        # set on a clone of the initialized flowsheet instead.
 
         m = self
         m.TIME = pyo.Set(initialize=range(self.n_time_points))
         m.blocks = pyo.Block(m.TIME)
 
-        if model_data_kwargs is None:
+        if (
+            model_data_kwargs is not None
+            and len(model_data_kwargs) != self.n_time_points
+        ):
+            _logger.error(
+                f"len(model_data_kwargs) != n_time_points.\n "
+                f"len(model_data_kwargs) = {len(model_data_kwargs)}\n"
+                f"len(n_time_points) = {self.n_time_points}\n"
+                f"Check input data for model_data_kwargs argument."
+            )
+
+        if model_data_kwargs is None or set_data_func is not None:
             blk = self._construct_flowsheet_instance(
                 flowsheet_options=flowsheet_options,
                 initialization_options=initialization_options,
@@ -184,16 +214,11 @@ class MultiPeriodModel(pyo.ConcreteModel):
             for t in m.TIME:
                 _logger.info(f"Constructing flowsheet model for time index {t}")
                 m.blocks[t].process = blk.clone()
+                # only the data of the time period differs from the template
+                if model_data_kwargs is not None:
+                    set_data_func(m.blocks[t].process, **model_data_kwargs[t])
 
         else:
-            if len(model_data_kwargs) != self.n_time_points:
-                _logger.error(
-                    f"len(model_data_kwargs) != n_time_points.\n "
-                    f"len(model_data_kwargs) = {len(model_data_kwargs)}\n"
-                    f"len(n_time_points) = {self.n_time_points}\n"
-                    f"Check input data for model_data_kwargs argument."
-                )
-
             _logger.warning(
                 f"model_data_kwargs argument is provided, so the flowsheet "
                 f"options are different for different time instances. In this case, "
@@ -220,6 +245,7 @@ class MultiPeriodModel(pyo.ConcreteModel):
             )
 
         self._first_active_time = m.TIME.first()
+        self._template_state = self._get_block_state(m.blocks[m.TIME.first()].process)
         return m
 
     def advance_time(self, **model_data_kwargs):
@@ -230,6 +256,12 @@ class MultiPeriodModel(pyo.ConcreteModel):
             model_data_kwargs: keyword arguments passed to user provided
                                `create_process_model` function
         """
+        if self._ring is not None:
+            raise ConfigurationError(
+                "advance_time cannot be used after advance_time_rolling, since the "
+                "time blocks are reused for new time periods."
+            )
+
         m = self
         previous_time = self._first_active_time
         current_time = m.TIME.next(previous_time)
@@ -276,6 +308,144 @@ class MultiPeriodModel(pyo.ConcreteModel):
         #                       m.blocks[current_time].process,
         #                       state_variable_pairs)
 
+    def advance_time_rolling(self, update_func=None, warm_start=False, **update_kwargs):
+        """
+        Advance the current model instance to the next time period, reusing the
+        block of the oldest time period for the new time period, so that the size
+        of the model does not grow.
+
+        The block of the oldest time period is reset to the state the first block
+        had when the model was built (variable values, fixed variables and values
+        of mutable parameters), and moved to the end of the horizon. The linking
+        and periodic constraints are updated in place. The other blocks keep
+        their values, i.e., the solution of the previous horizon is shifted by
+        one time period.
+
+        Arguments:
+            update_func: function that updates the process model of the new time
+                         period, called as update_func(process_block, **update_kwargs)
+            warm_start: if True, the values of the variables in the new time period
+                        that are not fixed are copied from the previous last time
+                        period, instead of being reset
+            update_kwargs: keyword arguments passed to `update_func`
+        """
+        m = self
+        if self._ring is None:
+            if len(m.TIME) != self.n_time_points or self._template_state is None:
+                raise ConfigurationError(
+                    "advance_time_rolling can only be used with a model built by "
+                    "build_multi_period_model, and not after advance_time."
+                )
+            self._ring = list(m.TIME)
+
+        ring = self._ring
+        oldest_time, last_time = ring[0], ring[-1]
+        ring.append(ring.pop(0))
+        self._first_active_time += 1
+
+        new_blk = m.blocks[oldest_time].process
+        last_blk = m.blocks[last_time].process
+        self._set_block_state(
+            new_blk,
+            self._template_state,
+            warm_start_blk=last_blk if warm_start else None,
+        )
+        if update_func is not None:
+            update_func(new_blk, **update_kwargs)
+
+        # sequential time coupling: the previous last block now links to the new
+        # block, which is at the end of the horizon and does not link forward
+        self._update_constraints(
+            last_blk,
+            "link_constraints",
+            self.get_linking_variable_pairs(last_blk, new_blk),
+        )
+        if new_blk.component("link_constraints") is not None:
+            new_blk.link_constraints.deactivate()
+
+        # periodic time coupling
+        if self.get_periodic_variable_pairs is not None:
+            last_blk.periodic_constraints.deactivate()
+            self._update_constraints(
+                new_blk,
+                "periodic_constraints",
+                self.get_periodic_variable_pairs(new_blk, m.blocks[ring[0]].process),
+            )
+
+    def _get_components(self, b):
+        """
+        Variables and mutable parameters of block `b`, in the same order for all
+        blocks with the same structure
+        """
+        if b not in self._block_components:
+            variables = list(b.component_data_objects(pyo.Var, descend_into=True))
+            params = [
+                p
+                for param in b.component_objects(pyo.Param, descend_into=True)
+                if param.mutable
+                for p in param.values()
+            ]
+            self._block_components[b] = (variables, params)
+        return self._block_components[b]
+
+    def _get_block_state(self, b):
+        """
+        Values of the variables and mutable parameters of block `b`, and the
+        fixed status of the variables
+        """
+        params = self._get_components(b)[1]
+        return (
+            VarSnapshot(b),
+            [pyo.value(p, exception=False) for p in params],
+        )
+
+    def _set_block_state(self, b, state, warm_start_blk=None):
+        """
+        Set the state of block `b`. If `warm_start_blk` is given, the values of
+        the variables that are not fixed are copied from it.
+        """
+        variables, params = self._get_components(b)
+        var_state, param_values = state
+        if len(variables) != len(var_state) or len(params) != len(param_values):
+            raise ConfigurationError(
+                f"The structure of block {b.name} differs from the first block, "
+                f"so it cannot be reset for a new time period."
+            )
+
+        if warm_start_blk is not None:
+            warm_start_values = [
+                v.value for v in self._get_components(warm_start_blk)[0]
+            ]
+        for i, v in enumerate(variables):
+            v.fixed = bool(var_state.fixed[i])
+            if warm_start_blk is not None and not v.fixed:
+                val = warm_start_values[i]
+            else:
+                val = var_state.values[i].item() if var_state.has_value[i] else None
+            v.set_value(val, skip_validation=True)
+
+        for p, val in zip(params, param_values):
+            p.set_value(val)
+
+    def _update_constraints(self, b1, name, variable_pairs):
+        """
+        Set the constraints `name` on `b1` to link the `variable_pairs`, reusing
+        the constraints if `b1` already has them
+        """
+        con = b1.component(name)
+        if con is not None and len(con) == len(variable_pairs):
+            for i, pair in enumerate(variable_pairs):
+                con[i].set_value(pair[0] == pair[1])
+            con.activate()
+            return
+
+        if con is not None:
+            b1.del_component(con)
+        if name == "link_constraints":
+            self._create_linking_constraints(b1, variable_pairs)
+        else:
+            self._create_periodic_constraints(b1, variable_pairs)
+
     @property
     def pyomo_model(self):
         """
@@ -292,8 +462,11 @@ class MultiPeriodModel(pyo.ConcreteModel):
 
     def get_active_process_blocks(self):
         """
-        Retrieve the active time blocks of the pyomo model
+        Retrieve the active time blocks of the pyomo model, in the order of the
+        time horizon
         """
+        if self._ring is not None:
+            return [self.blocks[t].process for t in self._ring]
         return [b.process for b in self.blocks.values() if b.process.active]
 
     def _create_linking_constraints(self, b1, variable_pairs):
@@ -15,13 +15,22 @@
 
 __author__ = "Radhakrishna Tumbalam Gooty"
 
+import gc
+
 import pytest
 import matplotlib.pyplot as plt
 import pyomo.environ as pyo
+from pyomo.common import unittest
+from pyomo.common.timing import TicTocTimer
+from pyomo.common.collections import ComponentSet
+from pyomo.core.expr.visitor import identify_variables
 from idaes.core import FlowsheetBlock
+from idaes.core.util.testing import PhysicalParameterTestBlock
+from idaes.models.unit_models import Heater
 from idaes.apps.grid_integration.multiperiod.multiperiod import MultiPeriodModel
 from idaes.core.util.model_statistics import degrees_of_freedom
-from idaes.core.util.exceptions import InitializationError
+from idaes.core.util.performance import PerformanceBaseClass
+from idaes.core.util.exceptions import ConfigurationError, InitializationError
 import idaes.logger as idaeslog
 
 
@@ -594,3 +603,204 @@ def test_multi_period_model_manual(build_multi_period_model_manual):
     assert len(m.blocks) == 5
 
     assert degrees_of_freedom(m) == 1
+
+
+def build_flowsheet_with_param(m):
+    """This function builds a dummy flowsheet with a mutable parameter"""
+    build_flowsheet(m)
+    m.fs.demand = pyo.Param(initialize=1, mutable=True)
+    m.fs.con1.set_value(m.fs.x + m.fs.y == m.fs.demand)
+    m.fs.x.set_value(0.25)
+    m.fs.y.set_value(0.75)
+
+    return m
+
+
+def update_demand(m, demand):
+    m.fs.demand = demand
+
+
+def assert_links(con, var1, var2):
+    """Check that a linking constraint contains exactly var1 and var2"""
+    assert ComponentSet(identify_variables(con.body)) == ComponentSet([var1, var2])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("periodic", [False, True])
+def test_advance_time_rolling(periodic):
+    m = MultiPeriodModel(
+        n_time_points=3,
+        process_model_func=build_flowsheet_with_param,
+        linking_variable_func=get_linking_variable_pairs,
+        periodic_variable_func=get_linking_variable_pairs if periodic else None,
+    )
+    m.build_multi_period_model()
+    assert m.current_time == 0
+
+    # change the solution, to check that the recycled blocks are reset
+    for t in m.TIME:
+        m.blocks[t].process.fs.x.set_value(10 + t)
+    m.blocks[0].process.fs.y.fix(0.5)
+
+    m.advance_time_rolling(update_func=update_demand, demand=2)
+
+    assert m.current_time == 1
+    assert len(m.blocks) == 3
+    assert [b.index() for b in m.blocks.values()] == [0, 1, 2]
+    blks = m.get_active_process_blocks()
+    assert blks == [m.blocks[t].process for t in (1, 2, 0)]
+
+    # the recycled block is reset and updated, the others are kept
+    new_blk = blks[-1]
+    assert new_blk.fs.x.value == 0.25
+    assert not new_blk.fs.y.fixed
+    assert pyo.value(new_blk.fs.demand) == 2
+    assert blks[0].fs.x.value == 11
+
+    # linking constraints follow the new order
+    assert blks[0].link_constraints.active
+    assert blks[1].link_constraints.active
+    assert not new_blk.link_constraints.active
+    assert_links(blks[0].link_constraints[0], blks[0].fs.y, blks[1].fs.y)
+    assert_links(blks[1].link_constraints[0], blks[1].fs.y, new_blk.fs.y)
+    if periodic:
+        assert new_blk.periodic_constraints.active
+        assert not blks[1].periodic_constraints.active
+        assert_links(new_blk.periodic_constraints[0], new_blk.fs.y, blks[0].fs.y)
+    assert degrees_of_freedom(m) == (0 if periodic else 1)
+
+    m.advance_time_rolling(warm_start=True)
+    blks = m.get_active_process_blocks()
+    assert blks == [m.blocks[t].process for t in (2, 0, 1)]
+    # variables of the new block are copied from the previous last block
+    assert blks[-1].fs.x.value == 0.25
+    assert pyo.value(blks[-1].fs.demand) == 1
+
+    # the model size does not change over many time periods
+    n_vars = len(list(m.component_data_objects(pyo.Var)))
+    n_cons = len(list(m.component_data_objects(pyo.Constraint)))
+    for _ in range(5):
+        m.advance_time_rolling()
+    assert m.current_time == 7
+    assert len(list(m.component_data_objects(pyo.Var))) == n_vars
+    assert len(list(m.component_data_objects(pyo.Constraint))) == n_cons
+    assert degrees_of_freedom(m) == (0 if periodic else 1)
+
+    with pytest.raises(ConfigurationError, match="advance_time cannot be used"):
+        m.advance_time()
+
+
+def build_heater_flowsheet(m=None, demand=1):
+    """This function builds a flowsheet with a unit model for a given demand"""
+    if m is None:
+        m = pyo.ConcreteModel()
+
+    m.fs = FlowsheetBlock(dynamic=False)
+    m.fs.props = PhysicalParameterTestBlock()
+    m.fs.unit = Heater(property_package=m.fs.props)
+    m.fs.demand = pyo.Param(initialize=demand, mutable=True)
+
+    return m
+
+
+def get_heater_linking_variable_pairs(m1, m2):
+    """This function returns pairs of linking variables"""
+    return [(m1.fs.unit.heat_duty[0], m2.fs.unit.heat_duty[0])]
+
+
+@pytest.mark.unit
+def test_data_kwargs_set_data_func():
+    calls = []
+
+    def build(m, **kwargs):
+        calls.append(kwargs)
+        return build_flowsheet_with_param(m)
+
+    m = MultiPeriodModel(
+        n_time_points=4,
+        process_model_func=build,
+        linking_variable_func=get_linking_variable_pairs,
+    )
+    data = {t: {"demand": t + 1} for t in range(4)}
+    m.build_multi_period_model(model_data_kwargs=data, set_data_func=update_demand)
+
+    # only the template is constructed
+    assert len(calls) == 1
+    assert [pyo.value(m.blocks[t].process.fs.demand) for t in m.TIME] == [1, 2, 3, 4]
+    assert degrees_of_freedom(m) == 1
+
+
+def build_heater_multiperiod_model(n_time_points, set_data_func=None):
+    """This function builds a multiperiod model of the heater flowsheet"""
+    m = MultiPeriodModel(
+        n_time_points=n_time_points,
+        process_model_func=build_heater_flowsheet,
+        linking_variable_func=get_heater_linking_variable_pairs,
+    )
+    m.build_multi_period_model(
+        model_data_kwargs={t: {"demand": 1 + t % 24} for t in range(n_time_points)},
+        set_data_func=set_data_func,
+    )
+
+    return m
+
+
+@pytest.mark.unit
+def test_cloned_model_matches_built():
+    n_time_points = 4
+    built = build_heater_multiperiod_model(n_time_points)
+    cloned = build_heater_multiperiod_model(n_time_points, set_data_func=update_demand)
+
+    # cloning the template gives the same model as constructing each flowsheet
+    for ctype in (pyo.Var, pyo.Param, pyo.Constraint):
+        built_data = list(built.component_data_objects(ctype, descend_into=True))
+        cloned_data = list(cloned.component_data_objects(ctype, descend_into=True))
+        assert [c.name for c in cloned_data] == [c.name for c in built_data]
+
+    for v1, v2 in zip(
+        built.component_data_objects(pyo.Var, descend_into=True),
+        cloned.component_data_objects(pyo.Var, descend_into=True),
+    ):
+        assert (v2.value, v2.lb, v2.ub, v2.fixed) == (v1.value, v1.lb, v1.ub, v1.fixed)
+
+    for p1, p2 in zip(
+        built.component_data_objects(pyo.Param, descend_into=True),
+        cloned.component_data_objects(pyo.Param, descend_into=True),
+    ):
+        assert pyo.value(p2, exception=False) == pyo.value(p1, exception=False)
+
+    for c1, c2 in zip(
+        built.component_data_objects(pyo.Constraint, descend_into=True),
+        cloned.component_data_objects(pyo.Constraint, descend_into=True),
+    ):
+        assert c2.active == c1.active
+        assert str(c2.expr) == str(c1.expr)
+
+    assert [pyo.value(cloned.blocks[t].process.fs.demand) for t in cloned.TIME] == [
+        1 + t for t in range(n_time_points)
+    ]
+    assert degrees_of_freedom(cloned) == degrees_of_freedom(built)
+
+
+@pytest.mark.performance
+class TestMultiPeriodBuildPerformance(PerformanceBaseClass, unittest.TestCase):
+    n_time_points = 720
+
+    def build_model(self):
+        return build_heater_multiperiod_model(
+            self.n_time_points, set_data_func=update_demand
+        )
+
+    def test_performance(self):
+        # the multiperiod model is not square, so only the build is timed
+        gc.collect()
+        timer = TicTocTimer()
+        build_heater_multiperiod_model(self.n_time_points)
+        self.recordData("build flowsheets", timer.toc("build flowsheets"))
+
+        gc.collect()
+        timer.tic(None)
+        model = self.build_model()
+        self.recordData("clone template", timer.toc("clone template"))
+
+        assert len(model.TIME) == self.n_time_points
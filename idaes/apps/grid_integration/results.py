@@ -0,0 +1,342 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Column-oriented recording of the results of the double-loop simulation.
+"""
+import numbers
+import os
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+
+def _column_dtype(value):
+    """
+    Data type of a column of values like the given value. Integer and float
+    columns are stored as NumPy numbers, everything else as Python objects.
+    """
+
+    if isinstance(value, (bool, np.bool_)):
+        return np.dtype(object)
+    if isinstance(value, numbers.Integral):
+        return np.dtype(np.int64)
+    if isinstance(value, numbers.Real):
+        return np.dtype(float)
+    return np.dtype(object)
+
+
+def _accepts(dtype, value):
+    """
+    Whether a column of the given data type can store the value as it is, so
+    that it is written out the same way. Missing values are stored as NaN in
+    float columns and as None in object columns.
+    """
+
+    if dtype == object:
+        return True
+    if value is None:
+        return dtype == float
+    return _column_dtype(value) == dtype
+
+
+class _FrameList(list):
+    """
+    List of DataFrames whose appended frames are also recorded, row by row, in
+    a results recorder. It stands in for the lists of DataFrames the results
+    were kept in before they were recorded with `ResultsRecorder`.
+    """
+
+    def __init__(self, recorder):
+        super().__init__([recorder.to_dataframe()] if len(recorder) > 0 else [])
+        self._recorder = recorder
+
+    def append(self, df):
+        super().append(df)
+        self._recorder.record_frame(df)
+
+    def extend(self, dfs):
+        for df in dfs:
+            self.append(df)
+
+    def __iadd__(self, dfs):
+        self.extend(dfs)
+        return self
+
+
+class ResultsRecorder:
+    """
+    Record rows of results in preallocated NumPy column buffers.
+
+    Each call to `record` adds a row. The columns are created when they first
+    appear, and rows without a value for a column are left empty. When the
+    buffers are full, the rows are written to a chunk file on disk, which keeps
+    the data types of the columns, and the buffers are reused, so the memory used does not grow with the length of the
+    simulation. `write_csv` combines the chunks and the buffered rows into the
+    result file.
+    """
+
+    def __init__(self, chunk_size=50000, directory=None):
+        """
+        Initializes the results recorder.
+
+        Arguments:
+            chunk_size: number of rows kept in memory before they are written to
+                a chunk file
+
+            directory: directory for the chunk files. If None, a temporary
+                directory is created when the first chunk is written, and removed
+                when the recorder is cleared or garbage collected.
+
+        Returns:
+            None
+        """
+
+        if chunk_size < 1:
+            raise ValueError(
+                f"chunk_size should be a positive integer, but {chunk_size} was given."
+            )
+
+        self.chunk_size = chunk_size
+        self.directory = directory
+
+        self._tmp_dir = None
+        self._chunk_files = []
+        # data types of the columns of each chunk file
+        self._chunk_dtypes = []
+        # column names in the order they were first recorded
+        self._columns = []
+        self._buffers = {}
+        self._n_rows = 0
+        self._n_flushed = 0
+
+    def __len__(self):
+        return self._n_flushed + self._n_rows
+
+    @property
+    def columns(self):
+        """
+        Names of the recorded columns.
+        """
+        return list(self._columns)
+
+    def record(self, **row):
+        """
+        Record a row of results.
+
+        Arguments:
+            row: values of the row, keyed by column name
+
+        Returns:
+            None
+        """
+
+        if self._n_rows == self.chunk_size:
+            self.flush()
+
+        i = self._n_rows
+        for name, value in row.items():
+            if isinstance(value, np.generic):
+                value = value.item()
+            buf = self._buffers.get(name)
+            if buf is None:
+                if name not in self._columns:
+                    self._columns.append(name)
+                buf = self._buffers[name] = self._new_buffer(value)
+            elif not _accepts(buf.dtype, value):
+                buf = self._buffers[name] = buf.astype(object)
+            buf[i] = np.nan if value is None and buf.dtype == float else value
+
+        # columns not in this row are left empty
+        for name, buf in self._buffers.items():
+            if name not in row:
+                if not _accepts(buf.dtype, None):
+                    buf = self._buffers[name] = buf.astype(object)
+                buf[i] = np.nan if buf.dtype == float else None
+
+        self._n_rows += 1
+
+    def record_frame(self, df):
+        """
+        Record the rows of a DataFrame of results.
+
+        Arguments:
+            df: pandas DataFrame, with a column for each value of the rows
+
+        Returns:
+            None
+        """
+
+        for row in df.to_dict("records"):
+            self.record(**row)
+
+    def frame_list(self):
+        """
+        Return the recorded results as a list of DataFrames. DataFrames appended
+        to the list are recorded too. This is the form the results were kept in
+        before, and it is only meant for code that still uses it.
+
+        Returns:
+            list: list with a DataFrame of the recorded results, or an empty list
+                if there are none
+        """
+
+        return _FrameList(self)
+
+    def _new_buffer(self, value):
+        # earlier rows in the buffer do not have a value for a new column
+        dtype = _column_dtype(value)
+        if value is None or (self._n_rows > 0 and not _accepts(dtype, None)):
+            dtype = np.dtype(object)
+        buf = np.empty(self.chunk_size, dtype=dtype)
+        if self._n_rows > 0:
+            buf[: self._n_rows] = np.nan if dtype == float else None
+        return buf
+
+    def _buffered_frame(self):
+        return pd.DataFrame(
+            {name: buf[: self._n_rows] for name, buf in self._buffers.items()},
+            columns=[c for c in self._columns if c in self._buffers],
+        )
+
+    def flush(self):
+        """
+        Write the rows in the buffers to a chunk file and empty the buffers.
+
+        Returns:
+            None
+        """
+
+        if self._n_rows == 0:
+            return
+
+        directory = self.directory
+        if directory is None:
+            if self._tmp_dir is None:
+                self._tmp_dir = tempfile.TemporaryDirectory(prefix="idaes_results_")
+            directory = self._tmp_dir.name
+
+        path = os.path.join(directory, f"chunk_{id(self)}_{len(self._chunk_files)}.pkl")
+        self._buffered_frame().to_pickle(path)
+        self._chunk_files.append(path)
+        self._chunk_dtypes.append(
+            {name: buf.dtype for name, buf in self._buffers.items()}
+        )
+
+        self._n_flushed += self._n_rows
+        self._n_rows = 0
+        # new columns are added to the next chunk as they appear
+        self._buffers = {}
+
+    def _column_dtypes(self):
+        """
+        Data types of the columns over all the recorded rows. A column keeps its
+        data type if it has the same one in every chunk, and can store the
+        missing values of the chunks without it. Otherwise it holds objects, as
+        in the buffers.
+        """
+
+        chunk_dtypes = list(self._chunk_dtypes)
+        if self._n_rows > 0 or not self._chunk_files:
+            chunk_dtypes.append(
+                {name: buf.dtype for name, buf in self._buffers.items()}
+            )
+
+        dtypes = {}
+        for name in self._columns:
+            # None if the column is missing in a chunk
+            column_dtypes = {d.get(name) for d in chunk_dtypes}
+            if len(column_dtypes) == 1:
+                dtypes[name] = column_dtypes.pop()
+            elif column_dtypes == {np.dtype(float), None}:
+                dtypes[name] = np.dtype(float)
+            else:
+                dtypes[name] = np.dtype(object)
+        return dtypes
+
+    def _with_dtypes(self, df, dtypes):
+        """
+        Give a chunk of rows all the columns, with their data types over all
+        the recorded rows.
+        """
+
+        columns = {}
+        for name, dtype in dtypes.items():
+            if name in df:
+                columns[name] = df[name].astype(dtype, copy=False)
+            else:
+                columns[name] = pd.Series(
+                    np.nan if dtype == float else None, index=df.index, dtype=dtype
+                )
+        return pd.DataFrame(columns, index=df.index, columns=list(dtypes))
+
+    def _frames(self):
+        """
+        Yield the recorded results with all the columns, chunk by chunk.
+        """
+
+        dtypes = self._column_dtypes()
+        for path in self._chunk_files:
+            yield self._with_dtypes(pd.read_pickle(path), dtypes)
+
+        if self._n_rows > 0 or not self._chunk_files:
+            yield self._with_dtypes(self._buffered_frame(), dtypes)
+
+    def to_dataframe(self):
+        """
+        Return all the recorded results in one DataFrame.
+
+        Returns:
+            pandas.DataFrame: recorded results
+        """
+
+        return pd.concat(list(self._frames()), ignore_index=True)
+
+    def write_csv(self, path):
+        """
+        Write all the recorded results to a CSV file, without loading more than
+        one chunk into memory at a time.
+
+        Arguments:
+            path: path of the CSV file
+
+        Returns:
+            None
+        """
+
+        header = True
+        for df in self._frames():
+            df.to_csv(path, index=False, header=header, mode="w" if header else "a")
+            header = False
+
+    def clear(self):
+        """
+        Discard the recorded results and remove the chunk files.
+
+        Returns:
+            None
+        """
+
+        for path in self._chunk_files:
+            if os.path.exists(path):
+                os.remove(path)
+        if self._tmp_dir is not None:
+            self._tmp_dir.cleanup()
+            self._tmp_dir = None
+
+        self._chunk_files = []
+        self._chunk_dtypes = []
+        self._columns = []
+        self._buffers = {}
+        self._n_rows = 0
+        self._n_flushed = 0
@@ -166,6 +166,32 @@ def test_forecast_day_ahead_prices(base_backcaster):
     )
 
 
+@pytest.mark.unit
+def test_historical_prices_changed_in_place(base_backcaster, caplog):
+    # deprecated, but the changes are still stored
+    base_backcaster.historical_da_prices["test_bus"][48:] = [4] * 24
+    assert "DEPRECATED" not in caplog.text
+
+    result_forecasts = base_backcaster.forecast_day_ahead_prices(
+        date="2022-05-11", hour=0, bus="test_bus", horizon=24, n_samples=1
+    )
+    assert "Backcaster.historical_da_prices in place has been DEPRECATED" in (
+        caplog.text
+    )
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=result_forecasts, second={0: [4] * 24}
+    )
+    assert base_backcaster.historical_da_prices["test_bus"][48:] == [4] * 24
+
+    # reading the prices does not warn
+    caplog.clear()
+    base_backcaster.historical_rt_prices
+    base_backcaster.forecast_real_time_prices(
+        date="2022-05-11", hour=0, bus="test_bus", horizon=24, n_samples=1
+    )
+    assert "DEPRECATED" not in caplog.text
+
+
 @pytest.mark.unit
 def test_forecast_day_ahead_and_real_time_prices(base_backcaster):
 
@@ -325,3 +351,94 @@ def test_fetch_day_ahead_stats_from_prescient(base_backcaster, historical_da_pri
         first=expected_historical_da_prices,
         second=base_backcaster._historical_da_prices,
     )
+
+
+@pytest.fixture
+def multi_bus_backcaster():
+    return Backcaster(
+        {"bus1": list(range(72)), "bus2": list(range(100, 148))},
+        {"bus1": list(range(200, 272)), "bus2": list(range(300, 324))},
+        max_historical_days=3,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("hour, horizon, n_samples", [(0, 48, 2), (18, 4, 5)])
+def test_forecast_day_ahead_and_real_time_prices_batch(
+    multi_bus_backcaster, hour, horizon, n_samples
+):
+    buses = ["bus2", "bus1"]
+    da_forecasts, rt_forecasts = (
+        multi_bus_backcaster.forecast_day_ahead_and_real_time_prices_batch(
+            date="2022-05-11",
+            hour=hour,
+            buses=buses,
+            horizon=horizon,
+            n_samples=n_samples,
+        )
+    )
+
+    assert da_forecasts.shape == (2, n_samples, horizon)
+    assert rt_forecasts.shape == (2, n_samples, horizon)
+
+    for i, bus in enumerate(buses):
+        da_forecast, rt_forecast = (
+            multi_bus_backcaster.forecast_day_ahead_and_real_time_prices(
+                date="2022-05-11",
+                hour=hour,
+                bus=bus,
+                horizon=horizon,
+                n_samples=n_samples,
+            )
+        )
+        for j in range(n_samples):
+            pyo_unittest.assertStructuredAlmostEqual(
+                first=list(da_forecasts[i, j]), second=da_forecast[j]
+            )
+            pyo_unittest.assertStructuredAlmostEqual(
+                first=list(rt_forecasts[i, j]), second=rt_forecast[j]
+            )
+
+    with pytest.raises(ForecastError, match=r"No bus3 day-ahead price available"):
+        multi_bus_backcaster.forecast_day_ahead_and_real_time_prices_batch(
+            date="2022-05-11", hour=0, buses=["bus3"], horizon=4, n_samples=1
+        )
+
+
+@pytest.mark.unit
+def test_forecast_after_history_wraps_around(multi_bus_backcaster):
+    # add 4 days, so the stored days wrap around the ring buffer
+    for day in range(4):
+        for t in range(24):
+            multi_bus_backcaster.fetch_hourly_stats_from_prescient(
+                MockPrescientHourlyStats({"bus1": day * 24 + t, "bus2": -t})
+            )
+
+    assert multi_bus_backcaster.historical_rt_prices["bus1"] == [
+        float(p) for p in range(24, 96)
+    ]
+    assert (
+        multi_bus_backcaster.historical_rt_prices["bus2"]
+        == [float(-t) for t in range(24)] * 3
+    )
+
+    # the newest day comes first, and the horizon continues into the oldest day
+    result_forecasts = multi_bus_backcaster.forecast_real_time_prices(
+        date="2022-05-11", hour=22, bus="bus1", horizon=4, n_samples=2
+    )
+    expected_forecasts = {0: [94, 95, 24, 25], 1: [70, 71, 72, 73]}
+    pyo_unittest.assertStructuredAlmostEqual(
+        first=result_forecasts, second=expected_forecasts
+    )
+
+
+@pytest.mark.unit
+def test_change_max_historical_days(multi_bus_backcaster):
+    multi_bus_backcaster.max_historical_days = 1
+
+    assert multi_bus_backcaster.historical_da_prices["bus1"] == [
+        float(p) for p in range(48, 72)
+    ]
+    assert multi_bus_backcaster.historical_rt_prices["bus2"] == [
+        float(p) for p in range(300, 324)
+    ]
@@ -11,6 +11,7 @@
 # for full copyright and license information.
 #################################################################################
 import pytest
+import pandas as pd
 
 import pyomo.environ as pyo
 from pyomo.common import unittest as pyo_unittest
@@ -359,3 +360,97 @@ def test_compute_RT_bids_pcost(bidder_object_pcost):
     }
 
     pyo_unittest.assertStructuredAlmostEqual(first=expected_bids, second=bids)
+
+
+@pytest.fixture
+def bidder_object_persistent():
+
+    solver = pyo.SolverFactory("appsi_highs")
+    forecaster = ExampleForecaster(prediction=30)
+
+    # create a bidder model
+    bidding_model_object = ExampleModel(model_data=testing_model_data)
+    bidder_object = Bidder(
+        bidding_model_object=bidding_model_object,
+        day_ahead_horizon=day_ahead_horizon,
+        real_time_horizon=real_time_horizon,
+        n_scenario=n_scenario,
+        solver=solver,
+        forecaster=forecaster,
+    )
+    return bidder_object
+
+
+@pytest.mark.unit
+def test_persistent_solvers(bidder_object_persistent):
+    day_ahead_solver = bidder_object_persistent._model_solvers[
+        bidder_object_persistent.day_ahead_model
+    ]
+    real_time_solver = bidder_object_persistent._model_solvers[
+        bidder_object_persistent.real_time_model
+    ]
+
+    # each bidding model is solved with its own copy of the solver
+    assert day_ahead_solver.is_persistent
+    assert real_time_solver.is_persistent
+    assert day_ahead_solver.solver is not real_time_solver.solver
+    assert day_ahead_solver.solver is not bidder_object_persistent.solver
+
+    assert bidder_object_persistent.solve_times == {"Day-ahead": [], "Real-time": []}
+
+
+@pytest.mark.component
+@pytest.mark.skipif(
+    not prescient_avail, reason="Prescient (optional dependency) not available"
+)
+@pytest.mark.skipif(
+    not pyo.SolverFactory("appsi_highs").available(False),
+    reason="solver not available",
+)
+def test_compute_DA_bids_persistent(bidder_object_persistent):
+    marginal_cost = bidder_object_persistent.bidding_model_object.marginal_cost
+    gen = bidder_object_persistent.generator
+    default_bids = bidder_object_persistent.bidding_model_object.model_data.p_cost
+    pmin = bidder_object_persistent.bidding_model_object.pmin
+    pmax = bidder_object_persistent.bidding_model_object.pmax
+    date = "2021-08-20"
+
+    # solve repeatedly with updated price forecasts
+    for shift in [1, 2, 1]:
+        bidder_object_persistent.forecaster.prediction = marginal_cost - shift
+        bids = bidder_object_persistent.compute_day_ahead_bids(date=date, hour=0)
+
+        expected_bids = {
+            t: {
+                gen: {
+                    "p_min": pmin,
+                    "p_max": pmax,
+                    "p_min_agc": pmin,
+                    "p_max_agc": pmax,
+                    "startup_capacity": pmin,
+                    "shutdown_capacity": pmin,
+                    "p_cost": [
+                        (p, p * marginal_cost - shift * pmin) for p, _ in default_bids
+                    ],
+                }
+            }
+            for t in range(horizon)
+        }
+
+        pyo_unittest.assertStructuredAlmostEqual(first=expected_bids, second=bids)
+
+    assert len(bidder_object_persistent.solve_times["Day-ahead"]) == 3
+    assert len(bidder_object_persistent.solve_times["Real-time"]) == 0
+
+
+@pytest.mark.unit
+def test_bids_result_list_deprecated(bidder_object, caplog):
+    df = pd.DataFrame({"Hour": [0], "Power 0 [MW]": [30.0]})
+
+    bidder_object.bids_result_list.append(df)
+    assert "bids_result_list is deprecated" in caplog.text
+    assert len(bidder_object.bids_results) == 1
+
+    bidder_object.bids_result_list = [df, df]
+    assert len(bidder_object.bids_results) == 2
+    assert len(bidder_object.bids_result_list) == 1
@@ -18,6 +18,7 @@ from pyomo.common import unittest as pyo_unittest
 from idaes.apps.grid_integration.bidder import Bidder
 from idaes.apps.grid_integration.tracker import Tracker
 from idaes.apps.grid_integration.coordinator import DoubleLoopCoordinator
+from idaes.apps.grid_integration.utils import ModelValueCopier
 from idaes.apps.grid_integration.tests.util import (
     ExampleModel,
     ExampleForecaster,
@@ -154,3 +155,60 @@ def test_assemble_sced_tracking_market_signals(coordinator_object):
         tracking_horizon=tracking_horizon,
     )
     pyo_unittest.assertStructuredAlmostEqual(first=signal, second=expected_signal)
+
+
+@pytest.mark.unit
+def test_clone_tracking_model(coordinator_object):
+    tracker_model = coordinator_object.tracker.model
+    projection_model = coordinator_object.projection_tracker.model
+
+    for t in coordinator_object.tracker.time_set:
+        tracker_model.power_dispatch[t] = 10.123456 + t
+        tracker_model.power_underdelivered[t] = 1.0
+
+    coordinator_object._clone_tracking_model()
+    copier = coordinator_object._tracking_model_copier
+
+    for t in coordinator_object.tracker.time_set:
+        assert pyo.value(projection_model.power_dispatch[t]) == round(10.123456 + t, 4)
+        assert pyo.value(projection_model.power_underdelivered[t]) == 1.0
+
+    # the copier is reused, and unchanged values are not copied again
+    coordinator_object._clone_tracking_model()
+    assert coordinator_object._tracking_model_copier is copier
+    assert copier.copy() == 0
+
+    tracker_model.power_underdelivered[0] = 2.0
+    assert copier.copy() == 1
+    assert pyo.value(projection_model.power_underdelivered[0]) == 2.0
+
+
+@pytest.mark.unit
+def test_model_value_copier():
+    def build():
+        m = pyo.ConcreteModel()
+        m.x = pyo.Var([0, 1])
+        m.p = pyo.Param([0, 1], mutable=True)
+        m.q = pyo.Param(initialize=1)
+        return m
+
+    source, target = build(), build()
+    copier = ModelValueCopier(source, target)
+    # immutable parameters are not copied
+    assert len(copier) == 4
+
+    # values that are not set are not copied
+    source.x[0] = 1.5
+    source.p[1] = 2.5
+    assert copier.copy() == 2
+    assert target.x[0].value == 1.5
+    assert target.x[1].value is None
+    assert target.p[1].value == 2.5
+    assert pyo.value(target.p[0], exception=False) is None
+
+
+@pytest.mark.unit
+def test_clone_tracking_model_diverged(coordinator_object):
+    coordinator_object.projection_tracker.model.extra_var = pyo.Var()
+    with pytest.raises(ValueError, match="do not have the same name"):
+        coordinator_object._clone_tracking_model()
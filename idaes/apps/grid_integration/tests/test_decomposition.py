@@ -0,0 +1,205 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+import numpy as np
+import pytest
+
+import pyomo.environ as pyo
+from pyomo.common import unittest as pyo_unittest
+
+from idaes.apps.grid_integration.bidder import (
+    Bidder,
+    SelfScheduler,
+    StochasticProgramBidder,
+)
+from idaes.apps.grid_integration.decomposition import (
+    ProgressiveHedging,
+    project_nonanticipative,
+    project_nondecreasing,
+)
+from idaes.apps.grid_integration.tests.util import (
+    ExampleModel,
+    ExampleForecaster,
+    testing_model_data,
+)
+
+horizon = 4
+n_scenario = 5
+
+rng = np.random.default_rng(0)
+day_ahead_price = rng.uniform(20, 40, (n_scenario, horizon))
+real_time_price = rng.uniform(20, 40, (n_scenario, horizon))
+
+solver_available = pyo.SolverFactory("appsi_highs").available(False)
+
+
+@pytest.mark.unit
+def test_project_nonanticipative():
+    values = np.array([[1.0, 4.0], [3.0, 2.0]])
+    np.testing.assert_allclose(
+        project_nonanticipative(values), [[2.0, 3.0], [2.0, 3.0]]
+    )
+
+
+@pytest.mark.unit
+def test_project_nondecreasing():
+    values = np.array([[5.0, 1.0], [1.0, 2.0], [3.0, 3.0]])
+    prices = np.array([[10.0, 1.0], [20.0, 2.0], [30.0, 3.0]])
+
+    # first period violates the order and is pooled, second is already ordered
+    np.testing.assert_allclose(
+        project_nondecreasing(values, prices), [[3.0, 1.0], [3.0, 2.0], [3.0, 3.0]]
+    )
+
+    # scenarios with the same price are not ordered with respect to each other
+    values = np.array([[5.0], [1.0], [0.0]])
+    prices = np.array([[10.0], [10.0], [20.0]])
+    np.testing.assert_allclose(
+        project_nondecreasing(values, prices), [[2.5], [1.0], [2.5]]
+    )
+
+
+@pytest.mark.unit
+def test_progressive_hedging_inputs():
+    with pytest.raises(ValueError, match=r".*rho should be greater than zero.*"):
+        ProgressiveHedging(rho=0)
+    with pytest.raises(ValueError, match=r".*n_workers should be a positive.*"):
+        ProgressiveHedging(n_workers=0)
+
+
+def make_bidder(bidder_class, decomposition):
+    bidder_object = bidder_class(
+        bidding_model_object=ExampleModel(model_data=testing_model_data),
+        day_ahead_horizon=horizon,
+        real_time_horizon=horizon,
+        n_scenario=n_scenario,
+        solver=pyo.SolverFactory("appsi_highs"),
+        forecaster=ExampleForecaster(prediction=30),
+        decomposition=decomposition,
+    )
+    bidder_object._pass_price_forecasts(
+        bidder_object.day_ahead_model, day_ahead_price, real_time_price
+    )
+    return bidder_object
+
+
+def day_ahead_power(model):
+    return np.array(
+        [
+            [pyo.value(model.fs[s].day_ahead_power[t]) for t in range(horizon)]
+            for s in model.SCENARIOS
+        ]
+    )
+
+
+@pytest.mark.component
+@pytest.mark.skipif(not solver_available, reason="solver not available")
+@pytest.mark.parametrize("bidder_class", [SelfScheduler, Bidder])
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_progressive_hedging(bidder_class, n_workers):
+    # extensive form
+    bidder_object = make_bidder(bidder_class, decomposition=None)
+    model = bidder_object.day_ahead_model
+    bidder_object._model_solvers[model].solve()
+
+    ph = ProgressiveHedging(n_workers=n_workers)
+    ph_bidder_object = make_bidder(bidder_class, decomposition=ph)
+    ph_model = ph_bidder_object.day_ahead_model
+    ph_bidder_object._solve_decomposed(
+        ph_model,
+        power_var_name="day_ahead_power",
+        energy_price_param_name="day_ahead_energy_price",
+    )
+
+    assert ph.converged
+    assert ph.iterations > 0
+    assert pyo.value(ph_model.obj) == pytest.approx(pyo.value(model.obj), rel=1e-5)
+    np.testing.assert_allclose(
+        day_ahead_power(ph_model), day_ahead_power(model), atol=1e-2
+    )
+
+    # progressive hedging components are only active during the solve
+    for s in ph_model.SCENARIOS:
+        assert not ph_model.fs[s].ph.active
+    # the bidding constraints hold
+    for c in ph_model.day_ahead_bidding_constraints.values():
+        assert pyo.value(c.body) >= pyo.value(c.lower) - 1e-6
+
+
+@pytest.mark.component
+@pytest.mark.skipif(not solver_available, reason="solver not available")
+def test_self_scheduler_compute_bids_decomposed():
+    forecaster = ExampleForecaster(prediction=30)
+    bids = []
+    for decomposition in (None, ProgressiveHedging()):
+        bidder_object = SelfScheduler(
+            bidding_model_object=ExampleModel(model_data=testing_model_data),
+            day_ahead_horizon=horizon,
+            real_time_horizon=horizon,
+            n_scenario=n_scenario,
+            solver=pyo.SolverFactory("appsi_highs"),
+            forecaster=forecaster,
+            decomposition=decomposition,
+        )
+        bids.append(bidder_object.compute_day_ahead_bids(date="2021-08-20", hour=0))
+
+    pyo_unittest.assertStructuredAlmostEqual(first=bids[0], second=bids[1], abstol=1e-2)
+
+
+@pytest.mark.unit
+def test_decomposition_not_supported():
+    class NoProjectionBidder(SelfScheduler):
+        _project_bids = StochasticProgramBidder._project_bids
+
+    with pytest.raises(TypeError, match="does not support scenario decomposition"):
+        make_bidder(NoProjectionBidder, decomposition=ProgressiveHedging())
+
+
+@pytest.mark.component
+@pytest.mark.skipif(not solver_available, reason="solver not available")
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_progressive_hedging_second_stage(n_workers):
+    ph = ProgressiveHedging(n_workers=n_workers, max_iter=3)
+    bidder_object = make_bidder(Bidder, decomposition=ph)
+    model = bidder_object.day_ahead_model
+    bidder_object._solve_decomposed(
+        model,
+        power_var_name="day_ahead_power",
+        energy_price_param_name="day_ahead_energy_price",
+    )
+
+    # even if progressive hedging did not converge, the second-stage decisions
+    # of each scenario are optimal for the first-stage decisions that are bid
+    bids = day_ahead_power(model)
+    obj = pyo.value(model.obj)
+    for s in model.SCENARIOS:
+        for t in range(horizon):
+            model.fs[s].day_ahead_power[t].fix(bids[s, t])
+    bidder_object._model_solvers[model].solve()
+    assert pyo.value(model.obj) == pytest.approx(obj, rel=1e-6)
+    np.testing.assert_allclose(day_ahead_power(model), bids)
+
+
+@pytest.mark.component
+@pytest.mark.skipif(not solver_available, reason="solver not available")
+def test_progressive_hedging_failed_subproblem():
+    ph = ProgressiveHedging()
+    bidder_object = make_bidder(SelfScheduler, decomposition=ph)
+    model = bidder_object.day_ahead_model
+    # no power output is possible
+    model.fs[0].power_output_ref[0].setub(-1)
+    with pytest.raises(RuntimeError, match="scenario 0 was not solved to optimality"):
+        bidder_object._solve_decomposed(
+            model,
+            power_var_name="day_ahead_power",
+            energy_price_param_name="day_ahead_energy_price",
+        )
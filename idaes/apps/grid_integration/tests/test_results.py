@@ -0,0 +1,170 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from idaes.apps.grid_integration.results import ResultsRecorder
+
+
+def record_rows(recorder, n_rows):
+    for i in range(n_rows):
+        row = {"Date": "2020-07-10", "Hour": i, "Power [MW]": i / 2}
+        if i % 3 == 0:
+            row["Scenario"] = i
+        recorder.record(**row)
+
+
+def expected_frame(n_rows):
+    # what concatenating one-row DataFrames gives
+    rows = []
+    for i in range(n_rows):
+        row = {"Date": "2020-07-10", "Hour": i, "Power [MW]": i / 2}
+        if i % 3 == 0:
+            row["Scenario"] = i
+        rows.append(pd.DataFrame.from_dict(row, orient="index").T)
+    return pd.concat(rows)
+
+
+@pytest.mark.unit
+def test_invalid_chunk_size():
+    with pytest.raises(ValueError, match="chunk_size should be a positive integer"):
+        ResultsRecorder(chunk_size=0)
+
+
+@pytest.mark.unit
+def test_record():
+    recorder = ResultsRecorder()
+    record_rows(recorder, 5)
+
+    assert len(recorder) == 5
+    assert recorder.columns == ["Date", "Hour", "Power [MW]", "Scenario"]
+
+    df = recorder.to_dataframe()
+    assert list(df["Hour"]) == [0, 1, 2, 3, 4]
+    assert list(df["Power [MW]"]) == [0, 0.5, 1, 1.5, 2]
+    assert df["Scenario"][0] == 0
+    assert pd.isna(df["Scenario"][1])
+    assert df["Scenario"][3] == 3
+
+
+@pytest.mark.unit
+def test_record_mixed_types():
+    recorder = ResultsRecorder()
+    recorder.record(a=1, b=None, c=1)
+    recorder.record(a=2.5, b="x", c=None)
+    recorder.record(b=True)
+
+    df = recorder.to_dataframe()
+    assert list(df["a"][:2]) == [1, 2.5]
+    assert pd.isna(df["a"][2])
+    assert pd.isna(df["b"][0])
+    assert list(df["b"][1:]) == ["x", True]
+    assert df["c"][0] == 1
+    assert pd.isna(df["c"][1])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 2, 4, 100])
+def test_write_csv(tmp_path, chunk_size):
+    recorder = ResultsRecorder(chunk_size=chunk_size, directory=tmp_path)
+    record_rows(recorder, 10)
+
+    # rows beyond the chunk size are written to disk
+    n_chunks = len(list(tmp_path.glob("chunk_*")))
+    assert n_chunks == (10 - 1) // chunk_size
+
+    path = tmp_path / "results.csv"
+    recorder.write_csv(path)
+    expected_path = tmp_path / "expected.csv"
+    expected_frame(10).to_csv(expected_path, index=False)
+
+    assert path.read_text() == expected_path.read_text()
+
+    recorder.clear()
+    assert len(recorder) == 0
+    assert len(list(tmp_path.glob("chunk_*"))) == 0
+
+
+@pytest.mark.unit
+def test_new_column_after_flush(tmp_path):
+    recorder = ResultsRecorder(chunk_size=2)
+    recorder.record(a=1)
+    recorder.record(a=2)
+    recorder.record(a=3, b=4)
+    chunk_dir = recorder._tmp_dir.name
+    assert os.path.isdir(chunk_dir)
+
+    path = tmp_path / "results.csv"
+    recorder.write_csv(path)
+    assert path.read_text().splitlines() == ["a,b", "1,", "2,", "3,4"]
+
+    recorder.clear()
+    assert not os.path.exists(chunk_dir)
+
+
+@pytest.mark.unit
+def test_record_frame():
+    recorder = ResultsRecorder()
+    recorder.record_frame(pd.DataFrame({"Hour": [0, 1], "Power [MW]": [0.0, 0.5]}))
+
+    assert len(recorder) == 2
+    assert list(recorder.to_dataframe()["Power [MW]"]) == [0, 0.5]
+
+
+@pytest.mark.unit
+def test_frame_list():
+    recorder = ResultsRecorder()
+    assert recorder.frame_list() == []
+
+    frames = recorder.frame_list()
+    frames.append(pd.DataFrame({"Hour": [0], "Power [MW]": [0.0]}))
+    frames.extend([pd.DataFrame({"Hour": [1], "Power [MW]": [0.5]})])
+
+    assert len(frames) == 2
+    assert len(recorder) == 2
+
+    frames = recorder.frame_list()
+    assert len(frames) == 1
+    assert list(frames[0]["Hour"]) == [0, 1]
+
+
+@pytest.mark.unit
+def test_to_dataframe_after_flush():
+    recorder = ResultsRecorder(chunk_size=2)
+    record_rows(recorder, 5)
+    recorder.record(Date="2020-07-11", Flag=True)
+
+    df = recorder.to_dataframe()
+    assert df["Date"].dtype == object
+    assert df["Power [MW]"].dtype == float
+    assert list(df["Date"]) == ["2020-07-10"] * 5 + ["2020-07-11"]
+    # read back from the chunk files with their types
+    assert list(df["Hour"][:5]) == [0, 1, 2, 3, 4]
+    assert all(isinstance(v, int) for v in df["Hour"][:5])
+    assert list(df["Power [MW]"][:5]) == [0, 0.5, 1, 1.5, 2]
+    assert pd.isna(df["Power [MW]"][5])
+    assert df["Scenario"][3] == 3
+    assert pd.isna(df["Scenario"][4])
+    assert df["Flag"][5] is True
+    assert pd.isna(df["Flag"][0])
+
+    # one chunk of the same type throughout keeps its type
+    recorder = ResultsRecorder(chunk_size=2)
+    for i in range(5):
+        recorder.record(Hour=i, Power=i / 2)
+    df = recorder.to_dataframe()
+    assert df["Hour"].dtype == np.int64
+    assert df["Power"].dtype == float
@@ -11,6 +11,7 @@
 # for full copyright and license information.
 #################################################################################
 import pytest
+import pandas as pd
 import pyomo.environ as pyo
 from idaes.apps.grid_integration.tracker import Tracker
 from idaes.apps.grid_integration.tests.util import ExampleModel, testing_model_data
@@ -191,3 +192,54 @@ def test_track_deviation_penalty(tracker_object):
         assert pytest.approx(
             large_penalty / (horizon - tracker_object.n_tracking_hour)
         ) == pyo.value(tracker_object.model.deviation_penalty[t])
+
+
+@pytest.mark.component
+@pytest.mark.skipif(
+    not pyo.SolverFactory("appsi_highs").available(False),
+    reason="solver not available",
+)
+def test_track_market_dispatch_persistent_solver():
+    solver = pyo.SolverFactory("appsi_highs")
+    tracking_model_object = ExampleModel(model_data=testing_model_data)
+    tracker_object = Tracker(
+        tracking_model_object=tracking_model_object,
+        tracking_horizon=horizon,
+        n_tracking_hour=1,
+        solver=solver,
+    )
+
+    # the tracker solves with its own copy of the solver
+    assert tracker_object._model_solver.is_persistent
+    assert tracker_object._model_solver.solver is not solver
+
+    for market_dispatch in ([30, 40, 50, 70], [60, 50, 40, 30], [35, 45]):
+        tracker_object.track_market_dispatch(
+            market_dispatch=market_dispatch, date="2021-07-26", hour="17:00"
+        )
+
+        for t, dispatch in zip(range(horizon), market_dispatch):
+            assert (
+                pytest.approx(pyo.value(tracker_object.power_output[t]), abs=1e-3)
+                == dispatch
+            )
+
+        # dispatch constraints beyond the market dispatch are deactivated
+        for t in range(len(market_dispatch), horizon):
+            assert not tracker_object.model.tracking_dispatch_constraints[t].active
+
+    assert len(tracker_object.solve_times) == 3
+    assert all(t > 0 for t in tracker_object.solve_times)
+
+
+@pytest.mark.unit
+def test_result_list_deprecated(tracker_object, caplog):
+    df = pd.DataFrame({"Hour": [0], "Power Output [MW]": [30.0]})
+
+    tracker_object.result_list.append(df)
+    assert "result_list is deprecated" in caplog.text
+    assert len(tracker_object.results) == 1
+
+    tracker_object.result_list = [df, df]
+    assert len(tracker_object.results) == 2
+    assert len(tracker_object.result_list) == 1
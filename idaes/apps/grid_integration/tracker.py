@@ -10,10 +10,14 @@
 # All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
 # for full copyright and license information.
 #################################################################################
-import pandas as pd
 import pyomo.environ as pyo
-from pyomo.opt.base.solvers import OptSolver
+from pyomo.common.deprecation import deprecation_warning
 import os
+from idaes.apps.grid_integration.utils import check_solver, ModelSolver
+from idaes.apps.grid_integration.results import ResultsRecorder
+import idaes.logger as idaeslog
+
+_logger = idaeslog.getLogger(__name__)
 
 
 class Tracker:
@@ -35,7 +39,10 @@ class Tracker:
 
             n_tracking_hour: number of implemented hours after each solve
 
-            solver: a Pyomo mathematical programming solver object
+            solver: a Pyomo mathematical programming solver object. If it is an
+                APPSI solver, e.g., SolverFactory("appsi_highs"), the tracking
+                model is kept loaded in the solver between solves, and only the
+                updated parameter values are passed to it.
 
         Returns:
             None
@@ -61,11 +68,40 @@ class Tracker:
         self.time_set = self.power_output.index_set()
 
         self.formulate_tracking_problem()
+        self._model_solver = ModelSolver(self.solver, self.model)
 
         self.daily_stats = None
         self.projection = None
 
-        self.result_list = []
+        self.results = ResultsRecorder()
+
+    @property
+    def result_list(self):
+        """
+        Deprecated list of DataFrames of the tracking results. The results are
+        recorded in the results recorder `results`.
+        """
+        deprecation_warning(
+            msg="result_list is deprecated. The tracking results are recorded in "
+            "the ResultsRecorder results.",
+            logger=_logger,
+            version="2.6.0",
+            remove_in="3.0.0",
+        )
+        return self.results.frame_list()
+
+    @result_list.setter
+    def result_list(self, value):
+        deprecation_warning(
+            msg="result_list is deprecated. The tracking results are recorded in "
+            "the ResultsRecorder results.",
+            logger=_logger,
+            version="2.6.0",
+            remove_in="3.0.0",
+        )
+        self.results.clear()
+        for df in value:
+            self.results.record_frame(df)
 
     def _check_inputs(self):
         """
@@ -137,12 +173,7 @@ class Tracker:
         Check if provides solver is a valid Pyomo solver object.
         """
 
-        if not isinstance(self.solver, OptSolver):
-            raise TypeError(
-                "The provided solver {} is not a valid Pyomo solver.".format(
-                    self.solver
-                )
-            )
+        check_solver(self.solver)
 
     def formulate_tracking_problem(self):
         """
@@ -299,7 +330,7 @@ class Tracker:
         self._pass_market_dispatch(market_dispatch)
 
         # solve the model
-        self.solver.solve(self.model, tee=False)
+        self._model_solver.solve(tee=False)
 
         self.record_results(date=date, hour=hour)
 
@@ -312,6 +343,13 @@ class Tracker:
 
         return profiles
 
+    @property
+    def solve_times(self):
+        """
+        Wall clock time of each tracking problem solve [s].
+        """
+        return self._model_solver.solve_times
+
     def _record_daily_stats(self, profiles):
         """
         Record the stats that are used to update the model in the past 24 hours.
@@ -384,32 +422,24 @@ class Tracker:
 
         """
 
-        df_list = []
         for t in self.time_set:
-
-            result_dict = {}
-
-            result_dict["Date"] = kwargs["date"]
-            result_dict["Hour"] = kwargs["hour"]
-
-            result_dict["Horizon [hr]"] = int(t)
-
-            result_dict["Power Dispatch [MW]"] = round(
-                pyo.value(self.model.power_dispatch[t]), 2
+            self.results.record(
+                **{
+                    "Date": kwargs["date"],
+                    "Hour": kwargs["hour"],
+                    "Horizon [hr]": int(t),
+                    "Power Dispatch [MW]": round(
+                        pyo.value(self.model.power_dispatch[t]), 2
+                    ),
+                    "Power Output [MW]": round(pyo.value(self.power_output[t]), 2),
+                    "Power Underdelivered [MW]": round(
+                        pyo.value(self.model.power_underdelivered[t]), 2
+                    ),
+                    "Power Overdelivered [MW]": round(
+                        pyo.value(self.model.power_overdelivered[t]), 2
+                    ),
+                }
             )
-            result_dict["Power Output [MW]"] = round(pyo.value(self.power_output[t]), 2)
-            result_dict["Power Underdelivered [MW]"] = round(
-                pyo.value(self.model.power_underdelivered[t]), 2
-            )
-            result_dict["Power Overdelivered [MW]"] = round(
-                pyo.value(self.model.power_overdelivered[t]), 2
-            )
-
-            result_df = pd.DataFrame.from_dict(result_dict, orient="index")
-            df_list.append(result_df.T)
-
-        # append to result list
-        self.result_list.append(pd.concat(df_list))
 
     def record_results(self, **kwargs):
         """
@@ -443,9 +473,7 @@ class Tracker:
         print("")
         print("Saving tracking results to disk...")
 
-        pd.concat(self.result_list).to_csv(
-            os.path.join(path, "tracker_detail.csv"), index=False
-        )
+        self.results.write_csv(os.path.join(path, "tracker_detail.csv"))
         self.tracking_model_object.write_results(
             path=os.path.join(path, "tracking_model_detail.csv")
         )
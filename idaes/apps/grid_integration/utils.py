@@ -10,6 +10,194 @@
 # All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
 # for full copyright and license information.
 #################################################################################
+from itertools import zip_longest
+from operator import attrgetter
+import time
+
+import numpy as np
+import pyomo.environ as pyo
+from pyomo.opt.base.solvers import OptSolver
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
+from pyomo.contrib.appsi.base import LegacySolverInterface
+
+
+def check_solver(solver):
+    """
+    Check if the provided solver is a valid Pyomo solver object, i.e., a solver
+    created by the Pyomo SolverFactory, including the APPSI persistent solver
+    interfaces (e.g., SolverFactory("appsi_highs")).
+
+    Args:
+        solver: solver object to check
+
+    Returns:
+        None
+    """
+
+    if not isinstance(solver, (OptSolver, LegacySolverInterface)):
+        raise TypeError(f"The provided solver {solver} is not a valid Pyomo solver.")
+
+
+class ModelSolver:
+    """
+    Solve the same model repeatedly and record the time taken by each solve.
+
+    If the solver is an APPSI persistent solver interface, the model is loaded
+    into the solver only once. Later solves only pass the changes since the
+    previous solve (new values of mutable parameters, fixed variables and
+    (de)activated constraints) to the solver, and the solver starts from its
+    previous solution, e.g., the previous optimal basis for LP solvers or the
+    current variable values for Ipopt. Each ModelSolver uses its own copy of the
+    solver, so that solving other models does not reset the loaded model.
+
+    Other solvers write out and solve the full model every time. The legacy
+    persistent interfaces (e.g., "gurobi_persistent") are reloaded before each
+    solve, since they do not pick up changes in mutable parameter values.
+    """
+
+    def __init__(self, solver, model):
+        """
+        Initializes the model solver object.
+
+        Arguments:
+            solver: a Pyomo mathematical programming solver object
+
+            model: the model to solve
+
+        Returns:
+            None
+        """
+
+        self.model = model
+        self.is_persistent = isinstance(solver, LegacySolverInterface)
+
+        if self.is_persistent:
+            self.solver = type(solver)()
+            self.solver.config = solver.config()
+            self.solver.options = dict(solver.options)
+        else:
+            self.solver = solver
+
+        # wall clock time of each solve [s]
+        self.solve_times = []
+
+    def solve(self, tee=False):
+        """
+        Solve the model.
+
+        Arguments:
+            tee: whether to display the solver log
+
+        Returns:
+            pyomo.opt.results.SolverResults: the solver results
+        """
+
+        start = time.perf_counter()
+
+        if isinstance(self.solver, PersistentSolver):
+            self.solver.set_instance(self.model)
+            results = self.solver.solve(tee=tee)
+        else:
+            results = self.solver.solve(self.model, tee=tee)
+
+        self.solve_times.append(time.perf_counter() - start)
+
+        return results
+
+
+class ModelValueCopier:
+    """
+    Copy the values of the variables and mutable parameters of a model to another
+    model with the same structure.
+
+    The corresponding variables and parameters of the two models are matched
+    once, when the copier is created. Each copy then reads the values of both
+    models into arrays, reading the values of the variables directly rather
+    than through pyo.value, and only assigns the values that differ.
+    """
+
+    def __init__(self, source, target, digits=4):
+        """
+        Initializes the model value copier object.
+
+        Arguments:
+            source: the model to copy the values from
+
+            target: the model to copy the values to
+
+            digits: number of decimal places to round the copied values to
+
+        Returns:
+            None
+        """
+
+        self.digits = digits
+        self.source_data = []
+        self.target_data = []
+
+        for ctype in (pyo.Var, pyo.Param):
+            for source_obj, target_obj in zip_longest(
+                source.component_objects(
+                    ctype, sort=pyo.SortComponents.alphabetizeComponentAndIndex
+                ),
+                target.component_objects(
+                    ctype, sort=pyo.SortComponents.alphabetizeComponentAndIndex
+                ),
+            ):
+                if (
+                    source_obj is None
+                    or target_obj is None
+                    or source_obj.name != target_obj.name
+                ):
+                    raise ValueError(
+                        f"Trying to copy the value of {source_obj} to {target_obj}, but they do not have the same name and possibly not the corresponding objects. Please make sure the models do not diverge. "
+                    )
+                # the values of immutable parameters cannot change
+                if ctype is pyo.Param and not source_obj.mutable:
+                    continue
+                for idx in source_obj.index_set():
+                    self.source_data.append(source_obj[idx])
+                    self.target_data.append(target_obj[idx])
+            if ctype is pyo.Var:
+                # the variables come before the parameters
+                self._n_vars = len(self.source_data)
+
+    def __len__(self):
+        return len(self.source_data)
+
+    def _values(self, data):
+        # values that are not set are NaN. The values of the variables are read
+        # directly, which is much faster than pyo.value; parameters without a
+        # value raise an error when read directly.
+        n_vars = self._n_vars
+        values = np.empty(len(data), dtype=float)
+        values[:n_vars] = list(map(attrgetter("value"), data[:n_vars]))
+        values[n_vars:] = [pyo.value(d, exception=False) for d in data[n_vars:]]
+        return values
+
+    def copy(self):
+        """
+        Copy the values of the source model to the target model.
+
+        Returns:
+            int: number of values copied
+        """
+
+        source_values = self._values(self.source_data)
+        target_values = self._values(self.target_data)
+        new_values = np.round(source_values, self.digits)
+
+        # NaN compares unequal to everything, so values that are not set in the
+        # source model are skipped
+        changed = np.flatnonzero(
+            (source_values != target_values)
+            & (new_values != target_values)
+            & ~np.isnan(source_values)
+        )
+        for i in changed:
+            self.target_data[i].set_value(new_values[i].item())
+
+        return len(changed)
 
 
 def convert_marginal_costs_to_actual_costs(power_marginal_cost_pairs):
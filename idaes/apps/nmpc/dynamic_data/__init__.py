@@ -13,5 +13,6 @@
 from .interval_data import (
     assert_disjoint_intervals,
     load_inputs_into_model,
+    load_time_series_into_model,
     interval_data_from_time_series,
 )
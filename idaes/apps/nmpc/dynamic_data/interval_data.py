@@ -13,6 +13,9 @@
 # TODO: Missing doc strings
 # pylint: disable=missing-module-docstring
 
+import numpy as np
+from pyomo.core.base.var import Var
+
 
 def assert_disjoint_intervals(intervals):
     """
@@ -27,18 +30,83 @@ def assert_disjoint_intervals(intervals):
 
     """
     intervals = list(sorted(intervals))
-    for i, (lo, hi) in enumerate(intervals):
-        if not lo <= hi:
-            raise RuntimeError(
-                "Lower endpoint of interval is higher than upper endpoint"
-            )
-        if i != 0:
-            prev_lo, prev_hi = intervals[i - 1]
-            if not prev_hi <= lo:
-                raise RuntimeError(
-                    "Intervals %s and %s are not disjoint"
-                    % ((prev_lo, prev_hi), (lo, hi))
-                )
+    if not intervals:
+        return
+    lo, hi = np.array(intervals, dtype=float).T
+    backwards = np.nonzero(lo > hi)[0]
+    overlapping = np.nonzero(hi[:-1] > lo[1:])[0]
+    # Report the first problem in sorted order
+    if len(backwards) and (not len(overlapping) or backwards[0] <= overlapping[0] + 1):
+        raise RuntimeError("Lower endpoint of interval is higher than upper endpoint")
+    if len(overlapping):
+        i = overlapping[0]
+        raise RuntimeError(
+            "Intervals %s and %s are not disjoint" % (intervals[i], intervals[i + 1])
+        )
+
+
+def _nearest_indices(points, targets, tolerance):
+    """
+    Returns the (zero-based) index of the nearest of the sorted points for
+    each target, or -1 if it is farther than the tolerance. Ties go to the
+    index on the left, as in ContinuousSet.find_nearest_index.
+    """
+    points = np.asarray(points, dtype=float)
+    targets = np.asarray(targets, dtype=float)
+    i = np.searchsorted(points, targets, side="right")
+    left = np.clip(i - 1, 0, len(points) - 1)
+    right = np.clip(i, 0, len(points) - 1)
+    use_right = np.abs(points[right] - targets) < np.abs(targets - points[left])
+    nearest = np.where(use_right, right, left)
+    delta = np.abs(points[nearest] - targets)
+    return np.where(delta <= tolerance, nearest, -1)
+
+
+def _interval_membership(points, lo, hi, tolerance):
+    """
+    Returns, for each of the sorted points, the index of the interval that
+    sets its value, or -1 if no interval does.
+
+    The sorted, disjoint intervals are given by their low and high endpoints,
+    which are matched to the nearest points within the tolerance. Intervals
+    with an endpoint that does not match any point are ignored. An interval
+    sets the values at the points after its low endpoint up to and including
+    its high endpoint, or at its endpoint if both endpoints match the same
+    point. Where intervals share a point, the last one sets its value.
+    """
+    idx0 = _nearest_indices(points, lo, tolerance)
+    idx1 = _nearest_indices(points, hi, tolerance)
+    valid = np.nonzero((idx0 >= 0) & (idx1 >= 0))[0]
+    idx0 = idx0[valid]
+    idx1 = idx1[valid]
+
+    membership = np.full(len(points), -1)
+    if not len(valid):
+        return membership
+    # Both endpoint indices are nondecreasing, since the intervals are
+    # sorted and disjoint
+    j = np.arange(len(points))
+    k = np.searchsorted(idx0, j, side="left") - 1
+    covered = (k >= 0) & (idx1[np.maximum(k, 0)] >= j)
+    membership[covered] = valid[k[covered]]
+    # Intervals whose endpoints match the same point come last among the
+    # intervals at that point
+    k = np.searchsorted(idx1, j, side="right") - 1
+    k_ = np.maximum(k, 0)
+    single = (k >= 0) & (idx0[k_] == j) & (idx1[k_] == j)
+    membership[single] = valid[k[single]]
+    return membership
+
+
+def _set_values(data_objects, values):
+    """
+    Sets the values of the variable (or mutable parameter) data objects.
+    """
+    for data, val in zip(data_objects, values):
+        if data.ctype is Var:
+            data.set_value(val, skip_validation=True)
+        else:
+            data.set_value(val)
 
 
 def load_inputs_into_model(model, time, input_data, time_tol=0):
@@ -63,6 +131,8 @@ def load_inputs_into_model(model, time, input_data, time_tol=0):
         must be within the ContinuousSet exactly.
 
     """
+    time_list = list(time)
+    time_points = np.array(time_list, dtype=float)
     for cuid, inputs in input_data.items():
         var = model.find_component(cuid)
         if var is None:
@@ -73,18 +143,82 @@ def load_inputs_into_model(model, time, input_data, time_tol=0):
 
         intervals = list(sorted(inputs.keys()))
         assert_disjoint_intervals(intervals)
-        for i, interval in enumerate(intervals):  # pylint: disable=unused-variable
-            idx0 = time.find_nearest_index(interval[0], tolerance=time_tol)
-            idx1 = time.find_nearest_index(interval[1], tolerance=time_tol)
-            if idx0 is None or idx1 is None:
-                # One of the interval boundaries is not a valid time index
-                # within tolerance. Skip this interval and move on.
-                continue
-            input_val = inputs[interval]
-            idx_iter = range(idx0 + 1, idx1 + 1) if idx0 != idx1 else (idx0,)
-            for idx in idx_iter:
-                t = time.at(idx)
-                var[t].set_value(input_val)
+        if not intervals:
+            continue
+        # Intervals with a boundary that is not a valid time index within
+        # tolerance are skipped
+        lo, hi = np.array(intervals, dtype=float).T
+        membership = _interval_membership(time_points, lo, hi, time_tol)
+        input_vals = [inputs[interval] for interval in intervals]
+        idx = np.nonzero(membership >= 0)[0]
+        _set_values(
+            [var[time_list[i]] for i in idx],
+            [input_vals[k] for k in membership[idx]],
+        )
+
+
+def load_time_series_into_model(model, time, data, use_left_endpoint=False, time_tol=0):
+    """
+    This function loads piecewise constant values given as time series
+    into variables (or mutable parameters) of a model. It is equivalent to
+    load_inputs_into_model with the interval data from
+    interval_data_from_time_series, but works on arrays without building
+    the intervals, which is much faster for long time series.
+
+    Arguments
+    ---------
+    model: _BlockData
+        Pyomo block containing the variables and parameters whose values
+        will be set
+    time: ContinuousSet
+        Pyomo ContinuousSet corresponding to the piecewise constant intervals
+    data: tuple
+        First entry is a sorted array of time points, second entry is a
+        dict mapping names each to an array of values at the corresponding
+        time point
+    use_left_endpoint: bool
+        Optional. Indicates whether each interval should take the value
+        of its left endpoint. Default is False, i.e. each interval takes
+        the value of its right endpoint.
+    time_tol: float
+        Optional. Tolerance within which the ContinuousSet will be searched
+        for the time points. The default is zero, i.e. the time points
+        must be within the ContinuousSet exactly.
+
+    """
+    series_time, value_dict = data
+    series_time = np.asarray(series_time, dtype=float)
+    n_t = len(series_time)
+    if np.any(np.diff(series_time) < 0):
+        raise RuntimeError("Time points of the time series must be sorted")
+
+    time_list = list(time)
+    if n_t == 1:
+        lo = hi = series_time
+        value_idx = np.zeros(1, dtype=int)
+    else:
+        lo = series_time[:-1]
+        hi = series_time[1:]
+        value_idx = np.arange(n_t - 1) if use_left_endpoint else np.arange(1, n_t)
+    membership = _interval_membership(time_list, lo, hi, time_tol)
+    idx = np.nonzero(membership >= 0)[0]
+    points = [time_list[i] for i in idx]
+    value_idx = value_idx[membership[idx]]
+
+    for cuid, values in value_dict.items():
+        var = model.find_component(cuid)
+        if var is None:
+            raise RuntimeError(
+                "Could not find a variable on model %s with ComponentUID %s"
+                % (model.name, cuid)
+            )
+        values = np.asarray(values)
+        if len(values) != n_t:
+            raise ValueError(
+                "Time series for %s has %s values, but there are %s time points"
+                % (cuid, len(values), n_t)
+            )
+        _set_values([var[t] for t in points], values[value_idx].tolist())
 
 
 def interval_data_from_time_series(data, use_left_endpoint=False):
@@ -125,10 +259,8 @@ def interval_data_from_time_series(data, use_left_endpoint=False):
     else:
         # This covers the case of n_t > 1 and n_t == 0
         interval_data = {}
-        intervals = [(time[i - 1], time[i]) for i in range(1, n_t)]
+        intervals = list(zip(time[:-1], time[1:]))
         for name, values in value_dict.items():
-            interval_values = [
-                values[i - 1] if use_left_endpoint else values[i] for i in range(1, n_t)
-            ]
+            interval_values = values[:-1] if use_left_endpoint else values[1:]
             interval_data[name] = dict(zip(intervals, interval_values))
         return interval_data
@@ -10,6 +10,7 @@
 # All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
 # for full copyright and license information.
 #################################################################################
+import numpy as np
 import pyomo.common.unittest as unittest
 import pytest
 
@@ -18,6 +19,7 @@ import pyomo.dae as dae
 from idaes.apps.nmpc.dynamic_data import (
     assert_disjoint_intervals,
     load_inputs_into_model,
+    load_time_series_into_model,
     interval_data_from_time_series,
 )
 
@@ -103,6 +105,74 @@ class TestLoadInputs(unittest.TestCase):
             load_inputs_into_model(m, m.time, inputs)
 
 
+@pytest.mark.unit
+class TestLoadTimeSeries(unittest.TestCase):
+    def make_model(self):
+        m = pyo.ConcreteModel()
+        m.time = dae.ContinuousSet(initialize=[0, 1, 2, 3, 4, 5, 6])
+        m.v = pyo.Var(m.time, initialize=0)
+        m.p = pyo.Param(m.time, initialize=0, mutable=True)
+        return m
+
+    def test_load_time_series(self):
+        m = self.make_model()
+        data = (np.array([0.0, 3.0, 6.0]), {"v": np.array([0.5, 1.0, 2.0])})
+        load_time_series_into_model(m, m.time, data)
+        for t in m.time:
+            if t == 0:
+                self.assertEqual(m.v[t].value, 0.0)
+            elif t <= 3:
+                self.assertEqual(m.v[t].value, 1.0)
+            else:
+                self.assertEqual(m.v[t].value, 2.0)
+
+        load_time_series_into_model(m, m.time, data, use_left_endpoint=True)
+        self.assertEqual([m.v[t].value for t in m.time], [0, 0.5, 0.5, 0.5, 1, 1, 1])
+
+    def test_load_time_series_param(self):
+        m = self.make_model()
+        data = ([1, 2, 4], {"p": [1.0, 2.0, 3.0]})
+        load_time_series_into_model(m, m.time, data)
+        self.assertEqual([m.p[t].value for t in m.time], [0, 0, 2, 3, 3, 0, 0])
+
+    def test_load_time_series_tolerance(self):
+        m = self.make_model()
+        data = ([0.01, 2.99, 7.0], {"v": [1.0, 2.0, 3.0]})
+        load_time_series_into_model(m, m.time, data)
+        self.assertEqual([m.v[t].value for t in m.time], [0] * 7)
+
+        # The interval ending at 7.0 is skipped
+        load_time_series_into_model(m, m.time, data, time_tol=0.1)
+        self.assertEqual([m.v[t].value for t in m.time], [0, 2, 2, 2, 0, 0, 0])
+
+    def test_same_as_interval_data(self):
+        rng = np.random.default_rng(1)
+        series_time = np.sort(rng.uniform(-1, 7, 20))
+        values = rng.normal(size=20)
+        for use_left_endpoint in (False, True):
+            m1 = self.make_model()
+            m2 = self.make_model()
+            interval_data = interval_data_from_time_series(
+                (series_time, {"v": values}), use_left_endpoint
+            )
+            load_inputs_into_model(m1, m1.time, interval_data, time_tol=0.2)
+            load_time_series_into_model(
+                m2, m2.time, (series_time, {"v": values}), use_left_endpoint, 0.2
+            )
+            self.assertEqual(
+                [m1.v[t].value for t in m1.time], [m2.v[t].value for t in m2.time]
+            )
+
+    def test_load_time_series_exceptions(self):
+        m = self.make_model()
+        with self.assertRaisesRegex(RuntimeError, "must be sorted"):
+            load_time_series_into_model(m, m.time, ([0, 2, 1], {"v": [1, 2, 3]}))
+        with self.assertRaisesRegex(ValueError, "has 2 values"):
+            load_time_series_into_model(m, m.time, ([0, 1, 2], {"v": [1, 2]}))
+        with self.assertRaisesRegex(RuntimeError, "Could not find"):
+            load_time_series_into_model(m, m.time, ([0, 1], {"_v": [1, 2]}))
+
+
 @pytest.mark.unit
 class TestIntervalFromTimeSeries(unittest.TestCase):
     def test_singleton(self):
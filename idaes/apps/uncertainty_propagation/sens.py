@@ -32,16 +32,23 @@ from pyomo.environ import (
     ComponentUID,
     check_optimal_termination,
 )
+from pyomo.common.collections import ComponentSet
 from pyomo.common.sorting import sorted_robust
 from pyomo.core.expr import ExpressionReplacementVisitor
 
 from pyomo.common.modeling import unique_component_name
 from pyomo.opt import SolverFactory, SolverStatus
+from pyomo.contrib.pynumero.asl import AmplInterface
+from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
+from collections import namedtuple
+from contextlib import contextmanager
 import logging
 import os
 import shutil
+import tempfile
 from pyomo.common.dependencies import numpy as np, numpy_available
 from scipy import sparse
+from scipy.sparse import linalg as sparse_linalg
 
 logger = logging.getLogger("pyomo.contrib.sensitivity_toolbox")
 
@@ -68,6 +75,27 @@ _K_AUG_SUFFIXES = {
 }
 
 
+@contextmanager
+def _isolated_working_directory():
+    """Runs the enclosed code in a new temporary working directory, which is
+    removed afterwards. k_aug and dot_sens read and write their files in the
+    working directory, so runs in different processes must not share it.
+
+    The working directory is changed with os.chdir, which applies to the whole
+    process. This isolates runs in different processes only: other threads of
+    the process also see the temporary directory while the enclosed code runs,
+    so runs must not be made from several threads at once.
+    """
+    cwd = os.getcwd()
+    tmp_dir = tempfile.mkdtemp(prefix="idaes_sens_")
+    os.chdir(tmp_dir)
+    try:
+        yield tmp_dir
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+
+
 def _add_sensitivity_suffixes(block):
     suffix_dict = {}
     suffix_dict.update(_SIPOPT_SUFFIXES)
@@ -210,6 +238,11 @@ def get_dsdp(model, theta_names, theta, var_dic={}, tee=False, solver_options=No
               p2 = 5
     the function returns dx/dp and dp/dp, and column orders.
 
+    The k_aug files are written to a temporary working directory. As the
+    working directory is shared by all the threads of a process, this function
+    must not be called from several threads at once; use separate processes,
+    or get_sensitivities, which writes no files.
+
     The following terms are used to define the output dimensions:
     Ncon   = number of constraints
     Nvar   = number of variables (Nx + Ntheta)
@@ -281,23 +314,20 @@ def get_dsdp(model, theta_names, theta, var_dic={}, tee=False, solver_options=No
         original_Param.append(orig_param)
         perturbed_Param.append(ptb_param)
 
-    m_kaug_dsdp = sensitivity_calculation(
-        "kaug", m, original_Param, perturbed_Param, tee
-    )
-    try:
-        with open("./dsdp/col_row.col", "r") as myfile:
-            col = myfile.read().splitlines()
-        with open("./dsdp/col_row.row", "r") as myfile:
-            row = myfile.read().splitlines()
-        dsdp = np.loadtxt("./dsdp/dsdp_in_.in")
-    except Exception as e:
-        print("File not found.")
+    with _isolated_working_directory():
+        m_kaug_dsdp = sensitivity_calculation(
+            "kaug", m, original_Param, perturbed_Param, tee
+        )
+        try:
+            with open("./dsdp/col_row.col", "r") as myfile:
+                col = myfile.read().splitlines()
+            with open("./dsdp/col_row.row", "r") as myfile:
+                row = myfile.read().splitlines()
+            dsdp = np.loadtxt("./dsdp/dsdp_in_.in")
+        except Exception as e:
+            print("File not found.")
     dsdp = dsdp.reshape((len(theta_names), int(len(dsdp) / len(theta_names))))
     dsdp = dsdp[: len(theta_names), : len(col)]
-    try:
-        shutil.rmtree("dsdp", ignore_errors=True)
-    except OSError:
-        pass
     col = [i for i in col if SensitivityInterface.get_default_block_name() not in i]
     dsdp_out = np.zeros((len(theta_names), len(col)))
     # e.g) k_aug dsdp returns -dx1/dx1 = -1.0
@@ -322,6 +352,11 @@ def get_dfds_dcds(model, theta_names, tee=False, solver_options=None):
     - Variables = (x1, x2, x3, p1, p2)
     - Fix p1 and p2 with estimated values
 
+    The k_aug files are written to a temporary working directory. As the
+    working directory is shared by all the threads of a process, this function
+    must not be called from several threads at once; use separate processes,
+    or get_sensitivities, which writes no files.
+
     The following terms are used to define the output dimensions:
     Ncon   = number of constraints
     Nvar   = number of variables (Nx + Ntheta)
@@ -386,71 +421,332 @@ def get_dfds_dcds(model, theta_names, tee=False, solver_options=None):
     model.dof_v = Suffix(direction=Suffix.EXPORT)  #: SUFFIX FOR K_AUG
     model.rh_name = Suffix(direction=Suffix.IMPORT)  #: SUFFIX FOR K_AUG AS WELL
     kaug.options["print_kkt"] = ""
-    results = ipopt.solve(model, tee=tee)
+    # k_aug writes its files to the working directory, which is removed
+    # with all the generated files afterwards
+    with _isolated_working_directory():
+        results = ipopt.solve(model, tee=tee)
+
+        # Raise Exception if ipopt fails
+        if not check_optimal_termination(results):
+            raise RuntimeError(
+                f"Solver failed to return an optimal solution. Please check the solver output. "
+                f"{results.solver.Message}"
+            )
+
+        for o in model.component_objects(Objective, active=True):
+            f_mean = value(o)
+        model.ipopt_zL_in.update(model.ipopt_zL_out)
+        model.ipopt_zU_in.update(model.ipopt_zU_out)
+        #: run k_aug
+        kaug.solve(model, tee=tee)  #: always call k_aug AFTER ipopt.
+        model.write(
+            "col_row.nl", format="nl", io_options={"symbolic_solver_labels": True}
+        )
+        # get the column numbers of theta
+        line_dic = {}
+        try:
+            for v in theta_names:
+                line_dic[v] = line_num("col_row.col", v)
+            # load gradient of the objective function
+            gradient_f = np.loadtxt("./GJH/gradient_f_print.txt")
+            with open("col_row.col", "r") as myfile:
+                col = myfile.read().splitlines()
+            col = [
+                i for i in col if SensitivityInterface.get_default_block_name() not in i
+            ]
+            with open("col_row.row", "r") as myfile:
+                row = myfile.read().splitlines()
+        except Exception as e:
+            print("File not found.")
+            raise e
+        # load gradient of all constraints (sparse)
+        # If no constraint exists, return []
+        num_constraints = len(
+            list(
+                model.component_data_objects(Constraint, active=True, descend_into=True)
+            )
+        )
+        if num_constraints > 0:
+            try:
+                # load text file from kaug
+                gradient_c = np.loadtxt("./GJH/A_print.txt")
+                # This is a sparse matrix
+                # gradient_c[:,0] are column index
+                # gradient_c[:,1] are data index
+                # gradient_c[:,1] are the matrix values
+            except Exception as e:
+                print("kaug file ./GJH/A_print.txt not found.")
+
+            # Subtract 1 from row and column indices to convert from
+            # start at 1 (kaug) to start at 0 (numpy)
+            row_idx = gradient_c[:, 1] - 1
+            col_idx = gradient_c[:, 0] - 1
+            data = gradient_c[:, 2]
+            gradient_c = sparse.csr_matrix(
+                (data, (row_idx, col_idx)), shape=(len(row) - 1, len(col))
+            )
+        else:
+            gradient_c = np.array([])
+
+    return gradient_f, gradient_c, col, row, line_dic
+
+
+def _active_set(multipliers, lb, ub, tol=1e-6):
+    """This function finds the active constraints (or variable bounds) from
+    their multipliers in the Lagrangian f + multipliers^T * g, as Ipopt
+    returns them at the solution.
+
+    Equality constraints are always active. An inequality is active if its
+    multiplier has the sign of the bound it is active at, i.e., negative at
+    a lower bound and positive at an upper bound.
+
+    Parameters
+    ----------
+    multipliers: numpy.ndarray
+        Multipliers of the constraints (or variable bounds)
+    lb: numpy.ndarray
+        Lower bounds of the constraints (or variables), -inf if there is none
+    ub: numpy.ndarray
+        Upper bounds of the constraints (or variables), inf if there is none
+    tol: float, optional
+        Magnitude of the multiplier of an inequality above which it is active
+
+    Returns
+    -------
+    active: numpy.ndarray
+        Indices of the active constraints (or variable bounds)
+    """
+    return np.nonzero(
+        (lb == ub)
+        | ((multipliers < -tol) & np.isfinite(lb))
+        | ((multipliers > tol) & np.isfinite(ub))
+    )[0]
+
+
+def _kkt_sensitivities(hessian, jacobian, param_rows):
+    """This function calculates the sensitivity of the primal variables with
+    respect to parameters that enter the model only through equality
+    constraints of the form x[i] - p[i] = 0.
+
+    The KKT matrix [[H, A^T], [A, 0]] is factored once, and the sensitivities
+    for all the parameters are computed with one solve with multiple
+    right-hand sides. The right-hand side for parameter i is the unit vector
+    of the constraint row param_rows[i], since d/dp[i] (x[i] - p[i]) = -1.
+
+    Parameters
+    ----------
+    hessian: scipy.sparse matrix
+        Nvar by Nvar Hessian of the Lagrangian
+    jacobian: scipy.sparse matrix
+        Ncon by Nvar Jacobian of the active constraints and variable bounds
+    param_rows: list of int
+        Rows of the jacobian of the constraints that link the parameters to
+        the variables
+
+    Returns
+    -------
+    dsdp: numpy.ndarray
+        Ntheta by Nvar matrix. dx/dp, the sensitivity of the primal
+        variables with respect to the parameters
+    """
+    n_var = hessian.shape[0]
+    n_con = jacobian.shape[0]
+    kkt = sparse.bmat([[hessian, jacobian.transpose()], [jacobian, None]], format="csc")
+    rhs = np.zeros((n_var + n_con, len(param_rows)))
+    for i, r in enumerate(param_rows):
+        rhs[n_var + r, i] = 1.0
+    try:
+        lu = sparse_linalg.splu(kkt)
+    except RuntimeError as e:
+        raise RuntimeError(
+            "The KKT matrix is singular. Check that the active constraints are "
+            "linearly independent and the reduced Hessian is nonsingular."
+        ) from e
+    return lu.solve(rhs)[:n_var, :].T
+
 
-    # Raise Exception if ipopt fails
+def get_sensitivities(
+    model, theta_names, theta=None, tee=False, solver_options=None, tol=1e-6
+):
+    """This function calculates the gradient vectors of the objective function
+    and constraints with respect to the variables, and the sensitivity of the
+    variables with respect to the parameters (theta_names), in memory.
+
+    This is the same information as get_dfds_dcds and get_dsdp give, but the
+    derivatives are evaluated through PyNumero instead of k_aug, so no files
+    are written and it is safe to call from several processes at once. The
+    model is solved once with Ipopt, and the KKT matrix at the solution is
+    factored once for all the parameters. The active set and the Hessian of
+    the Lagrangian are taken from the multipliers Ipopt returns.
+
+    The following terms are used to define the output dimensions:
+    Ncon   = number of constraints
+    Nvar   = number of variables (Nx + Ntheta)
+    Nx     = the number of decision (primal) variables
+    Ntheta = number of uncertain parameters.
+
+    Parameters
+    ----------
+    model: Pyomo ConcreteModel
+        model should include exactly one active objective function
+    theta_names: list of strings
+        List of Var names
+    theta: dict, optional
+        Values of the parameters, by default the current values of the Vars
+    tee: bool, optional
+        Indicates that ef solver output should be teed
+    solver_options: dict, optional
+        Provides options to the solver (also the name of an attribute)
+    tol: float, optional
+        Tolerance to decide whether an inequality constraint or a variable
+        bound is active at the solution, from the magnitude of the multiplier
+        Ipopt returns for it
+
+    Returns
+    -------
+    tuple
+        results object containing
+
+        - gradient_f: numpy.ndarray
+            Length Nvar array. Gradient vector of the objective function with
+            respect to the (decision variables, parameters)
+        - gradient_c: scipy.sparse.csr.csr_matrix
+            Ncon by Nvar size sparse matrix. Gradient vector of the
+            constraints with respect to the (decision variables, parameters)
+        - dsdp: scipy.sparse.csr.csr_matrix
+            Ntheta by Nvar size sparse matrix. Gradient vector of the
+            (decision variables, parameters) with respect to parameters
+        - primals: numpy.ndarray
+            Length Nvar array. Values of the (decision variables, parameters)
+            at the solution
+        - col: list
+            Size Nvar. List of variable names
+        - row: list
+            Size Ncon+1. List of constraints and objective function names
+        - col_map: ComponentMap
+            Column of each variable of model
+        - row_map: ComponentMap
+            Row of each constraint of model
+
+    Raises
+    ------
+    RuntimeError
+        if the PyNumero ASL interface is not available, or Ipopt fails
+    """
+    if not AmplInterface.available():
+        raise RuntimeError(
+            "get_sensitivities requires the PyNumero ASL interface. "
+            "Use get_dsdp and get_dfds_dcds with k_aug instead."
+        )
+
+    m = model.clone()
+    param_cons = []
+    m.extra = ConstraintList()
+    for i, name in enumerate(theta_names):
+        var = ComponentUID(name).find_component_on(m)
+        # the parameters are fixed by the added constraints instead
+        var.unfix()
+        var.setlb(None)
+        var.setub(None)
+        param = Param(
+            initialize=value(var) if theta is None else theta[name], mutable=True
+        )
+        m.add_component(unique_component_name(m, "param_%s" % i), param)
+        param_cons.append(m.extra.add(var - param == 0))
+
+    # multipliers of the constraints and variable bounds at the solution
+    for name in ("dual", "ipopt_zL_out", "ipopt_zU_out"):
+        if m.component(name) is None:
+            m.add_component(name, Suffix(direction=Suffix.IMPORT))
+
+    ipopt = SolverFactory("ipopt")
+    if solver_options is not None:
+        ipopt.options = solver_options
+    results = ipopt.solve(m, tee=tee)
     if not check_optimal_termination(results):
         raise RuntimeError(
             f"Solver failed to return an optimal solution. Please check the solver output. "
             f"{results.solver.Message}"
         )
 
-    for o in model.component_objects(Objective, active=True):
-        f_mean = value(o)
-    model.ipopt_zL_in.update(model.ipopt_zL_out)
-    model.ipopt_zU_in.update(model.ipopt_zU_out)
-    #: run k_aug
-    kaug.solve(model, tee=tee)  #: always call k_aug AFTER ipopt.
-    model.write("col_row.nl", format="nl", io_options={"symbolic_solver_labels": True})
-    # get the column numbers of theta
-    line_dic = {}
-    try:
-        for v in theta_names:
-            line_dic[v] = line_num("col_row.col", v)
-        # load gradient of the objective function
-        gradient_f = np.loadtxt("./GJH/gradient_f_print.txt")
-        with open("col_row.col", "r") as myfile:
-            col = myfile.read().splitlines()
-        col = [i for i in col if SensitivityInterface.get_default_block_name() not in i]
-        with open("col_row.row", "r") as myfile:
-            row = myfile.read().splitlines()
-    except Exception as e:
-        print("File not found.")
-        raise e
-    # load gradient of all constraints (sparse)
-    # If no constraint exists, return []
-    num_constraints = len(
-        list(model.component_data_objects(Constraint, active=True, descend_into=True))
+    nlp = PyomoNLP(m)
+    x = nlp.get_primals()
+    jac = nlp.evaluate_jacobian().tocsr()
+    grad_f = nlp.evaluate_grad_objective()
+
+    # Ipopt reports the multipliers with the signs of the AMPL interface,
+    # i.e., with the opposite sign of the multipliers in the Lagrangian
+    # f + duals^T * g + bound_duals^T * x used by PyNumero
+    duals = -np.array([m.dual.get(c, 0.0) for c in nlp.get_pyomo_constraints()])
+    bound_duals = -np.array(
+        [
+            m.ipopt_zL_out.get(v, 0.0) + m.ipopt_zU_out.get(v, 0.0)
+            for v in nlp.get_pyomo_variables()
+        ]
     )
-    if num_constraints > 0:
-        try:
-            # load text file from kaug
-            gradient_c = np.loadtxt("./GJH/A_print.txt")
-            # This is a sparse matrix
-            # gradient_c[:,0] are column index
-            # gradient_c[:,1] are data index
-            # gradient_c[:,1] are the matrix values
-        except Exception as e:
-            print("kaug file ./GJH/A_print.txt not found.")
-
-        # Subtract 1 from row and column indices to convert from
-        # start at 1 (kaug) to start at 0 (numpy)
-        row_idx = gradient_c[:, 1] - 1
-        col_idx = gradient_c[:, 0] - 1
-        data = gradient_c[:, 2]
-        gradient_c = sparse.csr_matrix(
-            (data, (row_idx, col_idx)), shape=(len(row) - 1, len(col))
-        )
-    else:
-        gradient_c = np.array([])
-    # remove all generated files
 
-    shutil.move("col_row.nl", "./GJH/")
-    shutil.move("col_row.col", "./GJH/")
-    shutil.move("col_row.row", "./GJH/")
-    shutil.rmtree("GJH", ignore_errors=True)
+    # active set: equalities, and inequalities and variable bounds with a
+    # nonzero multiplier
+    active_con = _active_set(duals, nlp.constraints_lb(), nlp.constraints_ub(), tol)
+    active_var = _active_set(bound_duals, nlp.primals_lb(), nlp.primals_ub(), tol)
+    n_var = nlp.n_primals()
+    active_jac = sparse.vstack(
+        [
+            jac[active_con, :],
+            sparse.csr_matrix(
+                (np.ones(len(active_var)), (np.arange(len(active_var)), active_var)),
+                shape=(len(active_var), n_var),
+            ),
+        ],
+        format="csr",
+    )
 
-    return gradient_f, gradient_c, col, row, line_dic
+    nlp.set_duals(duals)
+    hessian = nlp.evaluate_hessian_lag()
+
+    con_index = {c: j for j, c in enumerate(active_con)}
+    param_rows = [con_index[j] for j in nlp.get_constraint_indices(param_cons)]
+    dsdp = _kkt_sensitivities(hessian, active_jac, param_rows)
+
+    # map the results back onto the original model
+    extra = ComponentSet(param_cons)
+    clone_cons = [c for c in nlp.get_pyomo_constraints() if c not in extra]
+    clone_vars = nlp.get_pyomo_variables()
+    col = [v.name for v in clone_vars]
+    row = [c.name for c in clone_cons] + [nlp.get_pyomo_objective().name]
+    col_map = ComponentMap(
+        (ComponentUID(v, context=m).find_component_on(model), j)
+        for j, v in enumerate(clone_vars)
+    )
+    row_map = ComponentMap(
+        (ComponentUID(c, context=m).find_component_on(model), j)
+        for j, c in enumerate(clone_cons)
+    )
+    gradient_c = jac[nlp.get_constraint_indices(clone_cons), :]
+
+    Output = namedtuple(
+        "Output",
+        [
+            "gradient_f",
+            "gradient_c",
+            "dsdp",
+            "primals",
+            "col",
+            "row",
+            "col_map",
+            "row_map",
+        ],
+    )
+    return Output(
+        grad_f,
+        sparse.csr_matrix(gradient_c),
+        sparse.csr_matrix(dsdp),
+        x,
+        col,
+        row,
+        col_map,
+        row_map,
+    )
 
 
 def line_num(file_name, target):
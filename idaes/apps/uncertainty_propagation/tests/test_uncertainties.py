@@ -26,15 +26,38 @@ from pyomo.environ import (
 )
 import pyomo.contrib.parmest.parmest as parmest
 
+from pyomo.contrib.pynumero.asl import AmplInterface
+from scipy import sparse
+
 from idaes.apps.uncertainty_propagation.uncertainties import (
     quantify_propagate_uncertainty,
     propagate_uncertainty,
+    monte_carlo_propagate_uncertainty,
     clean_variable_name,
+    _predict_samples,
+    _solve_samples,
+)
+from idaes.apps.uncertainty_propagation.sens import (
+    _active_set,
+    _isolated_working_directory,
+    _kkt_sensitivities,
+    get_sensitivities,
 )
 
 ipopt_available = SolverFactory("ipopt").available(exception_flag=False)
 kaug_available = SolverFactory("k_aug").available(exception_flag=False)
 dotsens_available = SolverFactory("dot_sens").available(exception_flag=False)
+asl_available = AmplInterface.available()
+highs_available = SolverFactory("appsi_highs").available(exception_flag=False)
+
+# get_sensitivities evaluates derivatives with the PyNumero ASL interface. CI
+# installs it with the IDAES extensions (idaes get-extensions), so the tests of
+# the end-to-end propagation run there.
+requires_asl = pytest.mark.skipif(
+    not asl_available,
+    reason="The PyNumero ASL interface (installed with idaes get-extensions) "
+    "is not available",
+)
 
 
 @pytest.mark.skipif(not ipopt_available, reason="The 'ipopt' command is not available")
@@ -670,3 +693,270 @@ class TestUncertaintyPropagation:
             [a == b for a, b in zip(sorted(theta_names), sorted(var_dic.values()))]
         )
         assert clean == False
+
+
+@pytest.mark.unit
+def test_kkt_sensitivities():
+    # min x1^2 + x2^2  s.t.  x1 + x2 - x3 = 0,  x3 - p = 0
+    hessian = sparse.diags([2.0, 2.0, 0.0])
+    jacobian = sparse.csr_matrix([[1.0, 1.0, -1.0], [0.0, 0.0, 1.0]])
+    dsdp = _kkt_sensitivities(hessian, jacobian, [1])
+    np.testing.assert_array_almost_equal(dsdp, [[0.5, 0.5, 1.0]])
+
+    # two parameters with one factorization
+    # min (x1 - x3)^2 + x2^2  s.t.  x3 - p1 = 0,  x4 - p2 = 0,  x2 - x4 = 0
+    hessian = sparse.csr_matrix(
+        [
+            [2.0, 0.0, -2.0, 0.0],
+            [0.0, 2.0, 0.0, 0.0],
+            [-2.0, 0.0, 2.0, 0.0],
+            [0.0, 0.0, 0.0, 0.0],
+        ]
+    )
+    jacobian = sparse.csr_matrix(
+        [[0.0, 0.0, 1.0, 0.0], [0.0, 1.0, 0.0, -1.0], [0.0, 0.0, 0.0, 1.0]]
+    )
+    dsdp = _kkt_sensitivities(hessian, jacobian, [0, 2])
+    np.testing.assert_array_almost_equal(
+        dsdp, [[1.0, 0.0, 1.0, 0.0], [0.0, 1.0, 0.0, 1.0]]
+    )
+
+
+@pytest.mark.unit
+def test_kkt_sensitivities_singular():
+    hessian = sparse.csr_matrix((2, 2))
+    jacobian = sparse.csr_matrix([[1.0, 0.0]])
+    with pytest.raises(RuntimeError, match="The KKT matrix is singular"):
+        _kkt_sensitivities(hessian, jacobian, [0])
+
+
+@pytest.mark.unit
+def test_active_set():
+    # equality, x >= 0 active, x <= 1 inactive, 0 <= x <= 1 active at each bound
+    lb = np.array([1.0, 0.0, -np.inf, 0.0, 0.0])
+    ub = np.array([1.0, np.inf, 1.0, 1.0, 1.0])
+    multipliers = np.array([0.0, -2.0, 1e-9, -1.0, 3.0])
+    np.testing.assert_array_equal(_active_set(multipliers, lb, ub), [0, 1, 3, 4])
+
+    # multipliers with the wrong sign for the bound are not active
+    multipliers = np.array([5.0, 2.0, -1.0, 0.0, 0.0])
+    np.testing.assert_array_equal(_active_set(multipliers, lb, ub), [0])
+
+    assert len(_active_set(np.zeros(0), np.zeros(0), np.zeros(0))) == 0
+
+
+@pytest.mark.unit
+def test_isolated_working_directory():
+    cwd = os.getcwd()
+    with _isolated_working_directory() as tmp_dir:
+        assert os.path.samefile(os.getcwd(), tmp_dir)
+        with open("col_row.nl", "w") as f:
+            f.write("")
+    assert os.getcwd() == cwd
+    assert not os.path.exists(tmp_dir)
+
+
+@pytest.mark.skipif(not ipopt_available, reason="The 'ipopt' command is not available")
+@requires_asl
+@pytest.mark.component
+def test_get_sensitivities():
+    m = ConcreteModel()
+    m.x1 = Var(initialize=1)
+    m.x2 = Var(initialize=1)
+    m.p = Var(initialize=4)
+    m.c = Constraint(expr=m.x1 + m.x2 == m.p)
+    m.obj = Objective(expr=m.x1**2 + m.x2**2)
+
+    results = get_sensitivities(m, ["p"], {"p": 4})
+
+    col = results.col_map
+    assert set(results.col) == {"x1", "x2", "p"}
+    assert results.row == ["c", "obj"]
+    assert results.row_map[m.c] == 0
+    assert results.gradient_f[col[m.x1]] == pytest.approx(4.0)
+    assert results.gradient_f[col[m.p]] == pytest.approx(0.0)
+    assert results.gradient_c.shape == (1, 3)
+    assert results.gradient_c[0, col[m.p]] == pytest.approx(-1.0)
+    dsdp = results.dsdp.toarray()
+    assert dsdp[0, col[m.x1]] == pytest.approx(0.5)
+    assert dsdp[0, col[m.x2]] == pytest.approx(0.5)
+    assert dsdp[0, col[m.p]] == pytest.approx(1.0)
+
+
+@pytest.mark.skipif(not ipopt_available, reason="The 'ipopt' command is not available")
+@requires_asl
+@pytest.mark.component
+def test_get_sensitivities_active_bound():
+    m = ConcreteModel()
+    m.x1 = Var(initialize=1, bounds=(None, 1))
+    m.x2 = Var(initialize=1)
+    m.p = Var(initialize=4)
+    m.c = Constraint(expr=m.x1 + m.x2 == m.p)
+    m.obj = Objective(expr=(m.x1 - 3) ** 2 + m.x2**2)
+
+    results = get_sensitivities(m, ["p"], {"p": 4})
+
+    # x1 stays at its upper bound
+    col = results.col_map
+    dsdp = results.dsdp.toarray()
+    assert results.primals[col[m.x1]] == pytest.approx(1.0)
+    assert dsdp[0, col[m.x1]] == pytest.approx(0.0, abs=1e-8)
+    assert dsdp[0, col[m.x2]] == pytest.approx(1.0)
+
+
+@pytest.mark.skipif(not ipopt_available, reason="The 'ipopt' command is not available")
+@requires_asl
+@pytest.mark.component
+def test_propagate_uncertainty_pynumero():
+    model_uncertain = ConcreteModel()
+    model_uncertain.asymptote = Var(initialize=15)
+    model_uncertain.rate_constant = Var(initialize=0.5)
+    model_uncertain.obj = Objective(
+        expr=model_uncertain.asymptote * (1 - exp(-model_uncertain.rate_constant * 10)),
+    )
+    theta = {"asymptote": 19.142575284617866, "rate_constant": 0.53109137696521}
+    cov = np.array([[6.30579403, -0.4395341], [-0.4395341, 0.04193591]])
+
+    propagate_results = propagate_uncertainty(
+        model_uncertain,
+        theta,
+        cov,
+        ["asymptote", "rate_constant"],
+        method="pynumero",
+    )
+
+    np.testing.assert_array_almost_equal(
+        propagate_results.gradient_f, [0.9950625870024135, 0.9451480001755206]
+    )
+    np.testing.assert_array_almost_equal(
+        propagate_results.dsdp.toarray(), [[1.0, 0.0], [0.0, 1.0]]
+    )
+    assert list(propagate_results.propagation_c) == []
+    assert propagate_results.propagation_f == pytest.approx(5.45439337747349, rel=1e-6)
+
+
+@pytest.mark.unit
+def test_propagate_uncertainty_method():
+    model_uncertain = ConcreteModel()
+    model_uncertain.x = Var(initialize=1)
+    model_uncertain.obj = Objective(expr=model_uncertain.x)
+    with pytest.raises(ValueError, match="method must be either"):
+        propagate_uncertainty(
+            model_uncertain, {"x": 1}, np.eye(1), ["x"], method="finite_difference"
+        )
+
+
+@pytest.mark.unit
+def test_predict_samples():
+    x0 = np.array([1.0, 20.0, 2.0])
+    dsdp = np.array([[1.0, 0.0, 0.5], [0.0, 1.0, 0.0]])
+    theta0 = np.array([1.0, 20.0])
+    theta_samples = np.array([[1.05, 20.0], [1.0, 23.0], [1.2, 20.0], [0.95, 19.0]])
+    lb = np.array([-np.inf, -np.inf, 1.99])
+    ub = np.full(3, np.inf)
+
+    samples_x, resolved = _predict_samples(x0, dsdp, theta0, theta_samples, lb, ub, 0.1)
+
+    np.testing.assert_array_almost_equal(
+        samples_x,
+        [[1.05, 20.0, 2.025], [1.0, 23.0, 2.0], [1.2, 20.0, 2.1], [0.95, 19.0, 1.975]],
+    )
+    # 3/20 and 0.2/1 are outside the trust region, 1.975 violates the bound
+    assert list(resolved) == [False, True, True, True]
+
+
+@pytest.mark.unit
+def test_monte_carlo_propagate_uncertainty_options():
+    model_uncertain = ConcreteModel()
+    model_uncertain.x = Var(initialize=1)
+    model_uncertain.obj = Objective(expr=model_uncertain.x)
+    with pytest.raises(ValueError, match="n_samples should be a positive integer"):
+        monte_carlo_propagate_uncertainty(
+            model_uncertain, {"x": 1}, np.eye(1), ["x"], n_samples=0
+        )
+    with pytest.raises(ValueError, match="n_workers should be a positive integer"):
+        monte_carlo_propagate_uncertainty(
+            model_uncertain, {"x": 1}, np.eye(1), ["x"], n_workers=0
+        )
+    with pytest.raises(ValueError, match="cov must be a n x n matrix"):
+        monte_carlo_propagate_uncertainty(model_uncertain, {"x": 1}, np.eye(2), ["x"])
+
+
+@pytest.mark.skipif(not highs_available, reason="appsi_highs is not available")
+@pytest.mark.component
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_solve_samples(n_workers, capsys):
+    m = ConcreteModel()
+    m.a = Var(initialize=1)
+    m.b = Var(initialize=1)
+    m.y = Var(bounds=(0, 10))
+    m.c = Constraint(expr=m.y == 2 * m.a + m.b)
+    m.obj = Objective(expr=m.y)
+    state = (m, [m.a, m.b], [m.a, m.b, m.y], m.obj, SolverFactory("appsi_highs"))
+    args = [
+        (np.array([1.0, 1.0]), np.array([1.0, 1.0, 2.5])),
+        # y = 11 is outside the bounds
+        (np.array([3.0, 5.0]), np.array([3.0, 5.0, 10.0])),
+        (np.array([2.0, 0.5]), np.array([2.0, 0.5, 4.0])),
+    ]
+
+    solutions = _solve_samples(state, args, n_workers=n_workers, tee=True)
+
+    assert solutions[0][0] == pytest.approx([1.0, 1.0, 3.0])
+    assert solutions[0][1] == pytest.approx(3.0)
+    assert solutions[1] == (None, None)
+    assert solutions[2][0] == pytest.approx([2.0, 0.5, 4.5])
+    assert solutions[2][1] == pytest.approx(4.5)
+    if n_workers == 1:
+        # the solver output is shown
+        assert "HiGHS" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(not ipopt_available, reason="The 'ipopt' command is not available")
+@requires_asl
+@pytest.mark.component
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_monte_carlo_propagate_uncertainty(n_workers):
+    m = ConcreteModel()
+    m.asymptote = Var(initialize=15)
+    m.rate_constant = Var(initialize=0.5)
+    m.y = Var(initialize=15)
+    m.c = Constraint(expr=m.y == m.asymptote * (1 - exp(-m.rate_constant * 10)))
+    m.obj = Objective(expr=m.y)
+    theta = {"asymptote": 19.142575284617866, "rate_constant": 0.53109137696521}
+    cov = np.array([[6.30579403, -0.4395341], [-0.4395341, 0.04193591]])
+
+    results = monte_carlo_propagate_uncertainty(
+        m,
+        theta,
+        cov,
+        ["asymptote", "rate_constant"],
+        n_samples=200,
+        n_workers=n_workers,
+        seed=42,
+    )
+
+    assert results.samples_f.shape == (200,)
+    assert results.samples_x.shape == (200, 3)
+    assert 0 < np.count_nonzero(results.resolved) < 200
+    assert not np.any(results.failed)
+    col = [results.col.index("asymptote"), results.col.index("rate_constant")]
+    np.testing.assert_array_almost_equal(
+        results.samples_x[:, col], results.theta_samples
+    )
+    # samples outside the trust region are solved exactly
+    a, k = results.theta_samples[results.resolved].T
+    np.testing.assert_array_almost_equal(
+        results.samples_f[results.resolved], a * (1 - np.exp(-k * 10))
+    )
+    np.testing.assert_array_almost_equal(
+        results.samples_x[:, results.col.index("y")], results.samples_f
+    )
+    assert results.quantiles_f.shape == (3,)
+    assert results.quantiles_f[0] < results.quantiles_f[1] < results.quantiles_f[2]
+    # the spread agrees with the linearized propagation
+    assert np.std(results.samples_f) == pytest.approx(
+        np.sqrt(5.45439337747349), rel=0.2
+    )
+    # the model is left at the estimated parameters
+    assert m.asymptote.value == pytest.approx(theta["asymptote"])
@@ -26,7 +26,9 @@ from idaes.apps.uncertainty_propagation.sens import (
     SensitivityInterface,
     get_dsdp,
     get_dfds_dcds,
+    get_sensitivities,
 )
+from idaes.core.util.parallel import fork_available, get_worker_state, worker_pool
 
 # will replace with pyomo
 # (Pyomo PR 1613: https://github.com/pyomo/pyomo/pull/1613/)
@@ -213,7 +215,13 @@ def quantify_propagate_uncertainty(
 
 
 def propagate_uncertainty(
-    model_uncertain, theta, cov, theta_names, tee=False, solver_options=None
+    model_uncertain,
+    theta,
+    cov,
+    theta_names,
+    tee=False,
+    solver_options=None,
+    method="k_aug",
 ):
     """This function calculates gradient vector, expectation, and variance of
     the objective function and constraints  of the model for given estimated
@@ -243,6 +251,10 @@ def propagate_uncertainty(
     solver_options : dict, optional
         Provides options to the solver (also the name of an attribute),
         by default None
+    method : str, optional
+        "k_aug" to calculate the sensitivities with k_aug and dot_sens, or
+        "pynumero" to calculate them in memory with PyNumero (see
+        get_sensitivities), by default "k_aug"
 
     Returns
     -------
@@ -308,6 +320,11 @@ def propagate_uncertainty(
                          n = len(theta_names)"""
         )
 
+    if method not in ("k_aug", "pynumero"):
+        raise ValueError(
+            f"method must be either 'k_aug' or 'pynumero', but {method} was given."
+        )
+
     if len(theta_names) != len(theta):
         raise ValueError(
             """theta_names and theta must have the same number 
@@ -321,9 +338,21 @@ def propagate_uncertainty(
         model.find_component(var_dic[v]).setub(theta[v])
     # get gradient of the objective function, constraints,
     # and the column,row names
-    dsdp, col = get_dsdp(model, theta_names, theta, var_dic, tee)
-    dsdp = dsdp.toarray().T  # change shape, Nvar by Ntheta
-    gradient_f, gradient_c, col, row, line_dic = get_dfds_dcds(model, theta_names, tee)
+    if method == "pynumero":
+        sens = get_sensitivities(model, theta_names, theta, tee, solver_options)
+        dsdp = sens.dsdp.toarray().T  # change shape, Nvar by Ntheta
+        gradient_f, gradient_c, col, row = (
+            sens.gradient_f,
+            sens.gradient_c,
+            sens.col,
+            sens.row,
+        )
+    else:
+        dsdp, col = get_dsdp(model, theta_names, theta, var_dic, tee)
+        dsdp = dsdp.toarray().T  # change shape, Nvar by Ntheta
+        gradient_f, gradient_c, col, row, line_dic = get_dfds_dcds(
+            model, theta_names, tee
+        )
     num_constraints = len(
         list(model.component_data_objects(Constraint, active=True, descend_into=True))
     )
@@ -414,6 +443,312 @@ def propagate_uncertainty(
     return results
 
 
+def monte_carlo_propagate_uncertainty(
+    model_uncertain,
+    theta,
+    cov,
+    theta_names,
+    n_samples=1000,
+    quantiles=(0.05, 0.5, 0.95),
+    trust_radius=0.1,
+    n_workers=1,
+    seed=None,
+    tee=False,
+    solver_options=None,
+):
+    """This function propagates the uncertainty of the parameters to the
+    objective function and variables of the model by sampling. Parameter
+    samples are drawn from a normal distribution with the estimated optimal
+    parameters as mean and the given covariance matrix.
+
+    The model is solved once at the estimated parameters, and the KKT matrix
+    at that solution is factored once (see get_sensitivities). The solution
+    for each sample is predicted with a first-order step,
+    x(p) = x(theta) + dx/dp*(p - theta). Only the samples whose predicted step
+    leaves the trust region, or whose predicted solution violates a variable
+    bound, are solved again with Ipopt, starting from the predicted solution.
+    Samples which cannot be solved again keep their predicted solution, are
+    marked as failed, and are excluded from the quantiles.
+
+    The following terms are used to define the output dimensions:
+    Nvar   = number of variables (Nx + Ntheta)
+    Ntheta = number of uncertain parameters
+    Ns     = number of samples
+    Nq     = number of quantiles.
+
+    Parameters
+    ----------
+    model_uncertain : function or Pyomo ConcreteModel
+        Function is a python/ Function that generates an instance of the
+        Pyomo model
+    theta : dict
+        Size Ntheta python dictionary. Estimated parameters
+    cov : numpy.ndarray
+        Ntheta by Ntheta matrix. Covariance matrix of parameters
+    theta_names : list of strings
+        Size Ntheta. List of estimated l theta names
+    n_samples : int, optional
+        Number of parameter samples, by default 1000
+    quantiles : list of float, optional
+        Quantiles of the output distributions, by default (0.05, 0.5, 0.95)
+    trust_radius : float, optional
+        Largest predicted change of a variable, relative to the larger of its
+        value at the estimated parameters and one, for which the prediction is
+        accepted, by default 0.1
+    n_workers : int, optional
+        Number of processes to solve the samples outside the trust region, by
+        default 1
+    seed : int, optional
+        Seed of the random number generator, by default None
+    tee : bool, optional
+        Indicates that ef solver output should be teed, by default False
+    solver_options : dict, optional
+        Provides options to the solver (also the name of an attribute),
+        by default None
+
+    Returns
+    -------
+    tuple
+        results object containing the all information including
+
+        - results.theta_samples: numpy.ndarray
+            Ns by Ntheta matrix. Parameter samples
+        - results.samples_f: numpy.ndarray
+            Length Ns array. Objective function value of each sample
+        - results.samples_x: numpy.ndarray
+            Ns by Nvar matrix. Values of the (decision variables, parameters)
+            of each sample
+        - results.quantiles_f: numpy.ndarray
+            Length Nq array. Quantiles of the objective function
+        - results.quantiles_x: numpy.ndarray
+            Nq by Nvar matrix. Quantiles of the variables
+        - results.resolved: numpy.ndarray
+            Length Ns boolean array. Whether the sample was solved again
+            instead of predicted
+        - results.failed: numpy.ndarray
+            Length Ns boolean array. Whether the sample could not be solved
+            again. These samples keep their predicted solution and are not
+            included in the quantiles
+        - results.col: list
+            Size Nvar. List of variable names
+
+    Raises
+    ------
+    ValueError
+        if the sizes of theta, theta_names and cov do not match, or the
+        options are not valid
+    """
+    if isinstance(model_uncertain, Block):
+        model = model_uncertain
+    else:
+        model = model_uncertain()
+
+    cov_ = cov if isinstance(cov, np.ndarray) else cov.to_numpy()
+    if cov_.shape != (len(theta_names), len(theta_names)):
+        raise ValueError(
+            """cov must be a n x n matrix or dataframe where 
+                         n = len(theta_names)"""
+        )
+    if len(theta_names) != len(theta):
+        raise ValueError(
+            """theta_names and theta must have the same number 
+                          of elements"""
+        )
+    if not isinstance(n_samples, int) or n_samples < 1:
+        raise ValueError(
+            f"n_samples should be a positive integer, but {n_samples} was given."
+        )
+    if not isinstance(n_workers, int) or n_workers < 1:
+        raise ValueError(
+            f"n_workers should be a positive integer, but {n_workers} was given."
+        )
+
+    theta_names, var_dic, variable_clean = clean_variable_name(theta_names)
+    theta_vars = [model.find_component(var_dic[v]) for v in theta_names]
+    theta0 = np.array([theta[v] for v in theta_names], dtype=float)
+
+    sens = get_sensitivities(model, theta_names, theta, tee, solver_options)
+    col_vars = [None] * len(sens.col)
+    for v, j in sens.col_map.items():
+        col_vars[j] = v
+    objective = next(model.component_data_objects(Objective, active=True))
+    for v, val in zip(col_vars, sens.primals):
+        v.set_value(float(val), skip_validation=True)
+    f0 = value(objective)
+
+    rng = np.random.default_rng(seed)
+    theta_samples = rng.multivariate_normal(theta0, cov_, size=n_samples)
+
+    lb = np.array([-np.inf if v.lb is None else v.lb for v in col_vars])
+    ub = np.array([np.inf if v.ub is None else v.ub for v in col_vars])
+    # the parameters are not bounded by their nominal values
+    for v in theta_vars:
+        lb[sens.col_map[v]] = -np.inf
+        ub[sens.col_map[v]] = np.inf
+    samples_x, resolved = _predict_samples(
+        sens.primals,
+        sens.dsdp.toarray(),
+        theta0,
+        theta_samples,
+        lb,
+        ub,
+        trust_radius,
+    )
+    samples_f = f0 + (samples_x - sens.primals) @ sens.gradient_f
+
+    solver = SolverFactory("ipopt")
+    if solver_options is not None:
+        solver.options = solver_options
+    args = [(theta_samples[i], samples_x[i]) for i in np.nonzero(resolved)[0]]
+    fixed = [v.fixed for v in theta_vars]
+    try:
+        solutions = _solve_samples(
+            (model, theta_vars, col_vars, objective, solver), args, n_workers, tee
+        )
+    finally:
+        for v, val, was_fixed in zip(theta_vars, theta0, fixed):
+            v.set_value(float(val), skip_validation=True)
+            v.fixed = was_fixed
+        for v, val in zip(col_vars, sens.primals):
+            v.set_value(float(val), skip_validation=True)
+
+    failed = np.zeros(n_samples, dtype=bool)
+    for i, (x, f) in zip(np.nonzero(resolved)[0], solutions):
+        if x is None:
+            # keep the prediction, but do not use it in the quantiles
+            failed[i] = True
+        else:
+            samples_x[i] = x
+            samples_f[i] = f
+    n_failed = np.count_nonzero(failed)
+    if n_failed > 0:
+        logger.warning(
+            f"{n_failed} of {len(args)} samples outside the trust region could not "
+            f"be solved and are excluded from the quantiles."
+        )
+
+    if n_failed < n_samples:
+        quantiles_f = np.quantile(samples_f[~failed], quantiles)
+        quantiles_x = np.quantile(samples_x[~failed], quantiles, axis=0)
+    else:
+        quantiles_f = np.full(np.shape(quantiles), np.nan)
+        quantiles_x = np.full(np.shape(quantiles) + samples_x.shape[1:], np.nan)
+
+    Output = namedtuple(
+        "Output",
+        [
+            "theta_samples",
+            "samples_f",
+            "samples_x",
+            "quantiles_f",
+            "quantiles_x",
+            "resolved",
+            "failed",
+            "col",
+        ],
+    )
+    return Output(
+        theta_samples,
+        samples_f,
+        samples_x,
+        quantiles_f,
+        quantiles_x,
+        resolved,
+        failed,
+        sens.col,
+    )
+
+
+def _predict_samples(x0, dsdp, theta0, theta_samples, lb, ub, trust_radius):
+    """This function predicts the solution for parameter samples with a
+    first-order step from the solution at theta0, and decides which samples
+    have to be solved again.
+
+    Parameters
+    ----------
+    x0 : numpy.ndarray
+        Length Nvar array. Solution at theta0
+    dsdp : numpy.ndarray
+        Ntheta by Nvar matrix. dx/dp at theta0
+    theta0 : numpy.ndarray
+        Length Ntheta array. Nominal parameters
+    theta_samples : numpy.ndarray
+        Ns by Ntheta matrix. Parameter samples
+    lb, ub : numpy.ndarray
+        Length Nvar arrays. Variable bounds, infinite if unbounded
+    trust_radius : float
+        Largest accepted change of a variable, relative to the larger of its
+        value in x0 and one
+
+    Returns
+    -------
+    samples_x : numpy.ndarray
+        Ns by Nvar matrix. Predicted solutions
+    resolved : numpy.ndarray
+        Length Ns boolean array. Whether the prediction is outside the trust
+        region or violates a bound
+    """
+    steps = (theta_samples - theta0) @ dsdp
+    samples_x = x0 + steps
+    scale = np.maximum(np.abs(x0), 1.0)
+    outside = np.max(np.abs(steps) / scale, axis=1) > trust_radius
+    violated = np.any((samples_x < lb) | (samples_x > ub), axis=1)
+    return samples_x, outside | violated
+
+
+def _solve_samples(state, args, n_workers=1, tee=False):
+    """This function solves the model for each parameter sample, starting from
+    its predicted solution, in separate processes if n_workers > 1 and the
+    platform can fork processes.
+
+    Parameters
+    ----------
+    state : tuple
+        Model, list of parameter Vars, list of (decision variables,
+        parameters) Vars, objective and solver
+    args : list of tuples
+        Parameter values and predicted solution of each sample
+    n_workers : int, optional
+        Number of processes, by default 1
+    tee : bool, optional
+        Indicates that ef solver output should be teed, by default False
+
+    Returns
+    -------
+    list of tuples
+        Values of the (decision variables, parameters) and of the objective
+        function for each sample, or (None, None) if the solve failed
+    """
+    if n_workers > 1 and len(args) > 1 and fork_available():
+        # the workers are forked with the model
+        with worker_pool(state, max_workers=min(n_workers, len(args))) as pool:
+            return list(pool.map(_solve_sample_in_worker, [(a, tee) for a in args]))
+    return [_solve_sample(state, a, tee) for a in args]
+
+
+def _solve_sample(state, args, tee=False):
+    """This function solves the model for a parameter sample, starting from
+    the predicted solution, and returns the values of the (decision
+    variables, parameters) and the objective function, or (None, None) if the
+    solve fails.
+    """
+    theta_values, x_pred = args
+    model, theta_vars, col_vars, objective, solver = state
+    for v, val in zip(col_vars, x_pred):
+        v.set_value(float(val), skip_validation=True)
+    for v, val in zip(theta_vars, theta_values):
+        v.fix(float(val))
+    results = solver.solve(model, tee=tee, load_solutions=False)
+    if not check_optimal_termination(results):
+        return None, None
+    model.solutions.load_from(results)
+    return [value(v) for v in col_vars], value(objective)
+
+
+def _solve_sample_in_worker(args):
+    return _solve_sample(get_worker_state(), *args)
+
+
 # TODO: Improve the robustness of Parmest then remove this function.
 def clean_variable_name(theta_names):
     """This function removes all ' and spaces in theta_names. Note that
@@ -41,6 +41,7 @@ from idaes.core.util.exceptions import (
 )
 from idaes.core.util.tables import stream_table_dataframe_to_string
 from idaes.core.util.model_statistics import (
+    DegreesOfFreedomTracker,
     degrees_of_freedom,
     number_variables,
     number_activated_constraints,
@@ -249,6 +250,26 @@ class ProcessBlockData(BlockData):
             kwargs = self.parent_component()._block_data_config_default
         self.config = self.CONFIG(kwargs)
 
+    def track_degrees_of_freedom(self):
+        """
+        Return a context manager for incremental tracking of the degrees of
+        freedom of this block and all of its sub-blocks. Inside the with
+        statement, degrees_of_freedom() returns the tracked value for any of these
+        blocks without walking the model, e.g.::
+
+            with m.fs.track_degrees_of_freedom() as tracker:
+                ...
+
+        Whilst tracking, Var fixing and component activation are hooked for all
+        Pyomo models in the process; see DegreesOfFreedomTracker for details.
+        Call rebuild() on the tracker after adding or removing components or
+        changing the form of constraints.
+
+        Returns:
+            DegreesOfFreedomTracker
+        """
+        return DegreesOfFreedomTracker(self)
+
     def fix_initial_conditions(self, state="steady-state"):
         """This method fixes the initial conditions for dynamic models.
 
@@ -20,11 +20,21 @@ from io import StringIO
 import types
 import pandas
 
-from pyomo.environ import Block, ConcreteModel, Set, Var, Param, Expression, units
+from pyomo.environ import (
+    Block,
+    ConcreteModel,
+    Constraint,
+    Set,
+    Var,
+    Param,
+    Expression,
+    units,
+)
 
 from idaes.core.base.process_base import ProcessBaseBlock
 from idaes.core import FlowsheetBlockData, declare_process_block_class
 from idaes.core.initialization import BlockTriangularizationInitializer
+from idaes.core.util.model_statistics import degrees_of_freedom
 
 
 @declare_process_block_class("Flowsheet")
@@ -108,6 +118,22 @@ Unit : b                                                                   Time:
     assert stream.getvalue().strip() == expected.strip()
 
 
+@pytest.mark.unit
+def test_track_degrees_of_freedom():
+    m = ConcreteModel()
+    m.b = ProcessBaseBlock()
+    m.b.v = Var([1, 2])
+    m.b.c = Constraint(expr=m.b.v[1] == m.b.v[2])
+
+    with m.b.track_degrees_of_freedom() as tracker:
+        assert tracker.is_tracking(m.b)
+        assert degrees_of_freedom(m.b) == 1
+        m.b.v[1].fix(1)
+        assert tracker.degrees_of_freedom(m.b) == 0
+        assert degrees_of_freedom(m.b) == 0
+    assert not tracker.is_tracking(m.b)
+
+
 @pytest.mark.unit
 def test_report_perf_dict():
     m = ConcreteModel()
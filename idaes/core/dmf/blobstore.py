@@ -0,0 +1,280 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Content-addressed store for the data files of DMF resources.
+
+Each distinct file content is stored once, under its SHA-1 hash. The copy of a
+data file in a resource's data file directory is a hard link to the stored
+file, so adding the same file to many resources does not use any more disk
+space. The number of links to a stored file is its reference count: when the
+last resource using it is removed, the stored file is removed too.
+
+If hard links are not supported, e.g. because the resource directory is on a
+different file system, the data file is copied as before.
+
+Stored files, and so the hard links to them, are made read-only. A data file
+that is opened for writing must first be replaced by a private copy with
+`unshare`, so that other resources with the same content are not changed.
+"""
+# system
+import gzip
+import hashlib
+import logging
+import os
+from pathlib import Path
+import shutil
+import stat
+import tempfile
+from typing import Optional, Union
+
+_log = logging.getLogger(__name__)
+
+#: Compression for stored files
+GZIP = "gzip"
+#: Suffix of compressed files
+GZIP_SUFFIX = ".gz"
+
+_BLOCK_SIZE = 1 << 16
+
+_WRITE_BITS = stat.S_IWUSR | stat.S_IWGRP | stat.S_IWOTH
+
+
+def _set_writable(path: Union[str, Path], writable: bool):
+    mode = stat.S_IMODE(os.stat(path).st_mode)
+    os.chmod(path, mode | stat.S_IWUSR if writable else mode & ~_WRITE_BITS)
+
+
+def _unlink(path: Union[str, Path]):
+    # read-only files cannot be removed on Windows
+    try:
+        os.unlink(path)
+    except PermissionError:
+        _set_writable(path, True)
+        os.unlink(path)
+
+
+def unshare(path: Union[str, Path]) -> bool:
+    """Make a file a private, writable copy, if it is a hard link to a stored
+    file, so that it can be changed without changing the stored file and the
+    other files linked to it.
+
+    Args:
+        path: File to make private
+
+    Returns:
+        True if the file was replaced by a copy, False if it was already
+        private (in which case it is only made writable).
+
+    Raises:
+        OSError: If the file cannot be copied
+    """
+    if os.stat(path).st_nlink <= 1:
+        _set_writable(path, True)
+        return False
+    fd, tmp_name = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp")
+    os.close(fd)
+    try:
+        shutil.copy2(path, tmp_name)
+        _set_writable(tmp_name, True)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+    return True
+
+
+def file_sha1(path: Union[str, Path]) -> str:
+    """SHA-1 hash of the contents of a file."""
+    h = hashlib.sha1()
+    with open(path, "rb") as f:
+        blk = f.read(_BLOCK_SIZE)
+        while blk:
+            h.update(blk)
+            blk = f.read(_BLOCK_SIZE)
+    return h.hexdigest()
+
+
+class BlobStore:
+    """Content-addressed store of files.
+
+    Files are stored at ``<root>/<hash[:2]>/<hash>``. Stored files are
+    read-only, since every resource with the same data file shares the same
+    stored file.
+    """
+
+    def __init__(self, root: Union[str, Path], compression: Optional[str] = None):
+        """Create the store.
+
+        Args:
+            root: Directory for stored files. Created if it does not exist.
+            compression: If "gzip", store files compressed with gzip.
+                Otherwise store them as they are.
+
+        Raises:
+            ValueError: If the compression is not known
+        """
+        if compression and compression != GZIP:
+            raise ValueError(
+                f"Unknown compression '{compression}'. Expected '{GZIP}' or none"
+            )
+        self._root = Path(root)
+        self._root.mkdir(parents=True, exist_ok=True)
+        self.compression = compression or None
+
+    @property
+    def root(self) -> Path:
+        return self._root
+
+    def blob_path(self, digest: str) -> Path:
+        """Path to the stored file for a given content hash."""
+        name = digest + GZIP_SUFFIX if self.compression else digest
+        return self._root / digest[:2] / name
+
+    def add(self, src: Union[str, Path], digest: Optional[str] = None) -> str:
+        """Add a file to the store, unless a file with the same content is
+        already there.
+
+        Args:
+            src: File to add
+            digest: SHA-1 hash of the file, if already known. The file may have
+                changed since the hash was computed, so it is always hashed
+                again. If it still has this hash and is already stored, it is
+                not copied.
+
+        Returns:
+            SHA-1 hash of the file
+
+        Raises:
+            OSError: If the file cannot be read or stored
+        """
+        if digest is not None and self.blob_path(digest).exists():
+            if file_sha1(src) == digest:
+                return digest
+            _log.warning(f"Hash of file '{src}' has changed, storing under new hash")
+            digest = None
+        # Copy to a temporary file in the store, computing the hash as we go,
+        # then move it into place. The move is atomic, so concurrent adds of
+        # the same content are safe.
+        h = hashlib.sha1()
+        fd, tmp_name = tempfile.mkstemp(dir=self._root, prefix=".tmp")
+        try:
+            with open(src, "rb") as f_in, os.fdopen(fd, "wb") as raw_out:
+                if self.compression:
+                    f_out = gzip.GzipFile(fileobj=raw_out, mode="wb")
+                else:
+                    f_out = raw_out
+                blk = f_in.read(_BLOCK_SIZE)
+                while blk:
+                    h.update(blk)
+                    f_out.write(blk)
+                    blk = f_in.read(_BLOCK_SIZE)
+                if self.compression:
+                    f_out.close()
+            actual = h.hexdigest()
+            if digest is not None and actual != digest:
+                _log.warning(
+                    f"Hash of file '{src}' has changed, storing under new hash"
+                )
+            blob = self.blob_path(actual)
+            blob.parent.mkdir(exist_ok=True)
+            if blob.exists():
+                os.unlink(tmp_name)
+            else:
+                shutil.copystat(src, tmp_name)
+                _set_writable(tmp_name, False)
+                os.replace(tmp_name, blob)
+        except BaseException:
+            if os.path.exists(tmp_name):
+                os.unlink(tmp_name)
+            raise
+        return actual
+
+    def link(self, digest: str, dest: Union[str, Path]) -> bool:
+        """Make a stored file appear at `dest`.
+
+        Args:
+            digest: SHA-1 hash of stored file
+            dest: Path of new file
+
+        Returns:
+            True if `dest` is a hard link to the stored file, False if hard links
+            were not possible and it is a copy instead.
+
+        Raises:
+            OSError: If the file could not be linked or copied
+        """
+        blob = self.blob_path(digest)
+        try:
+            os.link(blob, dest)
+            return True
+        except OSError as err:
+            _log.debug(f"Cannot link '{blob}' to '{dest}', copying instead: {err}")
+        shutil.copy2(blob, dest)
+        _set_writable(dest, True)
+        self._collect(blob)
+        return False
+
+    def is_linked(self, digest: str, path: Union[str, Path]) -> Optional[Path]:
+        """Whether `path` is a hard link to a stored file with this hash.
+
+        Returns:
+            Path of the stored file, or None if `path` is not linked to it.
+        """
+        # check for both compressed and uncompressed stored files, since the
+        # compression setting may have changed since the file was stored
+        for blob in (
+            self._root / digest[:2] / name for name in (digest, digest + GZIP_SUFFIX)
+        ):
+            try:
+                if os.path.samefile(blob, path):
+                    return blob
+            except OSError:
+                pass
+        return None
+
+    def release(self, digest: str, path: Union[str, Path]) -> bool:
+        """Remove a file linked to a stored file, and the stored file as well
+        if nothing else links to it.
+
+        Args:
+            digest: SHA-1 hash of stored file
+            path: Path of file to remove
+
+        Returns:
+            True if the file was removed, False if it is not linked to the
+            stored file (in which case it is left alone).
+        """
+        blob = self.is_linked(digest, path)
+        if blob is None:
+            return False
+        _unlink(path)
+        if blob.exists():
+            # the stored file shares the mode of the removed link
+            _set_writable(blob, False)
+        self._collect(blob)
+        return True
+
+    def collect(self, digest: str):
+        """Remove the stored file with this hash if nothing else links to it."""
+        for name in (digest, digest + GZIP_SUFFIX):
+            self._collect(self._root / digest[:2] / name)
+
+    @staticmethod
+    def _collect(blob: Path):
+        # remove stored file if the store has the only link to it
+        try:
+            if os.stat(blob).st_nlink <= 1:
+                _unlink(blob)
+        except FileNotFoundError:
+            pass
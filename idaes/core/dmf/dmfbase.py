@@ -28,6 +28,7 @@ import re
 import shutil
 import sys
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from typing import Generator, Union
 
 # third-party
@@ -39,6 +40,7 @@ import yaml
 # local
 from . import errors
 from .resource import Resource
+from . import blobstore
 from . import resourcedb
 from . import workspace
 from .util import yaml_load, as_path
@@ -232,13 +234,29 @@ class DMF(workspace.Workspace, HasTraits):
     For details on the configuration files used by the DMF, see
     documentation for :class:`DMFConfig` (global configuration) and
     :class:`idaes.core.dmf.workspace.Workspace`.
+
+    Resources are stored with TinyDB by default. Setting ``db_backend: sqlite``
+    in the workspace configuration stores them in an indexed SQLite database
+    instead, which is much faster for workspaces with many resources. The first
+    time a workspace is opened with the SQLite backend, any existing TinyDB
+    resource database is copied into it.
     """
 
     db_file = Unicode(help="Database file name")
+    db_backend = Unicode(help="Database backend, 'tinydb' or 'sqlite'")
     datafile_dir = Unicode(help="Data file directory, relative to DMF root")
+    datafile_compression = Unicode(help="Compression for data files, '' or 'gzip'")
 
     CONF_DB_FILE = "db_file"
+    CONF_DB_BACKEND = "db_backend"
     CONF_DATA_DIR = "datafile_dir"
+    CONF_DATA_COMPRESSION = "datafile_compression"
+    #: Directory for the blob store, relative to the data file directory
+    BLOB_DIR = ".blobs"
+    #: Maximum number of threads used to copy the data files of a resource
+    COPY_WORKERS = 4
+    TINYDB_DB_FILE = "resourcedb.json"
+    SQLITE_DB_FILE = "resourcedb.sqlite"
     CONF_HELP_PATH = workspace.Fields.DOC_HTML_PATH
 
     # logging should really provide this
@@ -312,10 +330,27 @@ class DMF(workspace.Workspace, HasTraits):
                 raise errors.WorkspaceError(msg)
         # set up rest of DMF
         path = os.path.join(self.root, self.db_file)
-        self._db = resourcedb.ResourceDB(path)
+        if self.db_backend == resourcedb.SQLITE_BACKEND and not os.path.exists(path):
+            # one-shot migration of an existing TinyDB resource DB
+            tinydb_path = os.path.join(self.root, self.TINYDB_DB_FILE)
+            if os.path.exists(tinydb_path):
+                resourcedb.migrate_tinydb_to_sqlite(tinydb_path, path)
+        try:
+            self._db = resourcedb.open_resource_db(path, backend=self.db_backend)
+        except ValueError as err:
+            msg = 'Configuration "{}", database error: {}'.format(path, err)
+            raise errors.WorkspaceError(msg)
         self._datafile_path = os.path.join(self.root, self.datafile_dir)
         if not os.path.exists(self._datafile_path):
             os.mkdir(self._datafile_path, 0o750)
+        try:
+            self._blobs = blobstore.BlobStore(
+                os.path.join(self._datafile_path, self.BLOB_DIR),
+                compression=self.datafile_compression,
+            )
+        except ValueError as err:
+            msg = 'Configuration "{}", data file error: {}'.format(path, err)
+            raise errors.WorkspaceError(msg)
         # add create/modified date, and optional name/description
         _w = workspace.Workspace
         right_now = datetime.isoformat(datetime.now())
@@ -414,13 +449,31 @@ class DMF(workspace.Workspace, HasTraits):
 
     @default(CONF_DB_FILE)
     def _default_db_file(self):
-        return self.meta.get(self.CONF_DB_FILE, "resourcedb.json")
+        if self.db_backend == resourcedb.SQLITE_BACKEND:
+            default_file = self.SQLITE_DB_FILE
+        else:
+            default_file = self.TINYDB_DB_FILE
+        return self.meta.get(self.CONF_DB_FILE, default_file)
+
+    @default(CONF_DB_BACKEND)
+    def _default_db_backend(self):
+        return self.meta.get(self.CONF_DB_BACKEND, resourcedb.TINYDB_BACKEND)
 
     @default(CONF_DATA_DIR)
     def _default_res_dir(self):
         return self.meta.get(self.CONF_DATA_DIR, "files")
 
-    @observe(CONF_DB_FILE, CONF_DATA_DIR, CONF_HELP_PATH)
+    @default(CONF_DATA_COMPRESSION)
+    def _default_data_compression(self):
+        return self.meta.get(self.CONF_DATA_COMPRESSION, "")
+
+    @observe(
+        CONF_DB_FILE,
+        CONF_DB_BACKEND,
+        CONF_DATA_DIR,
+        CONF_DATA_COMPRESSION,
+        CONF_HELP_PATH,
+    )
     def _observe_setting(self, change):
         if change["type"] != "change":
             return
@@ -575,6 +628,9 @@ class DMF(workspace.Workspace, HasTraits):
             _log.debug("Not making a directory for datafiles")
             ddir = None
 
+        # Store the files to copy in the DMF blob store, in parallel, and link
+        # them into the datafiles dir
+        to_copy = []
         for datafile in rsrc.v["datafiles"]:
             # remove 'full_path' if added by previous pre-processing
             if "full_path" in datafile:
@@ -584,46 +640,47 @@ class DMF(workspace.Workspace, HasTraits):
             else:
                 do_copy = rsrc.do_copy
             if do_copy:
-                # The `do_copy` flag says do a copy of this datafile from its
-                # current path, say /a/path/to/file, into the resource's
-                # datafile-dir, say /a/dir/for/resources/, resulting in
-                # e.g. /a/dir/for/resources/file.
-                filepath = datafile["path"]
-                _, filename = os.path.split(filepath)
-                copydir = os.path.join(ddir, filename)
-                _log.debug(f'Copying datafile "{filepath}" to directory "{copydir}"')
-                try:
-                    shutil.copy2(filepath, copydir)
-                except (IOError, OSError) as err:
-                    msg = (
-                        'Cannot copy datafile from "{}" to DMF '
-                        'directory "{}": {}'.format(filepath, copydir, err)
-                    )
-                    _log.error(msg)
-                    raise errors.DMFError(msg)
-                # The `is_tmp` flag means to remove the original resource file
-                # after the copy is done.
-                if "is_tmp" in datafile:
-                    is_tmp = datafile["is_tmp"]
-                else:
-                    is_tmp = rsrc.is_tmp
-                if is_tmp:
-                    _log.debug(
-                        f"Temporary datafile flag is on, removing "
-                        f'original datafile "{filepath}"'
-                    )
-                    try:
-                        os.unlink(filepath)
-                    except OSError as err:
-                        _log.error(f'Removing temporary datafile "{filepath}": {err}')
-                    if "is_tmp" in datafile:  # remove this directive
-                        del datafile["is_tmp"]
-                datafile["path"] = filename
-                datafile["is_copy"] = True
-                if "do_copy" in datafile:  # remove this directive
-                    del datafile["do_copy"]
+                to_copy.append(datafile)
             else:
                 datafile["is_copy"] = False
+        if len(to_copy) > 1:
+            with ThreadPoolExecutor(
+                max_workers=min(len(to_copy), self.COPY_WORKERS)
+            ) as pool:
+                digests = list(
+                    pool.map(lambda df: self._store_datafile(df, ddir), to_copy)
+                )
+        else:
+            digests = [self._store_datafile(df, ddir) for df in to_copy]
+
+        for datafile, digest in zip(to_copy, digests):
+            filepath = datafile["path"]
+            # The `is_tmp` flag means to remove the original resource file
+            # after the copy is done.
+            if "is_tmp" in datafile:
+                is_tmp = datafile["is_tmp"]
+            else:
+                is_tmp = rsrc.is_tmp
+            if is_tmp:
+                _log.debug(
+                    f"Temporary datafile flag is on, removing "
+                    f'original datafile "{filepath}"'
+                )
+                try:
+                    os.unlink(filepath)
+                except OSError as err:
+                    _log.error(f'Removing temporary datafile "{filepath}": {err}')
+                if "is_tmp" in datafile:  # remove this directive
+                    del datafile["is_tmp"]
+            _, filename = os.path.split(filepath)
+            if self._blobs.compression:
+                filename += blobstore.GZIP_SUFFIX
+                datafile["compression"] = self._blobs.compression
+            datafile["path"] = filename
+            datafile["sha1"] = digest
+            datafile["is_copy"] = True
+            if "do_copy" in datafile:  # remove this directive
+                del datafile["do_copy"]
         # For idempotence, turn off these flags post-copy
         rsrc.do_copy = rsrc.is_tmp = False
         # Make sure datafiles dir is in sync
@@ -632,6 +689,64 @@ class DMF(workspace.Workspace, HasTraits):
         else:
             rsrc.v["datafiles_dir"] = str(ddir) if ddir else ""
 
+    def _store_datafile(self, datafile, ddir):
+        """Add a datafile to the blob store and link it into directory `ddir`.
+
+        The `do_copy` flag says do a copy of this datafile from its current
+        path, say /a/path/to/file, into the resource's datafile-dir, say
+        /a/dir/for/resources/, resulting in e.g. /a/dir/for/resources/file.
+        Files with the same contents share the same copy in the blob store.
+
+        Returns:
+            str: SHA-1 hash of the file
+        """
+        filepath = datafile["path"]
+        _, filename = os.path.split(filepath)
+        if self._blobs.compression:
+            filename += blobstore.GZIP_SUFFIX
+        copypath = os.path.join(ddir, filename)
+        _log.debug(f'Copying datafile "{filepath}" to "{copypath}"')
+        try:
+            digest = self._blobs.add(filepath, digest=datafile.get("sha1", None))
+            if os.path.exists(copypath):
+                os.unlink(copypath)
+            self._blobs.link(digest, copypath)
+        except (IOError, OSError) as err:
+            msg = 'Cannot copy datafile from "{}" to DMF ' 'directory "{}": {}'.format(
+                filepath, copypath, err
+            )
+            _log.error(msg)
+            raise errors.DMFError(msg)
+        return digest
+
+    def _release_datafiles(self, rsrc):
+        """Remove the copies of the datafiles of a resource, and any stored
+        files in the blob store that no other resource uses.
+        """
+        self._set_datafiles_full_path(rsrc)
+        ddirs = set()
+        for datafile in rsrc.v["datafiles"]:
+            if not (datafile.get("is_copy", False) and "sha1" in datafile):
+                continue
+            full_path = datafile["full_path"]
+            try:
+                if self._blobs.release(datafile["sha1"], full_path):
+                    ddirs.add(os.path.dirname(full_path))
+                elif os.path.exists(full_path):
+                    # a private copy, e.g. after the file was opened for writing
+                    os.unlink(full_path)
+                    self._blobs.collect(datafile["sha1"])
+                    ddirs.add(os.path.dirname(full_path))
+            except OSError as err:
+                _log.warning(f"Cannot remove datafile '{full_path}': {err}")
+        # remove the (system-generated) datafiles dir, if now empty
+        if not pathlib.Path(rsrc.v["datafiles_dir"]).is_absolute():
+            for ddir in ddirs:
+                try:
+                    os.rmdir(ddir)
+                except OSError:
+                    pass
+
     def count(self):
         return len(self._db)
 
@@ -832,20 +947,27 @@ class DMF(workspace.Workspace, HasTraits):
         Raises:
             NoSuchResourceError: if the starting resource is not found
         """
-        for depth, triple, meta in self.find_related(  # pylint: disable=unused-variable
-            rsrc, **kwargs
-        ):
-            if predicate is not None and triple.predicate != predicate:
-                continue
-            id_ = meta[Resource.ID_FIELD]
-            for r in self.find_by_id(id_):
-                yield self._postproc_resource(r)
+        # fetch all the related resources in one query
+        related_ids = [
+            meta[Resource.ID_FIELD]
+            for _, triple, meta in self.find_related(rsrc, **kwargs)
+            if predicate is None or triple.predicate == predicate
+        ]
+        found = self._db.find_by_ids(related_ids)
+        for id_ in related_ids:
+            if id_ in found:
+                yield self._postproc_resource(found[id_])
 
     def remove(self, identifier=None, filter_dict=None, update_relations=True):
         """Remove one or more resources, from its identifier or a filter.
         Unless told otherwise, this method will scan the DB and remove
         all relations that involve this resource.
 
+        The data files that were copied into the DMF for the removed resources
+        are deleted too. Files with the same content as a data file of another
+        resource are stored once, and kept until the last resource using them
+        is removed. Data files that were not copied are left alone.
+
         Args:
             identifier (str): Identifier for a resource.
             filter_dict (dict): Filter to use instead of identifier
@@ -877,7 +999,11 @@ class DMF(workspace.Workspace, HasTraits):
                 f"Cannot remove resource-id={identifier} filter={filter_dict}: Not found"
             )
             return
-        # TODO: Delete all associated data files!!
+        # Delete associated data files that are in the blob store
+        for i in id_list:
+            rsrc = self._db.get(i)
+            if rsrc is not None:
+                self._release_datafiles(rsrc)
         self._db.delete(idlist=id_list, internal_ids=True)
         # delete any added during this session
         for rsrc_id in id_list:
@@ -23,6 +23,7 @@ import argparse
 from collections import namedtuple
 from datetime import datetime
 import getpass
+import gzip
 import hashlib
 import json
 from json import JSONDecodeError
@@ -40,6 +41,7 @@ import pandas
 import yaml
 
 # local
+from . import blobstore
 from .util import datetime_timestamp, parse_datetime
 
 __author__ = "Dan Gunter"
@@ -176,6 +178,7 @@ RESOURCE_SCHEMA = {
                     "path": {"type": "string"},
                     "sha1": {"type": "string"},
                     "is_copy": {"type": "boolean"},
+                    "compression": {"type": "string"},
                 },
                 "required": ["path"],
             },
@@ -716,6 +719,9 @@ class Resource:
 
         Args:
             mode: If given, call `open(mode)` on the path and return a file object. Otherwise, return a Path object.
+                  Data files stored compressed are decompressed when they are opened, but a returned Path
+                  object is the path of the compressed file. Data files copied into the DMF are read-only
+                  links to shared files; opening one for writing first replaces it with a private copy.
             ignore_errors: If true, ignore failures on `open(mode)` of a path. This will only have an effect if
                   mode is not None (otherwise, no attempt is made to open the paths).
         Returns:
@@ -757,7 +763,21 @@ class Resource:
                 yield full_path
             else:
                 try:
-                    fp = full_path.open(mode=mode)
+                    if (
+                        any(c in mode for c in "wax+")
+                        and datafile.get("is_copy", False)
+                        and full_path.exists()
+                    ):
+                        # copy-on-write: do not change the file in the DMF blob
+                        # store, which other resources may share
+                        blobstore.unshare(full_path)
+                    if datafile.get("compression", None) == "gzip":
+                        # gzip.open() defaults to binary, Path.open() to text
+                        if "b" not in mode and "t" not in mode:
+                            mode += "t"
+                        fp = gzip.open(full_path, mode=mode)
+                    else:
+                        fp = full_path.open(mode=mode)
                 except FileNotFoundError:
                     if ignore_errors:
                         _log.warning(
@@ -15,8 +15,11 @@ Resource database.
 """
 # system
 from datetime import datetime
+import json
 import logging
+import os
 import re
+import sqlite3
 
 # third party
 from tinydb import TinyDB, Query
@@ -25,6 +28,7 @@ from tinydb import TinyDB, Query
 from . import errors
 from .resource import Resource
 from .resource import Triple, triple_from_resource_relations
+from .resource import RR_ID, RR_OBJ, RR_PRED, RR_ROLE, RR_SUBJ
 
 __author__ = "Dan Gunter <dkgunter@lbl.gov>"
 
@@ -49,10 +53,16 @@ class ResourceDB(object):
         """
         self._db = None
         self._gr = None
+        self._dbfile = None
+        self._relations = None
+        self._relations_sig = None
+        # (direction, key) of the index entries of each stored resource
+        self._relation_keys = {}
 
         if connection is not None:
             self._db = connection
         elif dbfile is not None:
+            self._dbfile = dbfile
             try:
                 db = TinyDB(dbfile)
             except IOError:
@@ -237,77 +247,148 @@ class ResourceDB(object):
     def find_related(self, id_, filter_dict=None, outgoing=True, maxdepth=0, meta=None):
         """Find all resources connected to the identified one.
 
+        The relations are read from an index of the relations of all resources,
+        which is built on first use and kept up to date as resources are added,
+        updated and removed, so the search only visits the connected resources.
+
         Args:
             id_ (str): Unique ID of target resource.
             filter_dict (dict): Filter to these resources
-            outgoing:
-            maxdepth:
+            outgoing: If True, follow relations from subject to object,
+                otherwise from object to subject.
+            maxdepth: Maximum depth of search; 0 or less means no limit.
             meta (List[str]): Metadata fields to extract
         Returns:
             Generator of (depth, relation, metadata)
         Raises:
             KeyError if the resource is not found.
         """
-        if maxdepth <= 0:
-            maxdepth = 9223372036854775807
-        # Get an iterator over all the resources, optionally
-        # filtered by an expression, as for find().
+        meta = meta or []
+        allowed = None
         if filter_dict:
-            filter_expr = self._create_filter_expr(filter_dict)
-            resource_list = self._db.search(filter_expr)
-        else:
-            resource_list = self._db.all()
-        # build adjacency list representing connections between resources
-        relation_map = {}
-        for rsrc in resource_list:
-            # print(f"@@ process resource: {rsrc[Resource.ID_FIELD]}")
-            # print(f"@@ resource relations: {rsrc['relations']}")
-            for rrel in rsrc["relations"]:
-                uuid = rsrc[Resource.ID_FIELD]
-                rel = triple_from_resource_relations(uuid, rrel)
-                # skip start of edge, get metadata, etc. at end of edge
-                if (outgoing and rel.subject == uuid) or (
-                    not outgoing and rel.object == uuid
-                ):
-                    # print(f"@@ do nothing for: {uuid}")
-                    continue
-                # add entry in map
-                key = rel.subject if outgoing else rel.object
-                # print(f"@@ add to relation map, key={key}")
-                meta_info = {k: rsrc[k] for k in meta}
-                value = (rel.subject, rel.predicate, rel.object, meta_info)
-                value_list = relation_map.get(key, None)
-                if value_list is None:
-                    relation_map[key] = [value]
-                else:
-                    value_list.append(value)
-        _log.debug(f"built relation map: {relation_map}")
-        # stop if there are no connections
-        if id_ not in relation_map:
+            allowed = set(self.find(filter_dict, id_only=True))
+        relation_map = self._relation_index(outgoing)
+
+        def edges_from(ids):
+            result = {}
+            for key in ids:
+                edges = [
+                    (subj, pred, obj, {k: rsrc[k] for k in meta})
+                    for subj, pred, obj, rsrc in relation_map.get(key, ())
+                    if allowed is None or rsrc.doc_id in allowed
+                ]
+                if edges:
+                    result[key] = edges
+            return result
+
+        return _search_relations(id_, edges_from, outgoing, maxdepth)
+
+    def _relation_index(self, outgoing):
+        """Get the relation index for one direction of search.
+
+        The index maps the identifier at the start of each edge to a list of
+        (subject, predicate, object, resource) tuples, where the resource is
+        the stored resource at the end of the edge.
+        """
+        if self._relations_current():
+            return self._relations[outgoing]
+        self._relations = {True: {}, False: {}}
+        self._relation_keys = {}
+        for rsrc in self._db.all():
+            self._index_relations(rsrc)
+        self._relations_sig = self._file_signature()
+        return self._relations[outgoing]
+
+    def _relations_current(self):
+        # the index is built, and the DB file was not changed by another process
+        return self._relations is not None and (
+            self._dbfile is None or self._file_signature() == self._relations_sig
+        )
+
+    def _index_relations(self, rsrc):
+        """Add the edges of the relations of a stored resource to the index.
+
+        The edges at the start of each identifier are kept in the order of the
+        resources in the database, as if the index was built from scratch.
+        """
+        uuid = rsrc[Resource.ID_FIELD]
+        keys = self._relation_keys.setdefault(rsrc.doc_id, set())
+        for rrel in rsrc["relations"]:
+            rel = triple_from_resource_relations(uuid, rrel)
+            if rel.subject == rel.object:
+                continue
+            # index at start of edge, get metadata, etc. at end of edge
+            direction = rel.subject != uuid
+            key = rel.subject if direction else rel.object
+            value = (rel.subject, rel.predicate, rel.object, rsrc)
+            edges = self._relations[direction].setdefault(key, [])
+            i = len(edges)
+            while i > 0 and edges[i - 1][3].doc_id > rsrc.doc_id:
+                i -= 1
+            edges.insert(i, value)
+            keys.add((direction, key))
+
+    def _unindex_relations(self, doc_id):
+        """Remove the edges of the relations of a stored resource from the index."""
+        for direction, key in self._relation_keys.pop(doc_id, ()):
+            edges = self._relations[direction]
+            remaining = [e for e in edges[key] if e[3].doc_id != doc_id]
+            if remaining:
+                edges[key] = remaining
+            else:
+                del edges[key]
+
+    def _update_relation_index(self, current, removed=(), added=()):
+        """Apply changes of stored resources to the relation index.
+
+        Args:
+            current (bool): Whether the index was current before the changes
+                were written, as given by :meth:`_relations_current`
+            removed (list[int]): Internal identifiers of removed or changed
+                resources
+            added (list[int]): Internal identifiers of added or changed resources
+        Returns:
+            None
+        """
+        if not current:
+            # rebuilt from scratch the next time it is needed
+            self._relations = None
             return
-        # Do a depth-first search through the edges, yield-ing
-        # the relations as we go
-        q, depth, visited = [], 0, set()
-        q.extend(relation_map[id_])
-        visited.add(id_)
-        while len(q) > 0 and depth < maxdepth:
-            depth += 1
-            # visit all the nodes in the queue
-            n = len(q)
-            for i in range(n):
-                relation = Triple(*q[i][:3])
-                yield (depth, relation, q[i][3])
-                if depth < maxdepth:
-                    # Follow relations from subject or object, depending on
-                    # the "direction" that we are searching.
-                    next_id = relation.object if outgoing else relation.subject
-                    # If there are relations, and we haven't already been to
-                    # this node, add them at the end of the queue; we will
-                    # visit them at the next depth increment.
-                    if next_id in relation_map and next_id not in visited:
-                        q.extend(relation_map[next_id])
-                        visited.add(next_id)
-            q = q[n:]  # pop off all the nodes we just visited
+        for doc_id in removed:
+            self._unindex_relations(doc_id)
+        for doc_id in added:
+            self._index_relations(self._db.get(doc_id=doc_id))
+        self._relations_sig = self._file_signature()
+
+    def _file_signature(self):
+        # detect changes to the DB file made by other processes
+        if self._dbfile is None:
+            return None
+        try:
+            st = os.stat(self._dbfile)
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def find_by_ids(self, identifiers):
+        """Get resources from a list of their unique (string) identifiers.
+
+        Args:
+            identifiers (list[str]): Resource identifiers
+
+        Returns:
+            dict: Resource for each identifier that was found
+        """
+        wanted = set(identifiers)
+        if not wanted:
+            return {}
+        qry = Query()
+        result = {}
+        for r in self._db.search(qry[Resource.ID_FIELD].one_of(list(wanted))):
+            rsrc = Resource(value=r)
+            rsrc.v["doc_id"] = r.doc_id
+            result[rsrc.id] = rsrc
+        return result
 
     def get(self, identifier):
         """Get a resource by identifier.
@@ -348,7 +429,9 @@ class ResourceDB(object):
         if self._db.contains(qry.id_ == resource.id):
             raise errors.DuplicateResourceError("put", resource.id)
         # add resource
-        self._db.insert(resource.v)
+        current = self._relations_current()
+        doc_id = self._db.insert(resource.v)
+        self._update_relation_index(current, added=[doc_id])
 
     def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
         """Delete one or more resources with given identifiers.
@@ -364,9 +447,10 @@ class ResourceDB(object):
         Returns:
             (list[str]) Identifiers
         """
+        current = self._relations_current()
         if internal_ids:
             doc_ids = idlist if idlist else [id_]
-            self._db.remove(doc_ids=doc_ids)
+            removed = self._db.remove(doc_ids=doc_ids)
         else:
             ID = Resource.ID_FIELD
             if filter_dict:
@@ -377,7 +461,8 @@ class ResourceDB(object):
                 cond = self._create_filter_expr({ID: [idlist]})
             else:
                 return
-            self._db.remove(cond=cond)
+            removed = self._db.remove(cond=cond)
+        self._update_relation_index(current, removed=removed)
 
     def update(self, id_, new_dict):
         """Update the identified resource with new values.
@@ -410,4 +495,558 @@ class ResourceDB(object):
             elif old.v[k] != v:
                 changed[k] = v
         _log.debug(f"update resource {id_} with new values: {changed}")
-        self._db.update(changed, self._create_filter_expr(id_cond))
+        self._update_fields(old, changed)
+
+    def _update_fields(self, old, changed):
+        """Write changed fields of a stored resource back to the database.
+
+        Args:
+            old (Resource): Stored resource, as returned by :meth:`find`
+            changed (dict): Fields of the resource that have new values
+        Returns:
+            None
+        """
+        id_cond = {Resource.ID_FIELD: old.id}
+        current = self._relations_current()
+        updated = self._db.update(changed, self._create_filter_expr(id_cond))
+        self._update_relation_index(current, removed=updated, added=updated)
+
+
+class SQLiteResourceDB(ResourceDB):
+    """Resource database stored in a SQLite file.
+
+    Each resource is stored as a JSON document, with the identifier, type and
+    created/modified dates copied into indexed columns and the aliases, tags
+    and relations copied into indexed tables. Filters use the same syntax as
+    :meth:`ResourceDB.find` and are translated to SQL, so searches on
+    the indexed fields do not need to scan every resource.
+
+    The database is opened in write-ahead-log (WAL) mode, so readers are not
+    blocked while resources are being added.
+    """
+
+    #: Resource fields that are copied into their own (indexed) columns
+    COLUMNS = (Resource.ID_FIELD, Resource.TYPE_FIELD, "created", "modified")
+    #: List-valued resource fields that are copied into their own tables
+    LIST_TABLES = ("aliases", "tags")
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS resources (
+            doc_id INTEGER PRIMARY KEY AUTOINCREMENT,
+            id_ TEXT UNIQUE,
+            type TEXT,
+            created REAL,
+            modified REAL,
+            doc TEXT NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS resources_type ON resources (type);
+        CREATE INDEX IF NOT EXISTS resources_created ON resources (created);
+        CREATE INDEX IF NOT EXISTS resources_modified ON resources (modified);
+        CREATE TABLE IF NOT EXISTS aliases (
+            doc_id INTEGER NOT NULL REFERENCES resources (doc_id) ON DELETE CASCADE,
+            value TEXT
+        );
+        CREATE INDEX IF NOT EXISTS aliases_value ON aliases (value, doc_id);
+        CREATE INDEX IF NOT EXISTS aliases_doc_id ON aliases (doc_id);
+        CREATE TABLE IF NOT EXISTS tags (
+            doc_id INTEGER NOT NULL REFERENCES resources (doc_id) ON DELETE CASCADE,
+            value TEXT
+        );
+        CREATE INDEX IF NOT EXISTS tags_value ON tags (value, doc_id);
+        CREATE INDEX IF NOT EXISTS tags_doc_id ON tags (doc_id);
+        CREATE TABLE IF NOT EXISTS relations (
+            doc_id INTEGER NOT NULL REFERENCES resources (doc_id) ON DELETE CASCADE,
+            predicate TEXT,
+            identifier TEXT,
+            role TEXT
+        );
+        CREATE INDEX IF NOT EXISTS relations_doc_id ON relations (doc_id);
+        CREATE INDEX IF NOT EXISTS relations_identifier ON relations (identifier);
+    """
+
+    _OPERATORS = {"$gt": ">", "$ge": ">=", "$lt": "<", "$le": "<="}
+    # maximum number of identifiers in one query
+    _BATCH_SIZE = 500
+
+    def __init__(self, dbfile=None, connection=None):
+        """Initialize from DMF and given configuration field.
+
+        Args:
+            dbfile (str): DB location
+            connection: If non-empty, this is an existing
+                :class:`sqlite3.Connection` that should be re-used, instead of
+                trying to connect to the location in `dbfile`.
+
+        Raises:
+            ValueError, if dbfile
+             and connection are both None
+        """
+        if connection is not None:
+            self._conn = connection
+        elif dbfile is not None:
+            try:
+                self._conn = sqlite3.connect(dbfile)
+            except sqlite3.Error as err:
+                raise errors.FileError(f'Cannot open resource DB "{dbfile}": {err}')
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        else:
+            raise ValueError("One of dbfile or connection must be given")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        self._conn.create_function("dmf_match", 3, _sql_regex_match)
+        with self._conn:
+            self._conn.executescript(self._SCHEMA)
+
+    def close(self):
+        """Close the connection to the database."""
+        self._conn.close()
+
+    def __len__(self):
+        return self._conn.execute("SELECT COUNT(*) FROM resources").fetchone()[0]
+
+    def find(self, filter_dict, id_only=False, flags=0):
+        """Find and return records based on the provided filter.
+
+        Args:
+            filter_dict (dict): Search filter. For syntax, see docs in
+                                :meth:`.dmf.DMF.find`.
+            id_only (bool): If true, return only the identifier of each
+                resource; otherwise a Resource object is returned.
+            flags (int): Flag values for, e.g., regex searches
+
+        Returns:
+            generator of int|Resource, depending on the value of `id_only`
+        """
+        where, params = self._create_filter_sql(filter_dict or {}, flags)
+        columns = "r.doc_id" if id_only else "r.doc_id, r.doc"
+        sql = f"SELECT {columns} FROM resources r WHERE {where} ORDER BY r.doc_id"
+        _log.debug(f"Find resources matching: {sql} {params}")
+        # fetch all rows first, so callers can modify the DB while iterating
+        rows = self._conn.execute(sql, params).fetchall()
+        for row in rows:
+            if id_only:
+                yield row[0]
+            else:
+                yield self._as_resource(*row)
+
+    @staticmethod
+    def _as_resource(doc_id, doc):
+        rsrc = Resource(value=json.loads(doc))
+        rsrc.v["doc_id"] = doc_id
+        return rsrc
+
+    @classmethod
+    def _create_filter_sql(cls, filter_dict, flags=0):
+        """Convert a filter to a SQL condition on the resources table `r`.
+
+        Args:
+            filter_dict (dict): Search filter, see :meth:`find`
+            flags (int): Flag values for regex searches
+
+        Returns:
+            (str, list) SQL condition and the values of its parameters
+        """
+        clauses, params = [], []
+        for k, v in filter_dict.items():
+            if not k:
+                continue
+            # strip off list-query operator
+            qry_all = False
+            if isinstance(v, list) and k.endswith("!"):
+                k, qry_all = k[:-1], True
+            if isinstance(v, list):
+                if len(v) == 0:
+                    continue
+                if isinstance(v[0], dict):
+                    # XXX: as for TinyDB, only one nested query is used
+                    cond = cls._nested_query_sql(k, v[0], qry_all, params, flags)
+                else:
+                    cond = cls._list_values_sql(k, v, qry_all, params)
+            else:
+                if k in cls.COLUMNS:
+                    field, exists = f"r.{k}", f"r.{k} IS NOT NULL"
+                else:
+                    path = _json_path(k)
+                    field = f"json_extract(r.doc, {path})"
+                    exists = f"json_type(r.doc, {path}) IS NOT NULL"
+                cond = cls._expr_to_sql(field, exists, v, params, flags)
+            clauses.append(cond)
+        if not clauses:
+            return "1", params
+        return " AND ".join(f"({c})" for c in clauses), params
+
+    @classmethod
+    def _expr_to_sql(cls, field, exists, v, params, flags=0):
+        """Get a SQL condition from a non-list filter expression.
+
+        Args:
+            field (str): SQL expression for the value of the field
+            exists (str): SQL condition that is true if the field exists
+            v: Filter value, see :meth:`ResourceDB._expr_to_query`
+            params (list): Parameter values; this is extended in-place
+            flags (int): Flag values for regex searches
+
+        Returns:
+            (str) SQL condition
+        """
+        if isinstance(v, dict):
+            conds = []
+            for op_key, op_value in v.items():
+                tv = cls._value_transform(op_value)
+                if not op_key:
+                    raise ValueError(f"empty operator for value `{tv}`")
+                if op_key == "$ne":
+                    conds.append(f"{exists} AND {field} IS NOT ?")
+                elif op_key in cls._OPERATORS:
+                    conds.append(f"{field} {cls._OPERATORS[op_key]} ?")
+                else:
+                    raise ValueError("Unexpected operator: {}".format(op_key))
+                params.append(tv)
+            return " AND ".join(conds)
+        tv = cls._value_transform(v)
+        if v is True:
+            return exists
+        if tv is False:
+            return f"NOT ({exists})"
+        if hasattr(tv, "match"):  # regex
+            params.extend([tv.pattern, int(flags or 0)])
+            return f"dmf_match(?, ?, {field})"
+        if tv is None:
+            return f"{exists} AND {field} IS NULL"
+        if isinstance(tv, (dict, list, tuple)):
+            params.append(json.dumps(tv, separators=(",", ":")))
+            return f"{field} = json(?)"
+        params.append(tv)
+        return f"{field} = ?"
+
+    @classmethod
+    def _list_values_sql(cls, key, values, qry_all, params):
+        """SQL condition matching resources whose list field `key` contains any
+        (or, if `qry_all` is True, all) of `values`.
+        """
+        placeholders = ", ".join("?" for _ in values)
+        if key in cls.LIST_TABLES:
+            source = f"{key} t WHERE t.doc_id = r.doc_id AND"
+            guard = ""
+        else:
+            path = _json_path(key)
+            source = f"json_each(r.doc, {path}) t WHERE"
+            guard = f"json_type(r.doc, {path}) = 'array' AND "
+        params.extend(values)
+        if qry_all:
+            params.append(len(set(values)))
+            return (
+                f"{guard}(SELECT COUNT(DISTINCT t.value) FROM {source} "
+                f"t.value IN ({placeholders})) = ?"
+            )
+        return f"{guard}EXISTS (SELECT 1 FROM {source} t.value IN ({placeholders}))"
+
+    @classmethod
+    def _nested_query_sql(cls, key, query, qry_all, params, flags=0):
+        """SQL condition matching resources where any (or, if `qry_all` is True,
+        all) of the items in list field `key` match the filter `query`.
+        """
+        path = _json_path(key)
+        conds = []
+        for list_k, list_v in query.items():
+            list_path = _json_path(list_k)
+            conds.append(
+                cls._expr_to_sql(
+                    f"json_extract(e.value, {list_path})",
+                    f"json_type(e.value, {list_path}) IS NOT NULL",
+                    list_v,
+                    params,
+                    flags=flags,
+                )
+            )
+        item_cond = " AND ".join(f"({c})" for c in ["e.type = 'object'"] + conds)
+        if qry_all:
+            return (
+                f"json_type(r.doc, {path}) = 'array' AND NOT EXISTS "
+                f"(SELECT 1 FROM json_each(r.doc, {path}) e "
+                f"WHERE NOT COALESCE({item_cond}, 0))"
+            )
+        return (
+            f"json_type(r.doc, {path}) = 'array' AND EXISTS "
+            f"(SELECT 1 FROM json_each(r.doc, {path}) e WHERE {item_cond})"
+        )
+
+    def find_related(self, id_, filter_dict=None, outgoing=True, maxdepth=0, meta=None):
+        meta = meta or []
+        where, filter_params = self._create_filter_sql(filter_dict or {})
+        # the stored resource at the end of each edge is the one holding the
+        # relation with the opposite role to the direction of search
+        role = RR_OBJ if outgoing else RR_SUBJ
+        meta_sql = ", ".join(f"json_extract(r.doc, {_json_path(k)})" for k in meta)
+
+        def edges_from(ids):
+            result = {}
+            ids = list(ids)
+            for i in range(0, len(ids), self._BATCH_SIZE):
+                batch = ids[i : i + self._BATCH_SIZE]
+                placeholders = ", ".join("?" for _ in batch)
+                sql = (
+                    f"SELECT rel.identifier, rel.predicate, r.id_, "
+                    f"json_array({meta_sql}) FROM relations rel "
+                    f"JOIN resources r ON r.doc_id = rel.doc_id "
+                    f"WHERE rel.role = ? AND rel.identifier IN ({placeholders}) "
+                    f"AND rel.identifier != r.id_ AND ({where}) "
+                    f"ORDER BY r.doc_id, rel.rowid"
+                )
+                rows = self._conn.execute(sql, [role] + batch + filter_params)
+                for other, pred, uuid, meta_values in rows:
+                    triple = (other, pred, uuid) if outgoing else (uuid, pred, other)
+                    meta_info = dict(zip(meta, json.loads(meta_values)))
+                    result.setdefault(other, []).append(triple + (meta_info,))
+            return result
+
+        return _search_relations(id_, edges_from, outgoing, maxdepth)
+
+    def find_by_ids(self, identifiers):
+        wanted = list(set(identifiers))
+        result = {}
+        for i in range(0, len(wanted), self._BATCH_SIZE):
+            batch = wanted[i : i + self._BATCH_SIZE]
+            placeholders = ", ".join("?" for _ in batch)
+            rows = self._conn.execute(
+                f"SELECT doc_id, doc FROM resources WHERE id_ IN ({placeholders})",
+                batch,
+            )
+            for row in rows:
+                rsrc = self._as_resource(*row)
+                result[rsrc.id] = rsrc
+        return result
+
+    def get(self, identifier):
+        """Get a resource by identifier.
+
+        Args:
+          identifier: Internal identifier
+
+        Returns:
+            (Resource) A resource or None
+        """
+        row = self._conn.execute(
+            "SELECT doc_id, doc FROM resources WHERE doc_id = ?", (identifier,)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._as_resource(*row)
+
+    def put(self, resource):
+        """Put this resource into the database.
+
+        Args:
+            resource (Resource): The resource to add
+
+        Returns:
+            None
+
+        Raises:
+            errors.DuplicateResourceError: If there is already a resource
+                in the database with the same "id".
+        """
+        _log.debug(f"put resource id={resource.id}")
+        try:
+            with self._conn:
+                self._insert(resource.v)
+        except sqlite3.IntegrityError:
+            raise errors.DuplicateResourceError("put", resource.id)
+
+    def _insert(self, doc, doc_id=None):
+        doc = {k: v for k, v in doc.items() if k != "doc_id"}
+        cur = self._conn.execute(
+            "INSERT INTO resources (doc_id, id_, type, created, modified, doc) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [doc_id] + [doc.get(c) for c in self.COLUMNS] + [json.dumps(doc)],
+        )
+        self._index_lists(cur.lastrowid, doc)
+
+    def _index_lists(self, doc_id, doc):
+        """Replace the rows in the alias, tag and relation tables for a resource."""
+        for table in self.LIST_TABLES + ("relations",):
+            self._conn.execute(f"DELETE FROM {table} WHERE doc_id = ?", (doc_id,))
+        for table in self.LIST_TABLES:
+            self._conn.executemany(
+                f"INSERT INTO {table} (doc_id, value) VALUES (?, ?)",
+                [(doc_id, value) for value in doc.get(table) or []],
+            )
+        self._conn.executemany(
+            "INSERT INTO relations (doc_id, predicate, identifier, role) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (doc_id, rel.get(RR_PRED), rel.get(RR_ID), rel.get(RR_ROLE))
+                for rel in doc.get("relations") or []
+            ],
+        )
+
+    def delete(self, id_=None, idlist=None, filter_dict=None, internal_ids=False):
+        """Delete one or more resources with given identifiers.
+
+        Args:
+            id_ (Union[str,int]): If given, delete this id.
+            idlist (list): If given, delete ids in this list
+            filter_dict (dict): If given, perform a search and
+                           delete ids it finds.
+            internal_ids (bool): If True, treat identifiers as numeric
+                (internal) identifiers. Otherwise treat them as
+                resource (string) indentifiers.
+        Returns:
+            None
+        """
+        if internal_ids:
+            ids = idlist if idlist else [id_]
+            column = "doc_id"
+        elif filter_dict:
+            where, params = self._create_filter_sql(filter_dict)
+            with self._conn:
+                self._conn.execute(
+                    f"DELETE FROM resources WHERE doc_id IN "
+                    f"(SELECT r.doc_id FROM resources r WHERE {where})",
+                    params,
+                )
+            return
+        elif id_:
+            ids, column = [id_], "id_"
+        elif idlist:
+            ids, column = idlist, "id_"
+        else:
+            return
+        placeholders = ", ".join("?" for _ in ids)
+        with self._conn:
+            self._conn.execute(
+                f"DELETE FROM resources WHERE {column} IN ({placeholders})", ids
+            )
+
+    def _update_fields(self, old, changed):
+        doc_id = old.v["doc_id"]
+        doc = {k: v for k, v in old.v.items() if k != "doc_id"}
+        doc.update(changed)
+        doc.pop("doc_id", None)
+        with self._conn:
+            self._conn.execute(
+                "UPDATE resources SET id_ = ?, type = ?, created = ?, modified = ?, "
+                "doc = ? WHERE doc_id = ?",
+                [doc.get(c) for c in self.COLUMNS] + [json.dumps(doc), doc_id],
+            )
+            if any(k in changed for k in self.LIST_TABLES + ("relations",)):
+                self._index_lists(doc_id, doc)
+
+
+def _search_relations(id_, edges_from, outgoing=True, maxdepth=0):
+    """Breadth-first search through the relations starting at a resource.
+
+    Args:
+        id_ (str): Unique ID of starting resource
+        edges_from (Callable): Function taking a list of resource IDs and
+            returning a dict mapping each ID with any edges from it to a list of
+            (subject, predicate, object, metadata) tuples
+        outgoing (bool): Direction of search, see :meth:`ResourceDB.find_related`
+        maxdepth (int): Maximum depth of search; 0 or less means no limit
+
+    Returns:
+        Generator of (depth, relation, metadata)
+    """
+    if maxdepth <= 0:
+        maxdepth = 9223372036854775807
+    edges = edges_from([id_])
+    # stop if there are no connections
+    if id_ not in edges:
+        return
+    q, depth, visited = list(edges[id_]), 0, {id_}
+    while len(q) > 0 and depth < maxdepth:
+        depth += 1
+        for item in q:
+            yield (depth, Triple(*item[:3]), item[3])
+        if depth == maxdepth:
+            break
+        # Follow relations from subject or object, depending on the "direction"
+        # that we are searching, to all nodes we haven't already been to. The
+        # edges for all of these are fetched together.
+        next_ids = []
+        for item in q:
+            next_id = item[2] if outgoing else item[0]
+            if next_id not in visited:
+                visited.add(next_id)
+                next_ids.append(next_id)
+        edges = edges_from(next_ids)
+        q = [item for next_id in next_ids for item in edges.get(next_id, ())]
+
+
+def _json_path(key):
+    """SQL literal for the JSON path of a (possibly dotted) resource field."""
+    fields = ".".join('"{}"'.format(f.replace('"', '\\"')) for f in key.split("."))
+    path = "$." + fields
+    return "'{}'".format(path.replace("'", "''"))
+
+
+def _sql_regex_match(pattern, flags, value):
+    # Same semantics as TinyDB Query.matches(), i.e. re.match()
+    if not isinstance(value, str):
+        return 0
+    return 1 if re.match(pattern, value, flags=flags) else 0
+
+
+#: Name of the TinyDB resource database backend
+TINYDB_BACKEND = "tinydb"
+#: Name of the SQLite resource database backend
+SQLITE_BACKEND = "sqlite"
+
+BACKENDS = {TINYDB_BACKEND: ResourceDB, SQLITE_BACKEND: SQLiteResourceDB}
+
+
+def open_resource_db(dbfile, backend=TINYDB_BACKEND):
+    """Open a resource database.
+
+    Args:
+        dbfile (str): DB location
+        backend (str): Name of the backend, one of the keys of :data:`BACKENDS`
+
+    Returns:
+        ResourceDB: The resource database
+
+    Raises:
+        ValueError: If the backend is not known
+    """
+    try:
+        db_class = BACKENDS[backend]
+    except KeyError:
+        raise ValueError(
+            f"Unknown resource DB backend '{backend}'. "
+            f"Expected one of: {', '.join(BACKENDS)}"
+        )
+    return db_class(dbfile)
+
+
+def migrate_tinydb_to_sqlite(tinydb_file, sqlite_file):
+    """Copy all resources from a TinyDB resource database into a new SQLite one.
+
+    Internal (numeric) identifiers of the resources are preserved.
+
+    Args:
+        tinydb_file (str): Location of existing TinyDB database
+        sqlite_file (str): Location of SQLite database to create
+
+    Returns:
+        int: Number of resources copied
+
+    Raises:
+        errors.FileError: If the TinyDB database cannot be opened
+        errors.DMFError: If the SQLite database already contains resources
+    """
+    source = ResourceDB(tinydb_file)
+    target = SQLiteResourceDB(sqlite_file)
+    try:
+        if len(target) > 0:
+            raise errors.DMFError(
+                f'Cannot migrate into resource DB "{sqlite_file}": not empty'
+            )
+        n = 0
+        with target._conn:
+            for doc in source._db.all():
+                target._insert(doc, doc_id=doc.doc_id)
+                n += 1
+    finally:
+        target.close()
+    _log.info(f"Migrated {n} resources from '{tinydb_file}' to '{sqlite_file}'")
+    return n
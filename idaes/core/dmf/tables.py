@@ -133,6 +133,9 @@ class Table:
         """
         fmt = file_format.lower()
         name = filepath.name
+        # compressed files are read by pandas, which infers the compression
+        if name.endswith(".gz"):
+            name = name[:-3]
         if fmt == "infer":
             if name.endswith(".csv"):
                 fmt = "csv"
@@ -300,10 +303,12 @@ class Table:
             tables = {}
             for idx, path in enumerate(rsrc.get_datafiles()):
                 table_ = cls.read_table(path, True, "infer")
-                table_.description = rsrc.v[Resource.DATAFILES_FIELD][idx].get(
-                    "desc", ""
-                )
-                tables[path.name] = table_
+                datafile = rsrc.v[Resource.DATAFILES_FIELD][idx]
+                table_.description = datafile.get("desc", "")
+                name = path.name
+                if datafile.get("compression", None) and name.endswith(".gz"):
+                    name = name[:-3]
+                tables[name] = table_
             return tables
         else:
             raise KeyError("No table in resource")
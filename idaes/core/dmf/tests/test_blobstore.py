@@ -0,0 +1,231 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Tests for idaes.core.dmf.blobstore module
+"""
+import hashlib
+import os
+import stat
+
+# third-party
+import pytest
+
+# package
+from idaes.core.dmf import resource
+from idaes.core.dmf.blobstore import BlobStore, unshare
+from idaes.core.dmf.dmfbase import DMF
+
+DATA = b"x,y\n1,2\n3,4\n"
+DIGEST = hashlib.sha1(DATA).hexdigest()
+
+
+@pytest.fixture
+def datafile(tmp_path):
+    path = tmp_path / "data.csv"
+    path.write_bytes(DATA)
+    return path
+
+
+@pytest.mark.unit
+def test_add_link_release(tmp_path, datafile):
+    store = BlobStore(tmp_path / "blobs")
+    assert store.add(datafile) == DIGEST
+    blob = store.blob_path(DIGEST)
+    assert blob.read_bytes() == DATA
+    # adding again does not make another copy
+    assert store.add(datafile, digest=DIGEST) == DIGEST
+    assert len(list((tmp_path / "blobs").glob("*/*"))) == 1
+    dest1, dest2 = tmp_path / "d1", tmp_path / "d2"
+    assert store.link(DIGEST, dest1)
+    assert store.link(DIGEST, dest2)
+    assert os.path.samefile(dest1, dest2)
+    # stored file is kept until the last link is released
+    assert store.release(DIGEST, dest1)
+    assert blob.exists()
+    assert store.release(DIGEST, dest2)
+    assert not blob.exists()
+    # unlinked files are not touched
+    assert not store.release(DIGEST, datafile)
+    assert datafile.exists()
+
+
+@pytest.mark.unit
+def test_add_changed_hash(tmp_path, datafile):
+    store = BlobStore(tmp_path / "blobs")
+    assert store.add(datafile, digest="0" * 40) == DIGEST
+    assert store.blob_path(DIGEST).exists()
+
+
+@pytest.mark.unit
+def test_add_stale_digest(tmp_path, datafile):
+    store = BlobStore(tmp_path / "blobs")
+    assert store.add(datafile) == DIGEST
+    # the file changes after its hash was computed
+    datafile.write_bytes(b"new contents")
+    new_digest = hashlib.sha1(b"new contents").hexdigest()
+    assert store.add(datafile, digest=DIGEST) == new_digest
+    assert store.blob_path(new_digest).read_bytes() == b"new contents"
+    assert store.blob_path(DIGEST).read_bytes() == DATA
+
+
+@pytest.mark.unit
+def test_compression(tmp_path, datafile):
+    import gzip
+
+    store = BlobStore(tmp_path / "blobs", compression="gzip")
+    assert store.add(datafile) == DIGEST
+    blob = store.blob_path(DIGEST)
+    assert blob.name.endswith(".gz")
+    assert gzip.decompress(blob.read_bytes()) == DATA
+    with pytest.raises(ValueError):
+        BlobStore(tmp_path / "blobs", compression="zip")
+
+
+def is_writable(path):
+    return bool(os.stat(path).st_mode & stat.S_IWUSR)
+
+
+@pytest.mark.unit
+def test_unshare(tmp_path, datafile):
+    store = BlobStore(tmp_path / "blobs")
+    store.add(datafile)
+    blob = store.blob_path(DIGEST)
+    assert not is_writable(blob)
+    dest1, dest2 = tmp_path / "d1", tmp_path / "d2"
+    store.link(DIGEST, dest1)
+    store.link(DIGEST, dest2)
+    assert not is_writable(dest1)
+
+    assert unshare(dest1)
+    assert not os.path.samefile(dest1, blob)
+    assert is_writable(dest1)
+    dest1.write_bytes(b"changed")
+    assert blob.read_bytes() == DATA
+    assert dest2.read_bytes() == DATA
+    # a private file is not released, and the stored file is kept
+    assert not store.release(DIGEST, dest1)
+    assert store.release(DIGEST, dest2)
+    assert not blob.exists()
+    assert not unshare(dest1)
+
+
+def add_with_datafile(dmf, path):
+    r = resource.Resource(type_="data")
+    r.add_data_file(str(path))
+    dmf.add(r)
+    return r
+
+
+@pytest.mark.component
+def test_dmf_shared_datafiles(tmp_path, datafile):
+    dmf = DMF(path=tmp_path / "ws", create=True)
+    r1 = add_with_datafile(dmf, datafile)
+    r2 = add_with_datafile(dmf, datafile)
+    paths = [
+        next(iter(dmf.fetch_one(r.id).get_datafiles())).resolve() for r in (r1, r2)
+    ]
+    assert paths[0] != paths[1]
+    assert os.path.samefile(*paths)
+    blob = dmf._blobs.blob_path(DIGEST)
+    assert r1.v["datafiles"][0]["sha1"] == DIGEST
+    dmf.remove(identifier=r1.id)
+    assert not paths[0].exists()
+    assert blob.exists()
+    dmf.remove(identifier=r2.id)
+    assert not paths[1].exists()
+    assert not blob.exists()
+    # original file is left alone
+    assert datafile.read_bytes() == DATA
+
+
+@pytest.mark.component
+def test_dmf_datafile_changed_after_added(tmp_path, datafile):
+    dmf = DMF(path=tmp_path / "ws", create=True)
+    add_with_datafile(dmf, datafile)
+    r = resource.Resource(type_="data")
+    r.add_data_file(str(datafile))
+    # the file changes between adding it to the resource and storing it
+    datafile.write_bytes(b"new contents")
+    dmf.add(r)
+    r = dmf.fetch_one(r.id)
+    assert next(iter(r.get_datafiles())).read_bytes() == b"new contents"
+    assert r.v["datafiles"][0]["sha1"] == hashlib.sha1(b"new contents").hexdigest()
+
+
+@pytest.mark.component
+def test_dmf_multiple_datafiles(tmp_path):
+    dmf = DMF(path=tmp_path / "ws", create=True)
+    r = resource.Resource(type_="data")
+    for i in range(6):
+        path = tmp_path / f"data{i}.txt"
+        path.write_text(f"file {i}")
+        r.add_data_file(str(path))
+    dmf.add(r)
+    r = dmf.fetch_one(r.id)
+    contents = []
+    for path in r.get_datafiles():
+        with open(path) as f:
+            contents.append(f.read())
+    assert contents == [f"file {i}" for i in range(6)]
+
+
+@pytest.mark.component
+def test_dmf_compressed_datafiles(tmp_path, datafile):
+    dmf = DMF(path=tmp_path / "ws", create=True)
+    dmf.datafile_compression = "gzip"
+    dmf = DMF(path=tmp_path / "ws")
+    r = add_with_datafile(dmf, datafile)
+    assert r.v["datafiles"][0]["path"] == "data.csv.gz"
+    assert r.v["datafiles"][0]["compression"] == "gzip"
+    r = dmf.fetch_one(r.id)
+    files = list(r.get_datafiles(mode="r"))
+    assert files[0].read() == DATA.decode()
+    files[0].close()
+
+
+@pytest.mark.component
+def test_dmf_remove_deletes_datafiles(tmp_path, datafile):
+    dmf = DMF(path=tmp_path / "ws", create=True)
+    r = add_with_datafile(dmf, datafile)
+    path = next(iter(dmf.fetch_one(r.id).get_datafiles()))
+    assert path.exists()
+    dmf.remove(identifier=r.id)
+    assert not path.exists()
+    assert not path.parent.exists()
+    assert datafile.read_bytes() == DATA
+
+
+@pytest.mark.component
+def test_dmf_write_shared_datafile(tmp_path, datafile):
+    dmf = DMF(path=tmp_path / "ws", create=True)
+    r1 = add_with_datafile(dmf, datafile)
+    r2 = add_with_datafile(dmf, datafile)
+    r1, r2 = dmf.fetch_one(r1.id), dmf.fetch_one(r2.id)
+    blob = dmf._blobs.blob_path(DIGEST)
+
+    with next(iter(r1.get_datafiles(mode="w"))) as f:
+        f.write("x,y\n5,6\n")
+    path1 = next(iter(r1.get_datafiles()))
+    path2 = next(iter(r2.get_datafiles()))
+    assert path1.read_text() == "x,y\n5,6\n"
+    # the other resource and the stored file are not changed
+    assert path2.read_bytes() == DATA
+    assert blob.read_bytes() == DATA
+    assert hashlib.sha1(blob.read_bytes()).hexdigest() == DIGEST
+
+    dmf.remove(identifier=r1.id)
+    assert not path1.exists()
+    assert blob.exists()
+    dmf.remove(identifier=r2.id)
+    assert not path2.exists()
+    assert not blob.exists()
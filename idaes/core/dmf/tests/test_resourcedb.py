@@ -0,0 +1,341 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Tests for idaes.core.dmf.resourcedb module.
+
+The SQLite backend is checked against the TinyDB backend, which
+is the reference for the filter semantics.
+"""
+
+import re
+
+# third-party
+import pytest
+
+# package
+from idaes.core.dmf import errors, resource
+from idaes.core.dmf.dmfbase import DMF
+from idaes.core.dmf.resourcedb import (
+    ResourceDB,
+    SQLiteResourceDB,
+    migrate_tinydb_to_sqlite,
+    open_resource_db,
+)
+
+
+def make_resources():
+    rlist = []
+    for i in range(6):
+        r = resource.Resource(
+            value={
+                "aliases": [f"r{i}"],
+                "tags": ["all", "even" if i % 2 == 0 else "odd"],
+                "desc": f"resource number {i}",
+            },
+            type_="data" if i < 3 else "other",
+        )
+        r.data = {"i": i, "half": i / 2, "flag": i == 1}
+        rlist.append(r)
+    for i in range(1, len(rlist)):
+        resource.create_relation(rlist[i - 1], resource.Predicates.derived, rlist[i])
+    return rlist
+
+
+@pytest.fixture(params=["tinydb", "sqlite"])
+def rdb(request, tmp_path):
+    path = tmp_path / ("resourcedb.json" if request.param == "tinydb" else "rdb.db")
+    db = open_resource_db(str(path), backend=request.param)
+    rlist = make_resources()
+    for r in rlist:
+        db.put(r)
+    return db, rlist
+
+
+filters = [
+    {},
+    {"type": "data"},
+    {"aliases": ["r1", "r4"]},
+    {"tags!": ["all", "even"]},
+    {"tags!": ["odd", "even"]},
+    {"data.i": {"$ge": 2, "$lt": 5}},
+    {"data.i": {"$ne": 3}},
+    {"data.half": 1.5},
+    {"data.flag": "@true"},
+    {"data.flag": True},
+    {"data.missing": True},
+    {"data.missing": False},
+    {"desc": "~resource number [13]"},
+    {"desc": "~number"},
+    {"relations": [{"role": "object", "predicate": resource.Predicates.derived}]},
+    {"type": "other", "tags": ["odd"]},
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("filter_dict", filters)
+def test_find(rdb, filter_dict):
+    db, rlist = rdb
+    ids = [r.id for r in db.find(filter_dict)]
+    # compare against the filter applied by the reference (TinyDB) backend
+    ref = ResourceDB(connection=_tinydb_table(rlist))
+    assert ids == [r.id for r in ref.find(filter_dict)]
+
+
+def _tinydb_table(rlist):
+    from tinydb import TinyDB
+    from tinydb.storages import MemoryStorage
+
+    table = TinyDB(storage=MemoryStorage).table("resources", cache_size=0)
+    for r in rlist:
+        table.insert(r.v)
+    return table
+
+
+@pytest.mark.unit
+def test_find_regex_flags(rdb):
+    db, _ = rdb
+    assert len(list(db.find({"desc": "~RESOURCE"}))) == 0
+    assert len(list(db.find({"desc": "~RESOURCE"}, flags=re.IGNORECASE))) == 6
+
+
+@pytest.mark.unit
+def test_find_id_only(rdb):
+    db, _ = rdb
+    doc_ids = list(db.find({"type": "data"}, id_only=True))
+    assert len(doc_ids) == 3
+    assert db.get(doc_ids[0]).v["doc_id"] == doc_ids[0]
+    assert db.get(12345) is None
+
+
+@pytest.mark.unit
+def test_len_put_duplicate(rdb):
+    db, rlist = rdb
+    assert len(db) == len(rlist)
+    with pytest.raises(errors.DuplicateResourceError):
+        db.put(rlist[0])
+
+
+@pytest.mark.unit
+def test_update(rdb):
+    db, rlist = rdb
+    r = rlist[0]
+    r.v["tags"].append("updated")
+    r.v["desc"] = "new description"
+    db.update(r.id, r.v)
+    assert [x.id for x in db.find({"tags": ["updated"]})] == [r.id]
+    assert db.find_one({"id_": r.id}).v["desc"] == "new description"
+    # type cannot change
+    r.v["type"] = "other"
+    with pytest.raises(ValueError):
+        db.update(r.id, r.v)
+    with pytest.raises(errors.NoSuchResourceError):
+        db.update("0" * 32, r.v)
+
+
+@pytest.mark.unit
+def test_delete(rdb):
+    db, rlist = rdb
+    db.delete(id_=rlist[0].id)
+    assert len(db) == 5
+    db.delete(filter_dict={"type": "other"})
+    assert len(db) == 2
+    doc_ids = list(db.find({}, id_only=True))
+    db.delete(idlist=doc_ids, internal_ids=True)
+    assert len(db) == 0
+
+
+@pytest.mark.unit
+def test_find_related(rdb):
+    db, rlist = rdb
+    related = list(db.find_related(rlist[0].id, meta=["id_"]))
+    assert [depth for depth, _, _ in related] == [1, 2, 3, 4, 5]
+    assert [m["id_"] for _, _, m in related] == [r.id for r in rlist[1:]]
+    related = list(db.find_related(rlist[0].id, meta=["id_"], maxdepth=2))
+    assert len(related) == 2
+    related = list(db.find_related(rlist[-1].id, meta=["id_"], outgoing=False))
+    assert [m["id_"] for _, _, m in related] == [r.id for r in reversed(rlist[:-1])]
+
+
+@pytest.mark.unit
+def test_open_resource_db_bad_backend(tmp_path):
+    with pytest.raises(ValueError):
+        open_resource_db(str(tmp_path / "db"), backend="nosuchdb")
+
+
+@pytest.mark.unit
+def test_migrate_tinydb_to_sqlite(tmp_path):
+    tinydb_file, sqlite_file = str(tmp_path / "r.json"), str(tmp_path / "r.db")
+    tdb = ResourceDB(tinydb_file)
+    for r in make_resources():
+        tdb.put(r)
+    expected = [(r.v["doc_id"], r.id) for r in tdb.find({})]
+
+    assert migrate_tinydb_to_sqlite(tinydb_file, sqlite_file) == 6
+
+    sdb = SQLiteResourceDB(sqlite_file)
+    assert [(r.v["doc_id"], r.id) for r in sdb.find({})] == expected
+    assert len(list(sdb.find({"tags": ["odd"]}))) == 3
+    sdb.close()
+    # target is not empty any more
+    with pytest.raises(errors.DMFError):
+        migrate_tinydb_to_sqlite(tinydb_file, sqlite_file)
+
+
+@pytest.mark.component
+def test_dmf_sqlite_migration(tmp_path):
+    dmf = DMF(path=tmp_path, create=True)
+    ids = []
+    for r in make_resources():
+        dmf.add(r)
+        ids.append(r.id)
+    del dmf
+    # switch workspace to sqlite backend
+    dmf = DMF(path=tmp_path)
+    dmf.db_backend = "sqlite"
+    dmf = DMF(path=tmp_path)
+    assert isinstance(dmf._db, SQLiteResourceDB)
+    assert (tmp_path / DMF.SQLITE_DB_FILE).exists()
+    assert [r.id for r in dmf.find()] == ids
+    assert len(list(dmf.find_related(dmf.fetch_one(ids[0])))) == 5
+    dmf.remove(identifier=ids[0])
+    assert dmf.count() == 5
+
+
+def make_graph():
+    # a -> b, a -> c, b -> d, c -> d, d -> e
+    rsrc = {k: resource.Resource(value={"desc": k}, type_="data") for k in "abcde"}
+    rsrc["e"].v["tags"] = ["end"]
+    for s, o in ("ab", "ac", "bd", "cd", "de"):
+        resource.create_relation(rsrc[s], resource.Predicates.derived, rsrc[o])
+    return rsrc
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"maxdepth": 2},
+        {"outgoing": False},
+        {"filter_dict": {"desc": "~[bde]"}},
+        {"filter_dict": {"desc": "~[bc]"}, "maxdepth": 1},
+    ],
+)
+def test_find_related_graph(tmp_path, kwargs):
+    rsrc = make_graph()
+    results = []
+    for backend, filename in (("tinydb", "r.json"), ("sqlite", "r.db")):
+        db = open_resource_db(str(tmp_path / filename), backend=backend)
+        for r in rsrc.values():
+            db.put(r)
+        start = rsrc["e" if kwargs.get("outgoing") is False else "a"].id
+        results.append(list(db.find_related(start, meta=["desc"], **kwargs)))
+    assert results[0] == results[1]
+    assert len(results[0]) > 0
+
+
+@pytest.mark.unit
+def test_find_related_graph_order(tmp_path):
+    rsrc = make_graph()
+    db = ResourceDB(str(tmp_path / "r.json"))
+    for r in rsrc.values():
+        db.put(r)
+    found = [(d, m["desc"]) for d, _, m in db.find_related(rsrc["a"].id, meta=["desc"])]
+    # d is reached twice, but only followed once
+    assert found == [(1, "b"), (1, "c"), (2, "d"), (2, "d"), (3, "e")]
+
+
+@pytest.mark.unit
+def test_find_related_index_updates(rdb):
+    db, rlist = rdb
+    assert len(list(db.find_related(rlist[0].id, meta=["id_"]))) == 5
+    # remove the end of the chain
+    db.delete(id_=rlist[-1].id)
+    assert len(list(db.find_related(rlist[0].id, meta=["id_"]))) == 4
+    # add a new branch
+    new = resource.Resource(value={"desc": "new"}, type_="data")
+    resource.create_relation(rlist[1], resource.Predicates.derived, new)
+    db.put(new)
+    db.update(rlist[1].id, rlist[1].v)
+    related = [m["desc"] for _, _, m in db.find_related(rlist[1].id, meta=["desc"])]
+    assert related == [
+        "resource number 2",
+        "new",
+        "resource number 3",
+        "resource number 4",
+    ]
+
+
+@pytest.mark.unit
+def test_find_related_index_incremental(tmp_path):
+    db = ResourceDB(str(tmp_path / "r.json"))
+    rsrc = make_graph()
+    for k in "abcd":
+        db.put(rsrc[k])
+    list(db.find_related(rsrc["a"].id))
+    index = db._relations
+
+    # changes are applied to the index, which is not rebuilt
+    db.put(rsrc["e"])
+    db.delete(id_=rsrc["c"].id)
+    rsrc["b"].v["desc"] = "B"
+    db.update(rsrc["b"].id, rsrc["b"].v)
+    found = [(d, m["desc"]) for d, _, m in db.find_related(rsrc["a"].id, meta=["desc"])]
+    assert db._relations is index
+    assert found == [(1, "B"), (2, "d"), (3, "e")]
+
+    # and is the same as one built from scratch
+    db._relations = None
+    for outgoing in (True, False):
+        rebuilt = db._relation_index(outgoing)
+        assert {k: [e[:3] + (e[3].doc_id,) for e in v] for k, v in rebuilt.items()} == {
+            k: [e[:3] + (e[3].doc_id,) for e in v] for k, v in index[outgoing].items()
+        }
+
+
+@pytest.mark.unit
+def test_find_related_other_instance(tmp_path):
+    path = str(tmp_path / "r.json")
+    db1, db2 = ResourceDB(path), ResourceDB(path)
+    rsrc = make_graph()
+    for k in "ab":
+        db1.put(rsrc[k])
+    assert len(list(db1.find_related(rsrc["a"].id))) == 1
+    # changes through another instance are picked up
+    db2.put(rsrc["c"])
+    assert len(list(db1.find_related(rsrc["a"].id))) == 2
+
+
+@pytest.mark.unit
+def test_find_by_ids(rdb):
+    db, rlist = rdb
+    ids = [rlist[3].id, rlist[0].id, "0" * 32]
+    found = db.find_by_ids(ids)
+    assert set(found.keys()) == {rlist[3].id, rlist[0].id}
+    assert found[rlist[0].id].v["desc"] == "resource number 0"
+    assert db.find_by_ids([]) == {}
+
+
+@pytest.mark.component
+@pytest.mark.parametrize("backend", ["tinydb", "sqlite"])
+def test_dmf_find_related_resources(tmp_path, backend):
+    dmf = DMF(path=tmp_path, create=True)
+    dmf.db_backend = backend
+    dmf = DMF(path=tmp_path)
+    rsrc = make_graph()
+    for r in rsrc.values():
+        dmf.add(r)
+    found = [r.v["desc"] for r in dmf.find_related_resources(rsrc["a"])]
+    assert found == ["b", "c", "d", "d", "e"]
+    found = [r.v["desc"] for r in dmf.find_related_resources(rsrc["a"], maxdepth=1)]
+    assert found == ["b", "c"]
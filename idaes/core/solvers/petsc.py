@@ -16,17 +16,23 @@
 # pylint: disable=missing-function-docstring
 
 import os
+import io
+import re
 import sys
 import shutil
 import enum
 import copy
 import json
 import gzip
+import tempfile
 import numpy as np
 
 import pyomo.environ as pyo
 from pyomo.common.collections import ComponentSet, ComponentMap
-from pyomo.core.expr.visitor import identify_variables
+from pyomo.core.expr.visitor import (
+    identify_variables,
+    identify_mutable_parameters,
+)
 import pyomo.dae as pyodae
 from pyomo.common import Executable
 from pyomo.dae.flatten import flatten_dae_components, slice_component_along_sets
@@ -38,6 +44,7 @@ from pyomo.solvers.plugins.solvers.ASL import ASL
 from pyomo.common.tempfiles import TempfileManager
 from pyomo.util.calc_var_value import calculate_variable_from_constraint
 from pyomo.common.deprecation import deprecation_warning
+from pyomo.repn.plugins.nl_writer import NLWriter
 
 import idaes
 import idaes.logger as idaeslog
@@ -397,6 +404,318 @@ def _sub_problem_scaling_suffix(m, t_block):
                 t_block.scaling_factor[c] = m.scaling_factor[c]
 
 
+def _scaling_factor(m, c):
+    """Get the scaling factor of a variable or constraint in the subproblem,
+    with the same precedence as in _sub_problem_scaling_suffix.
+    """
+    s = None
+    if hasattr(c.parent_block(), "scaling_factor"):
+        s = c.parent_block().scaling_factor.get(c, s)
+    if hasattr(m, "scaling_factor"):
+        s = m.scaling_factor.get(c, s)
+    return s
+
+
+def _time_element_subsystem(m, t, time_vars, time_cons, deriv_diff_map, timevar):
+    """Create a block for the DAE subsystem of time element t, with the DAE
+    and scaling suffixes set.
+
+    Args:
+        m (Block): model with the time element
+        t (float): time point at the end of the time element
+        time_vars (list): flattened variables indexed only by time
+        time_cons (list): flattened constraints indexed only by time
+        deriv_diff_map (ComponentMap): Maps DerivativeVar data objects to
+            differential variable data objects
+        timevar (Var): Optional time variable
+
+    Returns:
+        (tuple): subsystem block and list of differential variables
+    """
+    constraints = [con[t] for con in time_cons if t in con]
+    variables = [var[t] for var in time_vars]
+    # Create a temporary block with references to original constraints
+    # and variables so we can integrate this "subsystem" without
+    # altering the rest of the model.
+    t_block = create_subsystem_block(constraints, variables)
+    differential_vars = _set_dae_suffixes_from_variables(
+        t_block,
+        variables,
+        deriv_diff_map,
+    )
+    # We need to check if there are derivatives in the problem before
+    # sending this to the solver.  We'll assume that if you are using
+    # this and don't have any differential equations, you are making a
+    # mistake.
+    if len(differential_vars) < 1:
+        raise RuntimeError(f"No differential equations found at t = {t}, not a DAE")
+    if timevar is not None:
+        t_block.dae_suffix[timevar[t]] = int(DaeVarTypes.TIME)
+    # Set up the scaling factor suffix
+    _sub_problem_scaling_suffix(m, t_block)
+    return t_block, differential_vars
+
+
+# Initial guess segment of an NL file written without symbolic labels
+_NL_INITIAL_GUESS = re.compile(r"^x\d+\n(?:\d+ [^\n]*\n)*", re.MULTILINE)
+
+
+class _TimeElementTemplate(object):
+    """PRIVATE CLASS:
+
+    The DAE subsystem of one time element, used as a template to integrate
+    the other time elements. The NL file of the template is written once.
+    To integrate a time element, its variable values are copied into the
+    template time element, only the initial guess segment of the NL file is
+    rewritten, and the solution is copied back. The whole NL file is written
+    again only when the values of fixed variables change.
+
+    This requires every time element to have the same structure as the
+    template. The variable types, bounds and scaling factors are checked for
+    each time element, and the first time element integrated with the
+    template is checked to give the same NL file as its own subsystem.
+    Elements that do not match are integrated with their own subsystem. The
+    NL file is written without the linear presolve, which would change the
+    initial values written for the variables.
+    """
+
+    def __init__(self, m, t, time_vars, time_cons, deriv_diff_map, timevar=None):
+        """Create the subsystem of time element t and write its NL file.
+
+        Args:
+            m (Block): model with the time elements
+            t (float): time point at the end of the template time element
+            time_vars (list): flattened variables indexed only by time
+            time_cons (list): flattened constraints indexed only by time
+            deriv_diff_map (ComponentMap): Maps DerivativeVar data objects to
+                differential variable data objects
+            timevar (Var): Optional time variable
+        """
+        self.m = m
+        self.t = t
+        self.time_vars = time_vars
+        self.time_cons = time_cons
+        self.deriv_diff_map = deriv_diff_map
+        self.timevar = timevar
+        self.block, self.differential_vars = _time_element_subsystem(
+            m, t, time_vars, time_cons, deriv_diff_map, timevar
+        )
+        self.usable = True
+        self.validated = False
+        self.directory = tempfile.mkdtemp(prefix="petsc_dae_")
+        self.stub = os.path.join(self.directory, "element")
+        self._index = {id(var[t]): j for j, var in enumerate(time_vars)}
+        self._structure = self._get_structure(t)
+        self._components = self._get_components(self.block, t)
+        self._saved = None
+        self._column_names = []
+        self._write()
+
+    def _get_structure(self, t):
+        present = tuple(i for i, con in enumerate(self.time_cons) if t in con)
+        constraints = [self.time_cons[i][t] for i in present]
+        variables = [var[t] for var in self.time_vars]
+        return (
+            present,
+            tuple(con.active for con in constraints),
+            tuple(v.fixed for v in variables),
+            tuple(v.bounds for v in variables if not v.fixed),
+            tuple(_scaling_factor(self.m, c) for c in variables + constraints),
+        )
+
+    def _get_components(self, t_block, t):
+        # variables and mutable parameters in the element's constraints, with
+        # the element's time-indexed variables mapped to the template element
+        index = {id(var[t]): j for j, var in enumerate(self.time_vars)}
+        variables = ComponentSet()
+        params = ComponentSet()
+        for con in t_block.component_data_objects(pyo.Constraint, active=True):
+            for v in identify_variables(con.expr, include_fixed=True):
+                j = index.get(id(v))
+                variables.add(v if j is None else self.time_vars[j][self.t])
+            params.update(identify_mutable_parameters(con.expr))
+        return variables, params
+
+    def _fixed_values(self):
+        return tuple(var[self.t].value for var in self.time_vars if var[self.t].fixed)
+
+    def _save(self):
+        if self._saved is None:
+            self._saved = [var[self.t].value for var in self.time_vars]
+
+    def _copy_to_template(self, t):
+        self._save()
+        for var in self.time_vars:
+            var[self.t].set_value(var[t].value, skip_validation=True)
+
+    def _load_element(self, t):
+        # copy the values of time element t into the template, and write the
+        # NL file again if the values of the fixed variables changed
+        if t != self.t:
+            self._copy_to_template(t)
+        if self._fixed_values() != self._constants:
+            self._write()
+
+    def _write(self):
+        """Write the NL file of the template to a string and split it around
+        the initial guess segment.
+        """
+        ostream = io.StringIO()
+        info = NLWriter().write(
+            self.block,
+            ostream,
+            symbolic_solver_labels=False,
+            export_nonlinear_variables=self.differential_vars,
+            # presolve adjusts the initial values, so that the initial guess
+            # segment could not be written without the writer
+            linear_presolve=False,
+        )
+        text = ostream.getvalue()
+        match = _NL_INITIAL_GUESS.search(text)
+        self._head = text[: match.start()]
+        self._tail = text[match.end() :]
+        self._column_vars = info.variables
+        if info.scaling is not None:
+            self._column_scaling = info.scaling.variables
+        else:
+            self._column_scaling = None
+        if any(id(v) not in self._index for v in info.variables):
+            # variables from outside the time element can't be copied
+            self.usable = False
+        self._columns = [self._index.get(id(v)) for v in info.variables]
+        self._constants = self._fixed_values()
+
+    def _initial_guess(self):
+        lines = []
+        for i, v in enumerate(self._column_vars):
+            val = v.value
+            if val is None:
+                continue
+            if val.__class__ not in (int, float):
+                val = float(val)
+            if self._column_scaling is not None:
+                val = val * self._column_scaling[i]
+            lines.append(f"{i} {val!s}\n")
+        return f"x{len(lines)}\n" + "".join(lines)
+
+    def nl_text(self):
+        """Return the text of the template NL file with the current values
+        of the template element as the initial guess.
+        """
+        return self._head + self._initial_guess() + self._tail
+
+    def _validate(self, t):
+        t_block, differential_vars = _time_element_subsystem(
+            self.m, t, self.time_vars, self.time_cons, self.deriv_diff_map, self.timevar
+        )
+        if self._get_components(t_block, t) != self._components:
+            return False
+        self._copy_to_template(t)
+        self._write()
+        ostream = io.StringIO()
+        NLWriter().write(
+            t_block,
+            ostream,
+            symbolic_solver_labels=False,
+            export_nonlinear_variables=differential_vars,
+            linear_presolve=False,
+        )
+        return ostream.getvalue() == self.nl_text()
+
+    def matches(self, t):
+        """Check whether time element t can be integrated with the template.
+
+        Args:
+            t (float): time point at the end of the time element
+
+        Returns:
+            (bool): True if the time element has the same structure as the
+                template
+        """
+        if not self.usable:
+            return False
+        if t == self.t:
+            return True
+        if self._get_structure(t) != self._structure:
+            return False
+        if not self.validated:
+            self.validated = True
+            self.usable = self._validate(t)
+            if not self.usable:
+                _log = idaeslog.getLogger(__name__)
+                _log.warning(
+                    f"The subsystem at t = {t} does not have the same structure "
+                    f"as the subsystem at t = {self.t}, so it can't be reused. "
+                    f"Every time element will be written separately."
+                )
+        return self.usable
+
+    def solve(self, solver, t, tee=False, keepfiles=False, options=None):
+        """Integrate time element t with the template NL file.
+
+        Args:
+            solver: PETSc TS solver object
+            t (float): time point at the end of the time element
+            tee (bool): show solver output
+            keepfiles (bool): keep the solver files
+            options (dict): solver options for this time element
+
+        Returns:
+            Pyomo solver results
+        """
+        self._load_element(t)
+        with open(f"{self.stub}.nl", "w") as f:
+            f.write(self.nl_text())
+        # the column names are used to read the trajectory
+        self._column_names = [self.time_vars[j][t].name for j in self._columns]
+        with open(f"{self.stub}.col", "w") as f:
+            f.write("".join(f"{name}\n" for name in self._column_names))
+        res = solver.solve(
+            f"{self.stub}.nl", tee=tee, keepfiles=keepfiles, options=options
+        )
+        if len(res.solution) > 0:
+            values = res.solution(0).variable
+            for i, v in enumerate(self._column_vars):
+                val = values[f"v{i}"]["Value"]
+                if self._column_scaling is not None:
+                    val /= self._column_scaling[i]
+                v.set_value(val, skip_validation=True)
+        if t != self.t:
+            for var in self.time_vars:
+                if not var[t].fixed:
+                    var[t].set_value(var[self.t].value, skip_validation=True)
+        return res
+
+    def read_trajectory(self):
+        """Read the trajectory of the last time element integrated with the
+        template, and unscale it.
+
+        Returns:
+            (PetscTrajectory): trajectory
+        """
+        tj = PetscTrajectory(stub="tmp_vars_stub", delete_on_read=True)
+        if self._column_scaling is not None:
+            tj._unscale_columns(dict(zip(self._column_names, self._column_scaling)))
+        return tj
+
+    def close(self, keepfiles=False):
+        """Restore the values of the template time element and remove the
+        template files.
+
+        Args:
+            keepfiles (bool): if True, don't remove the template files
+
+        Returns:
+            None
+        """
+        if self._saved is not None:
+            for var, val in zip(self.time_vars, self._saved):
+                var[self.t].set_value(val, skip_validation=True)
+            self._saved = None
+        if not keepfiles:
+            shutil.rmtree(self.directory, ignore_errors=True)
+
+
 class PetscDAEResults(object):
     """This class stores the results of ``petsc_dae_by_time_element()`` it has
     two attributes ``results`` and ``trajectory``.  Results is a list of Pyomo
@@ -432,6 +751,7 @@ def petsc_dae_by_time_element(
     previous_trajectory=None,
     representative_time=None,
     snes_options=None,
+    reuse_subsystem=False,
 ):
     """Solve a DAE problem step by step using the PETSc DAE solver.  This
     integrates from one time point to the next.
@@ -482,6 +802,12 @@ def petsc_dae_by_time_element(
             representative_time is specified, it is assumed to be the second element of between.
             Must be an element of between.
         snes_options (dict): [DEPRECATED in favor of initial_solver_options] nonlinear equation solver options
+        reuse_subsystem (bool): if True, write the NL file of the first time
+            element once and reuse it for the following time elements with the
+            same structure, only updating the initial values. This is much
+            faster when there are many time elements, but requires every time
+            element to have the same equations, with data that changes in time
+            given by fixed variables rather than time-indexed parameters.
 
     Returns (PetscDAEResults):
         See PetscDAEResults documentation for more information.
@@ -607,84 +933,88 @@ def petsc_dae_by_time_element(
     ):
         # Solver time steps
         deriv_diff_map = _get_derivative_differential_data_map(m, time)
-        for t in between:
-            if t == between.first():
-                # t == between.first() was handled above
-                continue
-            constraints = [con[t] for con in time_cons if t in con]
-            variables = [var[t] for var in time_vars]
-            # Create a temporary block with references to original constraints
-            # and variables so we can integrate this "subsystem" without
-            # altering the rest of the model.
-            t_block = create_subsystem_block(constraints, variables)
-            differential_vars = _set_dae_suffixes_from_variables(
-                t_block,
-                variables,
-                deriv_diff_map,
-            )
-            # We need to check if there are derivatives in the problem before
-            # sending this to the solver.  We'll assume that if you are using
-            # this and don't have any differential equations, you are making a
-            # mistake.
-            if len(differential_vars) < 1:
-                raise RuntimeError(
-                    f"No differential equations found at t = {t}, not a DAE"
-                )
-            if timevar is not None:
-                t_block.dae_suffix[timevar[t]] = int(DaeVarTypes.TIME)
-            # Set up the scaling factor suffix
-            _sub_problem_scaling_suffix(m, t_block)
-            # Take initial conditions for this step from the result of previous
-            _copy_time(time_vars, tprev, t)
-            with idaeslog.solver_log(solve_log, idaeslog.INFO) as slc:
-                res = solver_dae.solve(
-                    t_block,
-                    tee=slc.tee,
-                    keepfiles=keepfiles,
-                    symbolic_solver_labels=symbolic_solver_labels,
-                    export_nonlinear_variables=differential_vars,
-                    options={"--ts_init_time": tprev, "--ts_max_time": t},
-                )
-            if save_trajectory:
-                tj_prev = tj
-                tj = PetscTrajectory(
-                    stub="tmp_vars_stub",
-                    delete_on_read=True,
-                    unscale=True,
-                    model=t_block,
-                )
-                # add fixed vars to the trajectory. this does two things 1)
-                # helps users looking for fixed var trajectory and 2) lets
-                # us concatenate trajectories with section that are mixed fixed
-                # and unfixed
-                for i, v in enumerate(variables):
-                    if isinstance(v.parent_component(), pyodae.DerivativeVar):
-                        continue  # skip derivative vars
-                    try:
-                        vec = tj.get_vec(v)
-                    except KeyError:
-                        tj._set_vec(v, [pyo.value(v)] * len(tj.time))
-                if tj_prev is not None:
-                    # due to the way variables is generated we know variables
-                    # have corresponding positions in the list
-                    no_repeat = set()
-                    for i, v in enumerate(variables):
-                        vp = variables_prev[i]
-                        if id(v) in no_repeat:
-                            continue  # variables can be repeated in list
+        template = None
+        try:
+            for t in between:
+                if t == between.first():
+                    # t == between.first() was handled above
+                    continue
+                variables = [var[t] for var in time_vars]
+                # Take initial conditions for this step from the result of previous
+                _copy_time(time_vars, tprev, t)
+                if reuse_subsystem and template is None:
+                    template = _TimeElementTemplate(
+                        m, t, time_vars, time_cons, deriv_diff_map, timevar
+                    )
+                options = {"--ts_init_time": tprev, "--ts_max_time": t}
+                use_template = template is not None and template.matches(t)
+                if use_template:
+                    with idaeslog.solver_log(solve_log, idaeslog.INFO) as slc:
+                        res = template.solve(
+                            solver_dae,
+                            t,
+                            tee=slc.tee,
+                            keepfiles=keepfiles,
+                            options=options,
+                        )
+                else:
+                    t_block, differential_vars = _time_element_subsystem(
+                        m, t, time_vars, time_cons, deriv_diff_map, timevar
+                    )
+                    with idaeslog.solver_log(solve_log, idaeslog.INFO) as slc:
+                        res = solver_dae.solve(
+                            t_block,
+                            tee=slc.tee,
+                            keepfiles=keepfiles,
+                            symbolic_solver_labels=symbolic_solver_labels,
+                            export_nonlinear_variables=differential_vars,
+                            options=options,
+                        )
+                if save_trajectory:
+                    tj_prev = tj
+                    if use_template:
+                        tj = template.read_trajectory()
+                    else:
+                        tj = PetscTrajectory(
+                            stub="tmp_vars_stub",
+                            delete_on_read=True,
+                            unscale=True,
+                            model=t_block,
+                        )
+                    # add fixed vars to the trajectory. this does two things 1)
+                    # helps users looking for fixed var trajectory and 2) lets
+                    # us concatenate trajectories with section that are mixed fixed
+                    # and unfixed
+                    for v in variables:
                         if isinstance(v.parent_component(), pyodae.DerivativeVar):
                             continue  # skip derivative vars
-                        no_repeat.add(id(v))
-                        # We'll add fixed vars in case they aren't fixed in
-                        # another section. Fixed vars don't go to the solver
-                        # so they don't show up in the trajectory data
-                        vec = tj.get_vec(v)
-                        vec_prev = tj_prev.get_vec(vp)
-                        tj._set_vec(v, vec_prev + vec)
-                    tj._set_time_vec(tj_prev.time + tj.time)
-                variables_prev = variables
-            tprev = t
-            res_list.append(res)
+                        try:
+                            tj.get_vec(v)
+                        except KeyError:
+                            tj._set_vec(v, pyo.value(v))
+                    if tj_prev is not None:
+                        # due to the way variables is generated we know variables
+                        # have corresponding positions in the list, so the
+                        # previous trajectory is renamed to this time element's
+                        # variables before appending to it
+                        names = {}
+                        for v, vp in zip(variables, variables_prev):
+                            if isinstance(v.parent_component(), pyodae.DerivativeVar):
+                                continue  # skip derivative vars
+                            names[tj_prev._name(vp)] = tj._name(v)
+                        if tj_prev is previous_trajectory:
+                            # don't change the trajectory passed in
+                            tj_prev = tj_prev.copy()
+                        tj_prev.append(tj, names=names)
+                        tj = tj_prev
+                    variables_prev = variables
+                tprev = t
+                res_list.append(res)
+        finally:
+            if template is not None:
+                # the template time element holds the values of the last
+                # time element integrated, so restore its own solution
+                template.close(keepfiles=keepfiles)
         # If the interpolation option is True and the trajectory is available
         # interpolate the values any skipped time points from the trajectory
         if interpolate and tj is not None:
@@ -797,10 +1127,15 @@ class PetscTrajectory(object):
         unscale=None,
         model=None,
         no_read=False,
+        npz=None,
     ):
         """Class to read PETSc TS solver trajectory data.  This can either read
         PETSc output by providing the ``stub`` argument, a trajectory dict by
-        providing ``vecs`` or a json file by providing ``json``.
+        providing ``vecs``, a json file by providing ``json`` or a NumPy npz
+        file by providing ``npz``.
+
+        The trajectory is stored as a 2-D array with a row for each time point
+        and a column for each variable.
 
         Args:
             stub (str): file name stub for variable info
@@ -814,7 +1149,11 @@ class PetscTrajectory(object):
                 False or None do not unscale.
             model (Block): if specified use for unscaling
             no_read (bool): if True make an uninitialized trajectory object
+            npz (str): path of a npz file written by ``to_npz``
         """
+        self.id_map = {}
+        self._columns = {}
+        self._set_data(np.zeros(0), np.zeros((0, 0)))
         if no_read:
             return
         if petsc_binary_io() is None and stub is not None:
@@ -823,7 +1162,6 @@ class PetscTrajectory(object):
         if model is not None and unscale is True:
             unscale = model
         self.model = model
-        self.id_map = {}
         if pth is not None:
             stub = os.path.join(pth, stub)
             vis_dir = os.path.join(pth, vis_dir)
@@ -838,12 +1176,135 @@ class PetscTrajectory(object):
             if unscale is not None:
                 self._unscale(unscale)
         elif vecs is not None:
-            self.vecs = vecs
-            self.time = vecs["_time"]
+            self._from_vecs(vecs)
         elif json is not None:
             self.from_json(json)
+        elif npz is not None:
+            self.from_npz(npz)
         else:
-            raise RuntimeError("To read trajectory, provide stub, vecs, or json")
+            raise RuntimeError("To read trajectory, provide stub, vecs, json, or npz")
+
+    def _set_data(self, time, data, names=None):
+        """Replace the trajectory data.
+
+        Args:
+            time (array): time points
+            data (array): values with a row for each time point and a column
+                for each variable
+            names (list): variable names of the columns, if None keep the
+                current names
+
+        Returns:
+            None
+        """
+        self._time = np.array(time, dtype=float)
+        self._data = np.array(data, dtype=float)
+        if self._data.ndim != 2:
+            self._data = self._data.reshape(len(self._time), -1)
+        self._n = len(self._time)
+        if names is not None:
+            self._columns = {name: j for j, name in enumerate(names)}
+
+    def _reserve(self, n):
+        """Make room for at least n time points. The capacity is at least
+        doubled, so appending time points takes amortized linear time.
+        """
+        if n <= len(self._time):
+            return
+        capacity = max(n, 2 * len(self._time))
+        time = np.empty(capacity)
+        time[: self._n] = self._time[: self._n]
+        data = np.empty((capacity, self._data.shape[1]))
+        data[: self._n] = self._data[: self._n]
+        self._time = time
+        self._data = data
+
+    def _add_columns(self, names):
+        """Add columns of NaN for variables not in the trajectory yet."""
+        new = [name for name in dict.fromkeys(names) if name not in self._columns]
+        if not new:
+            return
+        n_cols = self._data.shape[1]
+        data = np.full((len(self._time), n_cols + len(new)), np.nan)
+        data[:, :n_cols] = self._data
+        self._data = data
+        for j, name in enumerate(new):
+            self._columns[name] = n_cols + j
+
+    def _name(self, var):
+        if isinstance(var, str):
+            return var
+        try:
+            return self.id_map[id(var)]
+        except KeyError:
+            var_str = str(var)
+            self.id_map[id(var)] = var_str
+            return var_str
+
+    @property
+    def time(self):
+        """Array of the time points"""
+        return self._time[: self._n]
+
+    @time.setter
+    def time(self, time):
+        self._set_time_vec(time)
+
+    @property
+    def data(self):
+        """2-D array of values with a row for each time point and a column for
+        each variable, see ``names`` for the order of the columns"""
+        return self._data[: self._n]
+
+    @property
+    def names(self):
+        """List of the variable names in column order"""
+        return list(self._columns)
+
+    @property
+    def vecs(self):
+        """Dictionary of the trajectory with variable name keys and '_time',
+        and lists of values at each time point. This is a copy of the
+        trajectory, made on each access, so changes to it do not change the
+        trajectory; assign a new dictionary to ``vecs`` to replace it.
+
+        Deprecated, use ``time``, ``data``, ``names`` or ``get_vec`` instead,
+        which do not copy the trajectory into lists.
+        """
+        deprecation_warning(
+            msg="PetscTrajectory.vecs has been DEPRECATED in favor of the time, "
+            "data and names attributes and the get_vec method.",
+            logger=idaeslog.getLogger(__name__),
+            version="2.6.0",
+            remove_in="3.0.0",
+        )
+        return self._to_vecs()
+
+    @vecs.setter
+    def vecs(self, vecs):
+        deprecation_warning(
+            msg="PetscTrajectory.vecs has been DEPRECATED in favor of the time, "
+            "data and names attributes and the get_vec method.",
+            logger=idaeslog.getLogger(__name__),
+            version="2.6.0",
+            remove_in="3.0.0",
+        )
+        self._from_vecs(vecs)
+
+    def _to_vecs(self):
+        vecs = {"_time": self._time[: self._n].tolist()}
+        data = self._data[: self._n]
+        for name, j in self._columns.items():
+            vecs[name] = data[:, j].tolist()
+        return vecs
+
+    def _from_vecs(self, vecs):
+        names = [name for name in vecs if name != "_time"]
+        time = np.asarray(vecs["_time"], dtype=float)
+        data = np.empty((len(time), len(names)))
+        for j, name in enumerate(names):
+            data[:, j] = vecs[name]
+        self._set_data(time, data, names)
 
     def _read(self):
         with open(f"{self.stub}.col") as f:
@@ -852,28 +1313,22 @@ class PetscTrajectory(object):
             typ = list(map(int, f.readlines()))
         _vars = [name for i, name in enumerate(names) if typ[i] in [0, 1]]
         (t, v, names) = petsc_binary_io().ReadTrajectory("Visualization-data")
-        self.time = t
-        self.vecs_by_time = v
-        self.vecs = dict.fromkeys(_vars, None)
-        for k in self.vecs.keys():
-            self.vecs[k] = [0] * len(self.time)
-        self.vecs["_time"] = list(self.time)
-        for i, v in enumerate(_vars):
-            for j, vt in enumerate(self.vecs_by_time):
-                self.vecs[v][j] = vt[i]
+        data = np.asarray(v, dtype=float).reshape(len(t), -1)
+        self._set_data(t, data[:, : len(_vars)], _vars)
 
     def _set_vec(self, var, vec):
-        try:
-            var = self.id_map[id(var)]
-        except KeyError:
-            var_str = str(var)
-            self.id_map[id(var)] = var_str
-            var = var_str
-        self.vecs[var] = vec
+        name = self._name(var)
+        self._add_columns([name])
+        self._data[: self._n, self._columns[name]] = vec
 
     def _set_time_vec(self, vec):
-        self.vecs["_time"] = vec
-        self.time = self.vecs["_time"]
+        vec = np.asarray(vec, dtype=float)
+        if len(vec) != self._n:
+            raise ValueError(
+                f"Time vector has {len(vec)} points, but the trajectory has "
+                f"{self._n} points."
+            )
+        self._time[: self._n] = vec
 
     def get_vec(self, var):
         """Return the vector of variable values at each time point for var.
@@ -882,17 +1337,53 @@ class PetscTrajectory(object):
             var (str or Var): Variable to get vector for.
             time (Set): Time index set
 
-        Returns (list):
-            vector of variable values at each time point
+        Returns (numpy.ndarray):
+            vector of variable values at each time point. This is a view of
+            the trajectory data, not a list as before version 2.6.
 
         """
-        try:
-            var = self.id_map[id(var)]
-        except KeyError:
-            var_str = str(var)
-            self.id_map[id(var)] = var_str
-            var = var_str
-        return self.vecs[var]
+        name = self._name(var)
+        if name == "_time":
+            return self.time
+        return self._data[: self._n, self._columns[name]]
+
+    def append(self, other, names=None):
+        """Append the time points of another trajectory to this one.
+
+        Args:
+            other (PetscTrajectory): trajectory to append
+            names (dict): optional map from variable names in this trajectory
+                to the names of the same variables in other. Columns are
+                renamed before appending.
+
+        Returns:
+            None
+        """
+        if names:
+            self._columns = {
+                names.get(name, name): j for name, j in self._columns.items()
+            }
+        self._add_columns(other._columns)
+        n = self._n
+        n_other = len(other.time)
+        self._reserve(n + n_other)
+        self._time[n : n + n_other] = other.time
+        rows = self._data[n : n + n_other]
+        rows[:] = np.nan
+        cols = [self._columns[name] for name in other._columns]
+        rows[:, cols] = other.data
+        self._n += n_other
+
+    def copy(self):
+        """Return a copy of the trajectory.
+
+        Returns:
+            (PetscTrajectory)
+        """
+        tj = PetscTrajectory(no_read=True)
+        tj.id_map = copy.copy(self.id_map)
+        tj._set_data(self.time, self.data, self.names)
+        return tj
 
     def get_dt(self):
         """Get a list of time steps
@@ -903,10 +1394,23 @@ class PetscTrajectory(object):
         Returns:
             (list)
         """
-        dt = [None] * (len(self.time) - 1)
-        for i in range(len(self.time) - 1):
-            dt[i] = self.time[i + 1] - self.time[i]
-        return dt
+        return np.diff(self.time).tolist()
+
+    def _interpolate_rows(self, times, data):
+        """Interpolate rows of data at times, the same way as ``numpy.interp``
+        does for each column.
+        """
+        t = self.time
+        x = np.asarray(times, dtype=float)
+        i = np.clip(np.searchsorted(t, x, side="right") - 1, 0, len(t) - 1)
+        j = np.minimum(i + 1, len(t) - 1)
+        dt = t[j] - t[i]
+        w = np.zeros(len(x))
+        step = (dt > 0) & (x > t[i])
+        w[step] = (x[step] - t[i][step]) / dt[step]
+        if data.ndim == 1:
+            return data[i] + w * (data[j] - data[i])
+        return data[i] + w[:, None] * (data[j] - data[i])
 
     def interpolate(self, times):
         """Create a new vector dictionary interpolated at times. This method
@@ -917,18 +1421,12 @@ class PetscTrajectory(object):
             times (list): list of times to interpolate. These must be in
                 increasing order.
 
-        Returns (dict):
-            Dictionary of vectors for values at interpolated points
+        Returns (PetscTrajectory):
+            Trajectory with values at interpolated points
         """
         tj = PetscTrajectory(no_read=True)
         tj.id_map = copy.copy(self.id_map)
-        tj.vecs = dict.fromkeys(self.vecs.keys(), None)
-        tj.vecs["_time"] = copy.copy(times)
-        tj.time = tj.vecs["_time"]
-        for var in self.vecs:
-            if var == "_time":
-                continue
-            tj.vecs[var] = np.interp(tj.time, self.time, self.vecs[var])
+        tj._set_data(times, self._interpolate_rows(times, self.data), self.names)
         return tj
 
     def interpolate_vec(self, times, var):
@@ -940,10 +1438,28 @@ class PetscTrajectory(object):
             times (list): list of times to interpolate. These must be in
                 increasing order.
 
-        Returns (dict):
-            Dictionary of vectors for values at interpolated points
+        Returns (numpy.ndarray):
+            vector of values at interpolated points
+        """
+        return self._interpolate_rows(times, self.get_vec(var))
+
+    def _unscale_columns(self, factors):
+        """Divide the columns of the trajectory by scaling factors.
+
+        Args:
+            factors (dict): map from variable names to scaling factors
+
+        Returns:
+            None
         """
-        return np.interp(times, self.time, self.get_vec(var))
+        cols = []
+        scale = []
+        for name, s in factors.items():
+            if s is not None and name in self._columns:
+                cols.append(self._columns[name])
+                scale.append(s)
+        if cols:
+            self._data[: self._n, cols] /= np.asarray(scale, dtype=float)
 
     def _unscale(self, m):
         """If variable scale factors are used, the solver will see scaled
@@ -958,24 +1474,18 @@ class PetscTrajectory(object):
             None
         """
         # Variables might show up more than once because of References
-        already_scaled = set()
-        for var in m.component_data_objects():
-            try:
-                vec = self.get_vec(var)
-            except KeyError:
-                continue
-            vid = id(var)
-            if vid in already_scaled:
+        factors = {}
+        for var in m.component_data_objects(pyo.Var):
+            name = self._name(var)
+            if name not in self._columns or name in factors:
                 continue
             s = None
             if hasattr(var.parent_block(), "scaling_factor"):
                 s = var.parent_block().scaling_factor.get(var, s)
             if hasattr(m, "scaling_factor"):
                 s = m.scaling_factor.get(var, s)
-            if s is not None:
-                for i, x in enumerate(vec):
-                    vec[i] = x / s
-            already_scaled.add(vid)
+            factors[name] = s
+        self._unscale_columns(factors)
 
     def delete_files(self):
         """Delete the trajectory data and variable information files.
@@ -1002,10 +1512,10 @@ class PetscTrajectory(object):
         """
         if pth.endswith(".gz"):
             with gzip.open(pth, "w") as fp:
-                fp.write(json.dumps(self.vecs).encode("utf-8"))
+                fp.write(json.dumps(self._to_vecs()).encode("utf-8"))
         else:
             with open(pth, "w") as fp:
-                json.dump(self.vecs, fp)
+                json.dump(self._to_vecs(), fp)
 
     def from_json(self, pth):
         """Read the trajectory data from a json file in the form of a dictionary.
@@ -1018,8 +1528,35 @@ class PetscTrajectory(object):
         """
         if pth.endswith(".gz"):
             with gzip.open(pth, "r") as fp:
-                self.vecs = json.loads(fp.read())
+                self._from_vecs(json.loads(fp.read()))
         else:
             with open(pth, "r") as fp:
-                self.vecs = json.load(fp)
-        self.time = self.vecs["_time"]
+                self._from_vecs(json.load(fp))
+
+    def to_npz(self, pth, compressed=False):
+        """Save the trajectory data to a NumPy npz file, which is much faster
+        to write and read than json for long trajectories.
+
+        Args:
+            pth (str): path for npz file to write
+            compressed (bool): if True, compress the file
+
+        Returns:
+            None
+        """
+        save = np.savez_compressed if compressed else np.savez
+        with open(pth, "wb") as fp:
+            save(fp, time=self.time, data=self.data, names=np.array(self.names))
+
+    def from_npz(self, pth):
+        """Read the trajectory data from a NumPy npz file written by
+        ``to_npz``.
+
+        Args:
+            pth (str): path for npz file to read
+
+        Returns:
+            None
+        """
+        with np.load(pth) as npz:
+            self._set_data(npz["time"], npz["data"], npz["names"].tolist())
@@ -13,13 +13,15 @@
 
 """Basic unit tests for PETSc solver utilities"""
 import pytest
+import io
 import re
 import numpy as np
 import json
 import os
 import pyomo.environ as pyo
 import pyomo.dae as pyodae
-from pyomo.util.subsystems import create_subsystem_block
+from pyomo.repn.plugins.nl_writer import NLWriter
+from pyomo.util.subsystems import create_subsystem_block, TemporarySubsystemManager
 from idaes.core.solvers import petsc
 import idaes.logger as idaeslog
 
@@ -515,6 +517,247 @@ def test_set_dae_suffix():
     assert m.ydot[t, 4] not in t_block.dae_suffix
 
 
+def flatten_for_template(m, time):
+    regular_vars, time_vars = pyodae.flatten.flatten_dae_components(
+        m, time, pyo.Var, active=True, indices=(time.at(2),)
+    )
+    regular_cons, time_cons = pyodae.flatten.flatten_dae_components(
+        m, time, pyo.Constraint, active=True, indices=(time.at(2),)
+    )
+    return regular_vars, time_vars, time_cons
+
+
+@pytest.mark.unit
+def test_time_element_template():
+    m, y1, y2, y3, y4, y5, y6 = dae_with_non_time_indexed_constraint(nfe=4)
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.y[180, 1]] = 10
+    # make the inflow an input that changes in time
+    m.eq_Fin.deactivate()
+    for i, t in enumerate(m.t):
+        m.Fin[t].fix(0.01 * i)
+        m.y[t, 2] = 0.1 * i
+        m.r[t, 1] = 0.2 * i
+    regular_vars, time_vars, time_cons = flatten_for_template(m, m.t)
+    tdisc = petsc.find_discretization_equations(m, m.t)
+
+    with TemporarySubsystemManager(to_deactivate=tdisc, to_fix=regular_vars):
+        deriv_diff_map = petsc._get_derivative_differential_data_map(m, m.t)
+        template = petsc._TimeElementTemplate(
+            m, m.t.at(2), time_vars, time_cons, deriv_diff_map
+        )
+        assert template.usable
+        assert template.matches(m.t.at(2))
+        assert template.matches(m.t.at(3))
+        assert template.validated
+        # different scaling factors
+        assert not template.matches(180)
+        assert template.usable
+
+        # the NL file of the template with the values of another time element
+        # is the NL file of that time element
+        t = m.t.at(4)
+        m.y[t, 1].fix(0.5)
+        assert not template.matches(t)
+        m.y[t, 1].unfix()
+        assert template.matches(t)
+        t_block, differential_vars = petsc._time_element_subsystem(
+            m, t, time_vars, time_cons, deriv_diff_map, None
+        )
+        template._load_element(t)
+        ostream = io.StringIO()
+        NLWriter().write(
+            t_block,
+            ostream,
+            symbolic_solver_labels=False,
+            export_nonlinear_variables=differential_vars,
+            linear_presolve=False,
+        )
+        assert template.nl_text() == ostream.getvalue()
+        # the NL file is written again only when fixed values change
+        assert template._fixed_values() == template._constants
+        template._copy_to_template(m.t.at(3))
+        assert template._fixed_values() != template._constants
+
+        directory = template.directory
+        template.close()
+        assert not os.path.exists(directory)
+
+    # the template element has its own values again
+    assert pyo.value(m.y[m.t.at(2), 2]) == pytest.approx(0.1)
+    assert pyo.value(m.r[m.t.at(2), 1]) == pytest.approx(0.2)
+    assert pyo.value(m.y[m.t.at(4), 2]) == pytest.approx(0.3)
+
+
+@pytest.mark.unit
+def test_time_element_template_explicit_time(caplog):
+    m = pyo.ConcreteModel()
+    m.time = pyodae.ContinuousSet(initialize=(0.0, 1.0, 2.0, 3.0))
+    m.x = pyo.Var(m.time, initialize=1)
+    m.dxdt = pyodae.DerivativeVar(m.x, wrt=m.time)
+
+    # explicit time in the equations makes the time elements different
+    @m.Constraint(m.time)
+    def diff_eq(m, t):
+        return m.dxdt[t] == -m.x[t] + t
+
+    pyo.TransformationFactory("dae.finite_difference").apply_to(
+        m, nfe=3, scheme="BACKWARD"
+    )
+    m.x[0].fix(1)
+    regular_vars, time_vars, time_cons = flatten_for_template(m, m.time)
+    tdisc = petsc.find_discretization_equations(m, m.time)
+
+    with TemporarySubsystemManager(to_deactivate=tdisc):
+        deriv_diff_map = petsc._get_derivative_differential_data_map(m, m.time)
+        template = petsc._TimeElementTemplate(
+            m, 1.0, time_vars, time_cons, deriv_diff_map
+        )
+        assert template.matches(1.0)
+        assert not template.matches(2.0)
+        assert not template.usable
+        assert "does not have the same structure" in caplog.text
+        template.close()
+
+    assert pyo.value(m.x[1.0]) == 1
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not petsc.petsc_available(), reason="PETSc solver not available")
+def test_petsc_reuse_subsystem():
+    ts_options = {
+        "--ts_type": "cn",  # Crank–Nicolson
+        "--ts_adapt_type": "basic",
+        "--ts_dt": 0.01,
+        "--ts_save_trajectory": 1,
+    }
+    m0, y1, y2, y3, y4, y5, y6 = dae_with_non_time_indexed_constraint(nfe=10)
+    res0 = petsc.petsc_dae_by_time_element(m0, time=m0.t, ts_options=ts_options)
+
+    m, y1, y2, y3, y4, y5, y6 = dae_with_non_time_indexed_constraint(nfe=10)
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.y[180, 1]] = 10  # last element doesn't match
+    res = petsc.petsc_dae_by_time_element(
+        m, time=m.t, ts_options=ts_options, reuse_subsystem=True
+    )
+    assert len(res.results) == len(res0.results)
+    for t in m.t:
+        for j in range(1, 7):
+            assert pyo.value(m.y[t, j]) == pytest.approx(
+                pyo.value(m0.y[t, j]), rel=1e-5, abs=1e-8
+            )
+    assert pytest.approx(y1, rel=1e-3) == pyo.value(m.y[m.t.last(), 1])
+
+    tj = res.trajectory
+    assert tj.get_vec("_time")[-1] == pytest.approx(180)
+    assert tj.get_vec(m.y[180, 1])[-1] == pytest.approx(y1, rel=1e-3)
+    assert tj.get_vec(m.y[180, 2]) == pytest.approx(
+        res0.trajectory.get_vec(m0.y[180, 2]), rel=1e-5, abs=1e-8
+    )
+
+
+@pytest.mark.unit
+def test_trajectory_arrays(tmp_path):
+    vecs = {"_time": [0.0, 1.0, 2.0], "x": [1.0, 2.0, 3.0], "y[1]": [4.0, 5.0, 6.0]}
+    tj = petsc.PetscTrajectory(vecs=vecs)
+    assert tj.names == ["x", "y[1]"]
+    assert tj.data.shape == (3, 2)
+    assert tj.vecs == vecs
+    assert tj.get_dt() == [1.0, 1.0]
+    np.testing.assert_array_equal(tj.get_vec("_time"), [0, 1, 2])
+
+    # time points of the next element, with variables renamed
+    tj2 = petsc.PetscTrajectory(
+        vecs={"_time": [2.0, 3.0], "y[2]": [6.0, 7.0], "x": [3.0, 4.0], "z": [0, 1]}
+    )
+    tj.append(tj2, names={"y[1]": "y[2]"})
+    np.testing.assert_array_equal(tj.time, [0, 1, 2, 2, 3])
+    np.testing.assert_array_equal(tj.get_vec("x"), [1, 2, 3, 3, 4])
+    np.testing.assert_array_equal(tj.get_vec("y[2]"), [4, 5, 6, 6, 7])
+    np.testing.assert_array_equal(tj.get_vec("z")[3:], [0, 1])
+    assert np.all(np.isnan(tj.get_vec("z")[:3]))
+    with pytest.raises(KeyError):
+        tj.get_vec("y[1]")
+
+    # appending many times takes linear time, but test the values only
+    tj3 = tj.copy()
+    for i in range(100):
+        tj3.append(tj2)
+    assert len(tj3.time) == 205
+    assert tj3.get_vec("x")[-1] == 4
+    np.testing.assert_array_equal(tj.get_vec("x"), [1, 2, 3, 3, 4])
+
+    # interpolation is the same as numpy.interp, even at the repeated time
+    times = [-1, 0, 0.5, 2, 2.5, 3, 4]
+    tj4 = tj.interpolate(times)
+    for name in ["x", "y[2]"]:
+        expected = np.interp(times, tj.time, tj.get_vec(name))
+        np.testing.assert_allclose(tj4.get_vec(name), expected)
+        np.testing.assert_allclose(tj.interpolate_vec(times, name), expected)
+    np.testing.assert_array_equal(tj4.time, times)
+
+    tj._unscale_columns({"x": 10, "y[2]": None, "w": 2})
+    np.testing.assert_allclose(tj.get_vec("x"), [0.1, 0.2, 0.3, 0.3, 0.4])
+    np.testing.assert_array_equal(tj.get_vec("y[2]"), [4, 5, 6, 6, 7])
+
+    for compressed in [False, True]:
+        path = str(tmp_path / "tj.npz")
+        tj.to_npz(path, compressed=compressed)
+        tj5 = petsc.PetscTrajectory(npz=path)
+        assert tj5.names == tj.names
+        np.testing.assert_array_equal(tj5.time, tj.time)
+        np.testing.assert_array_equal(tj5.data, tj.data)
+
+    path = str(tmp_path / "tj.json")
+    tj.to_json(path)
+    tj6 = petsc.PetscTrajectory(json=path)
+    assert tj6.names == tj.names
+    np.testing.assert_array_equal(tj6.data, tj.data)
+
+
+@pytest.mark.unit
+def test_trajectory_vecs_deprecated(caplog):
+    tj = petsc.PetscTrajectory(vecs={"_time": [0.0, 1.0, 2.0], "x": [1.0, 2.0, 3.0]})
+    vecs = tj.vecs
+    assert "PetscTrajectory.vecs has been DEPRECATED" in caplog.text
+    assert vecs == {"_time": [0.0, 1.0, 2.0], "x": [1.0, 2.0, 3.0]}
+
+    # the dictionary is a copy, which is not changed with the trajectory
+    assert tj.vecs is not vecs
+    vecs["x"][1] = 10.0
+    vecs["y"] = [4.0, 5.0, 6.0]
+    np.testing.assert_array_equal(tj.get_vec("x"), [1, 2, 3])
+    assert tj.names == ["x"]
+    tj.time = [0.0, 2.0, 4.0]
+    assert vecs["_time"] == [0.0, 1.0, 2.0]
+    assert tj.vecs["_time"] == [0.0, 2.0, 4.0]
+
+    tj.vecs = {"_time": [0.0], "z": [1.0]}
+    assert tj.names == ["z"]
+    assert tj.vecs == {"_time": [0.0], "z": [1.0]}
+
+
+@pytest.mark.unit
+def test_trajectory_unscale():
+    m = pyo.ConcreteModel()
+    m.b = pyo.Block()
+    m.b.x = pyo.Var([1, 2])
+    m.b.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.b.scaling_factor[m.b.x[1]] = 10
+    m.b.scaling_factor[m.b.x[2]] = 2
+    m.scaling_factor = pyo.Suffix(direction=pyo.Suffix.EXPORT)
+    m.scaling_factor[m.b.x[2]] = 4
+    m.x_ref = pyo.Reference(m.b.x)
+
+    tj = petsc.PetscTrajectory(
+        vecs={"_time": [0, 1], "b.x[1]": [10, 20], "b.x[2]": [4, 8]}
+    )
+    tj._unscale(m)
+    # the top level model takes precedence, and references are unscaled once
+    np.testing.assert_allclose(tj.get_vec(m.b.x[1]), [1, 2])
+    np.testing.assert_allclose(tj.get_vec(m.b.x[2]), [1, 2])
+
+
 @pytest.mark.unit
 @pytest.mark.skipif(not petsc.petsc_available(), reason="PETSc solver not available")
 def test_petsc_read_trajectory():
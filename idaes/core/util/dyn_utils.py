@@ -826,3 +826,179 @@ def copy_values_at_time(
                         local_parent, var_target.parent_component().local_name
                     )[var_target.index()]
                     var_target.set_value(var_source.value)
+
+
+class TimeTransferMap(object):
+    """
+    Correspondence between the time-indexed variables of two flowsheets,
+    resolved once so that values can be copied between any two time points
+    repeatedly, e.g. between a plant and a controller model in every sample.
+
+    The variables are matched the same way as in `copy_values_at_time`, by
+    their names relative to the flowsheets. The map holds, for each time
+    point of each flowsheet, the VarData of the time-indexed variables and
+    of the variables in the time-indexed blocks at that point. The blocks at
+    different time points need not contain the same variables: variables of
+    a target block that do not exist in the source block are skipped. The
+    pairs of variables for two time points are found on the first copy
+    between them and reused afterwards, so the structure of the flowsheets
+    must not change while the map is used.
+    """
+
+    def __init__(self, fs_tgt, fs_src, outlvl=idaeslog.NOTSET):
+        """
+        Args:
+            fs_tgt : Target flowsheet, whose variables' values will get set
+            fs_src : Source flowsheet, whose variables' values will be used to
+                     set those of the target flowsheet. Could be the target
+                     flowsheet
+            outlvl : IDAES logger output level
+        """
+        self.fs_tgt = fs_tgt
+        self.fs_src = fs_src
+        time_target = fs_tgt.time
+        time_source = fs_src.time
+        init_log = idaeslog.getInitLogger(__name__, outlvl)
+
+        # time point -> list of time-indexed VarData at that point
+        self.target_vars = {t: [] for t in time_target}
+        self.source_vars = {t: [] for t in time_source}
+        # time point -> list with, for each time-indexed block, a dict mapping
+        # the path of each variable in the block at that point to the VarData
+        self.target_blocks = {t: [] for t in time_target}
+        self.source_blocks = {t: [] for t in time_source}
+        # (t_target, t_source) -> lists of target and source VarData
+        self._pairs = {}
+
+        var_visited = set()
+        for var_target in fs_tgt.component_objects(Var):
+            if id(var_target) in var_visited:
+                continue
+            var_visited.add(id(var_target))
+
+            if not is_explicitly_indexed_by(var_target, time_target):
+                continue
+            n = var_target.index_set().dimen
+
+            varname = var_target.getname(fully_qualified=True, relative_to=fs_tgt)
+            var_source = fs_src.find_component(varname)
+            if var_source is None:
+                init_log.warning(
+                    "Warning copying values: "
+                    + varname
+                    + " does not exist in source block "
+                    + fs_src.name
+                )
+                continue
+
+            if n == 1:
+                non_time_indices = [None]
+                index_getter = lambda non_time_index, t: t
+            elif n >= 2:
+                index_info = get_index_set_except(var_target, time_target)
+                non_time_indices = index_info["set_except"]
+                index_getter = index_info["index_getter"]
+            for non_time_index in non_time_indices:
+                for t in time_target:
+                    self.target_vars[t].append(
+                        var_target[index_getter(non_time_index, t)]
+                    )
+                for t in time_source:
+                    self.source_vars[t].append(
+                        var_source[index_getter(non_time_index, t)]
+                    )
+
+        blk_visited = set()
+        for blk_target in fs_tgt.component_objects(Block):
+            if id(blk_target) in blk_visited:
+                continue
+            blk_visited.add(id(blk_target))
+
+            if not is_explicitly_indexed_by(blk_target, time_target):
+                continue
+            n = blk_target.index_set().dimen
+
+            blkname = blk_target.getname(fully_qualified=True, relative_to=fs_tgt)
+            blk_source = fs_src.find_component(blkname)
+            if blk_source is None:
+                init_log.warning(
+                    "Warning copying values: "
+                    + blkname
+                    + " does not exist in source"
+                    + fs_src.name
+                )
+                continue
+
+            if n == 1:
+                non_time_indices = [None]
+                index_getter = lambda non_time_index, t: t
+            elif n >= 2:
+                index_info = get_index_set_except(blk_target, time_target)
+                non_time_indices = index_info["set_except"]
+                index_getter = index_info["index_getter"]
+            for non_time_index in non_time_indices:
+                for t in time_target:
+                    self.target_blocks[t].append(
+                        self._block_vars(blk_target[index_getter(non_time_index, t)])
+                    )
+                for t in time_source:
+                    self.source_blocks[t].append(
+                        self._block_vars(blk_source[index_getter(non_time_index, t)])
+                    )
+
+    @staticmethod
+    def _block_vars(blk):
+        """
+        Map the path of each variable in a block from the block to the VarData.
+        """
+        block_vars = {}
+        for var in blk.component_data_objects(Var):
+            route = tuple(path_from_block(var, blk, include_comp=True))
+            if route not in block_vars:
+                block_vars[route] = var
+        return block_vars
+
+    def _get_pairs(self, t_target, t_source):
+        pairs = self._pairs.get((t_target, t_source))
+        if pairs is None:
+            target = list(self.target_vars[t_target])
+            source = list(self.source_vars[t_source])
+            for target_block, source_block in zip(
+                self.target_blocks[t_target], self.source_blocks[t_source]
+            ):
+                for route, var in target_block.items():
+                    var_source = source_block.get(route)
+                    if var_source is not None:
+                        target.append(var)
+                        source.append(var_source)
+            pairs = self._pairs[t_target, t_source] = (target, source)
+        return pairs
+
+    def __len__(self):
+        """
+        Number of variables that are copied between the first time points of
+        the flowsheets.
+        """
+        return len(
+            self._get_pairs(self.fs_tgt.time.first(), self.fs_src.time.first())[0]
+        )
+
+    def copy_values(self, t_target, t_source, copy_fixed=True):
+        """
+        Set the values of the target variables at time t_target to the values
+        of the source variables at time t_source.
+
+        Args:
+            t_target : Target time point
+            t_source : Source time point
+            copy_fixed : Bool of whether or not to copy over fixed variables in
+                         target model
+
+        Returns:
+            None
+        """
+        target, source = self._get_pairs(t_target, t_source)
+        values = [var.value for var in source]
+        for var, val in zip(target, values):
+            if copy_fixed or not var.fixed:
+                var.set_value(val)
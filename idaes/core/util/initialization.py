@@ -15,26 +15,32 @@
 This module contains utility functions for initialization of IDAES models.
 """
 
+from contextlib import nullcontext
+
+import numpy as np
 from pyomo.environ import (
     Block,
     check_optimal_termination,
     Constraint,
     value,
+    Var,
 )
 from pyomo.network import Arc
 from pyomo.dae import ContinuousSet
+from pyomo.dae.flatten import flatten_dae_components
 from pyomo.core.expr.visitor import identify_variables
 
 from idaes.core.util.exceptions import ConfigurationError
 from idaes.core.util.model_statistics import degrees_of_freedom
+from idaes.core.util.parallel import fork_available, get_worker_state, worker_pool
 from idaes.core.util.dyn_utils import (
     get_activity_dict,
     deactivate_model_at,
     deactivate_constraints_unindexed_by,
     fix_vars_unindexed_by,
     get_derivatives_at,
-    copy_values_at_time,
     get_implicit_index_of_set,
+    TimeTransferMap,
 )
 import idaes.logger as idaeslog
 from idaes.core.solvers import get_solver
@@ -309,6 +315,28 @@ def initialize_by_time_element(fs, time, **kwargs):
         solver : Pyomo solver object initialized with user's desired options
         outlvl : IDAES logger outlvl
         ignore_dof : Bool. If True, checks for square problems will be skipped.
+        fix_diff_only : Bool. If True, only the differential and derivative
+                variables at the initial time point of a finite element are
+                fixed when solving it. Otherwise, all variables that link the
+                finite element to previous time points are fixed.
+        parallel_in_time : Bool. If True, the finite elements are solved
+                with the Parareal algorithm, in which every iteration solves
+                all the finite elements independently from a guess of their
+                initial states, and then corrects the guesses in a serial
+                sweep. Requires fix_diff_only=True. There is no separate
+                coarse model, so the guesses are only as good as the last
+                solves: Parareal may need up to nfe*(nfe+1)/2 solves, against
+                nfe for the serial initialization, and only pays off with
+                enough workers and states that settle in a few iterations.
+                The total number of solves is logged. Caprese's
+                initialize_by_element_in_range does not have this option.
+        n_workers : Number of processes that solve finite elements in
+                parallel-in-time initialization. Default is 1.
+        max_iter : Maximum number of Parareal iterations. Default is the
+                number of finite elements, after which Parareal has
+                converged to the serial solution.
+        tol : Convergence tolerance of Parareal on the change of the initial
+                states of the finite elements. Default is 1e-6.
 
     Returns:
         None
@@ -364,6 +392,18 @@ def initialize_by_time_element(fs, time, **kwargs):
     # is being present, but should be a good assumption otherwise, and is
     # significantly faster than searching each constraint for time-linking
     # variables.
+    parallel_in_time = kwargs.pop("parallel_in_time", False)
+    n_workers = kwargs.pop("n_workers", 1)
+    max_iter = kwargs.pop("max_iter", nfe)
+    tol = kwargs.pop("tol", 1e-6)
+    if parallel_in_time and not fix_diff_only:
+        raise ConfigurationError(
+            "Parallel-in-time initialization requires fix_diff_only=True"
+        )
+    if not isinstance(n_workers, int) or n_workers < 1:
+        raise ValueError(
+            f"n_workers should be a positive integer, but {n_workers} was given."
+        )
 
     if not ignore_dof:
         if degrees_of_freedom(fs) != 0:
@@ -437,57 +477,145 @@ def initialize_by_time_element(fs, time, **kwargs):
     init_log.info(
         "Flowsheet has been deactivated. Beginning element-wise initialization"
     )
-    for i in range(1, nfe + 1):
+
+    # Non-initial time points in each finite element
+    fe_points = [
+        [time.at(k) for k in range((i - 1) * ncp + 2, i * ncp + 2)]
+        for i in range(1, nfe + 1)
+    ]
+    # Differential and derivative variables, which are fixed at the initial
+    # time point of a finite element
+    state_at_time = {t: dvars_at_time[t] + derivs_at_time[t] for t in time}
+    # Values are copied from the initial point of every finite element
+    transfer_map = TimeTransferMap(fs, fs, outlvl=idaeslog.ERROR)
+
+    def solve_element(i, state=None):
         t_prev = time.at((i - 1) * ncp + 1)
-        # Non-initial time points in the finite element:
-        fe = [time.at(k) for k in range((i - 1) * ncp + 2, i * ncp + 2)]
+        if state is not None:
+            for var, val in zip(state_at_time[t_prev], state):
+                if not var.fixed and not np.isnan(val):
+                    var.set_value(float(val), skip_validation=True)
+        return _solve_finite_element(
+            fs,
+            time,
+            i,
+            t_prev,
+            fe_points[i - 1],
+            deactivated,
+            was_originally_active,
+            transfer_map,
+            derivs_at_time[t_prev],
+            dvars_at_time[t_prev],
+            fix_diff_only,
+            solver,
+            ignore_dof,
+            init_log,
+            solver_log,
+        )
 
-        init_log.info(f"Entering step {i}/{nfe} of initialization")
+    if parallel_in_time:
+        _parareal(
+            fs,
+            time,
+            fe_points,
+            state_at_time,
+            solve_element,
+            n_workers,
+            max_iter,
+            tol,
+            init_log,
+        )
+    else:
+        for i in range(1, nfe + 1):
+            init_log.info(f"Entering step {i}/{nfe} of initialization")
 
-        # Activate components of model that were active in the presumably
-        # square original system
-        for t in fe:
-            for comp in deactivated[t]:
-                if was_originally_active[id(comp)]:
-                    comp.activate()
-
-        # Get lists of derivative and differential variables
-        # at initial time point of finite element
-        init_deriv_list = derivs_at_time[t_prev]
-        init_dvar_list = dvars_at_time[t_prev]
-
-        # Variables that were originally fixed
-        fixed_vars = []
-        if fix_diff_only:
-            for drv in init_deriv_list:
-                # Cannot fix variables with value None.
-                # Any variable with value None was not solved for
-                # (either stale or not included in previous solve)
-                # and we don't want to fix it.
-                if not drv.fixed:
-                    fixed_vars.append(drv)
-                if not drv.value is None:
-                    drv.fix()
-            for dv in init_dvar_list:
-                if not dv.fixed:
-                    fixed_vars.append(dv)
-                if not dv.value is None:
-                    dv.fix()
-        else:
-            for con in fs.component_data_objects(Constraint, active=True):
-                for var in identify_variables(con.expr, include_fixed=False):
-                    t_idx = get_implicit_index_of_set(var, time)
-                    if t_idx is None:
-                        continue
-                    if t_idx <= t_prev:
-                        fixed_vars.append(var)
-                        var.fix()
+            results = solve_element(i)
+            if check_optimal_termination(results):
+                init_log.info(f"Successfully solved finite element {i}")
+            else:
+                init_log.error(f"Failed to solve finite element {i}")
+                raise ValueError("Failure in initialization solve")
 
+            # Log that initialization step {i} has been finished
+            init_log.info(f"Initialization step {i} complete")
+
+    # Reactivate components of the model that were originally active
+    for t in time:
+        for comp in deactivated[t]:
+            if was_originally_active[id(comp)]:
+                comp.activate()
+
+    for con in con_unindexed_by_time:
+        con.activate()
+    for var in var_unindexed_by_time:
+        var.unfix()
+
+    # Logger message that initialization is finished
+    init_log.info("Initialization completed. Model has been reactivated")
+
+
+def _solve_finite_element(
+    fs,
+    time,
+    i,
+    t_prev,
+    fe,
+    deactivated,
+    was_originally_active,
+    transfer_map,
+    init_deriv_list,
+    init_dvar_list,
+    fix_diff_only,
+    solver,
+    ignore_dof,
+    init_log,
+    solver_log,
+):
+    """
+    Activate a finite element of a deactivated flowsheet, fix its initial
+    conditions, solve it, and revert the flowsheet to its prior state.
+
+    Returns:
+        Results of the solve
+    """
+    # Activate components of model that were active in the presumably
+    # square original system
+    for t in fe:
+        for comp in deactivated[t]:
+            if was_originally_active[id(comp)]:
+                comp.activate()
+
+    # Variables that were originally fixed
+    fixed_vars = []
+    if fix_diff_only:
+        for drv in init_deriv_list:
+            # Cannot fix variables with value None.
+            # Any variable with value None was not solved for
+            # (either stale or not included in previous solve)
+            # and we don't want to fix it.
+            if not drv.fixed:
+                fixed_vars.append(drv)
+            if not drv.value is None:
+                drv.fix()
+        for dv in init_dvar_list:
+            if not dv.fixed:
+                fixed_vars.append(dv)
+            if not dv.value is None:
+                dv.fix()
+    else:
+        for con in fs.component_data_objects(Constraint, active=True):
+            for var in identify_variables(con.expr, include_fixed=False):
+                t_idx = get_implicit_index_of_set(var, time)
+                if t_idx is None:
+                    continue
+                if t_idx <= t_prev:
+                    fixed_vars.append(var)
+                    var.fix()
+
+    try:
         # Initialize finite element from its initial conditions
         for t in fe:
-            copy_values_at_time(
-                fs, fs, t, t_prev, copy_fixed=False, outlvl=idaeslog.ERROR
-            )
+            transfer_map.copy_values(t, t_prev, copy_fixed=False)
 
         # Log that we are solving finite element {i}
         init_log.info(f"Solving finite element {i}")
@@ -503,13 +631,8 @@ def initialize_by_time_element(fs, time, **kwargs):
                 raise ValueError("Nonzero degrees of freedom")
 
         with idaeslog.solver_log(solver_log, level=idaeslog.DEBUG) as slc:
-            results = solver.solve(fs, tee=slc.tee)
-        if check_optimal_termination(results):
-            init_log.info(f"Successfully solved finite element {i}")
-        else:
-            init_log.error(f"Failed to solve finite element {i}")
-            raise ValueError("Failure in initialization solve")
-
+            return solver.solve(fs, tee=slc.tee)
+    finally:
         # Deactivate components that may have been activated
         for t in fe:
             for comp in deactivated[t]:
@@ -519,19 +642,171 @@ def initialize_by_time_element(fs, time, **kwargs):
         for var in fixed_vars:
             var.unfix()
 
-        # Log that initialization step {i} has been finished
-        init_log.info(f"Initialization step {i} complete")
 
-    # Reactivate components of the model that were originally active
-    for t in time:
-        for comp in deactivated[t]:
-            if was_originally_active[id(comp)]:
-                comp.activate()
+def _parareal(
+    fs,
+    time,
+    fe_points,
+    state_at_time,
+    solve_element,
+    n_workers,
+    max_iter,
+    tol,
+    init_log,
+):
+    """
+    Initialize the finite elements of a deactivated flowsheet with the
+    Parareal algorithm.
+
+    The state of a finite element is the values of the differential and
+    derivative variables at its initial time point. In every iteration, the
+    finite elements are solved from their current states, in separate
+    processes if n_workers > 1 and the platform can fork processes. Then the
+    states are corrected in a serial sweep,
+
+        U[i+1] <- F[i] + (U_new[i] - U_old[i]),
+
+    where F[i] is the state at the end of finite element i from its last solve.
+    This is Parareal with a coarse propagator that moves a state by the change
+    over the finite element in the last solve, which costs nothing but is only
+    accurate once the states stop changing; there is no coarse model of the
+    flowsheet that is solved serially. After k iterations, the first k finite
+    elements have been solved from their exact states, so the algorithm
+    converges in at most nfe iterations. Finite elements whose state has not
+    changed are not solved again, but in the worst case iteration k solves
+    nfe - k + 1 finite elements, i.e., nfe*(nfe+1)/2 solves in total against
+    nfe for the serial initialization. The total number of solves is logged.
 
-    for con in con_unindexed_by_time:
-        con.activate()
-    for var in var_unindexed_by_time:
-        var.unfix()
+    Args:
+        fs : Flowsheet being initialized
+        time : Set whose elements are solved for individually
+        fe_points : List with the non-initial time points of each finite
+            element
+        state_at_time : Dict mapping time points to the differential and
+            derivative variables at that point
+        solve_element : Function of the (1-based) index of a finite element and
+            its state that solves the finite element and returns the results
+        n_workers : Number of processes that solve finite elements
+        max_iter : Maximum number of iterations
+        tol : Convergence tolerance on the change of the states, relative to
+            their magnitude if it is larger than one
 
-    # Logger message that initialization is finished
-    init_log.info("Initialization completed. Model has been reactivated")
+    Returns:
+        None
+    """
+    nfe = len(fe_points)
+    _, time_vars = flatten_dae_components(fs, time, Var)
+    fe_vars = [[var[t] for t in points for var in time_vars] for points in fe_points]
+
+    # The first guess of the state of every finite element is the initial
+    # condition
+    states = [_state_values(state_at_time[time.first()])] * nfe
+    # State from which each finite element was last solved, and its final state
+    solved_from = [None] * nfe
+    final_states = [None] * nfe
+
+    if n_workers > 1 and nfe > 1 and fork_available():
+        # The workers are forked with the flowsheet
+        pool_context = worker_pool(
+            (solve_element, fe_vars), max_workers=min(n_workers, nfe)
+        )
+    else:
+        pool_context = nullcontext()
+
+    converged = False
+    n_iter = n_solves = 0
+    with pool_context as pool:
+        for k in range(max_iter):
+            n_iter = k + 1
+            todo = [
+                i
+                for i in range(nfe)
+                if solved_from[i] is None
+                or not np.array_equal(states[i], solved_from[i], equal_nan=True)
+            ]
+            init_log.info(
+                f"Parareal iteration {k + 1}: solving {len(todo)} finite elements"
+            )
+
+            args = [(i + 1, states[i]) for i in todo]
+            n_solves += len(args)
+            if pool is None:
+                outcomes = (check_optimal_termination(solve_element(*a)) for a in args)
+            else:
+                outcomes = pool.map(_solve_finite_element_in_worker, args)
+
+            for i, outcome in zip(todo, outcomes):
+                if pool is None:
+                    ok = outcome
+                else:
+                    ok, values = outcome
+                    for var, val in zip(fe_vars[i], values):
+                        var.set_value(val, skip_validation=True)
+                if ok:
+                    solved_from[i] = states[i]
+                    final_states[i] = _state_values(state_at_time[fe_points[i][-1]])
+                elif i <= k:
+                    # The first k + 1 finite elements are solved from their
+                    # exact states
+                    init_log.error(f"Failed to solve finite element {i + 1}")
+                    raise ValueError("Failure in initialization solve")
+                else:
+                    # Keep the state until the finite element is solved from a
+                    # better one
+                    solved_from[i] = None
+                    final_states[i] = states[i]
+
+            # Serial correction sweep
+            new_states = [states[0]]
+            for i in range(nfe - 1):
+                new_states.append(final_states[i] + (new_states[i] - states[i]))
+            change = max(_state_change(u, v) for u, v in zip(new_states, states))
+            states = new_states
+
+            init_log.info(
+                f"Parareal iteration {k + 1}: largest change of states {change:.3e}"
+            )
+            if change <= tol and all(s is not None for s in solved_from):
+                converged = True
+                break
+
+    # The final time point of a finite element is the initial time point of
+    # the next one, so its state may have been changed by later solves
+    for points, final_state in zip(fe_points, final_states):
+        for var, val in zip(state_at_time[points[-1]], final_state):
+            if not var.fixed and not np.isnan(val):
+                var.set_value(float(val), skip_validation=True)
+
+    init_log.info(
+        f"Parallel-in-time initialization solved {n_solves} finite elements "
+        f"in {n_iter} iterations ({nfe} for serial initialization)"
+    )
+    if not converged:
+        init_log.warning(
+            f"Parallel-in-time initialization did not converge in {max_iter} "
+            "iterations."
+        )
+
+
+def _state_values(variables):
+    return np.array([var.value for var in variables], dtype=float)
+
+
+def _state_change(new, old):
+    # states that are not known are not compared
+    diff = np.abs(new - old) / np.maximum(1.0, np.abs(old))
+    diff = diff[~np.isnan(diff)]
+    return float(diff.max()) if len(diff) > 0 else 0.0
+
+
+def _solve_finite_element_in_worker(args):
+    """
+    Solve a finite element in a worker process and return whether the solve
+    was successful and the values of the variables in the finite element.
+    """
+
+    solve_element, fe_vars = get_worker_state()
+    i, state = args
+    results = solve_element(i, state)
+
+    return check_optimal_termination(results), [v.value for v in fe_vars[i - 1]]
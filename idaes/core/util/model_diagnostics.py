@@ -19,6 +19,8 @@ __author__ = "Alexander Dowling, Douglas Allan, Andrew Lee, Robby Parker, Ben Kn
 
 from operator import itemgetter
 import sys
+from time import perf_counter
+from contextlib import contextmanager
 from inspect import signature
 from math import log, isclose, inf, isfinite
 import json
@@ -61,7 +63,7 @@ from pyomo.core.base.constraint import ConstraintData
 from pyomo.repn.standard_repn import (  # pylint: disable=no-name-in-module
     generate_standard_repn,
 )
-from pyomo.common.collections import ComponentSet
+from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.common.config import (
     ConfigDict,
     ConfigValue,
@@ -75,9 +77,10 @@ from pyomo.contrib.pynumero.interfaces.pyomo_nlp import PyomoNLP
 from pyomo.contrib.pynumero.asl import AmplInterface
 from pyomo.contrib.fbbt.fbbt import compute_bounds_on_expr
 from pyomo.contrib.iis import mis
+from pyomo.solvers.plugins.solvers.persistent_solver import PersistentSolver
 from pyomo.common.deprecation import deprecation_warning
 from pyomo.common.errors import PyomoException
-from pyomo.common.tempfiles import TempfileManager
+from pyomo.common.tee import capture_output
 
 from idaes.core.solvers.get_solver import get_solver
 from idaes.core.util.model_statistics import (
@@ -102,11 +105,13 @@ from idaes.core.util.scaling import (
     extreme_jacobian_entries,
     jacobian_cond,
 )
+from idaes.core.util.parallel import get_worker_state, worker_pool
 from idaes.core.util.parameter_sweep import (
     SequentialSweepRunner,
     ParameterSweepBase,
     is_psweepspec,
 )
+from idaes.core.util.var_snapshot import VarSnapshot
 import idaes.logger as idaeslog
 
 _log = idaeslog.getLogger(__name__)
@@ -302,6 +307,21 @@ CONFIG.declare(
         description="Feasibility tolerance for identifying infeasible constraints and bounds",
     ),
 )
+CONFIG.declare(
+    "cache_results",
+    ConfigValue(
+        default=False,
+        domain=bool,
+        description="Whether to reuse results of diagnostic checks between calls",
+        doc="If True, results of diagnostic checks are cached and reused until their "
+        "inputs change. Structural checks are recomputed only when the active "
+        "constraints and objectives or the fixed status of variables change, and "
+        "numerical checks only when variable values, variable bounds or mutable "
+        "parameter values also change. Call clear_cache() after modifying the model "
+        "in other ways (e.g. changing a named Expression in place). Checks are always "
+        "run one after another in the current process.",
+    ),
+)
 
 
 SVDCONFIG = ConfigDict()
@@ -383,6 +403,28 @@ DHCONFIG.declare(
         description="Smallest value for nu to be considered non-zero in MILP models.",
     ),
 )
+DHCONFIG.declare(
+    "prune_candidates",
+    ConfigValue(
+        default=False,
+        domain=bool,
+        description="Whether to skip candidate equations which appear in an "
+        "irreducible degenerate set that has already been found.",
+    ),
+)
+DHCONFIG.declare(
+    "number_of_workers",
+    ConfigValue(
+        default=1,
+        domain=PositiveInt,
+        description="Number of worker processes to use for solving IDS MILPs.",
+        doc="Number of worker processes to use for solving IDS MILPs (default=1, "
+        "solve sequentially). Each worker builds its own copy of the IDS MILP and "
+        "solver once and then solves a share of the candidate equations. If "
+        "prune_candidates is True, candidates are dispatched in batches of this "
+        "size and pruned between batches.",
+    ),
+)
 DHCONFIG.declare(
     "trivial_constraint_tolerance",
     ConfigValue(
@@ -393,6 +435,61 @@ DHCONFIG.declare(
 )
 
 
+class _Fingerprint:
+    """
+    Fingerprint of the state of a model. The components (and constraint
+    expressions) it was taken from are kept and compared by identity, so that a
+    component created after another was deleted is never mistaken for it.
+    """
+
+    __slots__ = ("components", "state")
+
+    def __init__(self, components, state):
+        self.components = components
+        self.state = state
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, _Fingerprint)
+            and len(self.components) == len(other.components)
+            and all(a is b for a, b in zip(self.components, other.components))
+            and self.state == other.state
+        )
+
+    __hash__ = None
+
+
+class _DiagnosticsCache:
+    """
+    Store for the results of diagnostic checks, keyed on a fingerprint of the
+    model state (and any tolerances) each result was computed from.
+
+    Only the most recent result of each check is kept.
+    """
+
+    def __init__(self):
+        self._results = {}
+
+    def get_or_compute(self, name, key, compute):
+        """
+        Return the cached result of check name if it was computed with the same key,
+        otherwise call compute and cache the result.
+        """
+        cached = self._results.get(name)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+
+        result = compute()
+        self._results[name] = (key, result)
+        return result
+
+    def clear(self):
+        """
+        Discard all cached results.
+        """
+        self._results.clear()
+
+
 @document_kwargs_from_configdict(CONFIG)
 class DiagnosticsToolbox:
     """
@@ -450,6 +547,9 @@ class DiagnosticsToolbox:
         self._model = model
         self.config = CONFIG(kwargs)
 
+        self._cache = _DiagnosticsCache()
+        self._session_fingerprints = None
+
     @property
     def model(self):
         """
@@ -457,6 +557,149 @@ class DiagnosticsToolbox:
         """
         return self._model
 
+    def clear_cache(self):
+        """
+        Discards all cached results of diagnostic checks, so that every check is
+        recomputed the next time it is run.
+
+        Returns:
+            None
+
+        """
+        self._cache.clear()
+
+    @contextmanager
+    def _diagnostics_session(self):
+        """
+        Context within which the model is assumed not to change. The model
+        fingerprints are computed at most once and results of checks are shared
+        between all methods called within the context.
+        """
+        if self._session_fingerprints is not None:
+            # Nested call, reuse the enclosing session
+            yield
+            return
+
+        if self.config.cache_results:
+            self._session_fingerprints = {}
+        else:
+            # Results are only shared within the session, during which the model
+            # does not change, so there is no need to fingerprint it
+            session = object()
+            self._session_fingerprints = {"structure": session, "values": session}
+        try:
+            yield
+        finally:
+            self._session_fingerprints = None
+            if not self.config.cache_results:
+                self._cache.clear()
+
+    def _get_fingerprint(self, depends_on):
+        """
+        Returns a fingerprint of the model state that diagnostic checks depend on.
+        Within a diagnostics session each fingerprint is computed at most once, and
+        if results are not cached between calls none is computed at all, as the
+        model is assumed not to change during the session.
+
+        Args:
+            depends_on: "structure" for the active constraints and objectives and
+                the fixed status of variables, or "values" for the structure plus
+                variable values and bounds and mutable parameter values
+
+        Returns:
+            fingerprint of the model state, comparable with ==
+
+        """
+        if self._session_fingerprints is not None:
+            fingerprint = self._session_fingerprints.get(depends_on)
+            if fingerprint is not None:
+                return fingerprint
+
+        if depends_on == "structure":
+            components = [
+                item
+                for ctype in (Constraint, Objective)
+                for c in self._model.component_data_objects(
+                    ctype, active=True, descend_into=True
+                )
+                for item in (c, c.expr)
+            ]
+            variables = list(self._model.component_data_objects(Var, descend_into=True))
+            fingerprint = _Fingerprint(
+                components + variables, tuple(v.fixed for v in variables)
+            )
+        else:
+            structure = self._get_fingerprint("structure")
+            # the structure ends with the variables, with a fixed flag for each
+            n_vars = len(structure.state)
+            variables = structure.components[len(structure.components) - n_vars :]
+            params = [
+                p
+                for param in self._model.component_objects(Param, descend_into=True)
+                if param.mutable
+                for p in param.values()
+            ]
+            fingerprint = _Fingerprint(
+                structure.components + params,
+                (
+                    structure.state,
+                    tuple((v.value, v.lb, v.ub) for v in variables),
+                    tuple(p.value for p in params),
+                ),
+            )
+
+        if self._session_fingerprints is not None:
+            self._session_fingerprints[depends_on] = fingerprint
+
+        return fingerprint
+
+    def _run_checks(self, checks):
+        """
+        Runs a set of independent diagnostic checks, reusing cached results for
+        any check whose inputs have not changed. The checks are run one after
+        another: they are pure Python walks of the same model, which would not
+        run faster on a thread pool and are not safe to run concurrently.
+
+        Args:
+            checks: dict mapping the name of each check to a tuple of the model
+                state it depends on ("structure" or "values", or None if the
+                result should never be cached), a callable taking no arguments
+                which computes the result, and a tuple of any tolerances the
+                result depends on
+
+        Returns:
+            dict mapping the name of each check to its result
+
+        """
+        use_cache = self.config.cache_results or self._session_fingerprints is not None
+
+        results = {}
+        for name, (depends_on, compute, params) in checks.items():
+            if not use_cache or depends_on is None:
+                results[name] = compute()
+            else:
+                results[name] = self._cache.get_or_compute(
+                    name, (self._get_fingerprint(depends_on), params), compute
+                )
+
+        return results
+
+    def _get_jacobian(self):
+        return self._run_checks(
+            {
+                "jacobian": (
+                    "values",
+                    lambda: get_jacobian(self._model, scaled=False),
+                    (),
+                )
+            }
+        )["jacobian"]
+
+    def _get_var_snapshot(self):
+        return self._run_checks(
+            {"var_snapshot": ("values", lambda: VarSnapshot(self._model), ())}
+        )["var_snapshot"]
+
     def display_external_variables(self, stream=None):
         """
         Prints a list of variables that appear within activated Constraints in the
@@ -792,6 +1035,17 @@ class DiagnosticsToolbox:
             list-of-lists constraints in each independent block of the over-constrained set
 
         """
+        return self._run_checks(
+            {
+                "dulmage_mendelsohn_partition": (
+                    "structure",
+                    self._compute_dulmage_mendelsohn_partition,
+                    (),
+                )
+            }
+        )["dulmage_mendelsohn_partition"]
+
+    def _compute_dulmage_mendelsohn_partition(self):
         igraph = IncidenceGraphInterface(self._model, include_inequality=False)
         var_dm_partition, con_dm_partition = igraph.dulmage_mendelsohn()
 
@@ -1067,16 +1321,40 @@ class DiagnosticsToolbox:
             next_steps - list of suggested next steps to further investigate warnings
 
         """
+        checks = {
+            "dulmage_mendelsohn_partition": (
+                "structure",
+                self._compute_dulmage_mendelsohn_partition,
+                (),
+            ),
+            "degrees_of_freedom": (
+                "structure",
+                lambda: degrees_of_freedom(self._model),
+                (),
+            ),
+        }
         if not ignore_unit_consistency:
-            uc = identify_inconsistent_units(self._model)
-        else:
-            uc = []
-        uc_var, uc_con, oc_var, oc_con = self.get_dulmage_mendelsohn_partition()
+            checks["inconsistent_units"] = (
+                "structure",
+                lambda: identify_inconsistent_units(self._model),
+                (),
+            )
+        if not ignore_evaluation_errors:
+            # Potential evaluation errors depend on variable bounds
+            checks["potential_eval_errors"] = (
+                "values",
+                self._collect_potential_eval_errors,
+                (self.config.warn_for_evaluation_error_at_bounds,),
+            )
+        results = self._run_checks(checks)
+
+        uc = results.get("inconsistent_units", [])
+        uc_var, uc_con, oc_var, oc_con = results["dulmage_mendelsohn_partition"]
 
         # Collect warnings
         warnings = []
         next_steps = []
-        dof = degrees_of_freedom(self._model)
+        dof = results["degrees_of_freedom"]
         if dof != 0:
             dstring = "Degrees"
             if abs(dof) == 1:
@@ -1105,7 +1383,7 @@ class DiagnosticsToolbox:
             next_steps.append(self.display_overconstrained_set.__name__ + "()")
 
         if not ignore_evaluation_errors:
-            eval_warnings = self._collect_potential_eval_errors()
+            eval_warnings = results["potential_eval_errors"]
             if len(eval_warnings) > 0:
                 warnings.append(
                     f"WARNING: Found {len(eval_warnings)} potential evaluation errors."
@@ -1124,15 +1402,31 @@ class DiagnosticsToolbox:
             cautions - list of caution messages from structural analysis
 
         """
+        snapshot = self._get_var_snapshot()
+        results = self._run_checks(
+            {
+                "vars_fixed_to_zero": (
+                    "values",
+                    lambda: _vars_fixed_to_zero(self._model, snapshot=snapshot),
+                    (),
+                ),
+                "unused_variables": (
+                    "structure",
+                    lambda: variables_not_in_activated_constraints_set(self._model),
+                    (),
+                ),
+            }
+        )
+
         # Collect cautions
         cautions = []
-        zero_vars = _vars_fixed_to_zero(self._model)
+        zero_vars = results["vars_fixed_to_zero"]
         if len(zero_vars) > 0:
             vstring = "variables"
             if len(zero_vars) == 1:
                 vstring = "variable"
             cautions.append(f"Caution: {len(zero_vars)} {vstring} fixed to 0")
-        unused_vars = variables_not_in_activated_constraints_set(self._model)
+        unused_vars = results["unused_variables"]
         unused_vars_fixed = 0
         for v in unused_vars:
             if v.fixed:
@@ -1162,16 +1456,75 @@ class DiagnosticsToolbox:
             next_steps - list of suggested next steps to further investigate warnings
 
         """
+        # Results computed from a Jacobian supplied by the caller are not
+        # cached, as the fingerprints do not cover it
+        jac_depends_on = None
         if jac is None or nlp is None:
-            jac, nlp = get_jacobian(self._model, scaled=False)
+            jac, nlp = self._get_jacobian()
+            jac_depends_on = "values"
+
+        large = self.config.jacobian_large_value_warning
+        small = self.config.jacobian_small_value_warning
+        snapshot = self._get_var_snapshot()
+        checks = {
+            "large_residuals": (
+                "values",
+                lambda: large_residuals_set(
+                    self._model, tol=self.config.constraint_residual_tolerance
+                ),
+                (self.config.constraint_residual_tolerance,),
+            ),
+            "vars_violating_bounds": (
+                "values",
+                lambda: _vars_violating_bounds(
+                    self._model,
+                    tolerance=self.config.variable_bounds_violation_tolerance,
+                    snapshot=snapshot,
+                ),
+                (self.config.variable_bounds_violation_tolerance,),
+            ),
+            "extreme_jacobian_columns_warning": (
+                jac_depends_on,
+                lambda: extreme_jacobian_columns(
+                    jac=jac, nlp=nlp, large=large, small=small
+                ),
+                (large, small),
+            ),
+            "extreme_jacobian_rows_warning": (
+                jac_depends_on,
+                lambda: extreme_jacobian_rows(
+                    jac=jac, nlp=nlp, large=large, small=small
+                ),
+                (large, small),
+            ),
+        }
+        if not ignore_parallel_components:
+            partol = self.config.parallel_component_tolerance
+            checks["parallel_constraints"] = (
+                jac_depends_on,
+                lambda: check_parallel_jacobian(
+                    self._model, tolerance=partol, direction="row", jac=jac, nlp=nlp
+                ),
+                (partol,),
+            )
+            checks["parallel_variables"] = (
+                jac_depends_on,
+                lambda: check_parallel_jacobian(
+                    self._model,
+                    tolerance=partol,
+                    direction="column",
+                    jac=jac,
+                    nlp=nlp,
+                ),
+                (partol,),
+            )
+        results = self._run_checks(checks)
 
         warnings = []
         next_steps = []
 
         # Large residuals
-        large_residuals = large_residuals_set(
-            self._model, tol=self.config.constraint_residual_tolerance
-        )
+        large_residuals = results["large_residuals"]
         if len(large_residuals) > 0:
             cstring = "Constraints"
             if len(large_residuals) == 1:
@@ -1186,9 +1539,7 @@ class DiagnosticsToolbox:
             next_steps.append(self.compute_infeasibility_explanation.__name__ + "()")
 
         # Variables outside bounds
-        violated_bounds = _vars_violating_bounds(
-            self._model, tolerance=self.config.variable_bounds_violation_tolerance
-        )
+        violated_bounds = results["vars_violating_bounds"]
         if len(violated_bounds) > 0:
             cstring = "Variables"
             if len(violated_bounds) == 1:
@@ -1202,12 +1553,7 @@ class DiagnosticsToolbox:
             )
 
         # Extreme Jacobian rows and columns
-        jac_col = extreme_jacobian_columns(
-            jac=jac,
-            nlp=nlp,
-            large=self.config.jacobian_large_value_warning,
-            small=self.config.jacobian_small_value_warning,
-        )
+        jac_col = results["extreme_jacobian_columns_warning"]
         if len(jac_col) > 0:
             cstring = "Variables"
             if len(jac_col) == 1:
@@ -1221,12 +1567,7 @@ class DiagnosticsToolbox:
                 self.display_variables_with_extreme_jacobians.__name__ + "()"
             )
 
-        jac_row = extreme_jacobian_rows(
-            jac=jac,
-            nlp=nlp,
-            large=self.config.jacobian_large_value_warning,
-            small=self.config.jacobian_small_value_warning,
-        )
+        jac_row = results["extreme_jacobian_rows_warning"]
         if len(jac_row) > 0:
             cstring = "Constraints"
             if len(jac_row) == 1:
@@ -1242,13 +1583,8 @@ class DiagnosticsToolbox:
 
         # Parallel variables and constraints
         if not ignore_parallel_components:
-            partol = self.config.parallel_component_tolerance
-            par_cons = check_parallel_jacobian(
-                self._model, tolerance=partol, direction="row", jac=jac, nlp=nlp
-            )
-            par_vars = check_parallel_jacobian(
-                self._model, tolerance=partol, direction="column", jac=jac, nlp=nlp
-            )
+            par_cons = results["parallel_constraints"]
+            par_vars = results["parallel_variables"]
             if par_cons:
                 p = "pair" if len(par_cons) == 1 else "pairs"
                 warnings.append(
@@ -1276,17 +1612,79 @@ class DiagnosticsToolbox:
             cautions - list of caution messages from numerical analysis
 
         """
+        # Results computed from a Jacobian supplied by the caller are not
+        # cached, as the fingerprints do not cover it
+        jac_depends_on = None
         if jac is None or nlp is None:
-            jac, nlp = get_jacobian(self._model, scaled=False)
+            jac, nlp = self._get_jacobian()
+            jac_depends_on = "values"
+
+        abs_tol = self.config.variable_bounds_absolute_tolerance
+        rel_tol = self.config.variable_bounds_relative_tolerance
+        zero = self.config.variable_zero_value_tolerance
+        large_value = self.config.variable_large_value_tolerance
+        small_value = self.config.variable_small_value_tolerance
+        large = self.config.jacobian_large_value_caution
+        small = self.config.jacobian_small_value_caution
+        snapshot = self._get_var_snapshot()
+        results = self._run_checks(
+            {
+                "vars_near_bounds": (
+                    "values",
+                    lambda: variables_near_bounds_set(
+                        self._model, abs_tol=abs_tol, rel_tol=rel_tol
+                    ),
+                    (abs_tol, rel_tol),
+                ),
+                "vars_near_zero": (
+                    "values",
+                    lambda: _vars_near_zero(self._model, zero, snapshot=snapshot),
+                    (zero,),
+                ),
+                "vars_with_extreme_values": (
+                    "values",
+                    lambda: _vars_with_extreme_values(
+                        model=self._model,
+                        large=large_value,
+                        small=small_value,
+                        zero=zero,
+                        snapshot=snapshot,
+                    ),
+                    (large_value, small_value, zero),
+                ),
+                "vars_with_none_value": (
+                    "values",
+                    lambda: _vars_with_none_value(self._model, snapshot=snapshot),
+                    (),
+                ),
+                "extreme_jacobian_columns_caution": (
+                    jac_depends_on,
+                    lambda: extreme_jacobian_columns(
+                        jac=jac, nlp=nlp, large=large, small=small
+                    ),
+                    (large, small),
+                ),
+                "extreme_jacobian_rows_caution": (
+                    jac_depends_on,
+                    lambda: extreme_jacobian_rows(
+                        jac=jac, nlp=nlp, large=large, small=small
+                    ),
+                    (large, small),
+                ),
+                "extreme_jacobian_entries_caution": (
+                    jac_depends_on,
+                    lambda: extreme_jacobian_entries(
+                        jac=jac, nlp=nlp, large=large, small=small, zero=0
+                    ),
+                    (large, small),
+                ),
+            }
+        )
 
         cautions = []
 
         # Variables near bounds
-        near_bounds = variables_near_bounds_set(
-            self._model,
-            abs_tol=self.config.variable_bounds_absolute_tolerance,
-            rel_tol=self.config.variable_bounds_relative_tolerance,
-        )
+        near_bounds = results["vars_near_bounds"]
         if len(near_bounds) > 0:
             cstring = "Variables"
             if len(near_bounds) == 1:
@@ -1298,9 +1696,7 @@ class DiagnosticsToolbox:
             )
 
         # Variables near zero
-        near_zero = _vars_near_zero(
-            self._model, self.config.variable_zero_value_tolerance
-        )
+        near_zero = results["vars_near_zero"]
         if len(near_zero) > 0:
             cstring = "Variables"
             if len(near_zero) == 1:
@@ -1311,12 +1707,7 @@ class DiagnosticsToolbox:
             )
 
         # Variables with extreme values
-        xval = _vars_with_extreme_values(
-            model=self._model,
-            large=self.config.variable_large_value_tolerance,
-            small=self.config.variable_small_value_tolerance,
-            zero=self.config.variable_zero_value_tolerance,
-        )
+        xval = results["vars_with_extreme_values"]
         if len(xval) > 0:
             cstring = "Variables"
             if len(xval) == 1:
@@ -1328,7 +1719,7 @@ class DiagnosticsToolbox:
             )
 
         # Variables with value None
-        none_value = _vars_with_none_value(self._model)
+        none_value = results["vars_with_none_value"]
         if len(none_value) > 0:
             cstring = "Variables"
             if len(none_value) == 1:
@@ -1336,12 +1727,7 @@ class DiagnosticsToolbox:
             cautions.append(f"Caution: {len(none_value)} {cstring} with None value")
 
         # Extreme Jacobian rows and columns
-        jac_col = extreme_jacobian_columns(
-            jac=jac,
-            nlp=nlp,
-            large=self.config.jacobian_large_value_caution,
-            small=self.config.jacobian_small_value_caution,
-        )
+        jac_col = results["extreme_jacobian_columns_caution"]
         if len(jac_col) > 0:
             cstring = "Variables"
             if len(jac_col) == 1:
@@ -1352,12 +1738,7 @@ class DiagnosticsToolbox:
                 f">{self.config.jacobian_large_value_caution:.1E})"
             )
 
-        jac_row = extreme_jacobian_rows(
-            jac=jac,
-            nlp=nlp,
-            large=self.config.jacobian_large_value_caution,
-            small=self.config.jacobian_small_value_caution,
-        )
+        jac_row = results["extreme_jacobian_rows_caution"]
         if len(jac_row) > 0:
             cstring = "Constraints"
             if len(jac_row) == 1:
@@ -1369,13 +1750,7 @@ class DiagnosticsToolbox:
             )
 
         # Extreme Jacobian entries
-        extreme_jac = extreme_jacobian_entries(
-            jac=jac,
-            nlp=nlp,
-            large=self.config.jacobian_large_value_caution,
-            small=self.config.jacobian_small_value_caution,
-            zero=0,
-        )
+        extreme_jac = results["extreme_jacobian_entries_caution"]
         if len(extreme_jac) > 0:
             cstring = "Entries"
             if len(extreme_jac) == 1:
@@ -1405,10 +1780,11 @@ class DiagnosticsToolbox:
             AssertionError if any warnings are identified by structural analysis.
 
         """
-        warnings, _ = self._collect_structural_warnings(
-            ignore_evaluation_errors=ignore_evaluation_errors,
-            ignore_unit_consistency=ignore_unit_consistency,
-        )
+        with self._diagnostics_session():
+            warnings, _ = self._collect_structural_warnings(
+                ignore_evaluation_errors=ignore_evaluation_errors,
+                ignore_unit_consistency=ignore_unit_consistency,
+            )
         if len(warnings) > 0:
             raise AssertionError(f"Structural issues found ({len(warnings)}).")
 
@@ -1424,9 +1800,10 @@ class DiagnosticsToolbox:
             AssertionError if any warnings are identified by numerical analysis.
 
         """
-        warnings, _ = self._collect_numerical_warnings(
-            ignore_parallel_components=ignore_parallel_components
-        )
+        with self._diagnostics_session():
+            warnings, _ = self._collect_numerical_warnings(
+                ignore_parallel_components=ignore_parallel_components
+            )
         if len(warnings) > 0:
             raise AssertionError(f"Numerical issues found ({len(warnings)}).")
 
@@ -1451,9 +1828,18 @@ class DiagnosticsToolbox:
 
         # Potential evaluation errors
         # TODO: High Index?
-        stats = _collect_model_statistics(self._model)
-        warnings, next_steps = self._collect_structural_warnings()
-        cautions = self._collect_structural_cautions()
+        with self._diagnostics_session():
+            stats = self._run_checks(
+                {
+                    "model_statistics": (
+                        "structure",
+                        lambda: _collect_model_statistics(self._model),
+                        (),
+                    )
+                }
+            )["model_statistics"]
+            warnings, next_steps = self._collect_structural_warnings()
+            cautions = self._collect_structural_cautions()
 
         _write_report_section(
             stream=stream, lines_list=stats, title="Model Statistics", header="="
@@ -1496,22 +1882,31 @@ class DiagnosticsToolbox:
         if stream is None:
             stream = sys.stdout
 
-        jac, nlp = get_jacobian(self._model, scaled=False)
-
-        warnings, next_steps = self._collect_numerical_warnings(jac=jac, nlp=nlp)
-        cautions = self._collect_numerical_cautions(jac=jac, nlp=nlp)
+        with self._diagnostics_session():
+            warnings, next_steps = self._collect_numerical_warnings()
+            cautions = self._collect_numerical_cautions()
+            jac, _ = self._get_jacobian()
 
-        stats = []
-        try:
-            stats.append(
-                f"Jacobian Condition Number: {jacobian_cond(jac=jac, scaled=False):.3E}"
-            )
-        except RuntimeError as err:
-            if "Factor is exactly singular" in str(err):
-                _log.info(err)
-                stats.append("Jacobian Condition Number: Undefined (Exactly Singular)")
-            else:
-                raise
+            stats = []
+            try:
+                cond = self._run_checks(
+                    {
+                        "jacobian_condition_number": (
+                            "values",
+                            lambda: jacobian_cond(jac=jac, scaled=False),
+                            (),
+                        )
+                    }
+                )["jacobian_condition_number"]
+                stats.append(f"Jacobian Condition Number: {cond:.3E}")
+            except RuntimeError as err:
+                if "Factor is exactly singular" in str(err):
+                    _log.info(err)
+                    stats.append(
+                        "Jacobian Condition Number: Undefined (Exactly Singular)"
+                    )
+                else:
+                    raise
 
         _write_report_section(
             stream=stream, lines_list=stats, title="Model Statistics", header="="
@@ -2059,6 +2454,84 @@ class _EvalErrorWalker(StreamBasedExpressionVisitor):
         return self._warn_list
 
 
+def _create_milp_solver(solver, options):
+    """
+    Create a solver object for solving Degeneracy Hunter MILPs.
+
+    Args:
+        solver: name of solver to create
+        options: dict of options to set on solver (or None)
+
+    Returns:
+        Pyomo solver object
+    """
+    solver_obj = SolverFactory(solver)
+
+    if options is None:
+        options = {}
+    solver_obj.options = options
+
+    return solver_obj
+
+
+def _solve_ids_milp_for_candidate(ids_milp, solver, cons_idx, tee=False):
+    """
+    Solve the IDS MILP with the weight of a candidate equation fixed to 1. For
+    persistent solvers only the candidate weight is updated between solves.
+
+    Args:
+        ids_milp: IDS MILP model
+        solver: solver to use; persistent solvers must already have ids_milp set as
+            their instance
+        cons_idx: index of candidate equation
+        tee: Boolean, print solver output (default = False)
+
+    Returns:
+        bool indicating whether the solver terminated optimally, and wall clock
+        time taken to solve
+    """
+    persistent = isinstance(solver, PersistentSolver)
+
+    # Fix weight on candidate equation
+    ids_milp.nu[cons_idx].fix(1.0)
+    if persistent:
+        solver.update_var(ids_milp.nu[cons_idx])
+
+    # Solve MILP
+    start = perf_counter()
+    results = solver.solve(ids_milp, tee=tee)
+    solve_time = perf_counter() - start
+
+    ids_milp.nu[cons_idx].unfix()
+    if persistent:
+        solver.update_var(ids_milp.nu[cons_idx])
+
+    return check_optimal_termination(results), solve_time
+
+
+def _setup_ids_worker(ids_milp, solver, options):
+    # IDS MILP and solver held by each worker process of DegeneracyHunter2
+    solver_obj = _create_milp_solver(solver, options)
+    if isinstance(solver_obj, PersistentSolver):
+        solver_obj.set_instance(ids_milp)
+    return ids_milp, solver_obj
+
+
+def _solve_ids_milp_in_worker(cons_idx, tee):
+    ids_milp, solver = get_worker_state()
+    success, solve_time = _solve_ids_milp_for_candidate(
+        ids_milp, solver, cons_idx, tee=tee
+    )
+
+    ids_idx = {}
+    if success:
+        for i in ids_milp.C:
+            if ids_milp.y[i]() > YTOL:
+                ids_idx[i] = ids_milp.nu[i]()
+
+    return success, solve_time, ids_idx
+
+
 # TODO: Rename and redirect once old DegeneracyHunter is removed
 @document_kwargs_from_configdict(DHCONFIG)
 class DegeneracyHunter2:
@@ -2068,6 +2541,14 @@ class DegeneracyHunter2:
 
     Original implementation by Alex Dowling.
 
+    For models with many candidate equations, the search for IDS can be accelerated
+    by using a persistent MILP solver (the IDS MILP is then only sent to the solver
+    once and only the fixed weight of each candidate is updated between solves),
+    by pruning candidates which already appear in an IDS (prune_candidates), and
+    by solving candidates in parallel worker processes (number_of_workers). The
+    time taken to solve the IDS MILP for each candidate is recorded in
+    ids_solve_times.
+
     Args:
 
         model: model to be diagnosed. The DegeneracyHunter does not support indexed Blocks.
@@ -2093,23 +2574,30 @@ class DegeneracyHunter2:
 
         # Placeholder for solver - deferring construction lets us unit test more easily
         self.solver = None
+        self._persistent_instance = None
 
         # Create placeholders for results
         self.degenerate_set = {}
         self.irreducible_degenerate_sets = []
+        self.ids_solve_times = {}
 
     def _get_solver(self):
         if self.solver is None:
-            self.solver = SolverFactory(self.config.solver)
-
-            options = self.config.solver_options
-            if options is None:
-                options = {}
-
-            self.solver.options = options
+            self.solver = _create_milp_solver(
+                self.config.solver, self.config.solver_options
+            )
 
         return self.solver
 
+    def _set_persistent_instance(self, solver, milp):
+        # Persistent solvers only need to be given each MILP model once
+        if (
+            isinstance(solver, PersistentSolver)
+            and self._persistent_instance is not milp
+        ):
+            solver.set_instance(milp)
+            self._persistent_instance = milp
+
     def _prepare_candidates_milp(self):
         """
         Prepare MILP to find candidate equations for consider for IDS
@@ -2245,7 +2733,9 @@ class DegeneracyHunter2:
         """
         _log.info("Solving Candidates MILP model.")
 
-        results = self._get_solver().solve(self.candidates_milp, tee=tee)
+        solver = self._get_solver()
+        self._set_persistent_instance(solver, self.candidates_milp)
+        results = solver.solve(self.candidates_milp, tee=tee)
 
         self.degenerate_set = {}
 
@@ -2346,15 +2836,16 @@ class DegeneracyHunter2:
         eq_con_list = self.nlp.get_pyomo_equality_constraints()
         cons_idx = eq_con_list.index(cons)
 
-        # Fix weight on candidate equation
-        self.ids_milp.nu[cons_idx].fix(1.0)
-
-        # Solve MILP
-        results = self._get_solver().solve(self.ids_milp, tee=tee)
+        solver = self._get_solver()
+        self._set_persistent_instance(solver, self.ids_milp)
 
-        self.ids_milp.nu[cons_idx].unfix()
+        success, solve_time = _solve_ids_milp_for_candidate(
+            self.ids_milp, solver, cons_idx, tee=tee
+        )
+        self.ids_solve_times[cons] = solve_time
+        _log.info(f"IDS MILP for constraint {cons.name} solved in {solve_time:.3f}s.")
 
-        if check_optimal_termination(results):
+        if success:
             # We found an irreducible degenerate set
             return self._get_ids()
         else:
@@ -2363,6 +2854,66 @@ class DegeneracyHunter2:
                 f"IDS MILP with constraint {cons.name}."
             )
 
+    def _is_pruned(self, cons):
+        # A candidate is pruned if it is part of an IDS which has already been found
+        return any(cons in ids_ for ids_ in self.irreducible_degenerate_sets)
+
+    def _find_ids_in_parallel(self, tee: bool = False):
+        """
+        Solve the IDS MILPs for all candidate equations using a pool of worker
+        processes. If prune_candidates is True, candidates are dispatched in batches
+        of size number_of_workers and pruned between batches.
+
+        Args:
+            tee: Boolean, print solver output (default = False)
+
+        """
+        eq_con_list = self.nlp.get_pyomo_equality_constraints()
+        con_index = ComponentMap((c, i) for i, c in enumerate(eq_con_list))
+        candidates = list(self.degenerate_set)
+
+        n_workers = self.config.number_of_workers
+        if self.config.prune_candidates:
+            batch_size = n_workers
+        else:
+            batch_size = len(candidates)
+
+        with worker_pool(
+            (self.ids_milp, self.config.solver, self.config.solver_options),
+            max_workers=n_workers,
+            fork=False,
+            setup=_setup_ids_worker,
+        ) as pool:
+            while candidates:
+                batch = []
+                while candidates and len(batch) < batch_size:
+                    k = candidates.pop(0)
+                    if self.config.prune_candidates and self._is_pruned(k):
+                        _log.info(f"Skipping candidate {k.name}, already in an IDS.")
+                        continue
+                    batch.append(k)
+
+                futures = [
+                    pool.submit(_solve_ids_milp_in_worker, con_index[k], tee)
+                    for k in batch
+                ]
+                # Collect results in order of candidates for reproducibility
+                for k, f in zip(batch, futures):
+                    success, solve_time, ids_idx = f.result()
+                    self.ids_solve_times[k] = solve_time
+                    _log.info(
+                        f"IDS MILP for constraint {k.name} solved in {solve_time:.3f}s."
+                    )
+
+                    if not success:
+                        raise ValueError(
+                            f"Solver did not return an optimal termination condition "
+                            f"for IDS MILP with constraint {k.name}."
+                        )
+                    self.irreducible_degenerate_sets.append(
+                        {eq_con_list[i]: v for i, v in ids_idx.items()}
+                    )
+
     def find_irreducible_degenerate_sets(self, tee=False):
         """
         Compute irreducible degenerate sets
@@ -2384,9 +2935,18 @@ class DegeneracyHunter2:
             _log.info("Searching for Irreducible Degenerate Sets")
             self._prepare_ids_milp()
 
+            if self.config.number_of_workers > 1:
+                self._find_ids_in_parallel(tee=tee)
+                return
+
             # Loop over candidate equations
             count = 1
             for k in self.degenerate_set:
+                if self.config.prune_candidates and self._is_pruned(k):
+                    _log.info(f"Skipping candidate {k.name}, already in an IDS.")
+                    count += 1
+                    continue
+
                 print(f"Solving MILP {count} of {len(self.degenerate_set)}.")
                 _log.info_high(f"Solving MILP {count} of {len(self.degenerate_set)}.")
 
@@ -3148,6 +3708,24 @@ CACONFIG.declare(
         doc="Parameter sweep workflow runner",
     ),
 )
+CACONFIG.declare(
+    "workflow_runner_arguments",
+    ConfigValue(
+        domain=dict,
+        doc="Additional arguments to pass to the parameter sweep workflow runner "
+        "(e.g. number_of_workers for ParallelSweepRunner).",
+    ),
+)
+CACONFIG.declare(
+    "rebuild_model",
+    ConfigValue(
+        default=True,
+        domain=bool,
+        doc="Whether to clone the model for each sample (default=True). If False, "
+        "the model is cloned once (per worker process for parallel runners) and "
+        "restored to its initial state before each sample.",
+    ),
+)
 CACONFIG.declare(
     "solver_options",
     ConfigValue(
@@ -3165,6 +3743,82 @@ CACONFIG.declare(
 )
 
 
+class _IpoptLogParser:
+    """
+    Writable stream which parses an IPOPT log as it is written, collecting the
+    number of iterations, the number of iterations in restoration or with
+    regularization, and the total CPU time.
+    """
+
+    def __init__(self):
+        self.iters = 0
+        self.iters_in_restoration = 0
+        self.iters_w_regularization = 0
+        self.time = 0
+        self._in_iterations = False
+        self._buffer = ""
+
+    def write(self, data):
+        # Output may arrive in arbitrary chunks, so only parse complete lines
+        lines = (self._buffer + data).split("\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            self.parse_line(line)
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def get_stats(self):
+        """
+        Return iterations, iterations in restoration, iterations with
+        regularization and total CPU time parsed so far.
+        """
+        if self._buffer:
+            self.parse_line(self._buffer)
+            self._buffer = ""
+
+        return (
+            self.iters,
+            self.iters_in_restoration,
+            self.iters_w_regularization,
+            self.time,
+        )
+
+    def parse_line(self, line):
+        """
+        Parse a single line of an IPOPT log.
+        """
+        # ToDO: Check for final iteration with regularization or restoration
+        if line.startswith("iter"):
+            # This marks the start of the iteration logging
+            self._in_iterations = True
+        elif line.startswith("Number of Iterations....:"):
+            # Marks end of iteration logging
+            self._in_iterations = False
+            tokens = line.split()
+            self.iters = int(tokens[3])
+        elif self._in_iterations:
+            # Line contains details of an iteration, look for restoration or regularization
+            tokens = line.split()
+            try:
+                if not tokens[6] == "-":
+                    # Iteration with regularization
+                    self.iters_w_regularization += 1
+                if tokens[0].endswith("r"):
+                    # Iteration in restoration
+                    self.iters_in_restoration += 1
+            except IndexError:
+                # Blank line at end of iteration list, so assume we hit this
+                pass
+        elif line.startswith("Total CPU secs in IPOPT (w/o function evaluations)   ="):
+            tokens = line.split()
+            self.time += float(tokens[9])
+        elif line.startswith("Total CPU secs in NLP function evaluations           ="):
+            tokens = line.split()
+            self.time += float(tokens[8])
+
+
 class IpoptConvergenceAnalysis:
     """
     Tool to perform a parameter sweep of model checking for numerical issues and
@@ -3186,20 +3840,27 @@ class IpoptConvergenceAnalysis:
         self.config = self.CONFIG(kwargs)
 
         self._model = model
+        self._toolbox = None
 
         solver = SolverFactory("ipopt")
         if self.config.solver_options is not None:
             solver.options = self.config.solver_options
 
+        runner_args = self.config.workflow_runner_arguments
+        if runner_args is None:
+            runner_args = {}
+
         self._psweep = self.config.workflow_runner(
             input_specification=self.config.input_specification,
             build_model=self._build_model,
-            rebuild_model=True,
+            rebuild_model=self.config.rebuild_model,
+            reset_model=True,
             run_model=self._run_model,
             build_outputs=self._build_outputs,
             halt_on_error=self.config.halt_on_error,
             handle_solver_error=self._recourse,
             solver=solver,
+            **runner_args,
         )
 
     @property
@@ -3410,10 +4071,12 @@ class IpoptConvergenceAnalysis:
 
         return success, run_stats
 
-    @staticmethod
-    def _build_outputs(model, run_stats):
+    def _build_outputs(self, model, run_stats):
         # Run model diagnostics numerical checks
-        dt = DiagnosticsToolbox(model=model)
+        # Reuse the toolbox if the model is being reused between samples
+        if self._toolbox is None or self._toolbox.model is not model:
+            self._toolbox = DiagnosticsToolbox(model=model)
+        dt = self._toolbox
 
         warnings = False
         try:
@@ -3443,73 +4106,35 @@ class IpoptConvergenceAnalysis:
 
     @staticmethod
     def _parse_ipopt_output(ipopt_file):
-        # PArse IPOPT logs and return key metrics
-        # ToDO: Check for final iteration with regularization or restoration
-
-        iters = 0
-        iters_in_restoration = 0
-        iters_w_regularization = 0
-        time = 0
-        # parse the output file to get the iteration count, solver times, etc.
+        # Parse IPOPT log file and return key metrics
+        parser = _IpoptLogParser()
         with open(ipopt_file, "r") as f:
-            parseline = False
             for line in f:
-                if line.startswith("iter"):
-                    # This marks the start of the iteration logging, set parseline True
-                    parseline = True
-                elif line.startswith("Number of Iterations....:"):
-                    # Marks end of iteration logging, set parseline False
-                    parseline = False
-                    tokens = line.split()
-                    iters = int(tokens[3])
-                elif parseline:
-                    # Line contains details of an iteration, look for restoration or regularization
-                    tokens = line.split()
-                    try:
-                        if not tokens[6] == "-":
-                            # Iteration with regularization
-                            iters_w_regularization += 1
-                        if tokens[0].endswith("r"):
-                            # Iteration in restoration
-                            iters_in_restoration += 1
-                    except IndexError:
-                        # Blank line at end of iteration list, so assume we hit this
-                        pass
-                elif line.startswith(
-                    "Total CPU secs in IPOPT (w/o function evaluations)   ="
-                ):
-                    tokens = line.split()
-                    time += float(tokens[9])
-                elif line.startswith(
-                    "Total CPU secs in NLP function evaluations           ="
-                ):
-                    tokens = line.split()
-                    time += float(tokens[8])
-
-        return iters, iters_in_restoration, iters_w_regularization, time
+                parser.parse_line(line)
+
+        return parser.get_stats()
 
     def _run_ipopt_with_stats(self, model, solver, max_iter=500, max_cpu_time=120):
         # Solve model using provided solver (assumed to be IPOPT) and parse logs
         # ToDo: Check that the "solver" is, in fact, IPOPT
-
-        TempfileManager.push()
-        tempfile = TempfileManager.create_tempfile(suffix="ipopt_out", text=True)
+        # Solver output is parsed as it is streamed, rather than via a log file
         opts = {
-            "output_file": tempfile,
             "max_iter": max_iter,
             "max_cpu_time": max_cpu_time,
+            "print_level": 5,
         }
 
-        status_obj = solver.solve(model, options=opts, tee=True)
+        parser = _IpoptLogParser()
+        with capture_output(parser):
+            status_obj = solver.solve(model, options=opts, tee=True)
 
         (
             iters,
             iters_in_restoration,
             iters_w_regularization,
             time,
-        ) = self._parse_ipopt_output(tempfile)
+        ) = parser.get_stats()
 
-        TempfileManager.pop(remove=True)
         return status_obj, iters, iters_in_restoration, iters_w_regularization, time
 
     def _compare_results_to_dict(
@@ -3967,56 +4592,47 @@ def _var_in_block(var, block):
     return False
 
 
-def _vars_fixed_to_zero(model):
+def _vars_fixed_to_zero(model, snapshot=None):
     # Set of variables fixed to 0
-    zero_vars = ComponentSet()
-    for v in model.component_data_objects(Var, descend_into=True):
-        if v.fixed and value(v) == 0:
-            zero_vars.add(v)
-    return zero_vars
+    if snapshot is None:
+        snapshot = VarSnapshot(model)
+    return snapshot.components(snapshot.fixed & (snapshot.values == 0))
 
 
-def _vars_near_zero(model, variable_zero_value_tolerance):
+def _vars_near_zero(model, variable_zero_value_tolerance, snapshot=None):
     # Set of variables with values close to 0
-    near_zero_vars = ComponentSet()
-    for v in model.component_data_objects(Var, descend_into=True):
-        if v.value is not None and abs(value(v)) <= variable_zero_value_tolerance:
-            near_zero_vars.add(v)
-    return near_zero_vars
-
-
-def _vars_violating_bounds(model, tolerance):
-    violated_bounds = ComponentSet()
-    for v in model.component_data_objects(Var, descend_into=True):
-        if v.value is not None:
-            if v.lb is not None and v.value <= v.lb - tolerance:
-                violated_bounds.add(v)
-            elif v.ub is not None and v.value >= v.ub + tolerance:
-                violated_bounds.add(v)
-
-    return violated_bounds
+    if snapshot is None:
+        snapshot = VarSnapshot(model)
+    return snapshot.components(np.abs(snapshot.values) <= variable_zero_value_tolerance)
+
+
+def _vars_violating_bounds(model, tolerance, snapshot=None):
+    if snapshot is None:
+        snapshot = VarSnapshot(model)
+    # Variables without a value are stored as NaN, so all comparisons fail
+    values = snapshot.values
+    lb = snapshot.lb
+    ub = snapshot.ub
+    violated = (np.isfinite(lb) & (values <= lb - tolerance)) | (
+        np.isfinite(ub) & (values >= ub + tolerance)
+    )
 
+    return snapshot.components(violated)
 
-def _vars_with_none_value(model):
-    none_value = ComponentSet()
-    for v in model.component_data_objects(Var, descend_into=True):
-        if v.value is None:
-            none_value.add(v)
 
-    return none_value
+def _vars_with_none_value(model, snapshot=None):
+    if snapshot is None:
+        snapshot = VarSnapshot(model)
+    return snapshot.components(~snapshot.has_value)
 
 
-def _vars_with_extreme_values(model, large, small, zero):
-    extreme_vars = ComponentSet()
-    for v in model.component_data_objects(Var, descend_into=True):
-        if v.value is not None:
-            mag = abs(value(v))
-            if mag > abs(large):
-                extreme_vars.add(v)
-            elif mag < abs(small) and mag > abs(zero):
-                extreme_vars.add(v)
+def _vars_with_extreme_values(model, large, small, zero, snapshot=None):
+    if snapshot is None:
+        snapshot = VarSnapshot(model)
+    mag = np.abs(snapshot.values)
+    extreme = (mag > abs(large)) | ((mag < abs(small)) & (mag > abs(zero)))
 
-    return extreme_vars
+    return snapshot.components(extreme)
 
 
 def _write_report_section(
@@ -19,13 +19,21 @@ IDAES models.
 __author__ = "Andrew Lee"
 
 import sys
+import threading
+
+import numpy as np
 
 from pyomo.environ import Block, Constraint, Expression, Objective, Var, value
+from pyomo.core.base.block import BlockData
+from pyomo.core.base.component import ActiveComponentData
+from pyomo.core.base.constraint import ConstraintData
+from pyomo.core.base.var import VarData
 from pyomo.dae import DerivativeVar
 from pyomo.core.expr import identify_variables
-from pyomo.common.collections import ComponentSet
+from pyomo.common.collections import ComponentMap, ComponentSet
 from pyomo.common.deprecation import deprecation_warning
 
+from idaes.core.util.var_snapshot import VarSnapshot
 import idaes.logger as idaeslog
 
 _log = idaeslog.getLogger(__name__)
@@ -727,33 +735,35 @@ def variables_near_bounds_generator(
         abs_tol = tol
         rel_tol = tol
 
-    for v in _iter_indexed_block_data_objects(
-        block, ctype=Var, active=True, descend_into=True
-    ):
-        # To avoid errors, check that v has a value
-        if v.value is None:
-            continue
+    snapshot = VarSnapshot(block, active=True, descend_into=True)
+    lb = snapshot.lb
+    ub = snapshot.ub
+    has_lb = np.isfinite(lb)
+    has_ub = np.isfinite(ub)
 
+    with np.errstate(invalid="ignore"):
         # First, magnitude of variable
-        if v.ub is not None and v.lb is not None:
+        mag = np.select(
             # Both upper and lower bounds, apply tol to (upper - lower)
-            mag = value(v.ub - v.lb)
-        elif v.ub is not None:
             # Only upper bound, apply tol to bound value
-            mag = abs(value(v.ub))
-        elif v.lb is not None:
             # Only lower bound, apply tol to bound value
-            mag = abs(value(v.lb))
-        else:
-            mag = 0
+            [has_lb & has_ub, has_ub, has_lb],
+            [ub - lb, np.abs(ub), np.abs(lb)],
+            default=0,
+        )
 
         # Calculate largest tolerance from absolute and relative
-        tol = max(abs_tol, mag * rel_tol)
+        tol = np.maximum(abs_tol, mag * rel_tol)
 
-        if v.ub is not None and not skip_ub and value(v.ub - v.value) <= tol:
-            yield v
-        elif v.lb is not None and not skip_lb and value(v.value - v.lb) <= tol:
-            yield v
+        # Variables without a value are stored as NaN, so all comparisons fail
+        near_bound = np.zeros(len(snapshot), dtype=bool)
+        if not skip_ub:
+            near_bound |= has_ub & (ub - snapshot.values <= tol)
+        if not skip_lb:
+            near_bound |= has_lb & (snapshot.values - lb <= tol)
+
+    for i in np.flatnonzero(near_bound):
+        yield snapshot.variables[i]
 
 
 def variables_near_bounds_set(
@@ -1368,11 +1378,328 @@ def degrees_of_freedom(block):
     Returns:
         Number of degrees of freedom in block.
     """
+    for tracker in _dof_trackers:
+        if tracker.is_tracking(block):
+            return tracker.degrees_of_freedom(block)
+
     return number_unfixed_variables_in_activated_equalities(
         block
     ) - number_activated_equalities(block)
 
 
+# -------------------------------------------------------------------------
+# Incremental degrees of freedom tracking
+# Active DegreesOfFreedomTrackers, notified of changes by the hooks below
+_dof_trackers = []
+# Original Pyomo methods replaced by hooks whilst any tracker is active
+_original_methods = {}
+# Guards the list of active trackers and the installation and removal of hooks
+_dof_hooks_lock = threading.Lock()
+# Number of active trackers using the hooks, and the thread they are used from
+_dof_hooks_count = 0
+_dof_hooks_thread = None
+
+
+def _set_fixed_hook(self, val):
+    val = bool(val)
+    changed = val != self._fixed
+    self._fixed = val
+    if changed:
+        for tracker in _dof_trackers:
+            tracker._fixed_changed(self)  # pylint: disable=protected-access
+
+
+def _activate_hook(self):
+    _original_methods["activate"](self)
+    for tracker in _dof_trackers:
+        tracker._active_changed(self)  # pylint: disable=protected-access
+
+
+def _deactivate_hook(self):
+    _original_methods["deactivate"](self)
+    for tracker in _dof_trackers:
+        tracker._active_changed(self)  # pylint: disable=protected-access
+
+
+def _install_dof_hooks():
+    # Pyomo component data objects use __slots__, so the hooks cannot be
+    # installed on the objects of one model and are set on the classes instead
+    _original_methods["fixed"] = VarData.fixed
+    _original_methods["activate"] = ActiveComponentData.activate
+    _original_methods["deactivate"] = ActiveComponentData.deactivate
+
+    VarData.fixed = property(VarData.fixed.fget, _set_fixed_hook)
+    ActiveComponentData.activate = _activate_hook
+    ActiveComponentData.deactivate = _deactivate_hook
+
+
+def _remove_dof_hooks():
+    VarData.fixed = _original_methods.pop("fixed")
+    ActiveComponentData.activate = _original_methods.pop("activate")
+    ActiveComponentData.deactivate = _original_methods.pop("deactivate")
+
+
+def _acquire_dof_hooks(tracker):
+    # Register an active tracker, installing the hooks for the first one
+    global _dof_hooks_count, _dof_hooks_thread  # pylint: disable=global-statement
+    with _dof_hooks_lock:
+        if _dof_hooks_count == 0:
+            _install_dof_hooks()
+            _dof_hooks_thread = threading.get_ident()
+        else:
+            _check_dof_thread()
+        _dof_hooks_count += 1
+        _dof_trackers.append(tracker)
+
+
+def _release_dof_hooks(tracker):
+    # Unregister an active tracker, removing the hooks after the last one
+    global _dof_hooks_count, _dof_hooks_thread  # pylint: disable=global-statement
+    with _dof_hooks_lock:
+        _dof_trackers.remove(tracker)
+        _dof_hooks_count -= 1
+        if _dof_hooks_count == 0:
+            _remove_dof_hooks()
+            _dof_hooks_thread = None
+
+
+def _check_dof_thread():
+    # The hooks are not thread safe, so all trackers and the models they track
+    # must be used from the thread that entered the first active tracker
+    if threading.get_ident() != _dof_hooks_thread:
+        raise RuntimeError(
+            "DegreesOfFreedomTrackers are active in another thread. Trackers, "
+            "and the models they track, can only be used from one thread."
+        )
+
+
+def _is_active(component_data):
+    return component_data.active and component_data.parent_component().active
+
+
+class DegreesOfFreedomTracker:
+    """
+    Context manager for incremental tracking of the degrees of freedom of a model
+    and all of its sub-blocks.
+
+    Inside the with statement, the tracker follows the fixing and unfixing of Vars
+    and the activation and deactivation of Constraints and Blocks, and updates
+    running counts of active equality constraints and unfixed variables in them
+    for every sub-block affected by each event. Queries of the degrees of freedom
+    of any tracked block (including via degrees_of_freedom) then return
+    immediately rather than walking the model. Tracking stops and all tracking
+    data is released when the with statement exits.
+
+    .. warning::
+        To follow these events, the setter of ``VarData.fixed`` and the
+        ``ActiveComponentData.activate`` and ``deactivate`` methods are replaced
+        for all Pyomo models in the process (not only the tracked model) whilst
+        any tracker is active, and restored when the last active tracker exits.
+        Fixing, unfixing, activating and deactivating components of other models
+        is slightly slower whilst tracking. The hooks are installed and removed
+        under a lock, but are not otherwise thread safe: all active trackers
+        must be entered from the same thread, and a RuntimeError is raised if a
+        tracker is entered, queried or rebuilt, or a tracked component is
+        changed, from another thread. Other threads may still change models
+        which are not tracked.
+
+    Changes to the model which are not fixing/unfixing or activating/deactivating
+    components (e.g. adding or deleting components, changing the expression or
+    bounds of a Constraint, or setting private flags directly) are not tracked;
+    call rebuild() after making such changes.
+
+    Args:
+        block: model (BlockData) to track degrees of freedom for
+    """
+
+    def __init__(self, block):
+        if not isinstance(block, BlockData):
+            raise TypeError(
+                "DegreesOfFreedomTracker only supports BlockData objects "
+                "(either a scalar Block or an element of an indexed Block)."
+            )
+        self._root = block
+        self._enabled = False
+        self._clear()
+
+    def __enter__(self):
+        if self._enabled:
+            raise RuntimeError("DegreesOfFreedomTracker is already tracking.")
+        _acquire_dof_hooks(self)
+        self._enabled = True
+        self.rebuild()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        _release_dof_hooks(self)
+        self._enabled = False
+        self._clear()
+
+    @property
+    def enabled(self):
+        """
+        Whether the tracker is currently tracking (i.e. inside its with statement).
+        """
+        return self._enabled
+
+    def _clear(self):
+        # block -> number of active equalities in block, for all tracked blocks
+        self._n_equalities = ComponentMap()
+        # block -> number of unfixed variables in active equalities in block
+        self._n_unfixed = ComponentMap()
+        # var -> ComponentMap(block: number of active equalities containing var)
+        self._var_refs = ComponentMap()
+        # con -> [variables in con, is equality, blocks counting con]
+        self._constraints = ComponentMap()
+
+    def rebuild(self):
+        """
+        Recount the degrees of freedom of all blocks from the current state of the
+        model. This must be called after any change to the model which is not
+        tracked (see class documentation).
+
+        Returns:
+            None
+        """
+        if not self._enabled:
+            raise RuntimeError(
+                "DegreesOfFreedomTracker can only be rebuilt whilst tracking."
+            )
+        _check_dof_thread()
+        self._clear()
+
+        self._n_equalities[self._root] = 0
+        self._n_unfixed[self._root] = 0
+        for b in self._root.component_data_objects(Block, descend_into=True):
+            self._n_equalities[b] = 0
+            self._n_unfixed[b] = 0
+
+        for c in self._root.component_data_objects(Constraint, descend_into=True):
+            record = [
+                tuple(identify_variables(c.body)),
+                c.upper is not None
+                and c.lower is not None
+                and value(c.upper) == value(c.lower),
+                (),
+            ]
+            self._constraints[c] = record
+            self._update_constraint(c, record)
+
+    def is_tracking(self, block):
+        """
+        Check whether degrees of freedom are being tracked for a given block.
+
+        Args:
+            block: block to check
+
+        Returns:
+            bool
+        """
+        return self._enabled and block in self._n_equalities
+
+    def degrees_of_freedom(self, block=None):
+        """
+        Return the degrees of freedom of a tracked block.
+
+        Args:
+            block: block to return degrees of freedom of (default = tracked model)
+
+        Returns:
+            Number of degrees of freedom in block
+
+        Raises:
+            KeyError if block is not being tracked
+        """
+        if block is None:
+            block = self._root
+        if not self.is_tracking(block):
+            raise KeyError(f"Degrees of freedom are not being tracked for {block}.")
+        _check_dof_thread()
+
+        return self._n_unfixed[block] - self._n_equalities[block]
+
+    def _counting_blocks(self, con):
+        # Return blocks in which con appears as an active equality. These are the
+        # ancestors of con up to the tracked model, stopping at the first
+        # deactivated block.
+        if not _is_active(con):
+            return ()
+
+        blocks = []
+        b = con.parent_block()
+        while b is not None and _is_active(b):
+            blocks.append(b)
+            if b is self._root:
+                break
+            b = b.parent_block()
+
+        return tuple(blocks)
+
+    def _update_constraint(self, con, record):
+        variables, equality, old_blocks = record
+        new_blocks = self._counting_blocks(con) if equality else ()
+        if new_blocks == old_blocks:
+            return
+
+        for b in old_blocks:
+            if b not in new_blocks:
+                self._remove_equality(b, variables)
+        for b in new_blocks:
+            if b not in old_blocks:
+                self._add_equality(b, variables)
+        record[2] = new_blocks
+
+    def _add_equality(self, block, variables):
+        self._n_equalities[block] += 1
+        for v in variables:
+            refs = self._var_refs.get(v)
+            if refs is None:
+                refs = self._var_refs[v] = ComponentMap()
+            count = refs.get(block, 0)
+            refs[block] = count + 1
+            if count == 0 and not v.fixed:
+                self._n_unfixed[block] += 1
+
+    def _remove_equality(self, block, variables):
+        self._n_equalities[block] -= 1
+        for v in variables:
+            refs = self._var_refs[v]
+            count = refs[block] - 1
+            if count > 0:
+                refs[block] = count
+                continue
+            del refs[block]
+            if not refs:
+                del self._var_refs[v]
+            if not v.fixed:
+                self._n_unfixed[block] -= 1
+
+    def _fixed_changed(self, var):
+        refs = self._var_refs.get(var)
+        if refs is None:
+            return
+        _check_dof_thread()
+
+        delta = -1 if var.fixed else 1
+        for b in refs:
+            self._n_unfixed[b] += delta
+
+    def _active_changed(self, component):
+        if isinstance(component, ConstraintData):
+            record = self._constraints.get(component)
+            if record is not None:
+                _check_dof_thread()
+                self._update_constraint(component, record)
+        elif isinstance(component, BlockData):
+            if component not in self._n_equalities:
+                return
+            _check_dof_thread()
+            for c in component.component_data_objects(Constraint, descend_into=True):
+                record = self._constraints.get(c)
+                if record is not None:
+                    self._update_constraint(c, record)
+
+
 def large_residuals_set(block, tol=1e-5, return_residual_values=False):
     """
     Method to return a ComponentSet of all Constraint components with a
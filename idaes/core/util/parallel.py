@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+This module contains utilities for running tasks on a pool of worker processes
+which all hold a copy of the same state (e.g. a model and a solver), so that
+the state is passed to each worker once instead of with every task.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+import multiprocessing
+
+# State of the current worker process, set when the worker starts
+_worker_state = None
+
+
+def fork_available():
+    """
+    Check whether worker processes can be started by forking on this platform,
+    in which case they inherit the state without it being pickled.
+
+    Returns:
+        bool
+    """
+    return "fork" in multiprocessing.get_all_start_methods()
+
+
+def _initialize_worker(state, setup):
+    global _worker_state  # pylint: disable=global-statement
+    _worker_state = state if setup is None else setup(*state)
+
+
+def get_worker_state():
+    """
+    Return the state held by the current worker process of a worker_pool.
+
+    Returns:
+        state passed to worker_pool, or the result of its setup function
+    """
+    return _worker_state
+
+
+@contextmanager
+def worker_pool(state, max_workers=None, fork=True, setup=None):
+    """
+    Context manager for a pool of worker processes which all hold a copy of the
+    given state. Tasks submitted to the pool get the state of their worker with
+    get_worker_state().
+
+    Each worker gets a copy of the state when it starts, so changes made to
+    the state in the parent process afterwards are not seen by the workers.
+
+    Args:
+        state: state of the workers
+        max_workers: maximum number of worker processes (default = None, use
+            number of CPUs)
+        fork: if True, workers are started by forking the parent process, so
+            they inherit the state without it being pickled; this must only be
+            used if fork_available() is True. Otherwise, workers are started with
+            the default method of the platform and the state must be picklable.
+        setup: function called in each worker when it starts, as setup(*state),
+            whose result is the state of the worker (default = None, the state is
+            used as it is)
+
+    Yields:
+        concurrent.futures.ProcessPoolExecutor
+    """
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("fork") if fork else None,
+        initializer=_initialize_worker,
+        initargs=(state, setup),
+    ) as pool:
+        yield pool
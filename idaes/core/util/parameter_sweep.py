@@ -11,21 +11,29 @@
 # for full copyright and license information.
 #################################################################################
 """
-IDAES Parameter Sweep API and sequential workflow runner.
+IDAES Parameter Sweep API and sequential and parallel workflow runners.
 """
 
 import sys
 import json
+from concurrent.futures import as_completed
 
 from pandas import DataFrame
 
 from pyomo.core import Param, Var
 from pyomo.environ import check_optimal_termination
-from pyomo.common.config import ConfigDict, ConfigValue, document_kwargs_from_configdict
+from pyomo.common.config import (
+    ConfigDict,
+    ConfigValue,
+    document_kwargs_from_configdict,
+    PositiveInt,
+)
 
 import idaes.logger as idaeslog
 from idaes.core.surrogate.pysmo.sampling import SamplingMethods, UniformSampling
 from idaes.core.util.exceptions import ConfigurationError
+from idaes.core.util.parallel import get_worker_state, worker_pool
+from idaes.core.util.var_snapshot import VarSnapshot
 
 __author__ = "Andrew Lee"
 
@@ -347,6 +355,17 @@ CONFIG.declare(
         "all runs (default=True, rebuild for all runs).",
     ),
 )
+CONFIG.declare(
+    "reset_model",
+    ConfigValue(
+        default=False,
+        domain=bool,
+        doc="If rebuild_model is False, whether to restore the variable values, fixed "
+        "status and mutable parameter values of the model to those it was built with "
+        "before each run (default=False, run each sample from the end state of the "
+        "previous run).",
+    ),
+)
 CONFIG.declare(
     "build_model",
     ConfigValue(doc="Callback method to construct initialized model for execution."),
@@ -422,6 +441,43 @@ CONFIG.declare(
 )
 
 
+def _save_model_state(model):
+    """
+    Record the values and fixed status of all variables and the values of all
+    mutable parameters in a model.
+
+    Args:
+        model: model to record state of
+
+    Returns:
+        state object to pass to _restore_model_state
+    """
+    params = [
+        p
+        for p in model.component_data_objects(Param, descend_into=True)
+        if p.parent_component().mutable
+    ]
+
+    return (VarSnapshot(model), params, [p.value for p in params])
+
+
+def _restore_model_state(state):
+    """
+    Restore the state of a model recorded by _save_model_state.
+
+    Args:
+        state: state object returned by _save_model_state
+
+    Returns:
+        None
+    """
+    snapshot, params, param_values = state
+
+    snapshot.restore()
+    for p, val in zip(params, param_values):
+        p.set_value(val)
+
+
 @document_kwargs_from_configdict(CONFIG)
 class ParameterSweepBase:
     """
@@ -436,6 +492,7 @@ class ParameterSweepBase:
         self.config = CONFIG(kwargs)
         self._results = {}
         self._model = None  # used to store model instance if rebuild_model is False
+        self._model_state = None  # initial state of model if reset_model is True
 
     @property
     def results(self):
@@ -516,7 +573,9 @@ class ParameterSweepBase:
         if not self.config.rebuild_model:
             # If reusing model, see if instance has been constructed yet
             if self._model is not None:
-                # If yes, return and done
+                # If yes, restore initial state if required and done
+                if self.config.reset_model:
+                    _restore_model_state(self._model_state)
                 return self._model
 
         # Otherwise, build instance of model
@@ -529,6 +588,8 @@ class ParameterSweepBase:
         if not self.config.rebuild_model:
             # If reusing model, store instance for reuse
             self._model = model
+            if self.config.reset_model:
+                self._model_state = _save_model_state(model)
 
         return model
 
@@ -827,3 +888,77 @@ class SequentialSweepRunner(ParameterSweepBase):
             count += 1
 
         return self.results
+
+
+PARALLEL_CONFIG = CONFIG()
+PARALLEL_CONFIG.declare(
+    "number_of_workers",
+    ConfigValue(
+        default=None,
+        domain=PositiveInt,
+        doc="Number of worker processes to use (default=None, use number of CPUs).",
+    ),
+)
+
+
+def _execute_sample_in_worker(sample_id):
+    # each worker process holds its own copy of the runner
+    return sample_id, get_worker_state().execute_single_sample(sample_id)
+
+
+@document_kwargs_from_configdict(PARALLEL_CONFIG)
+class ParallelSweepRunner(ParameterSweepBase):
+    """
+    Parallel runner for parameter sweeps.
+
+    This class executes a parameter sweep by distributing samples over a pool of
+    worker processes. Each worker holds its own copy of the runner, thus if
+    rebuild_model is False the model is only built once per worker. Setting
+    reset_model to True restores the model to its initial state before each sample,
+    giving the same results as rebuilding the model without the cost of doing so.
+
+    Note that the callbacks, solver and input specification must be picklable on
+    platforms which do not start worker processes by forking.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__()
+        self.config = PARALLEL_CONFIG(kwargs)
+
+    def execute_parameter_sweep(self):
+        """
+        Execute parallel parameter sweep.
+
+        Returns:
+            dict of results indexed by sample ID.
+        """
+        self._results = {}
+        samples = self.get_input_samples()
+
+        results = {}
+        with worker_pool(
+            self, max_workers=self.config.number_of_workers, fork=False
+        ) as pool:
+            futures = [pool.submit(_execute_sample_in_worker, s) for s in samples.index]
+
+            count = 1
+            try:
+                for f in as_completed(futures):
+                    s, (sresults, success, error) = f.result()
+                    results[s] = {
+                        "success": success,
+                        "results": sresults,
+                        "error": error,
+                    }
+
+                    self.progress_bar(float(count) / float(len(samples)), "Complete")
+                    count += 1
+            except BaseException:
+                for f in futures:
+                    f.cancel()
+                raise
+
+        # Order results by sample ID, as for sequential execution
+        self._results = {s: results[s] for s in samples.index}
+
+        return self.results
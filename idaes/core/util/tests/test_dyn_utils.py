@@ -186,6 +186,103 @@ def test_fix_and_deactivate():
                 assert m.fs.b2[m.time.at(1), x].b3[c1].v[c2].value == -1
 
 
+def make_transfer_model():
+    m = ConcreteModel()
+    m.time = ContinuousSet(bounds=(0, 10))
+    m.space = ContinuousSet(bounds=(0, 5))
+    m.set1 = Set(initialize=["a", "b"])
+    m.v0 = Var(m.space, initialize=1)
+    m.v1 = Var(m.time, initialize=1)
+    m.v2 = Var(m.set1, m.time, initialize=1)
+
+    @m.Block(m.time)
+    def b1(b, t):
+        b.v = Var(initialize=2)
+
+        @b.Block(m.set1)
+        def b2(b, c):
+            b.v = Var(m.set1, initialize=3)
+
+    @m.Block(m.time, m.space)
+    def b3(b, t, x):
+        b.v = Var(m.set1, initialize=4)
+
+    disc = TransformationFactory("dae.finite_difference")
+    disc.apply_to(m, wrt=m.time, nfe=4)
+    disc.apply_to(m, wrt=m.space, nfe=2)
+    return m
+
+
+@pytest.mark.unit
+def test_time_transfer_map():
+    m = make_transfer_model()
+    src = m.clone()
+    for i, var in enumerate(src.component_data_objects(Var)):
+        var.set_value(i)
+    m.v1[0].fix()
+    m.b1[0].b2["b"].v["a"].fix()
+    m.b3[0, 5].v["b"].fix()
+
+    expected = m.clone()
+    transfer_map = TimeTransferMap(m, src)
+    # v1, v2, b1 and b3 at each time point
+    assert len(transfer_map) == 1 + 2 + 1 + 4 + 3 * 2
+
+    for t_target, t_source in [(0, 10), (10, 2.5), (0, 0)]:
+        for copy_fixed in [False, True]:
+            copy_values_at_time(expected, src, t_target, t_source, copy_fixed)
+            transfer_map.copy_values(t_target, t_source, copy_fixed)
+            for var, var_expected in zip(
+                m.component_data_objects(Var), expected.component_data_objects(Var)
+            ):
+                assert var.value == var_expected.value
+
+    # Copying within the same model
+    transfer_map = TimeTransferMap(src, src)
+    transfer_map.copy_values(0, 5)
+    assert src.b3[0, 2.5].v["a"].value == src.b3[5, 2.5].v["a"].value
+    assert src.b1[0].b2["a"].v["b"].value == src.b1[5].b2["a"].v["b"].value
+
+
+@pytest.mark.unit
+def test_time_transfer_map_missing_component(caplog):
+    m = make_transfer_model()
+    src = make_transfer_model()
+    src.del_component(src.v2)
+    transfer_map = TimeTransferMap(m, src)
+    assert "v2 does not exist in source block" in caplog.text
+    assert len(transfer_map) == 1 + 1 + 4 + 3 * 2
+
+
+@pytest.mark.unit
+def test_time_transfer_map_heterogeneous_block():
+    m = ConcreteModel()
+    m.time = ContinuousSet(bounds=(0, 1))
+
+    @m.Block(m.time)
+    def b(b, t):
+        b.x = Var(initialize=t)
+        if t == 0:
+            b.x0 = Var(initialize=5)
+
+    expected = m.clone()
+    transfer_map = TimeTransferMap(m, m)
+    assert len(transfer_map) == 2
+
+    copy_values_at_time(expected, expected, 1, 0)
+    transfer_map.copy_values(1, 0)
+    for var, var_expected in zip(
+        m.component_data_objects(Var), expected.component_data_objects(Var)
+    ):
+        assert var.value == var_expected.value
+
+    # Variables missing at the source time point are skipped
+    m.b[1].x.set_value(3)
+    transfer_map.copy_values(0, 1)
+    assert m.b[0].x.value == 3
+    assert m.b[0].x0.value == 5
+
+
 @pytest.mark.unit
 def test_copy_non_time_indexed_values():
     m1 = ConcreteModel()
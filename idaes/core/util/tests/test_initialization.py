@@ -14,6 +14,8 @@
 Tests for math util methods.
 """
 
+import re
+
 import pytest
 from pyomo.environ import (
     Block,
@@ -29,7 +31,11 @@ from pyomo.environ import (
     units as pyunits,
     TransformationFactory,
     check_optimal_termination,
+    SolverFactory,
+    Objective,
+    Reference,
 )
+from pyomo.dae import DerivativeVar
 from pyomo.network import Arc, Port
 
 from idaes.core import (
@@ -60,6 +66,7 @@ from idaes.core.util.initialization import (
     initialize_by_time_element,
 )
 from idaes.core.solvers import get_solver
+import idaes.logger as idaeslog
 
 __author__ = "Andrew Lee"
 
@@ -1090,3 +1097,112 @@ def test_initialize_by_time_element():
 
     results = solver.solve(m.fs)
     assert check_optimal_termination(results)
+
+
+class HighsBlockSolver:
+    # The HiGHS interface solves models, not blocks of a model
+    def __init__(self):
+        self.solver = SolverFactory("appsi_highs")
+
+    def solve(self, blk, tee=False):
+        m = ConcreteModel()
+        m.blk = Reference(blk)
+        return self.solver.solve(m, tee=tee)
+
+
+def linear_dae_model(nfe, ncp, scheme):
+    # dx/dt = -x + y, y = u, with a step in the input u
+    m = ConcreteModel()
+    m.fs = FlowsheetBlock(dynamic=True, time_set=[0, 4], time_units=pyunits.s)
+    m.fs.x = Var(m.fs.time, initialize=0)
+    m.fs.y = Var(m.fs.time, initialize=0)
+    m.fs.u = Var(m.fs.time, initialize=0)
+    m.fs.dxdt = DerivativeVar(m.fs.x, wrt=m.fs.time, initialize=0)
+
+    @m.fs.Constraint(m.fs.time)
+    def diff_eq(b, t):
+        return b.dxdt[t] == -b.x[t] + b.y[t]
+
+    @m.fs.Constraint(m.fs.time)
+    def alg_eq(b, t):
+        return b.y[t] == b.u[t]
+
+    # HiGHS needs an objective
+    m.fs.obj = Objective(expr=0)
+
+    disc = TransformationFactory("dae.collocation")
+    if scheme == "BACKWARD":
+        disc = TransformationFactory("dae.finite_difference")
+        disc.apply_to(m, wrt=m.fs.time, nfe=nfe, scheme=scheme)
+    else:
+        disc.apply_to(m, wrt=m.fs.time, nfe=nfe, ncp=ncp, scheme=scheme)
+
+    m.fs.x[0].fix(1)
+    for t in m.fs.time:
+        m.fs.u[t].fix(0 if t <= 1 else 2)
+    return m
+
+
+@pytest.mark.component
+@pytest.mark.skipif(
+    not SolverFactory("appsi_highs").available(exception_flag=False),
+    reason="HiGHS not available",
+)
+@pytest.mark.parametrize("scheme, ncp", [("BACKWARD", 1), ("LAGRANGE-RADAU", 3)])
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_initialize_by_time_element_parallel_in_time(scheme, ncp, n_workers):
+    highs = HighsBlockSolver()
+
+    m_serial = linear_dae_model(8, ncp, scheme)
+    initialize_by_time_element(m_serial.fs, m_serial.fs.time, solver=highs)
+
+    m = linear_dae_model(8, ncp, scheme)
+    initialize_by_time_element(
+        m.fs, m.fs.time, solver=highs, parallel_in_time=True, n_workers=n_workers
+    )
+
+    for t in m.fs.time:
+        for name in ["x", "y", "dxdt"]:
+            assert m.fs.component(name)[t].value == pytest.approx(
+                m_serial.fs.component(name)[t].value, abs=1e-6
+            )
+    assert m.fs.x[0].fixed
+    assert not m.fs.x[4].fixed
+    assert not m.fs.dxdt[2].fixed
+    assert all(c.active for c in m.fs.diff_eq.values())
+
+
+@pytest.mark.component
+@pytest.mark.skipif(
+    not SolverFactory("appsi_highs").available(exception_flag=False),
+    reason="HiGHS not available",
+)
+def test_initialize_by_time_element_parallel_in_time_solves_logged(caplog):
+    m = linear_dae_model(4, 1, "BACKWARD")
+    with caplog.at_level(idaeslog.INFO):
+        initialize_by_time_element(
+            m.fs,
+            m.fs.time,
+            solver=HighsBlockSolver(),
+            parallel_in_time=True,
+            outlvl=idaeslog.INFO,
+        )
+
+    match = re.search(
+        r"solved (\d+) finite elements in (\d+) iterations \(4 for serial", caplog.text
+    )
+    assert match is not None
+    n_solves, n_iter = int(match.group(1)), int(match.group(2))
+    assert 4 <= n_solves <= 4 * 5 // 2
+    assert 1 <= n_iter <= 4
+
+
+@pytest.mark.unit
+def test_initialize_by_time_element_parallel_in_time_options():
+    m = linear_dae_model(2, 1, "BACKWARD")
+    with pytest.raises(ConfigurationError, match="requires fix_diff_only=True"):
+        initialize_by_time_element(
+            m.fs, m.fs.time, parallel_in_time=True, fix_diff_only=False
+        )
+    with pytest.raises(ValueError, match="n_workers should be a positive integer"):
+        initialize_by_time_element(m.fs, m.fs.time, parallel_in_time=True, n_workers=0)
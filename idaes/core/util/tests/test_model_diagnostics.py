@@ -79,11 +79,14 @@ from idaes.core.util.model_diagnostics import (
     _vars_with_extreme_values,
     _write_report_section,
     _collect_model_statistics,
+    _Fingerprint,
+    _IpoptLogParser,
     check_parallel_jacobian,
     compute_ill_conditioning_certificate,
 )
 from idaes.core.util.parameter_sweep import (
     SequentialSweepRunner,
+    ParallelSweepRunner,
     ParameterSweepSpecification,
 )
 from idaes.core.surrogate.pysmo.sampling import (
@@ -1517,6 +1520,165 @@ Suggested next steps:
         assert isinstance(dh, DegeneracyHunter2)
 
 
+class TestDiagnosticsToolboxCache:
+    @pytest.fixture
+    def model(self):
+        m = ConcreteModel()
+        m.x = Var([1, 2, 3], initialize=1, bounds=(0, 10))
+        m.c1 = Constraint(expr=m.x[1] + m.x[2] == 2)
+        m.c2 = Constraint(expr=m.x[2] + m.x[3] == 2)
+        m.x[1].fix(1)
+
+        return m
+
+    @pytest.mark.unit
+    def test_config(self, model):
+        dt = DiagnosticsToolbox(model)
+
+        assert not dt.config.cache_results
+
+    @pytest.mark.unit
+    def test_no_cache(self, model):
+        dt = DiagnosticsToolbox(model)
+
+        part1 = dt.get_dulmage_mendelsohn_partition()
+        part2 = dt.get_dulmage_mendelsohn_partition()
+
+        assert part1 == part2
+        assert part1 is not part2
+        assert dt._cache._results == {}
+
+    @pytest.mark.unit
+    def test_session_cache_cleared(self, model):
+        dt = DiagnosticsToolbox(model)
+
+        with dt._diagnostics_session():
+            part1 = dt.get_dulmage_mendelsohn_partition()
+            part2 = dt.get_dulmage_mendelsohn_partition()
+            assert part1 is part2
+
+        assert dt._cache._results == {}
+        assert dt._session_fingerprints is None
+
+    @pytest.mark.unit
+    def test_structure_dependency(self, model):
+        dt = DiagnosticsToolbox(model, cache_results=True)
+
+        part1 = dt.get_dulmage_mendelsohn_partition()
+        assert dt.get_dulmage_mendelsohn_partition() is part1
+
+        # Changing values should not invalidate structural results
+        model.x[2].set_value(5)
+        model.x[3].setub(20)
+        assert dt.get_dulmage_mendelsohn_partition() is part1
+
+        # Changing fixed variables should
+        model.x[1].unfix()
+        part2 = dt.get_dulmage_mendelsohn_partition()
+        assert part2 is not part1
+        assert len(part2[0]) == 1
+
+        # As should deactivating constraints
+        model.c2.deactivate()
+        part3 = dt.get_dulmage_mendelsohn_partition()
+        assert part3 is not part2
+
+        # And changing the expression of a constraint
+        model.c2.activate()
+        model.c2.set_value(model.x[1] + model.x[3] == 2)
+        assert dt.get_dulmage_mendelsohn_partition() is not part3
+
+        dt.clear_cache()
+        assert dt._cache._results == {}
+
+    @pytest.mark.unit
+    def test_replaced_constraint(self, model):
+        dt = DiagnosticsToolbox(model, cache_results=True)
+
+        part1 = dt.get_dulmage_mendelsohn_partition()
+
+        # A new constraint is a different component, even if it is identical
+        # and replaces a deleted one
+        model.del_component(model.c2)
+        model.c2 = Constraint(expr=model.x[2] + model.x[3] == 2)
+        part2 = dt.get_dulmage_mendelsohn_partition()
+        assert part2 is not part1
+
+    @pytest.mark.unit
+    def test_session_without_cache_not_fingerprinted(self, model):
+        dt = DiagnosticsToolbox(model)
+
+        with dt._diagnostics_session():
+            dt.get_dulmage_mendelsohn_partition()
+            fingerprint = dt._get_fingerprint("structure")
+            assert not isinstance(fingerprint, _Fingerprint)
+            assert dt._get_fingerprint("values") is fingerprint
+
+    @pytest.mark.unit
+    def test_session_fingerprints_computed_once(self, model):
+        dt = DiagnosticsToolbox(model, cache_results=True)
+
+        with dt._diagnostics_session():
+            structure = dt._get_fingerprint("structure")
+            assert isinstance(structure, _Fingerprint)
+            assert dt._get_fingerprint("structure") is structure
+            values = dt._get_fingerprint("values")
+            assert dt._get_fingerprint("values") is values
+
+        assert dt._get_fingerprint("structure") == structure
+        assert dt._get_fingerprint("values") == values
+        model.x[2].set_value(3)
+        assert dt._get_fingerprint("structure") == structure
+        assert dt._get_fingerprint("values") != values
+
+    @pytest.mark.unit
+    def test_values_dependency(self, model):
+        dt = DiagnosticsToolbox(model, cache_results=True)
+
+        assert dt._collect_structural_cautions() == []
+
+        model.x[1].fix(0)
+        assert dt._collect_structural_cautions() == ["Caution: 1 variable fixed to 0"]
+        unused = dt._cache._results["unused_variables"]
+
+        model.x[1].fix(2)
+        assert dt._collect_structural_cautions() == []
+        # Unused variables only depend on the model structure
+        assert dt._cache._results["unused_variables"] is unused
+
+    @pytest.mark.unit
+    def test_tolerance_dependency(self, model):
+        dt = DiagnosticsToolbox(model, cache_results=True)
+        model.x[2].set_value(10.01)
+
+        warnings, _ = dt._collect_structural_warnings()
+        assert len(warnings) == 0
+        assert "potential_eval_errors" in dt._cache._results
+
+        dt.config.warn_for_evaluation_error_at_bounds = False
+        dt._collect_structural_warnings()
+        assert dt._cache._results["potential_eval_errors"][0][1] == (False,)
+
+    @pytest.mark.component
+    @pytest.mark.skipif(
+        not AmplInterface.available(), reason="pynumero_ASL is not available"
+    )
+    def test_supplied_jacobian_not_cached(self, model):
+        dt = DiagnosticsToolbox(model, cache_results=True)
+
+        assert dt._collect_numerical_cautions() == []
+        cached = dt._cache._results["extreme_jacobian_entries_caution"]
+        assert len(cached[1]) == 0
+
+        jac, nlp = iscale.get_jacobian(model, scaled=False)
+        cautions = dt._collect_numerical_cautions(jac=1e6 * jac, nlp=nlp)
+        assert "Caution: 3 extreme Jacobian Entries (<1.0E-04 or >1.0E+04)" in cautions
+
+        # Results for the supplied Jacobian are neither cached nor taken from cache
+        assert dt._cache._results["extreme_jacobian_entries_caution"] is cached
+        assert dt._collect_numerical_cautions() == []
+
+
 def dummy_callback(arg1):
     pass
 
@@ -1994,6 +2156,22 @@ class TestDegeneracyHunter:
 
         assert dh.degenerate_set == {}
         assert dh.irreducible_degenerate_sets == []
+        assert dh.ids_solve_times == {}
+
+        assert not dh.config.prune_candidates
+        assert dh.config.number_of_workers == 1
+
+    @pytest.mark.unit
+    def test_is_pruned(self, model):
+        dh = DegeneracyHunter2(model, prune_candidates=True)
+
+        assert not dh._is_pruned(model.con2)
+
+        dh.irreducible_degenerate_sets.append({model.con2: 1, model.con5: -1})
+
+        assert dh._is_pruned(model.con2)
+        assert dh._is_pruned(model.con5)
+        assert not dh._is_pruned(model.con1)
 
     @pytest.mark.unit
     def test_get_solver(self, model):
@@ -2122,6 +2300,32 @@ class TestDegeneracyHunter:
             {model.con5: 1, model.con2: -1},
         ]
 
+        assert set(dh.ids_solve_times.keys()) == {model.con2, model.con5}
+
+    @pytest.mark.solver
+    @pytest.mark.component
+    def test_find_irreducible_degenerate_sets_pruned(self, model, scip_solver):
+        dh = DegeneracyHunter2(model, prune_candidates=True)
+        dh.find_irreducible_degenerate_sets()
+
+        assert dh.irreducible_degenerate_sets == [
+            {model.con2: 1, model.con5: -1},
+        ]
+
+        # con5 is part of the first IDS, so it should not have been solved
+        assert set(dh.ids_solve_times.keys()) == {model.con2}
+
+    @pytest.mark.solver
+    @pytest.mark.component
+    def test_find_irreducible_degenerate_sets_parallel(self, model, scip_solver):
+        dh = DegeneracyHunter2(model, number_of_workers=2)
+        dh.find_irreducible_degenerate_sets()
+
+        assert dh.irreducible_degenerate_sets == [
+            {model.con2: 1, model.con5: -1},
+            {model.con5: 1, model.con2: -1},
+        ]
+
     @pytest.mark.solver
     @pytest.mark.component
     def test_report_irreducible_degenerate_sets(self, model, scip_solver):
@@ -2286,6 +2490,38 @@ class TestIpoptConvergenceAnalysis:
         assert regularization == 4
         assert time == 0.016 + 0.035
 
+    @pytest.mark.unit
+    def test_parse_ipopt_log_stream(self):
+        fname = os.path.join(currdir, "ipopt_output.txt")
+        with open(fname, "r") as f:
+            log = f.read()
+
+        parser = _IpoptLogParser()
+        # Write in chunks which do not align with line breaks
+        for i in range(0, len(log), 37):
+            parser.write(log[i : i + 37])
+
+        iters, restoration, regularization, time = parser.get_stats()
+
+        assert iters == 43
+        assert restoration == 39
+        assert regularization == 4
+        assert time == 0.016 + 0.035
+
+    @pytest.mark.unit
+    def test_init_reuse_model(self, model):
+        ca = IpoptConvergenceAnalysis(
+            model,
+            rebuild_model=False,
+            workflow_runner=ParallelSweepRunner,
+            workflow_runner_arguments={"number_of_workers": 2},
+        )
+
+        assert isinstance(ca._psweep, ParallelSweepRunner)
+        assert not ca._psweep.config.rebuild_model
+        assert ca._psweep.config.reset_model
+        assert ca._psweep.config.number_of_workers == 2
+
     @pytest.mark.component
     @pytest.mark.solver
     def test_run_ipopt_with_stats(self):
@@ -685,6 +685,183 @@ def test_degrees_of_freedom(m):
     assert degrees_of_freedom(m.b2) == -1
 
 
+def _check_tracked_dof(tracker, model):
+    for b in [model] + list(model.component_data_objects(Block, descend_into=True)):
+        assert tracker.degrees_of_freedom(b) == (
+            number_unfixed_variables_in_activated_equalities(b)
+            - number_activated_equalities(b)
+        )
+
+
+@pytest.mark.unit
+def test_degrees_of_freedom_tracker(m):
+    with DegreesOfFreedomTracker(m) as tracker:
+        assert tracker.enabled
+        assert tracker.is_tracking(m)
+        assert tracker.is_tracking(m.b2["a"])
+        assert degrees_of_freedom(m) == 10
+        assert degrees_of_freedom(m.b2["b"]) == -1
+        _check_tracked_dof(tracker, m)
+
+        # Fix and unfix variables
+        m.v[0].fix()
+        m.b2["b"].v1.unfix()
+        _check_tracked_dof(tracker, m)
+        m.v[0].unfix()
+        m.b2["b"].v1.fix()
+        m.b2["b"].v1.fix()  # No change in fixed status
+        _check_tracked_dof(tracker, m)
+
+        # Activate and deactivate constraints
+        m.b2["a"].c1.activate()
+        _check_tracked_dof(tracker, m)
+        m.b2["b"].c1.deactivate()
+        _check_tracked_dof(tracker, m)
+
+        # Activate and deactivate blocks
+        m.b1.activate()
+        _check_tracked_dof(tracker, m)
+        m.b1.sb.v1.unfix()
+        _check_tracked_dof(tracker, m)
+        m.b1.sb.deactivate()
+        _check_tracked_dof(tracker, m)
+        m.b2.deactivate()
+        _check_tracked_dof(tracker, m)
+        m.b2.activate()
+        _check_tracked_dof(tracker, m)
+
+        # Untracked changes need a rebuild
+        m.b2["b"].c3 = Constraint(expr=m.b2["b"].v2["a"] == 1)
+        tracker.rebuild()
+        _check_tracked_dof(tracker, m)
+
+    assert not tracker.enabled
+    assert not tracker.is_tracking(m)
+    with pytest.raises(KeyError):
+        tracker.degrees_of_freedom(m)
+
+
+@pytest.mark.unit
+def test_degrees_of_freedom_tracker_untracked_block(m):
+    other = ConcreteModel()
+    other.v = Var()
+    other.c = Constraint(expr=other.v == 1)
+
+    with DegreesOfFreedomTracker(m.b2["a"]) as tracker:
+        assert not tracker.is_tracking(m)
+        assert not tracker.is_tracking(other)
+        # Untracked blocks are counted in full
+        assert degrees_of_freedom(m) == 10
+        assert degrees_of_freedom(other) == 0
+        other.v.fix()
+        assert degrees_of_freedom(other) == -1
+
+
+@pytest.mark.unit
+def test_degrees_of_freedom_tracker_hooks(m):
+    from pyomo.core.base.var import VarData
+
+    original = VarData.fixed
+
+    t1 = DegreesOfFreedomTracker(m)
+    # Nothing is patched until the tracker is entered
+    assert VarData.fixed is original
+    with pytest.raises(RuntimeError, match="can only be rebuilt whilst tracking"):
+        t1.rebuild()
+
+    with t1:
+        with DegreesOfFreedomTracker(m.b2["b"]) as t2:
+            assert VarData.fixed is not original
+
+            m.b2["b"].v1.unfix()
+            assert t1.degrees_of_freedom(m.b2["b"]) == t2.degrees_of_freedom() == 0
+
+            with pytest.raises(RuntimeError, match="is already tracking"):
+                with t2:
+                    pass
+
+        assert VarData.fixed is not original
+    assert VarData.fixed is original
+
+    # The tracker can be used again
+    with t1:
+        assert t1.degrees_of_freedom(m.b2["b"]) == 0
+    assert VarData.fixed is original
+
+
+@pytest.mark.unit
+def test_degrees_of_freedom_tracker_exception(m):
+    from pyomo.core.base.var import VarData
+
+    original = VarData.fixed
+
+    with pytest.raises(ValueError):
+        with DegreesOfFreedomTracker(m) as tracker:
+            raise ValueError()
+
+    assert not tracker.enabled
+    assert VarData.fixed is original
+
+
+@pytest.mark.unit
+def test_degrees_of_freedom_tracker_threads(m):
+    import threading
+    from pyomo.core.base.var import VarData
+    import idaes.core.util.model_statistics as ms
+
+    original = VarData.fixed
+    errors = {}
+
+    def run(name, func):
+        def target():
+            try:
+                func()
+            except RuntimeError as err:
+                errors[name] = str(err)
+
+        thread = threading.Thread(target=target)
+        thread.start()
+        thread.join()
+
+    def enter_other():
+        with DegreesOfFreedomTracker(m.b2["a"]):
+            pass
+
+    other = ConcreteModel()
+    other.v = Var()
+
+    with DegreesOfFreedomTracker(m) as tracker:
+        assert ms._dof_hooks_count == 1
+        run("enter", enter_other)
+        run("query", tracker.degrees_of_freedom)
+        run("rebuild", tracker.rebuild)
+        run("fix", m.b2["b"].v1.unfix)
+        # Untracked models can still be changed from other threads
+        run("other", other.v.fix)
+        assert ms._dof_hooks_count == 1
+
+    assert set(errors) == {"enter", "query", "rebuild", "fix"}
+    for msg in errors.values():
+        assert "active in another thread" in msg
+    assert other.v.fixed
+    assert ms._dof_hooks_count == 0
+    assert ms._dof_hooks_thread is None
+    assert VarData.fixed is original
+
+    # Once no trackers are active, they can be used from another thread
+    run("after", enter_other)
+    assert "after" not in errors
+    assert VarData.fixed is original
+
+
+@pytest.mark.unit
+def test_degrees_of_freedom_tracker_indexed_block(m):
+    with pytest.raises(
+        TypeError, match="DegreesOfFreedomTracker only supports BlockData objects"
+    ):
+        DegreesOfFreedomTracker(m.b2)
+
+
 @pytest.mark.unit
 def test_large_residuals_set(m):
     # Initialize derivative var values so no errors occur
@@ -0,0 +1,56 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Tests for pools of worker processes with a shared state.
+"""
+import os
+
+import pytest
+
+from idaes.core.util.parallel import fork_available, get_worker_state, worker_pool
+
+
+def _scale(x):
+    factor, _ = get_worker_state()
+    return factor * x, os.getpid()
+
+
+def _setup(factor, offset):
+    return factor + offset, None
+
+
+@pytest.mark.unit
+def test_get_worker_state_in_parent():
+    assert get_worker_state() is None
+
+
+@pytest.mark.component
+@pytest.mark.skipif(not fork_available(), reason="fork is not available")
+def test_worker_pool_fork():
+    # an unpicklable state is inherited by forked workers
+    state = (3, lambda: None)
+    with worker_pool(state, max_workers=2) as pool:
+        results = list(pool.map(_scale, range(4)))
+
+    assert [r[0] for r in results] == [0, 3, 6, 9]
+    assert all(r[1] != os.getpid() for r in results)
+    assert get_worker_state() is None
+
+
+@pytest.mark.component
+def test_worker_pool_setup():
+    with worker_pool((2, 1), max_workers=2, fork=False, setup=_setup) as pool:
+        results = list(pool.map(_scale, range(4)))
+
+    assert [r[0] for r in results] == [0, 3, 6, 9]
+    assert get_worker_state() is None
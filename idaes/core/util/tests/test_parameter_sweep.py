@@ -37,6 +37,7 @@ from idaes.core.util.parameter_sweep import (
     ParameterSweepSpecification,
     ParameterSweepBase,
     SequentialSweepRunner,
+    ParallelSweepRunner,
 )
 from idaes.core.surrogate.pysmo.sampling import (
     LatinHypercubeSampling,
@@ -692,6 +693,45 @@ class TestParameterSweepBase:
 
         assert psweep.get_initialized_model() == "foo"
 
+    @pytest.mark.unit
+    def test_get_initialized_model_reset(self):
+        psweep = ParameterSweepBase(
+            build_model=self.build_model,
+            rebuild_model=False,
+            reset_model=True,
+        )
+
+        m = psweep.get_initialized_model()
+        assert psweep._model_state is not None
+
+        m.v1.set_value(10)
+        m.v2.unfix()
+        m.v3.fix(20)
+        m.p2.set_value(30)
+
+        assert psweep.get_initialized_model() is m
+        assert value(m.v1) == 1
+        assert m.v1.fixed
+        assert m.v2.fixed
+        assert value(m.v3) == 1
+        assert not m.v3.fixed
+        assert value(m.p2) == 1
+
+    @pytest.mark.unit
+    def test_get_initialized_model_no_reset(self):
+        psweep = ParameterSweepBase(
+            build_model=self.build_model,
+            rebuild_model=False,
+        )
+
+        m = psweep.get_initialized_model()
+        assert psweep._model_state is None
+
+        m.v1.set_value(10)
+
+        assert psweep.get_initialized_model() is m
+        assert value(m.v1) == 10
+
     @pytest.mark.unit
     def test_get_initialized_model_w_args(self):
         def build_model(arg1=None, arg2=None):
@@ -1395,3 +1435,94 @@ class TestSequentialSweepRunner:
 
         assert psweep.results[1]["success"]
         assert psweep.results[1]["results"] == pytest.approx(6 - 1e-3, rel=1e-8)
+
+
+def build_parallel_model():
+    m = ConcreteModel()
+    m.v1 = Var(initialize=1)
+    m.v2 = Var(initialize=4)
+    m.v2.fix()
+
+    return m
+
+
+def run_parallel_model(model, solver):
+    # Accumulate into v1 so that results depend on the model being reset
+    model.v1.set_value(value(model.v1) + value(model.v2))
+    return True, None
+
+
+def build_parallel_outputs(model, run_stats):
+    return value(model.v1)
+
+
+class TestParallelSweepRunner:
+    @pytest.fixture
+    def spec(self):
+        spec = ParameterSweepSpecification()
+        spec.set_sampling_method(UniformSampling)
+        spec.add_sampled_input("v2", 2, 6)
+        spec.set_sample_size([5])
+        spec.generate_samples()
+
+        return spec
+
+    @pytest.mark.unit
+    def test_init(self):
+        psweep = ParallelSweepRunner(number_of_workers=2)
+
+        assert psweep.config.number_of_workers == 2
+        assert psweep.config.rebuild_model
+        assert not psweep.config.reset_model
+
+    @pytest.mark.component
+    def test_parallel_runner(self, spec):
+        psweep = ParallelSweepRunner(
+            build_model=build_parallel_model,
+            input_specification=spec,
+            run_model=run_parallel_model,
+            build_outputs=build_parallel_outputs,
+            number_of_workers=2,
+        )
+
+        results = psweep.execute_parameter_sweep()
+
+        assert list(results.keys()) == [0, 1, 2, 3, 4]
+        for k, v in results.items():
+            assert v["success"]
+            assert v["error"] is None
+            assert v["results"] == pytest.approx(1 + 2 + k, rel=1e-8)
+
+    @pytest.mark.component
+    def test_parallel_runner_reuse_model(self, spec):
+        psweep = ParallelSweepRunner(
+            build_model=build_parallel_model,
+            input_specification=spec,
+            run_model=run_parallel_model,
+            build_outputs=build_parallel_outputs,
+            rebuild_model=False,
+            reset_model=True,
+            number_of_workers=2,
+        )
+
+        results = psweep.execute_parameter_sweep()
+
+        # Results should match rebuilding the model for each sample
+        for k, v in results.items():
+            assert v["results"] == pytest.approx(1 + 2 + k, rel=1e-8)
+
+    @pytest.mark.component
+    def test_parallel_runner_matches_sequential(self, spec):
+        kwargs = dict(
+            build_model=build_parallel_model,
+            input_specification=spec,
+            run_model=run_parallel_model,
+            build_outputs=build_parallel_outputs,
+        )
+
+        seq = SequentialSweepRunner(**kwargs).execute_parameter_sweep()
+        par = ParallelSweepRunner(
+            **kwargs, number_of_workers=3
+        ).execute_parameter_sweep()
+
+        assert seq == par
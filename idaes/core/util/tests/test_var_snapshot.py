@@ -0,0 +1,150 @@
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+Tests for VarSnapshot.
+"""
+
+import numpy as np
+import pytest
+
+from pyomo.environ import Block, ConcreteModel, Set, Suffix, Var
+
+from idaes.core.util.var_snapshot import VarSnapshot
+
+
+@pytest.fixture
+def model():
+    m = ConcreteModel()
+    m.x = Var(initialize=1, bounds=(0, 10))
+    m.y = Var(initialize=-2, bounds=(None, 5))
+    m.z = Var()
+    m.z.fix(0)
+    m.b = Block()
+    m.b.w = Var(initialize=3, bounds=(-1, None))
+
+    return m
+
+
+@pytest.mark.unit
+def test_snapshot(model):
+    snap = VarSnapshot(model)
+
+    assert len(snap) == 4
+    assert snap.variables == [model.x, model.y, model.z, model.b.w]
+    assert snap.index[model.b.w] == 3
+
+    np.testing.assert_array_equal(snap.values, [1, -2, 0, 3])
+    np.testing.assert_array_equal(snap.lb, [0, -np.inf, -np.inf, -1])
+    np.testing.assert_array_equal(snap.ub, [10, 5, np.inf, np.inf])
+    np.testing.assert_array_equal(snap.fixed, [False, False, True, False])
+    np.testing.assert_array_equal(snap.has_value, [True, True, True, True])
+    assert snap.scaling_factors is None
+
+
+@pytest.mark.unit
+def test_snapshot_none_value(model):
+    model.x.set_value(None)
+    snap = VarSnapshot(model)
+
+    assert np.isnan(snap.values[0])
+    assert not snap.has_value[0]
+
+
+@pytest.mark.unit
+def test_snapshot_active(model):
+    model.b.deactivate()
+
+    assert len(VarSnapshot(model)) == 4
+    assert len(VarSnapshot(model, active=True)) == 3
+
+
+@pytest.mark.unit
+def test_snapshot_descend_into(model):
+    assert len(VarSnapshot(model, descend_into=False)) == 3
+
+
+@pytest.mark.unit
+def test_snapshot_indexed_block():
+    m = ConcreteModel()
+    m.s = Set(initialize=[1, 2])
+    m.b = Block(m.s)
+    for b in m.b.values():
+        b.v = Var(initialize=4)
+
+    snap = VarSnapshot(m.b)
+
+    assert snap.variables == [m.b[1].v, m.b[2].v]
+
+
+@pytest.mark.unit
+def test_snapshot_scaling_factors(model):
+    model.scaling_factor = Suffix(direction=Suffix.EXPORT)
+    model.scaling_factor[model.x] = 10
+
+    snap = VarSnapshot(model, scaling_factors=True)
+
+    assert snap.scaling_factors[0] == 10
+    assert np.isnan(snap.scaling_factors[1])
+
+
+@pytest.mark.unit
+def test_components(model):
+    snap = VarSnapshot(model)
+
+    selected = snap.components(snap.values > 0)
+
+    assert list(selected) == [model.x, model.b.w]
+
+
+@pytest.mark.unit
+def test_update(model):
+    snap = VarSnapshot(model)
+
+    model.x.set_value(7)
+    model.y.setub(None)
+    model.z.unfix()
+    snap.update()
+
+    assert snap.values[0] == 7
+    assert snap.ub[1] == np.inf
+    assert not snap.fixed[2]
+
+
+@pytest.mark.unit
+def test_restore(model):
+    model.x.set_value(None)
+    snap = VarSnapshot(model)
+
+    model.x.set_value(4)
+    model.y.set_value(20)
+    model.y.fix()
+    model.z.unfix()
+
+    snap.restore()
+
+    assert model.x.value is None
+    assert model.y.value == -2
+    assert not model.y.fixed
+    assert model.z.fixed
+    assert model.z.value == 0
+
+
+@pytest.mark.unit
+def test_restore_values_only(model):
+    snap = VarSnapshot(model)
+
+    model.y.fix(20)
+    snap.restore(fixed=False)
+
+    assert model.y.value == -2
+    assert model.y.fixed
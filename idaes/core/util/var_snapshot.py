@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#################################################################################
+# The Institute for the Design of Advanced Energy Systems Integrated Platform
+# Framework (IDAES IP) was produced under the DOE Institute for the
+# Design of Advanced Energy Systems (IDAES).
+#
+# Copyright (c) 2018-2024 by the software owners: The Regents of the
+# University of California, through Lawrence Berkeley National Laboratory,
+# National Technology & Engineering Solutions of Sandia, LLC, Carnegie Mellon
+# University, West Virginia University Research Corporation, et al.
+# All rights reserved.  Please see the files COPYRIGHT.md and LICENSE.md
+# for full copyright and license information.
+#################################################################################
+"""
+This module contains a utility class for recording the values, bounds and fixed
+status of all variables in a model into NumPy arrays, so that checks over all
+variables can be performed as array operations.
+"""
+
+import numpy as np
+
+from pyomo.environ import Var
+from pyomo.common.collections import ComponentMap, ComponentSet
+
+from idaes.core.util.scaling import get_scaling_factor
+
+
+class VarSnapshot:
+    """
+    Snapshot of the state of all variables in a model.
+
+    Values, bounds, fixed status and (optionally) scaling factors are read from
+    the model in a single pass and stored in contiguous NumPy arrays, with the
+    i-th entry of each array corresponding to the i-th entry of variables.
+    Variables without a value are stored as NaN, missing bounds as -inf and inf
+    respectively and missing scaling factors as NaN.
+
+    Args:
+        block: model (or indexed Block) to record variables from
+        active: passed to component_data_objects; if True, variables in
+            deactivated blocks are skipped (default = None)
+        descend_into: whether to include variables in sub-blocks (default = True)
+        scaling_factors: whether to also record the scaling factors of all
+            variables (default = False)
+
+    """
+
+    def __init__(self, block, active=None, descend_into=True, scaling_factors=False):
+        if block.is_indexed():
+            blocks = list(block.values())
+        else:
+            blocks = [block]
+
+        self.variables = [
+            v
+            for b in blocks
+            for v in b.component_data_objects(
+                Var, active=active, descend_into=descend_into
+            )
+        ]
+        self.index = ComponentMap((v, i) for i, v in enumerate(self.variables))
+
+        self.scaling_factors = None
+        self.update(scaling_factors=scaling_factors)
+
+    def __len__(self):
+        return len(self.variables)
+
+    def update(self, scaling_factors=False):
+        """
+        Re-read the values, bounds and fixed status of the recorded variables from
+        the model.
+
+        Args:
+            scaling_factors: whether to also re-read the scaling factors of all
+                variables (default = False)
+
+        Returns:
+            None
+        """
+        n = len(self.variables)
+        values = np.empty(n)
+        lb = np.empty(n)
+        ub = np.empty(n)
+        fixed = np.empty(n, dtype=bool)
+        # Track missing values explicitly, so that variables with a value of NaN
+        # can be distinguished from variables with no value
+        has_value = np.empty(n, dtype=bool)
+
+        for i, v in enumerate(self.variables):
+            val = v.value
+            has_value[i] = val is not None
+            values[i] = val if has_value[i] else np.nan
+            bnd = v.lb
+            lb[i] = -np.inf if bnd is None else bnd
+            bnd = v.ub
+            ub[i] = np.inf if bnd is None else bnd
+            fixed[i] = v.fixed
+
+        self.values = values
+        self.lb = lb
+        self.ub = ub
+        self.fixed = fixed
+        self.has_value = has_value
+
+        if scaling_factors:
+            self.scaling_factors = np.fromiter(
+                (get_scaling_factor(v, default=np.nan) for v in self.variables),
+                dtype=float,
+                count=n,
+            )
+
+    def components(self, mask):
+        """
+        Get the variables selected by a boolean mask.
+
+        Args:
+            mask: boolean array with one entry per recorded variable
+
+        Returns:
+            ComponentSet of variables for which mask is True, in model order
+        """
+        variables = self.variables
+        return ComponentSet(variables[i] for i in np.flatnonzero(mask))
+
+    def restore(self, values=True, fixed=True):
+        """
+        Write the recorded values and/or fixed status back to the variables.
+
+        Args:
+            values: whether to restore variable values (default = True)
+            fixed: whether to restore the fixed status of variables (default = True)
+
+        Returns:
+            None
+        """
+        for i, v in enumerate(self.variables):
+            if values:
+                val = self.values[i].item() if self.has_value[i] else None
+                v.set_value(val, skip_validation=True)
+            if fixed:
+                v.fixed = bool(self.fixed[i])